@@ -22,6 +22,8 @@ a = Analysis(
         ('src/lucidshark/data/pmd-ruleset.xml', 'lucidshark/data'),
         ('src/lucidshark/data/checkstyle-google.xml', 'lucidshark/data'),
         ('src/lucidshark/data/spotbugs-exclude.xml', 'lucidshark/data'),
+        ('src/lucidshark/data/LucidSharkJvmWorker.java', 'lucidshark/data'),
+        ('src/lucidshark/data/lucidshark-eslint-server.js', 'lucidshark/data'),
         ('src/lucidshark/data/templates/*.yml', 'lucidshark/data/templates'),
     ],
     hiddenimports=[
@@ -31,15 +33,33 @@ a = Analysis(
         'lucidshark.cli.runner',
         'lucidshark.cli.arguments',
         'lucidshark.cli.commands',
+        # Commands are imported lazily by the CLI runner
+        'lucidshark.cli.commands.doctor',
+        'lucidshark.cli.commands.help',
+        'lucidshark.cli.commands.init',
+        'lucidshark.cli.commands.list_scanners',
+        'lucidshark.cli.commands.overview',
+        'lucidshark.cli.commands.scan',
+        'lucidshark.cli.commands.serve',
+        'lucidshark.cli.commands.status',
+        'lucidshark.cli.commands.validate',
         'lucidshark.core',
         'lucidshark.config',
+        'lucidshark.config.loader',
+        'lucidshark.config.models',
+        'lucidshark.config.validation',
         'lucidshark.bootstrap',
         'lucidshark.detection',
         'lucidshark.generation',
         'lucidshark.mcp',
+        'lucidshark.mcp.formatter',
+        'lucidshark.mcp.server',
+        'lucidshark.mcp.tools',
+        'lucidshark.mcp.watcher',
         'lucidshark.pipeline',
         'lucidshark.telemetry',
         'lucidshark.plugins.go_utils',
+        'lucidshark.plugins.jvm_worker',
         # Plugin entry points - linters
         'lucidshark.plugins.linters.ruff',
         'lucidshark.plugins.linters.eslint',
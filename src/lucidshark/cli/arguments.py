@@ -291,7 +291,7 @@ def _build_scan_parser(subparsers: argparse._SubParsersAction) -> None:
     exec_group.add_argument(
         "--sequential",
         action="store_true",
-        help="Disable parallel scanner execution (for debugging).",
+        help="Disable parallel domain and scanner execution (for debugging).",
     )
     exec_group.add_argument(
         "--fix",
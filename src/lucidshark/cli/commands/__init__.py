@@ -10,6 +10,13 @@ from argparse import Namespace
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from lucidshark.cli.commands.init import InitCommand
+    from lucidshark.cli.commands.list_scanners import ListScannersCommand
+    from lucidshark.cli.commands.overview import OverviewCommand
+    from lucidshark.cli.commands.scan import ScanCommand
+    from lucidshark.cli.commands.serve import ServeCommand
+    from lucidshark.cli.commands.status import StatusCommand
+    from lucidshark.cli.commands.validate import ValidateCommand
     from lucidshark.config.models import LucidSharkConfig
 
 
@@ -42,15 +49,28 @@ class Command(ABC):
         """
 
 
-# Import command implementations for convenience
-# ruff: noqa: E402
-from lucidshark.cli.commands.status import StatusCommand
-from lucidshark.cli.commands.list_scanners import ListScannersCommand
-from lucidshark.cli.commands.scan import ScanCommand
-from lucidshark.cli.commands.init import InitCommand
-from lucidshark.cli.commands.serve import ServeCommand
-from lucidshark.cli.commands.validate import ValidateCommand
-from lucidshark.cli.commands.overview import OverviewCommand
+# Command implementations are imported on first access so that loading the
+# Command base class (and therefore starting the CLI) stays cheap
+_COMMAND_MODULES = {
+    "StatusCommand": "lucidshark.cli.commands.status",
+    "ListScannersCommand": "lucidshark.cli.commands.list_scanners",
+    "ScanCommand": "lucidshark.cli.commands.scan",
+    "InitCommand": "lucidshark.cli.commands.init",
+    "ServeCommand": "lucidshark.cli.commands.serve",
+    "ValidateCommand": "lucidshark.cli.commands.validate",
+    "OverviewCommand": "lucidshark.cli.commands.overview",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import for command implementations."""
+    module_path = _COMMAND_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module_path), name)
+
 
 __all__ = [
     "Command",
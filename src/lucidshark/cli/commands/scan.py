@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 from argparse import Namespace
 from pathlib import Path
@@ -28,6 +29,7 @@ from lucidshark.core.models import (
 )
 from lucidshark.core.streaming import CLIStreamHandler, StreamHandler
 from lucidshark.pipeline import PipelineConfig, PipelineExecutor
+from lucidshark.pipeline.scheduler import DomainScheduler, domain_dependencies
 from lucidshark.plugins.reporters import get_reporter_plugin
 
 LOGGER = get_logger(__name__)
@@ -160,11 +162,16 @@ class ScanCommand(Command):
     def _run_scan(self, args: Namespace, config: LucidSharkConfig) -> ScanResult:
         """Execute the scan based on CLI arguments and config.
 
-        Uses PipelineExecutor to run the scan pipeline:
-        1. Linting (if --linting or --all)
-        2. Scanner execution (parallel by default)
-        3. Enricher execution (sequential, in configured order)
-        4. Result aggregation
+        Enabled domains are run concurrently by DomainScheduler, bounded by
+        pipeline.max_workers (coverage waits for testing; with --fix,
+        formatting waits for linting and every other domain waits for
+        both). Security domains run through
+        PipelineExecutor as one scheduled task:
+        1. Scanner execution (parallel by default)
+        2. Enricher execution (sequential, in configured order)
+        3. Result aggregation
+
+        --sequential runs domains one at a time in the order listed above.
 
         Partial Scanning (default behavior):
         - If --files is specified, scan only those files
@@ -286,6 +293,13 @@ class ScanCommand(Command):
         all_flag = getattr(args, "all", False)
         fix_enabled = getattr(args, "fix", False)
 
+        # Domains are registered on a shared scheduler and run concurrently,
+        # subject to domain_dependencies() (e.g. coverage waits for testing)
+        scheduler = DomainScheduler(
+            max_workers=config.pipeline.max_workers,
+            sequential=getattr(args, "sequential", False),
+        )
+
         # Run linting if requested or if --all and linting is configured
         linting_flag = getattr(args, "linting", False)
         linting_configured = (
@@ -304,15 +318,18 @@ class ScanCommand(Command):
                 linting_command = config.pipeline.linting.command
                 linting_pre_command = config.pipeline.linting.pre_command
                 linting_post_command = config.pipeline.linting.post_command
-            all_issues.extend(
-                runner.run_linting(
+            scheduler.add(
+                "linting",
+                functools.partial(
+                    runner.run_linting,
                     context,
                     fix_enabled,
                     exclude_patterns=linting_exclude,
                     command=linting_command,
                     pre_command=linting_pre_command,
                     post_command=linting_post_command,
-                )
+                ),
+                depends_on=domain_dependencies("linting", fix_enabled),
             )
 
         # Run type checking if requested or if --all and type_checking is configured
@@ -336,14 +353,17 @@ class ScanCommand(Command):
                 tc_command = config.pipeline.type_checking.command
                 tc_pre_command = config.pipeline.type_checking.pre_command
                 tc_post_command = config.pipeline.type_checking.post_command
-            all_issues.extend(
-                runner.run_type_checking(
+            scheduler.add(
+                "type_checking",
+                functools.partial(
+                    runner.run_type_checking,
                     context,
                     exclude_patterns=tc_exclude,
                     command=tc_command,
                     pre_command=tc_pre_command,
                     post_command=tc_post_command,
-                )
+                ),
+                depends_on=domain_dependencies("type_checking", fix_enabled),
             )
 
         # Run formatting if requested or if --all and formatting is configured
@@ -364,15 +384,18 @@ class ScanCommand(Command):
                 formatting_command = config.pipeline.formatting.command
                 formatting_pre_command = config.pipeline.formatting.pre_command
                 formatting_post_command = config.pipeline.formatting.post_command
-            all_issues.extend(
-                runner.run_formatting(
+            scheduler.add(
+                "formatting",
+                functools.partial(
+                    runner.run_formatting,
                     context,
                     fix_enabled,
                     exclude_patterns=formatting_exclude,
                     command=formatting_command,
                     pre_command=formatting_pre_command,
                     post_command=formatting_post_command,
-                )
+                ),
+                depends_on=domain_dependencies("formatting", fix_enabled),
             )
 
         # Run tests if requested or if --all and testing is configured
@@ -404,17 +427,19 @@ class ScanCommand(Command):
                 testing_command = config.pipeline.testing.command
                 testing_pre_command = config.pipeline.testing.pre_command
                 testing_post_command = config.pipeline.testing.post_command
-            all_issues.extend(
-                runner.run_tests(
+            scheduler.add(
+                "testing",
+                functools.partial(
+                    runner.run_tests,
                     context,
                     exclude_patterns=testing_exclude,
                     command=testing_command,
                     pre_command=testing_pre_command,
                     post_command=testing_post_command,
-                )
+                ),
+                depends_on=domain_dependencies("testing", fix_enabled),
             )
 
-        coverage_summary: Optional[CoverageSummary] = None
         if coverage_enabled:
             coverage_threshold = getattr(args, "coverage_threshold", None)
             if coverage_threshold is None and config.pipeline.coverage:
@@ -430,17 +455,128 @@ class ScanCommand(Command):
                 coverage_command = config.pipeline.coverage.command
                 coverage_pre_command = config.pipeline.coverage.pre_command
                 coverage_post_command = config.pipeline.coverage.post_command
-            all_issues.extend(
-                runner.run_coverage(
+            scheduler.add(
+                "coverage",
+                functools.partial(
+                    runner.run_coverage,
                     context,
                     coverage_threshold,
                     exclude_patterns=coverage_exclude,
                     command=coverage_command,
                     pre_command=coverage_pre_command,
                     post_command=coverage_post_command,
-                )
+                ),
+                depends_on=domain_dependencies("coverage", fix_enabled),
+            )
+
+        # Run duplication detection if requested or if --all and duplication is configured
+        duplication_flag = getattr(args, "duplication", False)
+        duplication_configured = (
+            config.pipeline.duplication is None or config.pipeline.duplication.enabled
+        )
+        duplication_enabled = duplication_flag or (all_flag and duplication_configured)
+
+        if duplication_enabled:
+            # Get threshold and options from CLI or config
+            duplication_threshold = getattr(args, "duplication_threshold", None)
+            min_lines = getattr(args, "min_lines", None)
+            min_chars = 3  # Default
+            exclude_patterns: Optional[List[str]] = None
+
+            # Fall back to config values if not set on CLI
+            if config.pipeline.duplication:
+                if duplication_threshold is None:
+                    duplication_threshold = config.pipeline.duplication.threshold
+                if min_lines is None:
+                    min_lines = config.pipeline.duplication.min_lines
+                min_chars = config.pipeline.duplication.min_chars or min_chars
+                exclude_patterns = config.pipeline.duplication.exclude or None
+
+            # Apply defaults
+            duplication_threshold = duplication_threshold or 10.0
+            min_lines = min_lines or 4
+
+            # Get baseline/cache/git flags from config
+            use_baseline = False
+            use_cache = True
+            use_git = True
+            if config.pipeline.duplication:
+                use_baseline = config.pipeline.duplication.baseline
+                use_cache = config.pipeline.duplication.cache
+                use_git = config.pipeline.duplication.use_git
+
+            scheduler.add(
+                "duplication",
+                functools.partial(
+                    runner.run_duplication,
+                    context,
+                    duplication_threshold,
+                    min_lines,
+                    min_chars,
+                    exclude_patterns,
+                    use_baseline=use_baseline,
+                    use_cache=use_cache,
+                    use_git=use_git,
+                ),
+                depends_on=domain_dependencies("duplication", fix_enabled),
             )
 
+        # Run security scanning if any domains are enabled
+        if enabled_domains:
+            # Collect unique scanners needed based on config
+            needed_scanners: List[str] = []
+            for domain in enabled_domains:
+                # Only process security domains (ScanDomain) here
+                # Tool domains (linting, type_checking, etc.) are handled separately above
+                from lucidshark.core.models import ScanDomain
+
+                if not isinstance(domain, ScanDomain):
+                    continue
+
+                # Use get_plugins_for_domain to get ALL scanners for defense-in-depth
+                scanner_names = config.get_plugins_for_domain(domain.value)
+                if scanner_names:
+                    for scanner_name in scanner_names:
+                        if scanner_name not in needed_scanners:
+                            needed_scanners.append(scanner_name)
+                else:
+                    LOGGER.warning(
+                        f"No scanner plugin configured for domain: {domain.value}"
+                    )
+
+            if needed_scanners:
+                # Build pipeline configuration
+                pipeline_config = PipelineConfig(
+                    sequential_scanners=getattr(args, "sequential", False),
+                    max_workers=config.pipeline.max_workers,
+                    enricher_order=config.pipeline.enrichers,
+                )
+
+                # Execute pipeline
+                executor = PipelineExecutor(
+                    config=config,
+                    pipeline_config=pipeline_config,
+                    lucidshark_version=self._version,
+                )
+
+                def run_security() -> List[UnifiedIssue]:
+                    nonlocal pipeline_result
+                    pipeline_result = executor.execute(needed_scanners, context)
+                    return pipeline_result.issues
+
+                scheduler.add(
+                    "security",
+                    run_security,
+                    depends_on=domain_dependencies("security", fix_enabled),
+                )
+
+        # Execute all registered domains; results come back in registration
+        # order so the issue list does not depend on completion order
+        for domain_issues in scheduler.execute().values():
+            all_issues.extend(domain_issues)
+
+        coverage_summary: Optional[CoverageSummary] = None
+        if coverage_enabled:
             # Build coverage summary from context.coverage_result
             if context.coverage_result is None:
                 LOGGER.warning(
@@ -521,101 +657,12 @@ class ScanCommand(Command):
                     # No --base-branch: use full project coverage
                     coverage_summary = context.coverage_result.to_summary()
 
-        # Run duplication detection if requested or if --all and duplication is configured
-        duplication_flag = getattr(args, "duplication", False)
-        duplication_configured = (
-            config.pipeline.duplication is None or config.pipeline.duplication.enabled
-        )
-        duplication_enabled = duplication_flag or (all_flag and duplication_configured)
-
         duplication_summary: Optional[DuplicationSummary] = None
         if duplication_enabled:
-            # Get threshold and options from CLI or config
-            duplication_threshold = getattr(args, "duplication_threshold", None)
-            min_lines = getattr(args, "min_lines", None)
-            min_chars = 3  # Default
-            exclude_patterns: Optional[List[str]] = None
-
-            # Fall back to config values if not set on CLI
-            if config.pipeline.duplication:
-                if duplication_threshold is None:
-                    duplication_threshold = config.pipeline.duplication.threshold
-                if min_lines is None:
-                    min_lines = config.pipeline.duplication.min_lines
-                min_chars = config.pipeline.duplication.min_chars or min_chars
-                exclude_patterns = config.pipeline.duplication.exclude or None
-
-            # Apply defaults
-            duplication_threshold = duplication_threshold or 10.0
-            min_lines = min_lines or 4
-
-            # Get baseline/cache/git flags from config
-            use_baseline = False
-            use_cache = True
-            use_git = True
-            if config.pipeline.duplication:
-                use_baseline = config.pipeline.duplication.baseline
-                use_cache = config.pipeline.duplication.cache
-                use_git = config.pipeline.duplication.use_git
-
-            all_issues.extend(
-                runner.run_duplication(
-                    context,
-                    duplication_threshold,
-                    min_lines,
-                    min_chars,
-                    exclude_patterns,
-                    use_baseline=use_baseline,
-                    use_cache=use_cache,
-                    use_git=use_git,
-                )
-            )
-
             # Build duplication summary from context.duplication_result
             if context.duplication_result is not None:
                 duplication_summary = context.duplication_result.to_summary()
 
-        # Run security scanning if any domains are enabled
-        if enabled_domains:
-            # Collect unique scanners needed based on config
-            needed_scanners: List[str] = []
-            for domain in enabled_domains:
-                # Only process security domains (ScanDomain) here
-                # Tool domains (linting, type_checking, etc.) are handled separately above
-                from lucidshark.core.models import ScanDomain
-
-                if not isinstance(domain, ScanDomain):
-                    continue
-
-                # Use get_plugins_for_domain to get ALL scanners for defense-in-depth
-                scanner_names = config.get_plugins_for_domain(domain.value)
-                if scanner_names:
-                    for scanner_name in scanner_names:
-                        if scanner_name not in needed_scanners:
-                            needed_scanners.append(scanner_name)
-                else:
-                    LOGGER.warning(
-                        f"No scanner plugin configured for domain: {domain.value}"
-                    )
-
-            if needed_scanners:
-                # Build pipeline configuration
-                pipeline_config = PipelineConfig(
-                    sequential_scanners=getattr(args, "sequential", False),
-                    max_workers=config.pipeline.max_workers,
-                    enricher_order=config.pipeline.enrichers,
-                )
-
-                # Execute pipeline
-                executor = PipelineExecutor(
-                    config=config,
-                    pipeline_config=pipeline_config,
-                    lucidshark_version=self._version,
-                )
-
-                pipeline_result = executor.execute(needed_scanners, context)
-                all_issues.extend(pipeline_result.issues)
-
         # Apply ignore_issues
         if config.ignore_issues:
             from lucidshark.core.ignore_issues import apply_ignore_issues
@@ -5,29 +5,37 @@ This module handles command dispatch and execution for the lucidshark CLI.
 
 from __future__ import annotations
 
+import importlib
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
-
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
 
 from lucidshark.cli.arguments import build_parser
-from lucidshark.cli.config_bridge import ConfigBridge
 from lucidshark.cli.exit_codes import (
     EXIT_INVALID_USAGE,
     EXIT_SCANNER_ERROR,
     EXIT_SUCCESS,
 )
-from lucidshark.cli.commands.status import StatusCommand
-from lucidshark.cli.commands.scan import ScanCommand
-from lucidshark.cli.commands.help import HelpCommand
-from lucidshark.cli.commands.doctor import DoctorCommand
-from lucidshark.cli.commands.overview import OverviewCommand
-from lucidshark.config import load_config
-from lucidshark.config.loader import ConfigError, find_project_config, load_yaml_file
-from lucidshark.config.models import LucidSharkConfig
 from lucidshark.core.logging import configure_logging, get_logger
 
+if TYPE_CHECKING:
+    from lucidshark.cli.commands.doctor import DoctorCommand
+    from lucidshark.cli.commands.help import HelpCommand
+    from lucidshark.cli.commands.overview import OverviewCommand
+    from lucidshark.cli.commands.scan import ScanCommand
+    from lucidshark.cli.commands.status import StatusCommand
+    from lucidshark.config.models import LucidSharkConfig
+
 LOGGER = get_logger(__name__)
 
+# Commands created on first use: name -> (module path, class name)
+_LAZY_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "status": ("lucidshark.cli.commands.status", "StatusCommand"),
+    "scan": ("lucidshark.cli.commands.scan", "ScanCommand"),
+    "help": ("lucidshark.cli.commands.help", "HelpCommand"),
+    "doctor": ("lucidshark.cli.commands.doctor", "DoctorCommand"),
+    "overview": ("lucidshark.cli.commands.overview", "OverviewCommand"),
+}
+
 
 def get_version() -> str:
     """Get lucidshark version.
@@ -46,23 +54,57 @@ class CLIRunner:
     """Orchestrates CLI execution with subcommand dispatch."""
 
     def __init__(self) -> None:
-        """Initialize CLIRunner with parser and commands."""
+        """Initialize CLIRunner with the argument parser.
+
+        Command modules pull in the config, pipeline and plugin packages,
+        so each command is imported and created on first use only.
+        """
         self.parser = build_parser()
         self._version = get_version()
-        self.status_cmd = StatusCommand(version=self._version)
-        self.scan_cmd = ScanCommand(version=self._version)
-        self.help_cmd = HelpCommand(version=self._version)
-        self.doctor_cmd = DoctorCommand(version=self._version)
-        self.overview_cmd = OverviewCommand(version=self._version)
+        self._commands: Dict[str, Any] = {}
         # InitCommand will be imported lazily when needed
         self._init_cmd = None
 
+    def _command(self, name: str) -> Any:
+        """Import and instantiate a command on first use."""
+        if name not in self._commands:
+            module_path, class_name = _LAZY_COMMANDS[name]
+            command_class = getattr(importlib.import_module(module_path), class_name)
+            self._commands[name] = command_class(version=self._version)
+        return self._commands[name]
+
+    @property
+    def status_cmd(self) -> "StatusCommand":
+        """Lazily created StatusCommand."""
+        return self._command("status")
+
+    @property
+    def scan_cmd(self) -> "ScanCommand":
+        """Lazily created ScanCommand."""
+        return self._command("scan")
+
+    @property
+    def help_cmd(self) -> "HelpCommand":
+        """Lazily created HelpCommand."""
+        return self._command("help")
+
+    @property
+    def doctor_cmd(self) -> "DoctorCommand":
+        """Lazily created DoctorCommand."""
+        return self._command("doctor")
+
+    @property
+    def overview_cmd(self) -> "OverviewCommand":
+        """Lazily created OverviewCommand."""
+        return self._command("overview")
+
     def _maybe_start_update_check(self) -> None:
         """Start a background update check if auto_update is enabled.
 
         Does a lightweight read of lucidshark.yml to check the auto_update
         setting without performing a full config load.
         """
+        from lucidshark.config.loader import find_project_config, load_yaml_file
         from lucidshark.updater import maybe_start_background_check
 
         auto_update = True
@@ -167,13 +209,17 @@ class CLIRunner:
 
         return self.init_cmd.execute(args)
 
-    def _load_config(self, args) -> Tuple[Optional[LucidSharkConfig], int]:
+    def _load_config(self, args) -> Tuple[Optional["LucidSharkConfig"], int]:
         """Load configuration from args, returning (config, exit_code).
 
         On success ``exit_code`` is ``EXIT_SUCCESS`` and ``config`` is the
         loaded :class:`LucidSharkConfig`.  On failure ``config`` is ``None``
         and ``exit_code`` should be returned to the caller immediately.
         """
+        from lucidshark.cli.config_bridge import ConfigBridge
+        from lucidshark.config import load_config
+        from lucidshark.config.loader import ConfigError
+
         project_root = Path(args.path).resolve()
         cli_overrides = ConfigBridge.args_to_overrides(args)
         try:
@@ -233,6 +279,8 @@ class CLIRunner:
                 return EXIT_SCANNER_ERROR
 
         # No scanners selected - provide context-specific guidance
+        from lucidshark.config.loader import find_project_config
+
         project_root = Path(args.path).resolve()
         has_config = find_project_config(project_root) is not None
         if has_config:
@@ -7,18 +7,46 @@ Provides configuration file loading, parsing, and validation with support for:
 - Plugin-specific configuration passthrough
 """
 
-from lucidshark.config.models import (
-    LucidSharkConfig,
-    OutputConfig,
-    ScannerDomainConfig,
-    DEFAULT_PLUGINS,
-)
-from lucidshark.config.loader import (
-    load_config,
-    find_project_config,
-    find_global_config,
-)
-from lucidshark.config.validation import validate_config, ConfigValidationWarning
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lucidshark.config.loader import (
+        find_global_config,
+        find_project_config,
+        load_config,
+    )
+    from lucidshark.config.models import (
+        DEFAULT_PLUGINS,
+        LucidSharkConfig,
+        OutputConfig,
+        ScannerDomainConfig,
+    )
+    from lucidshark.config.validation import ConfigValidationWarning, validate_config
+
+# Submodules are imported on first access so that importing the package
+# (e.g. during CLI startup) does not pull in YAML parsing and validation
+_LAZY_ATTRIBUTES = {
+    "LucidSharkConfig": "lucidshark.config.models",
+    "OutputConfig": "lucidshark.config.models",
+    "ScannerDomainConfig": "lucidshark.config.models",
+    "DEFAULT_PLUGINS": "lucidshark.config.models",
+    "load_config": "lucidshark.config.loader",
+    "find_project_config": "lucidshark.config.loader",
+    "find_global_config": "lucidshark.config.loader",
+    "validate_config": "lucidshark.config.validation",
+    "ConfigValidationWarning": "lucidshark.config.validation",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import for configuration models, loading and validation."""
+    module_path = _LAZY_ATTRIBUTES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module_path), name)
+
 
 __all__ = [
     "LucidSharkConfig",
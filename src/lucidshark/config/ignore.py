@@ -8,12 +8,16 @@ Uses pathspec library for full gitignore compliance including:
 - ** recursive globbing
 - ! negation patterns
 - # comments
+
+Matching resolves the project root and each directory once per pattern set
+and remembers which directories are ignored, so filtering thousands of
+files costs one ``resolve()`` per unique directory.
 """
 
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
 import pathspec
 
@@ -26,6 +30,61 @@ LOGGER = get_logger(__name__)
 
 LUCIDSHARKIGNORE_NAMES = [".lucidsharkignore"]
 
+# Marks a directory whose resolved location is outside the project root
+_OUTSIDE = object()
+
+
+class RelativePathResolver:
+    """Converts absolute paths into forward-slash paths relative to a root.
+
+    The root is resolved once and every parent directory once; files are
+    joined to their resolved parent instead of being resolved themselves.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the resolver.
+
+        Args:
+            root: Project root that paths are made relative to.
+        """
+        self.root = root
+        self._root_resolved = root.resolve()
+        self._dirs: Dict[Path, object] = {}
+
+    def _relative_dir(self, directory: Path) -> object:
+        """Relative form of a directory ("" for the root), or ``_OUTSIDE``."""
+        rel = self._dirs.get(directory)
+        if rel is None:
+            try:
+                rel = directory.resolve().relative_to(self._root_resolved).as_posix()
+            except ValueError:
+                rel = _OUTSIDE
+            rel = "" if rel == "." else rel
+            self._dirs[directory] = rel
+        return rel
+
+    def relative(self, path: Path) -> Optional[str]:
+        """Return ``path`` relative to the root.
+
+        Args:
+            path: Absolute path.
+
+        Returns:
+            Forward-slash relative path ("." for the root itself), or None
+            if the path is outside the root.
+        """
+        name = path.name
+        rel_dir = (
+            _OUTSIDE if name in ("", ".", "..") else self._relative_dir(path.parent)
+        )
+        if rel_dir is _OUTSIDE:
+            # Root itself, paths ending in "..", or genuinely outside
+            try:
+                return path.resolve().relative_to(self._root_resolved).as_posix()
+            except ValueError:
+                return None
+        return f"{rel_dir}/{name}" if rel_dir else name
+
 
 class IgnorePatterns:
     """Manages ignore patterns from multiple sources."""
@@ -54,9 +113,48 @@ class IgnorePatterns:
             clean_patterns,
         )
 
+        self._has_patterns = bool(clean_patterns)
+        # A negated pattern may re-include files below an ignored directory
+        self._can_prune = not any(p.strip().startswith("!") for p in clean_patterns)
+        self._resolvers: Dict[Path, RelativePathResolver] = {}
+        self._dir_verdicts: Dict[str, bool] = {}
+
         if clean_patterns:
             LOGGER.debug(f"Loaded {len(clean_patterns)} ignore patterns from {source}")
 
+    def _resolver(self, root: Path) -> RelativePathResolver:
+        """Return the memoizing resolver for a project root."""
+        resolver = self._resolvers.get(root)
+        if resolver is None:
+            resolver = RelativePathResolver(root)
+            self._resolvers[root] = resolver
+        return resolver
+
+    def _dir_ignored(self, rel_dir: str) -> bool:
+        """Check (and remember) whether a relative directory is ignored."""
+        verdict = self._dir_verdicts.get(rel_dir)
+        if verdict is None:
+            verdict = self._spec.match_file(rel_dir + "/")
+            self._dir_verdicts[rel_dir] = verdict
+        return verdict
+
+    def _match(self, path: Path, resolver: RelativePathResolver) -> bool:
+        """Match one path using the memoized resolver and directory verdicts."""
+        absolute = path if path.is_absolute() else resolver.root / path
+        rel = resolver.relative(absolute)
+        if rel is None:
+            # Outside the root: match the path as given
+            return self._spec.match_file(path.as_posix())
+
+        if self._can_prune:
+            # Files below an ignored directory are ignored (as in gitignore)
+            end = rel.find("/")
+            while end != -1:
+                if self._dir_ignored(rel[:end]):
+                    return True
+                end = rel.find("/", end + 1)
+        return self._spec.match_file(rel)
+
     def matches(self, path: Path, root: Path) -> bool:
         """Check if a path matches any ignore pattern.
 
@@ -67,17 +165,39 @@ class IgnorePatterns:
         Returns:
             True if path should be ignored, False otherwise.
         """
-        try:
-            # Normalize so relative_to works reliably
-            path_res = path.resolve() if path.is_absolute() else (root / path).resolve()
-            root_res = root.resolve()
-            rel_path = path_res.relative_to(root_res)
-        except ValueError:
-            rel_path = path
+        if not self._has_patterns:
+            return False
+        return self._match(path, self._resolver(root))
+
+    def match_many(self, paths: Iterable[Path], root: Path) -> List[bool]:
+        """Check many paths against the ignore patterns.
+
+        Args:
+            paths: Paths to check (absolute or relative).
+            root: Project root for relative path calculation.
+
+        Returns:
+            One verdict per path, True if the path should be ignored.
+        """
+        if not self._has_patterns:
+            return [False for _ in paths]
+        resolver = self._resolver(root)
+        return [self._match(p, resolver) for p in paths]
 
-        # pathspec expects forward-slash paths
-        rel_str = str(rel_path).replace("\\", "/")
-        return self._spec.match_file(rel_str)
+    def filter_paths(self, paths: Iterable[Path], root: Path) -> List[Path]:
+        """Return the paths that are not ignored, keeping their order.
+
+        Args:
+            paths: Paths to filter (absolute or relative).
+            root: Project root for relative path calculation.
+
+        Returns:
+            Paths that do not match any ignore pattern.
+        """
+        paths = list(paths)
+        return [
+            p for p, ignored in zip(paths, self.match_many(paths, root)) if not ignored
+        ]
 
     def get_exclude_patterns(self) -> List[str]:
         """Get patterns suitable for scanner --exclude flags.
@@ -204,7 +324,7 @@ def filter_paths_with_ignore(
 
     if paths:
         original_count = len(paths)
-        paths = [p for p in paths if not ignore_patterns.matches(p, project_root)]
+        paths = ignore_patterns.filter_paths(paths, project_root)
         filtered_count = original_count - len(paths)
         if filtered_count > 0:
             LOGGER.debug(f"Filtered {filtered_count} files via ignore patterns")
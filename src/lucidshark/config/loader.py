@@ -31,7 +31,6 @@ from lucidshark.config.models import (
     SettingsConfig,
     ToolConfig,
 )
-from lucidshark.config.validation import validate_config
 from lucidshark.core.logging import get_logger
 from lucidshark.bootstrap.paths import get_lucidshark_home
 
@@ -80,6 +79,8 @@ def load_config(
     Raises:
         ConfigError: If specified config file doesn't exist or has parse errors.
     """
+    from lucidshark.config.validation import validate_config
+
     sources: List[str] = []
     merged: Dict[str, Any] = {}
 
@@ -325,6 +326,9 @@ def _parse_domain_pipeline_config(
     command = domain_data.get("command")
     pre_command = domain_data.get("pre_command")
     post_command = domain_data.get("post_command")
+    cache = domain_data.get("cache", True)
+    shards = domain_data.get("shards", 0)
+    impact = domain_data.get("impact", False)
     return DomainPipelineConfig(
         enabled=enabled,
         tools=tools,
@@ -333,6 +337,9 @@ def _parse_domain_pipeline_config(
         command=command,
         pre_command=pre_command,
         post_command=post_command,
+        cache=cache,
+        shards=shards,
+        impact=impact,
     )
 
 
@@ -568,6 +575,9 @@ def dict_to_config(data: Dict[str, Any]) -> LucidSharkConfig:
     settings = SettingsConfig(
         strict_mode=settings_data.get("strict_mode", True),
         auto_update=settings_data.get("auto_update", True),
+        jvm_worker=settings_data.get("jvm_worker", False),
+        scala_build_server=settings_data.get("scala_build_server", False),
+        typescript_build=settings_data.get("typescript_build", False),
     )
 
     return LucidSharkConfig(
@@ -121,6 +121,11 @@ class DomainPipelineConfig:
         None  # Shell command to run before main command (e.g., cleanup)
     )
     post_command: Optional[str] = None  # Shell command to run after main command
+    cache: bool = (
+        True  # Reuse cached results for unchanged files (linting/type_checking)
+    )
+    shards: Union[int, str] = 0  # Parallel test shards (testing): count, "auto" or 0
+    impact: bool = False  # Run only tests affected by changed files (testing)
 
 
 @dataclass
@@ -270,6 +275,9 @@ class SettingsConfig:
 
     strict_mode: bool = True  # All configured tools must run successfully
     auto_update: bool = True  # Background auto-update (opt out via false)
+    jvm_worker: bool = False  # Run JVM tools in a persistent worker JVM
+    scala_build_server: bool = False  # Reuse an sbt server / Gradle daemon
+    typescript_build: bool = False  # Emitting tsc -b for project references
 
 
 @dataclass
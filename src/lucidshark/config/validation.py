@@ -71,6 +71,9 @@ VALID_TOP_LEVEL_KEYS: Set[str] = {
 VALID_SETTINGS_KEYS: Set[str] = {
     "strict_mode",
     "auto_update",
+    "jvm_worker",
+    "scala_build_server",
+    "typescript_build",
 }
 
 # Valid keys under output section
@@ -101,10 +104,14 @@ VALID_PIPELINE_DOMAIN_KEYS: Set[str] = {
     "command",  # Custom shell command to run instead of plugins
     "pre_command",  # Shell command to run before main command (e.g., cleanup)
     "post_command",  # Shell command to run after main command
+    "cache",  # Reuse cached results for unchanged files
 }
 
-# Valid keys under pipeline.testing section (same as domain keys)
-VALID_PIPELINE_TESTING_KEYS: Set[str] = VALID_PIPELINE_DOMAIN_KEYS
+# Valid keys under pipeline.testing section
+VALID_PIPELINE_TESTING_KEYS: Set[str] = VALID_PIPELINE_DOMAIN_KEYS | {
+    "shards",  # Split tests across parallel processes: count or "auto"
+    "impact",  # Run only tests affected by changed files
+}
 
 # Valid keys under pipeline.coverage section
 VALID_PIPELINE_COVERAGE_KEYS: Set[str] = {
@@ -655,6 +662,34 @@ def validate_config(
                                 )
                             )
 
+                    # Validate shards and impact for testing
+                    if domain == "testing":
+                        shards = domain_config.get("shards")
+                        if shards is not None and not (
+                            shards == "auto"
+                            or (
+                                isinstance(shards, int)
+                                and not isinstance(shards, bool)
+                                and shards >= 0
+                            )
+                        ):
+                            warnings.append(
+                                ConfigValidationWarning(
+                                    message="'pipeline.testing.shards' must be a non-negative integer or 'auto'",
+                                    source=source,
+                                    key="pipeline.testing.shards",
+                                )
+                            )
+                        impact = domain_config.get("impact")
+                        if impact is not None and not isinstance(impact, bool):
+                            warnings.append(
+                                ConfigValidationWarning(
+                                    message="'pipeline.testing.impact' must be a boolean",
+                                    source=source,
+                                    key="pipeline.testing.impact",
+                                )
+                            )
+
                     # Validate exclude is a list (if present in domain config)
                     exclude = domain_config.get("exclude")
                     if exclude is not None and not isinstance(exclude, list):
@@ -963,6 +998,38 @@ def validate_config(
                     )
                 )
 
+            jvm_worker = settings.get("jvm_worker")
+            if jvm_worker is not None and not isinstance(jvm_worker, bool):
+                warnings.append(
+                    ConfigValidationWarning(
+                        message="'settings.jvm_worker' must be a boolean",
+                        source=source,
+                        key="settings.jvm_worker",
+                    )
+                )
+
+            scala_build_server = settings.get("scala_build_server")
+            if scala_build_server is not None and not isinstance(
+                scala_build_server, bool
+            ):
+                warnings.append(
+                    ConfigValidationWarning(
+                        message="'settings.scala_build_server' must be a boolean",
+                        source=source,
+                        key="settings.scala_build_server",
+                    )
+                )
+
+            typescript_build = settings.get("typescript_build")
+            if typescript_build is not None and not isinstance(typescript_build, bool):
+                warnings.append(
+                    ConfigValidationWarning(
+                        message="'settings.typescript_build' must be a boolean",
+                        source=source,
+                        key="settings.typescript_build",
+                    )
+                )
+
     return warnings
 
 
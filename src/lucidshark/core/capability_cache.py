@@ -0,0 +1,214 @@
+"""Cache for tool capability probes.
+
+Plugins probe their environment before running a tool: ``pytest --help``
+to see whether pytest-json-report is installed, ``cargo tarpaulin
+--version``, ``<tool> --version`` for the version shown in reports. These
+probes spawn a subprocess on every scan although their answer only changes
+when the tool or its environment is reinstalled.
+
+Probe results are stored in ``cache/capabilities.json`` under
+``LUCIDSHARK_HOME``, or ``~/.lucidshark`` when it is not set, and reused
+while the files they depend on (the binary, its site-packages, project
+config files ...) keep the same modification time and size. Entries also
+expire after ``CAPABILITY_CACHE_TTL`` seconds, which bounds staleness for
+changes no watched file reflects.
+
+Set ``LUCIDSHARK_CAPABILITY_CACHE=0`` to probe on every call.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+from lucidshark.core.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Bump when the on-disk format changes to discard old caches
+CAPABILITY_CACHE_FORMAT = 2
+
+CAPABILITY_CACHE_FILE = "capabilities.json"
+
+CAPABILITY_CACHE_ENV = "LUCIDSHARK_CAPABILITY_CACHE"
+
+# Maximum age of an entry in seconds
+CAPABILITY_CACHE_TTL = 24 * 60 * 60
+
+
+def _stat_fingerprint(paths: Iterable[Path]) -> Optional[List[Any]]:
+    """Describe the state of the watched paths.
+
+    Missing paths are recorded as None so their creation invalidates the
+    entry.
+
+    Returns:
+        One ``[path, mtime_ns, size]`` entry per path, or None if no path
+        exists (nothing would invalidate the entry).
+    """
+    fingerprint: List[Any] = []
+    exists = False
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            fingerprint.append([str(path), None, None])
+            continue
+        exists = True
+        fingerprint.append([str(path), stat.st_mtime_ns, stat.st_size])
+    return fingerprint if exists else None
+
+
+class CapabilityCache:
+    """Probe results keyed by probe name and validated by file stats."""
+
+    def __init__(
+        self, cache_file: Optional[Path], ttl: float = CAPABILITY_CACHE_TTL
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_file: JSON file to persist entries in, or None to keep
+                them in memory only.
+            ttl: Seconds after which an entry is probed again.
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the entries from disk on first use."""
+        if self._entries is None:
+            entries: Dict[str, Dict[str, Any]] = {}
+            if self.cache_file is not None and self.cache_file.exists():
+                try:
+                    data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+                    if data.get("format") == CAPABILITY_CACHE_FORMAT:
+                        entries = data.get("entries", {})
+                except (OSError, ValueError, AttributeError) as e:
+                    LOGGER.debug(f"Ignoring unreadable capability cache: {e}")
+            self._entries = entries
+        return self._entries
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Write the entries atomically."""
+        if self.cache_file is None:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.cache_file.parent, suffix=".tmp", prefix="capabilities"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"format": CAPABILITY_CACHE_FORMAT, "entries": entries}, f)
+            os.replace(tmp, self.cache_file)
+        except OSError as e:
+            LOGGER.debug(f"Failed to write capability cache: {e}")
+
+    def probe(
+        self,
+        name: str,
+        key: Sequence[Any],
+        watched: Iterable[Path],
+        probe: Callable[[], T],
+    ) -> T:
+        """Return a cached probe result, running the probe when stale.
+
+        Args:
+            name: Probe name (e.g. ``"pytest-json-report"``).
+            key: JSON-serializable values identifying the probe target,
+                such as the binary path and working directory.
+            watched: Files and directories whose modification invalidates
+                the result (e.g. the binary and its site-packages).
+            probe: Function computing the result; it must return a
+                JSON-serializable value. Exceptions propagate and nothing
+                is cached.
+
+        Returns:
+            The probe result.
+        """
+        fingerprint = _stat_fingerprint(watched)
+        if fingerprint is None:
+            return probe()
+
+        entry_key = json.dumps([name, *key], default=str)
+        with self._lock:
+            entry = self._load().get(entry_key)
+        now = time.time()
+        if (
+            entry is not None
+            and entry.get("fingerprint") == fingerprint
+            and 0 <= now - entry.get("time", 0) < self.ttl
+        ):
+            return entry["value"]
+
+        value = probe()
+        with self._lock:
+            entries = self._load()
+            entries[entry_key] = {
+                "fingerprint": fingerprint,
+                "time": now,
+                "value": value,
+            }
+            self._save(entries)
+        return value
+
+
+_default_cache: Optional[CapabilityCache] = None
+_default_lock = threading.Lock()
+
+
+def get_capability_cache() -> Optional[CapabilityCache]:
+    """Return the process-wide capability cache.
+
+    Probes describe the machine rather than one project (their keys carry
+    the working directory where it matters), so the cache lives in
+    ``LUCIDSHARK_HOME`` when set and in ``~/.lucidshark`` otherwise, not
+    under the directory the process happened to start in.
+
+    Returns:
+        The process-wide cache, or None if disabled via
+        ``LUCIDSHARK_CAPABILITY_CACHE=0``.
+    """
+    global _default_cache
+
+    if os.environ.get(CAPABILITY_CACHE_ENV, "").strip().lower() in ("0", "false"):
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            from lucidshark.bootstrap.paths import (
+                DEFAULT_HOME_DIR_NAME,
+                LUCIDSHARK_HOME_ENV,
+                LucidsharkPaths,
+            )
+
+            env_home = os.environ.get(LUCIDSHARK_HOME_ENV)
+            home = Path(env_home) if env_home else Path.home() / DEFAULT_HOME_DIR_NAME
+            _default_cache = CapabilityCache(
+                LucidsharkPaths(home).cache_dir / CAPABILITY_CACHE_FILE
+            )
+        return _default_cache
+
+
+def cached_probe(
+    name: str,
+    key: Sequence[Any],
+    watched: Iterable[Path],
+    probe: Callable[[], T],
+) -> T:
+    """Run ``probe`` through the process-wide capability cache.
+
+    See :meth:`CapabilityCache.probe` for the arguments.
+    """
+    cache = get_capability_cache()
+    if cache is None:
+        return probe()
+    return cache.probe(name, key, watched, probe)
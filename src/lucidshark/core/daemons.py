@@ -0,0 +1,54 @@
+"""Tool daemons kept running by long-lived LucidShark processes.
+
+The MCP server and the file watcher scan the same project over and over.
+Plugins may start a tool daemon (such as ``dmypy``) on the first scan of
+such a session and reuse it for later ones; they register a stop function
+here so the daemon is shut down together with the server or watcher.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict
+
+from lucidshark.core.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+_stop_functions: Dict[str, Callable[[], None]] = {}
+_lock = threading.Lock()
+
+
+def register_daemon(key: str, stop: Callable[[], None]) -> None:
+    """Register a running daemon.
+
+    Args:
+        key: Unique daemon identifier (e.g. ``"dmypy:/path/to/project"``).
+            Registering an existing key replaces its stop function.
+        stop: Function stopping the daemon.
+    """
+    with _lock:
+        _stop_functions[key] = stop
+
+
+def unregister_daemon(key: str) -> None:
+    """Forget a daemon that stopped on its own.
+
+    Args:
+        key: Identifier passed to :func:`register_daemon`.
+    """
+    with _lock:
+        _stop_functions.pop(key, None)
+
+
+def shutdown_daemons() -> None:
+    """Stop every registered daemon."""
+    with _lock:
+        stop_functions = list(_stop_functions.items())
+        _stop_functions.clear()
+    for key, stop in stop_functions:
+        try:
+            stop()
+            LOGGER.debug(f"Stopped daemon {key}")
+        except Exception as e:
+            LOGGER.warning(f"Failed to stop daemon {key}: {e}")
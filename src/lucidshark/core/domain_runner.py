@@ -8,7 +8,17 @@ from __future__ import annotations
 
 import subprocess
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Type,
+)
 
 if TYPE_CHECKING:
     from lucidshark.core.models import ToolDomain
@@ -16,6 +26,7 @@ if TYPE_CHECKING:
 from lucidshark.config import LucidSharkConfig
 from lucidshark.core.logging import get_logger
 from lucidshark.core.models import ScanContext, ScanDomain, UnifiedIssue
+from lucidshark.core.result_cache import run_cached
 from lucidshark.core.streaming import StreamEvent, StreamHandler, StreamType
 
 LOGGER = get_logger(__name__)
@@ -143,38 +154,62 @@ EXTENSION_LANGUAGE: Dict[str, str] = {
 }
 
 
+def _select_plugins(
+    plugins: Mapping[str, Type[Any]],
+    names: Iterable[str],
+) -> Dict[str, Type[Any]]:
+    """Resolve the selected plugin names to classes.
+
+    Only the selected plugins are loaded, so unused plugin modules are
+    never imported. Plugins that fail to load are left out.
+
+    Args:
+        plugins: Mapping of plugin_name -> plugin_class (possibly lazy).
+        names: Names of the plugins to keep, in order.
+
+    Returns:
+        Dict of the selected plugins that could be loaded.
+    """
+    selected: Dict[str, Type[Any]] = {}
+    for name in names:
+        plugin_class = plugins.get(name)
+        if plugin_class is not None:
+            selected[name] = plugin_class
+    return selected
+
+
 def filter_plugins_by_language(
-    plugins: Dict[str, Type[Any]],
+    plugins: Mapping[str, Type[Any]],
     project_languages: List[str],
 ) -> Dict[str, Type[Any]]:
     """Filter plugins to only those supporting the project's languages.
 
     Args:
-        plugins: Dict of plugin_name -> plugin_class.
+        plugins: Mapping of plugin_name -> plugin_class.
         project_languages: List of languages from project config.
 
     Returns:
         Filtered dict of plugins that support at least one project language.
     """
     if not project_languages:
-        return plugins
+        return _select_plugins(plugins, plugins)
 
-    filtered = {}
-    for name, cls in plugins.items():
+    languages = [lang.lower() for lang in project_languages]
+    names = []
+    for name in plugins:
         supported_langs = PLUGIN_LANGUAGES.get(name, [])
         # Include plugin if it supports any of the project languages
         # or if the plugin has no language restrictions
         if not supported_langs or any(
-            lang.lower() in [sl.lower() for sl in supported_langs]
-            for lang in project_languages
+            sl.lower() in languages for sl in supported_langs
         ):
-            filtered[name] = cls
+            names.append(name)
 
-    return filtered
+    return _select_plugins(plugins, names)
 
 
 def filter_plugins_by_config(
-    plugins: Dict[str, Type[Any]],
+    plugins: Mapping[str, Type[Any]],
     config: LucidSharkConfig,
     domain: str,
     project_root: Optional[Path] = None,
@@ -186,7 +221,7 @@ def filter_plugins_by_config(
     are configured, auto-detects languages from the project.
 
     Args:
-        plugins: Dict of plugin_name -> plugin_class.
+        plugins: Mapping of plugin_name -> plugin_class.
         config: LucidShark configuration.
         domain: Domain name (linting, type_checking, testing, coverage).
         project_root: Optional project root for auto-detecting languages.
@@ -196,7 +231,9 @@ def filter_plugins_by_config(
     """
     configured_tools = config.pipeline.get_enabled_tool_names(domain)
     if configured_tools:
-        return {name: cls for name, cls in plugins.items() if name in configured_tools}
+        return _select_plugins(
+            plugins, [name for name in plugins if name in configured_tools]
+        )
 
     # Use configured languages or auto-detect from project
     languages = config.project.languages
@@ -211,7 +248,7 @@ def filter_plugins_by_config(
 
 
 def filter_scanners_by_config(
-    scanners: Dict[str, Type[Any]],
+    scanners: Mapping[str, Type[Any]],
     config: LucidSharkConfig,
     domain: str,
 ) -> Dict[str, Type[Any]]:
@@ -221,7 +258,7 @@ def filter_scanners_by_config(
     and opengrep for SAST).
 
     Args:
-        scanners: Dict of scanner_name -> scanner_class.
+        scanners: Mapping of scanner_name -> scanner_class.
         config: LucidShark configuration.
         domain: Scanner domain (sast, sca, iac, container).
 
@@ -230,10 +267,10 @@ def filter_scanners_by_config(
     """
     configured_plugins = config.get_plugins_for_domain(domain)
     if configured_plugins:
-        return {
-            name: cls for name, cls in scanners.items() if name in configured_plugins
-        }
-    return scanners
+        return _select_plugins(
+            scanners, [name for name in scanners if name in configured_plugins]
+        )
+    return _select_plugins(scanners, scanners)
 
 
 def detect_language(path: Path) -> str:
@@ -451,6 +488,73 @@ class DomainRunner:
         merged = IgnorePatterns.merge(context.ignore_patterns, domain_patterns)
         return replace(context, ignore_patterns=merged)
 
+    def _cache_enabled(self, domain: str) -> bool:
+        """Check whether the result cache is enabled for a domain.
+
+        Args:
+            domain: Domain name (linting, type_checking).
+
+        Returns:
+            True unless the domain config sets ``cache: false``.
+        """
+        domain_config = getattr(self.config.pipeline, domain, None)
+        return domain_config is None or domain_config.cache
+
+    def _run_plugin_pool(
+        self,
+        context: ScanContext,
+        names: List[str],
+        run_plugin: Callable[[str, ScanContext], List[UnifiedIssue]],
+        parallel: bool = True,
+    ) -> List[UnifiedIssue]:
+        """Run the plugins of a single domain, concurrently when possible.
+
+        Each plugin runs against its own copy of the context with private
+        ``tools_executed`` and ``tool_skips`` lists. These are merged back
+        into the shared context in plugin order, so the returned issues and
+        bookkeeping match a sequential run regardless of completion order.
+
+        Args:
+            context: Scan context for the domain.
+            names: Plugin names, in the order results should be reported.
+            run_plugin: Callable running one plugin and returning its issues.
+                Must handle its own plugin errors.
+            parallel: If False, run the plugins one at a time.
+
+        Returns:
+            Issues from all plugins, in plugin order.
+        """
+        workers = min(self.config.pipeline.max_workers, len(names))
+        if not parallel or workers <= 1:
+            issues: List[UnifiedIssue] = []
+            for name in names:
+                issues.extend(run_plugin(name, context))
+            return issues
+
+        import copy
+        from concurrent.futures import ThreadPoolExecutor
+
+        plugin_contexts: Dict[str, ScanContext] = {}
+        for name in names:
+            plugin_context = copy.copy(context)
+            plugin_context.tools_executed = []
+            plugin_context.tool_skips = []
+            plugin_contexts[name] = plugin_context
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="lucidshark-plugin"
+        ) as executor:
+            futures = {
+                name: executor.submit(run_plugin, name, plugin_contexts[name])
+                for name in names
+            }
+
+        issues = []
+        for name in names:
+            issues.extend(futures[name].result())
+            context.tools_executed.extend(plugin_contexts[name].tools_executed)
+            context.tool_skips.extend(plugin_contexts[name].tool_skips)
+        return issues
+
     def run_linting(
         self,
         context: ScanContext,
@@ -512,25 +616,28 @@ class DomainRunner:
         linters = filter_plugins_by_config(
             linters, self.config, "linting", self.project_root
         )
+        use_cache = self._cache_enabled("linting")
 
-        for name, plugin_class in linters.items():
+        def run_linter(name: str, ctx: ScanContext) -> List[UnifiedIssue]:
             try:
                 self._log("info", f"Running linter: {name}")
-                plugin = plugin_class(project_root=self.project_root)
+                plugin = linters[name](project_root=self.project_root)
 
                 if fix and plugin.supports_fix:
-                    fix_result = plugin.fix(context)
+                    fix_result = plugin.fix(ctx)
                     self._log(
                         "info",
                         f"{name}: Fixed {fix_result.issues_fixed} issues, "
                         f"{fix_result.issues_remaining} remaining",
                     )
                     # Run again to get remaining issues
-                    issues.extend(plugin.lint(context))
+                    linter_issues = plugin.lint(ctx)
+                elif use_cache:
+                    linter_issues = run_cached(plugin, ctx, "linting", plugin.lint)
                 else:
-                    issues.extend(plugin.lint(context))
+                    linter_issues = plugin.lint(ctx)
 
-                context.tools_executed.append(
+                ctx.tools_executed.append(
                     {
                         "name": name,
                         "domains": ["linting"],
@@ -538,9 +645,16 @@ class DomainRunner:
                         "error": None,
                     }
                 )
+                return linter_issues
 
             except Exception as e:
                 LOGGER.error(f"Linter {name} failed: {e}")
+                return []
+
+        # Fixers rewrite files in place, so they must not run concurrently
+        issues.extend(
+            self._run_plugin_pool(context, list(linters), run_linter, parallel=not fix)
+        )
 
         self._run_post_command(post_command, "post_lint_command")
         return issues
@@ -605,23 +719,23 @@ class DomainRunner:
             formatters, self.config, "formatting", self.project_root
         )
 
-        for name, plugin_class in formatters.items():
+        def run_formatter(name: str, ctx: ScanContext) -> List[UnifiedIssue]:
             try:
                 self._log("info", f"Running formatter: {name}")
-                plugin = plugin_class(project_root=self.project_root)
+                plugin = formatters[name](project_root=self.project_root)
 
                 if fix and plugin.supports_fix:
-                    fix_result = plugin.fix(context)
+                    fix_result = plugin.fix(ctx)
                     self._log(
                         "info",
                         f"{name}: Fixed {fix_result.issues_fixed} issues, "
                         f"{fix_result.issues_remaining} remaining",
                     )
-                    issues.extend(plugin.check(context))
+                    formatter_issues = plugin.check(ctx)
                 else:
-                    issues.extend(plugin.check(context))
+                    formatter_issues = plugin.check(ctx)
 
-                context.tools_executed.append(
+                ctx.tools_executed.append(
                     {
                         "name": name,
                         "domains": ["formatting"],
@@ -629,9 +743,18 @@ class DomainRunner:
                         "error": None,
                     }
                 )
+                return formatter_issues
 
             except Exception as e:
                 LOGGER.error(f"Formatter {name} failed: {e}")
+                return []
+
+        # Formatters rewrite files in place when fixing, so serialize them
+        issues.extend(
+            self._run_plugin_pool(
+                context, list(formatters), run_formatter, parallel=not fix
+            )
+        )
 
         self._run_post_command(post_command, "post_formatting_command")
         return issues
@@ -697,14 +820,20 @@ class DomainRunner:
         checkers = filter_plugins_by_config(
             checkers, self.config, "type_checking", self.project_root
         )
+        use_cache = self._cache_enabled("type_checking")
 
-        for name, plugin_class in checkers.items():
+        def run_checker(name: str, ctx: ScanContext) -> List[UnifiedIssue]:
             try:
                 self._log("info", f"Running type checker: {name}")
-                plugin = plugin_class(project_root=self.project_root)
-                issues.extend(plugin.check(context))
+                plugin = checkers[name](project_root=self.project_root)
+                if use_cache:
+                    checker_issues = run_cached(
+                        plugin, ctx, "type_checking", plugin.check, per_file=False
+                    )
+                else:
+                    checker_issues = plugin.check(ctx)
 
-                context.tools_executed.append(
+                ctx.tools_executed.append(
                     {
                         "name": name,
                         "domains": ["type_checking"],
@@ -712,9 +841,13 @@ class DomainRunner:
                         "error": None,
                     }
                 )
+                return checker_issues
 
             except Exception as e:
                 LOGGER.error(f"Type checker {name} failed: {e}")
+                return []
+
+        issues.extend(self._run_plugin_pool(context, list(checkers), run_checker))
 
         self._run_post_command(post_command, "post_type_check_command")
         return issues
@@ -1308,11 +1441,12 @@ class DomainRunner:
                 runners, self.config, "testing", self.project_root
             )
 
-            for name, plugin_class in runners.items():
+            def run_runner(name: str, ctx: ScanContext) -> List[UnifiedIssue]:
+                runner_issues: List[UnifiedIssue] = []
                 try:
                     self._log("info", f"Running test runner: {name}")
-                    plugin = plugin_class(project_root=self.project_root)
-                    result = plugin.run_tests(context)
+                    plugin = runners[name](project_root=self.project_root)
+                    result = plugin.run_tests(ctx)
 
                     self._log(
                         "info",
@@ -1320,9 +1454,9 @@ class DomainRunner:
                         f"{result.skipped} skipped, {result.errors} errors",
                     )
 
-                    issues.extend(result.issues)
+                    runner_issues.extend(result.issues)
 
-                    context.tools_executed.append(
+                    ctx.tools_executed.append(
                         {
                             "name": name,
                             "domains": ["testing"],
@@ -1333,7 +1467,7 @@ class DomainRunner:
 
                     # Create summary issue if tests failed
                     if not result.success:
-                        issues.append(
+                        runner_issues.append(
                             UnifiedIssue(
                                 id=f"{name}-test-failure",
                                 domain=ToolDomain.TESTING,
@@ -1353,6 +1487,9 @@ class DomainRunner:
                     LOGGER.debug(f"Test runner {name} not available")
                 except Exception as e:
                     LOGGER.error(f"Test runner {name} failed: {e}")
+                return runner_issues
+
+            issues.extend(self._run_plugin_pool(context, list(runners), run_runner))
 
         self._run_post_command(post_command, "testing.post_command")
         return issues
@@ -0,0 +1,238 @@
+"""Project file enumeration with compiled ignore patterns.
+
+Collects the source files of a project for tools that need an explicit
+file list. Gitignore-style exclude patterns are compiled into a single
+``pathspec.PathSpec`` once per pattern set, ``git ls-files`` is used when
+the project is a git repository, and the filesystem fallback walks with
+``os.scandir`` so excluded directories (``node_modules``, ``target``,
+``.git`` ...) are pruned instead of being descended into.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Collection, Iterable, List, Optional, Tuple
+
+import pathspec
+
+from lucidshark.core.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Directories no scan wants to descend into
+DEFAULT_EXCLUDES: Tuple[str, ...] = (
+    ".git/**",
+    "**/node_modules/**",
+    "**/__pycache__/**",
+    "**/.venv/**",
+    "**/venv/**",
+    "**/target/**",
+    "**/build/**",
+    "**/dist/**",
+    "**/.lucidshark/**",
+)
+
+
+@lru_cache(maxsize=64)
+def compile_patterns(patterns: Tuple[str, ...]) -> pathspec.PathSpec:
+    """Compile gitignore-style patterns, reusing earlier compilations.
+
+    Args:
+        patterns: Gitignore-style patterns (comments and blanks allowed).
+
+    Returns:
+        Compiled PathSpec.
+    """
+    clean = [p for p in patterns if p.strip() and not p.strip().startswith("#")]
+    return pathspec.PathSpec.from_lines("gitignore", clean)
+
+
+def _has_negation(patterns: Iterable[str]) -> bool:
+    """Whether any pattern re-includes paths (``!pattern``)."""
+    return any(p.strip().startswith("!") for p in patterns)
+
+
+class FileEnumerator:
+    """Lists project files that are not excluded by ignore patterns."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        exclude_patterns: Iterable[str] = (),
+        include_defaults: bool = True,
+        skip_dirs: Collection[str] = (),
+        skip_hidden_dirs: bool = False,
+    ) -> None:
+        """Initialize the enumerator.
+
+        Args:
+            project_root: Project root directory; paths are matched relative to it.
+            exclude_patterns: Gitignore-style patterns to exclude.
+            include_defaults: Also exclude ``DEFAULT_EXCLUDES``.
+            skip_dirs: Directory names never descended into during a walk.
+            skip_hidden_dirs: Do not descend into directories starting with ".".
+        """
+        patterns = tuple(exclude_patterns)
+        if include_defaults:
+            patterns = DEFAULT_EXCLUDES + patterns
+        self.project_root = project_root
+        self._spec = compile_patterns(patterns)
+        # A negated pattern may re-include files below an excluded directory
+        self._can_prune = not _has_negation(patterns)
+        self._skip_dirs = frozenset(skip_dirs)
+        self._skip_hidden_dirs = skip_hidden_dirs
+
+    def is_excluded(self, relative_path: str) -> bool:
+        """Check a project-relative path against the compiled patterns.
+
+        Args:
+            relative_path: Path relative to the project root.
+
+        Returns:
+            True if the path is excluded.
+        """
+        return self._spec.match_file(relative_path.replace("\\", "/"))
+
+    def _prune_dir(self, name: str, relative_path: str) -> bool:
+        """Whether a walk should skip a directory entirely."""
+        if name in self._skip_dirs:
+            return True
+        if self._skip_hidden_dirs and name.startswith("."):
+            return True
+        return self._can_prune and self._spec.match_file(relative_path + "/")
+
+    def walk(
+        self,
+        extensions: Optional[Collection[str]] = None,
+        start: Optional[Path] = None,
+        max_depth: Optional[int] = None,
+    ) -> List[Path]:
+        """Walk the filesystem, pruning excluded directories.
+
+        Args:
+            extensions: Lowercase file extensions to include (all if None).
+            start: Directory to walk (defaults to the project root).
+            max_depth: Deepest directory level to list (``start`` is 0).
+
+        Returns:
+            Matching file paths in walk order.
+        """
+        root = self.project_root
+        start = start or root
+        try:
+            prefix = start.relative_to(root).as_posix()
+        except ValueError:
+            prefix = ""
+        prefix = "" if prefix == "." else prefix
+
+        files: List[Path] = []
+        stack: List[Tuple[str, str, int]] = [(str(start), prefix, 0)]
+        while stack:
+            directory, rel_dir, depth = stack.pop()
+            descend = max_depth is None or depth < max_depth
+            try:
+                with os.scandir(directory) as entries:
+                    subdirs = []
+                    for entry in entries:
+                        rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        if is_dir:
+                            if descend and not self._prune_dir(entry.name, rel):
+                                subdirs.append((entry.path, rel, depth + 1))
+                            continue
+                        if (
+                            extensions is not None
+                            and os.path.splitext(entry.name)[1].lower()
+                            not in extensions
+                        ):
+                            continue
+                        if not entry.is_file() or self._spec.match_file(rel):
+                            continue
+                        files.append(Path(entry.path))
+            except OSError as e:
+                LOGGER.debug(f"Cannot list {directory}: {e}")
+                continue
+            # Reversed so directories are visited in listing order
+            stack.extend(reversed(subdirs))
+        return files
+
+    def git_files(
+        self, extensions: Optional[Collection[str]] = None
+    ) -> Optional[List[Path]]:
+        """List tracked and untracked-but-not-ignored files via git.
+
+        Args:
+            extensions: Lowercase file extensions to include (all if None).
+
+        Returns:
+            Matching file paths, or None if git cannot list the project.
+        """
+        try:
+            result = subprocess.run(
+                [
+                    "git",
+                    "ls-files",
+                    "-z",
+                    "--cached",
+                    "--others",
+                    "--exclude-standard",
+                ],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            LOGGER.debug(f"git ls-files failed: {e}")
+            return None
+        if result.returncode != 0:
+            return None
+
+        files: List[Path] = []
+        seen = set()
+        for rel in result.stdout.split("\0"):
+            if not rel or rel in seen:
+                continue
+            seen.add(rel)
+            if (
+                extensions is not None
+                and os.path.splitext(rel)[1].lower() not in extensions
+            ):
+                continue
+            if self._spec.match_file(rel):
+                continue
+            path = self.project_root / rel
+            # Deleted but still tracked files are listed by --cached
+            if path.is_file():
+                files.append(path)
+        return files
+
+    def files(
+        self,
+        extensions: Optional[Collection[str]] = None,
+        use_git: bool = True,
+    ) -> List[Path]:
+        """List project files, preferring ``git ls-files`` when available.
+
+        Args:
+            extensions: Lowercase file extensions to include (all if None).
+            use_git: Try ``git ls-files`` before walking the filesystem.
+
+        Returns:
+            Matching file paths.
+        """
+        if use_git:
+            from lucidshark.core.git import is_git_repo
+
+            if is_git_repo(self.project_root):
+                files = self.git_files(extensions)
+                if files is not None:
+                    return files
+                LOGGER.debug("git ls-files failed, falling back to file walk")
+        return self.walk(extensions)
@@ -0,0 +1,213 @@
+"""Project-wide file inventory shared by all plugins of a scan.
+
+The project tree is walked once per :class:`ScanContext` (pruning the
+directories matched by the ignore patterns, and nothing else, like the
+``rglob`` searches it replaces) and the resulting files are indexed by
+extension. Plugins ask the
+inventory for their files instead of running their own ``rglob`` per
+extension.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Collection, Dict, Iterable, List, Optional, Tuple
+
+from lucidshark.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from lucidshark.config.ignore import IgnorePatterns
+
+LOGGER = get_logger(__name__)
+
+
+class FileInventory:
+    """Files of one project, indexed by extension and language.
+
+    The walk happens on first use and is thread-safe, so domains running
+    concurrently share a single walk.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        ignore_patterns: Optional["IgnorePatterns"] = None,
+    ) -> None:
+        """Initialize the inventory.
+
+        Args:
+            project_root: Project root directory.
+            ignore_patterns: Patterns whose matches are left out.
+        """
+        self.project_root = project_root
+        self._ignore_patterns = ignore_patterns
+        self._lock = threading.Lock()
+        self._by_extension: Optional[Dict[str, List[Path]]] = None
+
+    def _index(self) -> Dict[str, List[Path]]:
+        """Walk the project once and index files by lowercase extension."""
+        with self._lock:
+            if self._by_extension is None:
+                from lucidshark.core.file_enumeration import FileEnumerator
+
+                patterns = (
+                    self._ignore_patterns.get_exclude_patterns()
+                    if self._ignore_patterns is not None
+                    else []
+                )
+                files = FileEnumerator(
+                    self.project_root, patterns, include_defaults=False
+                ).walk()
+
+                index: Dict[str, List[Path]] = {}
+                for path in sorted(files):
+                    index.setdefault(path.suffix.lower(), []).append(path)
+                self._by_extension = index
+                LOGGER.debug(f"Indexed {len(files)} files under {self.project_root}")
+            return self._by_extension
+
+    def files(self) -> List[Path]:
+        """Return every file in the inventory, sorted."""
+        return sorted(p for paths in self._index().values() for p in paths)
+
+    def with_extensions(self, extensions: Iterable[str]) -> List[Path]:
+        """Return the files having any of the given extensions.
+
+        Args:
+            extensions: Extensions including the dot (e.g. ``{".py"}``).
+
+        Returns:
+            Sorted list of matching files.
+        """
+        index = self._index()
+        found: List[Path] = []
+        for ext in {e.lower() for e in extensions}:
+            found.extend(index.get(ext, []))
+        return sorted(found)
+
+    def for_language(self, language: str) -> List[Path]:
+        """Return the files of a language (as named by language detection).
+
+        Args:
+            language: Language name (e.g. ``"python"``, ``"c++"``).
+
+        Returns:
+            Sorted list of matching files.
+        """
+        from lucidshark.detection.languages import EXTENSION_MAP
+
+        return self.with_extensions(
+            ext for ext, lang in EXTENSION_MAP.items() if lang == language.lower()
+        )
+
+    def under(
+        self,
+        paths: Iterable[Path],
+        extensions: Iterable[str],
+    ) -> List[Path]:
+        """Return the files with the given extensions below ``paths``.
+
+        Directories select the inventory files they contain. Explicit files
+        are kept if they exist, their extension matches and the ignore
+        patterns do not exclude them, even if they are outside the inventory
+        (e.g. a file the user passed on the command line).
+
+        Args:
+            paths: Files and directories to select from.
+            extensions: Extensions including the dot.
+
+        Returns:
+            Matching files in input order, without duplicates.
+        """
+        extensions = {e.lower() for e in extensions}
+        candidates = self.with_extensions(extensions)
+        found: List[Path] = []
+        seen = set()
+        for path in paths:
+            if path.is_dir():
+                selected = self._files_in_dir(path, candidates, extensions)
+            elif (
+                path.suffix.lower() in extensions
+                and path.is_file()
+                and not self._is_ignored(path)
+            ):
+                selected = [path]
+            else:
+                selected = []
+            for f in selected:
+                if f not in seen:
+                    seen.add(f)
+                    found.append(f)
+        return found
+
+    def _is_ignored(self, path: Path) -> bool:
+        """Whether the ignore patterns exclude an explicit file."""
+        return self._ignore_patterns is not None and self._ignore_patterns.matches(
+            path, self.project_root
+        )
+
+    def _files_in_dir(
+        self,
+        directory: Path,
+        candidates: List[Path],
+        extensions: Collection[str],
+    ) -> List[Path]:
+        """Select the candidates inside ``directory``."""
+        root = self.project_root
+        if not directory.is_absolute():
+            directory = root / directory
+        try:
+            rel = directory.relative_to(root)
+        except ValueError:
+            try:
+                rel = directory.resolve().relative_to(root.resolve())
+            except ValueError:
+                # Outside the project: not covered by the inventory
+                from lucidshark.core.file_enumeration import FileEnumerator
+
+                return sorted(
+                    FileEnumerator(directory, include_defaults=False).walk(extensions)
+                )
+        base = root / rel
+        return [f for f in candidates if f.is_relative_to(base)]
+
+    def count_by_extension(self) -> Dict[str, int]:
+        """Return the number of files per lowercase extension."""
+        return {ext: len(paths) for ext, paths in self._index().items()}
+
+
+class InventoryCache:
+    """Holds the inventories of a scan context and its shallow copies.
+
+    Domain runners hand each plugin a shallow copy of the context; they all
+    reference the same cache, so the project is walked once per scan and
+    set of ignore patterns.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[Path, Tuple[str, ...]], FileInventory] = {}
+
+    def get(
+        self,
+        project_root: Path,
+        ignore_patterns: Optional["IgnorePatterns"],
+    ) -> FileInventory:
+        """Return the inventory for the given root and ignore patterns.
+
+        Inventories are keyed by the root and the patterns themselves, so
+        equal pattern sets share one walk.
+        """
+        patterns = (
+            tuple(ignore_patterns.get_exclude_patterns())
+            if ignore_patterns is not None
+            else ()
+        )
+        key = (project_root, patterns)
+        with self._lock:
+            inventory = self._entries.get(key)
+            if inventory is None:
+                inventory = FileInventory(project_root, ignore_patterns)
+                self._entries[key] = inventory
+            return inventory
@@ -13,43 +13,41 @@ from typing import List, Optional, Set, Tuple
 
 import pathspec
 
+from lucidshark.config.ignore import RelativePathResolver
 from lucidshark.config.models import IgnoreIssueEntry
 from lucidshark.core.models import UnifiedIssue
 
 
-def _normalize_path(file_path: Path, project_root: Path) -> str:
+def _normalize_path(file_path: Path, resolver: RelativePathResolver) -> str:
     """Normalize a file path to a forward-slash relative path for pattern matching.
 
     Args:
         file_path: The file path to normalize.
-        project_root: Project root for relative path calculation.
+        resolver: Memoizing resolver for the project root.
 
     Returns:
         Forward-slash normalized path string suitable for pathspec matching.
     """
-    try:
-        resolved = file_path.resolve() if file_path.is_absolute() else file_path
-        root_resolved = project_root.resolve()
-        rel_path = resolved.relative_to(root_resolved)
-    except ValueError:
-        # Path is not relative to project root, use as-is
-        rel_path = file_path
-
-    # pathspec expects forward-slash paths
-    return str(rel_path).replace("\\", "/")
+    if file_path.is_absolute():
+        rel_str = resolver.relative(file_path)
+        if rel_str is not None:
+            return rel_str
+    # Relative or outside the project root, use as-is
+    # (pathspec expects forward-slash paths)
+    return str(file_path).replace("\\", "/")
 
 
 def _matches_spec(
     issue: UnifiedIssue,
     spec: pathspec.PathSpec,
-    project_root: Path,
+    resolver: RelativePathResolver,
 ) -> bool:
     """Check if issue's file_path matches the pre-compiled pathspec.
 
     Args:
         issue: The issue to check.
         spec: Pre-compiled PathSpec for matching.
-        project_root: Project root for relative path calculation.
+        resolver: Memoizing resolver for the project root.
 
     Returns:
         True if the issue's file path matches the spec, False otherwise.
@@ -58,7 +56,7 @@ def _matches_spec(
     if issue.file_path is None:
         return False  # No file path = can't match paths filter
 
-    rel_str = _normalize_path(issue.file_path, project_root)
+    rel_str = _normalize_path(issue.file_path, resolver)
     return spec.match_file(rel_str)
 
 
@@ -118,6 +116,8 @@ def apply_ignore_issues(
 
     # Track which rule IDs actually matched
     matched_rule_ids: Set[str] = set()
+    # Resolves the root once and each issue directory once
+    resolver = RelativePathResolver(project_root)
 
     # Apply ignores
     for issue in issues:
@@ -126,7 +126,7 @@ def apply_ignore_issues(
 
             # Check paths filter if specified (compiled_spec is set when paths is non-empty)
             if compiled_spec is not None:
-                if not _matches_spec(issue, compiled_spec, project_root):
+                if not _matches_spec(issue, compiled_spec, resolver):
                     continue  # Skip - path doesn't match
 
             issue.ignored = True
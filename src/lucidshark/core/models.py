@@ -3,7 +3,18 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from lucidshark.core.file_inventory import FileInventory, InventoryCache
 
 if TYPE_CHECKING:
     from lucidshark.config.ignore import IgnorePatterns
@@ -202,6 +213,13 @@ class ScanContext:
     tools_executed: List[Dict[str, Any]] = field(default_factory=list)
     # True if --all-files was used (full project scan vs incremental)
     all_files: bool = False
+    # True in long-lived processes (MCP server, file watcher) where plugins
+    # may keep tool daemons running between scans (see core.daemons)
+    persistent_tools: bool = False
+    # Project file inventory, shared with shallow copies of this context
+    inventory_cache: InventoryCache = field(
+        default_factory=InventoryCache, repr=False, compare=False
+    )
 
     def record_skip(
         self,
@@ -256,6 +274,39 @@ class ScanContext:
             return []
         return self.ignore_patterns.get_exclude_patterns()
 
+    def get_file_inventory(self) -> FileInventory:
+        """Get the project-wide file inventory.
+
+        The project is walked once per scan, with ignore patterns applied,
+        and the result is shared by every plugin.
+
+        Returns:
+            FileInventory for the project root.
+        """
+        return self.inventory_cache.get(self.project_root, self.ignore_patterns)
+
+    def find_files(
+        self,
+        extensions: Iterable[str],
+        paths: Optional[Iterable[Path]] = None,
+    ) -> List[Path]:
+        """Find the files with the given extensions in the scan paths.
+
+        Directories are expanded from the file inventory; explicit files are
+        kept unless they are missing or excluded by the ignore patterns.
+
+        Args:
+            extensions: File extensions including the dot (e.g. ``{".py"}``).
+            paths: Files and directories to search (defaults to ``paths``,
+                or the whole project if there are none).
+
+        Returns:
+            Matching files from the file inventory.
+        """
+        if paths is None:
+            paths = self.paths or [self.project_root]
+        return self.get_file_inventory().under(paths, extensions)
+
     @classmethod
     def create(
         cls,
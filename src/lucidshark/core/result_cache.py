@@ -0,0 +1,541 @@
+"""Content-addressed result cache for linters and type checkers.
+
+Stores the issues a tool reported for each file under
+``.lucidshark/cache/results/{tool}.json`` so unchanged files are not
+re-analyzed on the next scan. An entry is reused only when all of the
+following are unchanged:
+
+- the tool name and version (``get_version()``)
+- the effective configuration (lucidshark tool options, exclude patterns
+  and the tool's own config files at the project root, plus those given by
+  ``cache_config_paths``)
+- for type checkers, the installed dependencies they read (the
+  modification times of the paths given by ``cache_environment``)
+- the SHA-256 of the file content
+
+Linters whose findings depend only on the file being linted opt in per
+file via ``cache_extensions``. Type checkers analyze the whole program, so
+their results are cached under a single key covering every matching
+source file in the project.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from lucidshark.core.logging import get_logger
+from lucidshark.core.models import (
+    ScanContext,
+    Severity,
+    ToolDomain,
+    UnifiedIssue,
+    parse_domain,
+)
+
+LOGGER = get_logger(__name__)
+
+# Bump when the on-disk format changes to discard old caches
+RESULT_CACHE_FORMAT = 2
+
+# Cache subdirectory under .lucidshark/cache
+RESULT_CACHE_DIR = "results"
+
+# Index key used for whole-project (type checker) entries
+_PROJECT_KEY = "<project>"
+
+# Key marking a metadata value encoded with its type
+_TYPE_TAG = "__type__"
+
+# Tool versions that cannot identify a build of the tool
+_UNKNOWN_VERSIONS = {"", "unknown"}
+
+
+def hash_file(path: Path) -> Optional[str]:
+    """Compute the SHA-256 of a file's content.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Hex digest, or None if the file cannot be read.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a metadata value so that it survives a JSON round trip.
+
+    Tuples and paths are tagged with their type; JSON types are kept.
+
+    Raises:
+        TypeError: For values that cannot be restored exactly.
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode_value(v) for v in value]
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value) or _TYPE_TAG in value:
+            raise TypeError("Cannot cache a dict with non-string or reserved keys")
+        return {k: _encode_value(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return {_TYPE_TAG: "tuple", "items": [_encode_value(v) for v in value]}
+    if isinstance(value, PurePath):
+        return {_TYPE_TAG: "path", "value": str(value)}
+    raise TypeError(f"Cannot cache a value of type {type(value).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    """Restore a value encoded by :func:`_encode_value`."""
+    if isinstance(value, list):
+        return [_decode_value(v) for v in value]
+    if isinstance(value, dict):
+        tag = value.get(_TYPE_TAG)
+        if tag == "tuple":
+            return tuple(_decode_value(v) for v in value["items"])
+        if tag == "path":
+            return Path(value["value"])
+        return {k: _decode_value(v) for k, v in value.items()}
+    return value
+
+
+def issue_to_dict(issue: UnifiedIssue, project_root: Path) -> Dict[str, Any]:
+    """Serialize an issue for the cache.
+
+    File paths are stored relative to the project root, and metadata is
+    encoded so it is restored with its original types.
+
+    Args:
+        issue: Issue to serialize.
+        project_root: Project root directory.
+
+    Returns:
+        JSON-compatible dictionary.
+
+    Raises:
+        TypeError: If a field or metadata value cannot be restored exactly.
+    """
+    data: Dict[str, Any] = {
+        name: _encode_value(value)
+        for name, value in vars(issue).items()
+        if name not in ("domain", "severity", "file_path")
+    }
+    data["domain"] = issue.domain.value
+    data["severity"] = issue.severity.value
+    if issue.file_path is not None:
+        data["file_path"] = _relative_key(issue.file_path, project_root)
+    return data
+
+
+def issue_from_dict(data: Dict[str, Any], project_root: Path) -> UnifiedIssue:
+    """Deserialize an issue stored by :func:`issue_to_dict`.
+
+    Args:
+        data: Serialized issue.
+        project_root: Project root directory.
+
+    Returns:
+        UnifiedIssue with an absolute file path.
+    """
+    values = {name: _decode_value(value) for name, value in data.items()}
+    values["domain"] = parse_domain(values["domain"]) or ToolDomain.LINTING
+    values["severity"] = Severity(values["severity"])
+    if values.get("file_path") is not None:
+        values["file_path"] = project_root / values["file_path"]
+    return UnifiedIssue(**values)
+
+
+def _relative_key(path: Path, project_root: Path) -> str:
+    """Return the project-relative posix key for a path."""
+    if not path.is_absolute():
+        path = project_root / path
+    try:
+        return path.resolve().relative_to(project_root.resolve()).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of a path in nanoseconds, or None if it is missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def compute_fingerprint(
+    tool: str,
+    version: str,
+    context: ScanContext,
+    domain: str,
+    config_files: Tuple[str, ...] = (),
+    environment: Sequence[Path] = (),
+) -> str:
+    """Hash everything besides file content that affects a tool's results.
+
+    Args:
+        tool: Tool name.
+        version: Tool version.
+        context: Scan context.
+        domain: Pipeline domain the tool runs in (linting, type_checking).
+        config_files: Tool config files relative to the project root (or
+            absolute).
+        environment: Paths whose modification time changes when installed
+            dependencies change (site-packages, ``node_modules`` markers).
+
+    Returns:
+        Hex digest identifying the tool configuration.
+    """
+    tool_options: Dict[str, Any] = {}
+    domain_config = getattr(context.config.pipeline, domain, None)
+    for tool_config in getattr(domain_config, "tools", None) or []:
+        if tool_config.name == tool:
+            tool_options = dict(vars(tool_config))
+
+    config_hashes = {
+        name: hash_file(context.project_root / name) for name in sorted(config_files)
+    }
+    environment_mtimes = {
+        str(path): _mtime_ns(path) for path in sorted(set(environment))
+    }
+    payload = {
+        "format": RESULT_CACHE_FORMAT,
+        "tool": tool,
+        "version": version,
+        "project_root": str(context.project_root.resolve()),
+        "options": tool_options,
+        "exclude": sorted(context.get_exclude_patterns()),
+        "config_files": config_hashes,
+        "environment": environment_mtimes,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def expand_files(
+    context: ScanContext,
+    extensions: Tuple[str, ...],
+    paths: Optional[List[Path]] = None,
+) -> List[Path]:
+    """Expand scan paths into the source files a tool would analyze.
+
+    Directories are walked recursively, skipping well-known vendor and
+    build directories as well as anything matched by the ignore patterns.
+
+    Args:
+        context: Scan context.
+        extensions: Lowercase file extensions to include.
+        paths: Paths to expand (defaults to ``context.paths``).
+
+    Returns:
+        Sorted, de-duplicated list of resolved file paths.
+    """
+    from lucidshark.core.file_enumeration import FileEnumerator
+    from lucidshark.detection.languages import SKIP_DIRS
+
+    root = context.project_root
+    ignore = context.ignore_patterns
+    enumerator = FileEnumerator(
+        root,
+        ignore.get_exclude_patterns() if ignore is not None else (),
+        include_defaults=False,
+        skip_dirs=SKIP_DIRS,
+        skip_hidden_dirs=True,
+    )
+    files = set()
+
+    for path in context.paths if paths is None else paths:
+        path = path if path.is_absolute() else root / path
+        if path.is_file():
+            if path.suffix.lower() in extensions and not (
+                ignore is not None and ignore.matches(path, root)
+            ):
+                files.add(path.resolve())
+            continue
+        if path.is_dir():
+            files.update(f.resolve() for f in enumerator.walk(extensions, start=path))
+
+    return sorted(files)
+
+
+class ResultCache:
+    """Per-tool store of cached issues keyed by file content hash."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        tool: str,
+        fingerprint: str,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            project_root: Project root directory.
+            tool: Tool name (one index file per tool).
+            fingerprint: Tool/config fingerprint from :func:`compute_fingerprint`.
+            cache_dir: Override for the cache directory (defaults to
+                ``.lucidshark/cache/results``).
+        """
+        if cache_dir is None:
+            from lucidshark.bootstrap.paths import LucidsharkPaths
+
+            cache_dir = (
+                LucidsharkPaths.for_project(project_root).cache_dir / RESULT_CACHE_DIR
+            )
+        self._project_root = project_root
+        self._fingerprint = fingerprint
+        self._path = cache_dir / f"{tool}.json"
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._hashes: Dict[str, Optional[str]] = {}
+        self._dirty = False
+
+    @property
+    def path(self) -> Path:
+        """Location of the cache index file."""
+        return self._path
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the index, discarding it if the fingerprint changed."""
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("format") != RESULT_CACHE_FORMAT
+            or data.get("fingerprint") != self._fingerprint
+        ):
+            LOGGER.debug(f"Discarding stale result cache {self._path}")
+            return {}
+        entries = data.get("files")
+        return entries if isinstance(entries, dict) else {}
+
+    def _file_hash(self, path: Path) -> Tuple[str, Optional[str]]:
+        """Return the index key and (memoized) content hash for a file."""
+        key = _relative_key(path, self._project_root)
+        if key not in self._hashes:
+            self._hashes[key] = hash_file(path)
+        return key, self._hashes[key]
+
+    def lookup(self, files: List[Path]) -> Tuple[List[UnifiedIssue], List[Path]]:
+        """Split files into cached results and files that must be analyzed.
+
+        Args:
+            files: Files to look up.
+
+        Returns:
+            Tuple of (issues for cache hits, files that missed).
+        """
+        issues: List[UnifiedIssue] = []
+        misses: List[Path] = []
+        for path in files:
+            key, digest = self._file_hash(path)
+            entry = self._entries.get(key)
+            if digest is None or entry is None or entry.get("hash") != digest:
+                misses.append(path)
+                continue
+            issues.extend(
+                issue_from_dict(item, self._project_root) for item in entry["issues"]
+            )
+        return issues, misses
+
+    def store(self, files: List[Path], issues: List[UnifiedIssue]) -> None:
+        """Record the issues reported for freshly analyzed files.
+
+        Files without issues are stored with an empty list. Issues for files
+        outside ``files`` are not cached.
+
+        Args:
+            files: Files the tool analyzed.
+            issues: Issues the tool reported for them.
+        """
+        by_file: Dict[str, List[Dict[str, Any]]] = {}
+        for path in files:
+            key, digest = self._file_hash(path)
+            if digest is not None:
+                by_file[key] = []
+        for issue in issues:
+            if issue.file_path is None:
+                continue
+            key = _relative_key(issue.file_path, self._project_root)
+            if key in by_file:
+                try:
+                    by_file[key].append(issue_to_dict(issue, self._project_root))
+                except TypeError as e:
+                    # Analyze the file again next time rather than replay
+                    # an issue that cannot be restored exactly
+                    LOGGER.debug(f"Not caching results for {key}: {e}")
+                    del by_file[key]
+        for key, items in by_file.items():
+            self._entries[key] = {"hash": self._hashes[key], "issues": items}
+        self._dirty = self._dirty or bool(by_file)
+
+    def project_digest(self, files: List[Path], targets: List[Path]) -> str:
+        """Compute a key covering every source file and the scan targets.
+
+        Args:
+            files: All source files the tool may read.
+            targets: Paths the tool is asked to check.
+
+        Returns:
+            Hex digest of the file set and contents.
+        """
+        digest = hashlib.sha256()
+        for target in sorted(_relative_key(p, self._project_root) for p in targets):
+            digest.update(f"target:{target}\n".encode())
+        for path in files:
+            key, file_hash = self._file_hash(path)
+            digest.update(f"{key}:{file_hash}\n".encode())
+        return digest.hexdigest()
+
+    def lookup_project(self, digest: str) -> Optional[List[UnifiedIssue]]:
+        """Return the cached issues for a whole-project key, if present.
+
+        Args:
+            digest: Key from :meth:`project_digest`.
+
+        Returns:
+            Cached issues, or None on a miss.
+        """
+        entry = self._entries.get(_PROJECT_KEY)
+        if entry is None or entry.get("hash") != digest:
+            return None
+        return [issue_from_dict(item, self._project_root) for item in entry["issues"]]
+
+    def store_project(self, digest: str, issues: List[UnifiedIssue]) -> None:
+        """Record the issues for a whole-project key.
+
+        Args:
+            digest: Key from :meth:`project_digest`.
+            issues: Issues reported by the tool.
+        """
+        try:
+            items = [issue_to_dict(i, self._project_root) for i in issues]
+        except TypeError as e:
+            LOGGER.debug(f"Not caching project results: {e}")
+            return
+        self._entries[_PROJECT_KEY] = {"hash": digest, "issues": items}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the index to disk atomically if it changed."""
+        if not self._dirty:
+            return
+        data = {
+            "format": RESULT_CACHE_FORMAT,
+            "fingerprint": self._fingerprint,
+            "files": self._entries,
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self._path.parent, prefix=f".{self._path.stem}-", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, self._path)
+            self._dirty = False
+        except OSError as e:
+            LOGGER.debug(f"Failed to write result cache {self._path}: {e}")
+
+
+def run_cached(
+    plugin: Any,
+    context: ScanContext,
+    domain: str,
+    run: Callable[[ScanContext], List[UnifiedIssue]],
+    per_file: bool = True,
+) -> List[UnifiedIssue]:
+    """Run a linter or type checker through the result cache.
+
+    Plugins without ``cache_extensions`` run directly. Per-file plugins
+    (linters) are only given the files whose cached results are stale;
+    whole-program plugins (type checkers) are skipped entirely when no
+    source file in the project changed.
+    Results are not cached when the run recorded a skip (tool missing,
+    timeout, crash), since its empty output is not a real result.
+
+    Args:
+        plugin: Linter or type checker plugin instance.
+        context: Scan context for this plugin.
+        domain: Pipeline domain (linting, type_checking).
+        run: Callable running the plugin against a context.
+        per_file: If False, cache the results for the project as a whole.
+
+    Returns:
+        Issues for all files in scope, cached and fresh.
+    """
+    from dataclasses import replace
+
+    extensions = tuple(getattr(plugin, "cache_extensions", ()) or ())
+    if not extensions or not context.paths:
+        return run(context)
+
+    version = plugin.get_version()
+    if version in _UNKNOWN_VERSIONS:
+        return run(context)
+
+    config_files = tuple(getattr(plugin, "cache_config_files", ()) or ())
+    cache_config_paths = getattr(plugin, "cache_config_paths", None)
+    if callable(cache_config_paths):
+        config_files += tuple(str(path) for path in cache_config_paths(context))
+    cache_environment = getattr(plugin, "cache_environment", None)
+    fingerprint = compute_fingerprint(
+        plugin.name,
+        version,
+        context,
+        domain,
+        config_files,
+        cache_environment(context) if callable(cache_environment) else (),
+    )
+    cache = ResultCache(context.project_root, plugin.name, fingerprint)
+    skips_before = len(context.tool_skips)
+
+    if not per_file:
+        files = expand_files(context, extensions, [context.project_root])
+        digest = cache.project_digest(files, context.paths)
+        cached = cache.lookup_project(digest)
+        if cached is not None:
+            LOGGER.info(f"{plugin.name}: using cached results (no changes)")
+            return cached
+        issues = run(context)
+        if len(context.tool_skips) == skips_before:
+            cache.store_project(digest, issues)
+            cache.save()
+        return issues
+
+    files = expand_files(context, extensions)
+    if not files:
+        return run(context)
+
+    issues, misses = cache.lookup(files)
+    LOGGER.info(
+        f"{plugin.name}: {len(files) - len(misses)} of {len(files)} files cached"
+    )
+    if not misses:
+        return issues
+
+    # Untouched contexts keep the tool's own path handling (e.g. "." for
+    # the project root); otherwise only the stale files are analyzed
+    run_context = (
+        context if len(misses) == len(files) else replace(context, paths=misses)
+    )
+    # The replaced context shares tool_skips, so skips are still detected
+    fresh = run(run_context)
+    if len(context.tool_skips) == skips_before:
+        cache.store(misses, fresh)
+        cache.save()
+    return issues + fresh
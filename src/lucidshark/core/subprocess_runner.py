@@ -28,6 +28,7 @@ def run_with_streaming(
     stream_handler: Optional[StreamHandler] = None,
     timeout: int = 120,
     capture_output: bool = True,
+    env: Optional[Dict[str, str]] = None,
 ) -> subprocess.CompletedProcess:
     """Run a command with optional streaming output.
 
@@ -44,6 +45,9 @@ def run_with_streaming(
         timeout: Timeout in seconds (default: 120).
         capture_output: Whether to capture output (default: True). If False and
             streaming is enabled, output goes only to the stream handler.
+        env: Environment variables to set for this command only, on top of
+            the current environment. ``os.environ`` is never modified, so
+            tools running concurrently in other threads are unaffected.
 
     Returns:
         CompletedProcess with stdout/stderr captured (if capture_output=True).
@@ -54,6 +58,7 @@ def run_with_streaming(
     """
     handler = stream_handler or NullStreamHandler()
     cwd_str = str(cwd)
+    proc_env = merge_env(env)
 
     # If no streaming requested, use simple subprocess.run for efficiency
     if isinstance(handler, NullStreamHandler):
@@ -65,6 +70,7 @@ def run_with_streaming(
             errors="replace",
             cwd=cwd_str,
             timeout=timeout,
+            env=proc_env,
         )
 
     # Streaming mode with Popen
@@ -83,6 +89,7 @@ def run_with_streaming(
                 encoding="utf-8",
                 errors="replace",
                 cwd=cwd_str,
+                env=proc_env,
             ) as proc
         ):
             # Use a queue to collect output from both streams
@@ -168,6 +175,66 @@ def run_with_streaming(
         raise subprocess.SubprocessError(f"Failed to run {tool_name}: {e}") from e
 
 
+def replay_output(
+    cmd: List[str],
+    tool_name: str,
+    returncode: int,
+    stdout: str,
+    stderr: str,
+    stream_handler: Optional[StreamHandler] = None,
+) -> subprocess.CompletedProcess:
+    """Report the output of a tool run by a persistent worker.
+
+    Emits the output to the stream handler as if the tool had run as a
+    subprocess via :func:`run_with_streaming`.
+
+    Args:
+        cmd: Equivalent command line, recorded in the result.
+        tool_name: Name of the tool (used in stream events).
+        returncode: Exit code of the tool.
+        stdout: Captured standard output.
+        stderr: Captured standard error.
+        stream_handler: Handler for streaming output.
+
+    Returns:
+        CompletedProcess with the given output.
+    """
+    handler = stream_handler or NullStreamHandler()
+    handler.start_tool(tool_name)
+    for stream_type, output in (
+        (StreamType.STDOUT, stdout),
+        (StreamType.STDERR, stderr),
+    ):
+        for line_num, line in enumerate(output.splitlines(), 1):
+            handler.emit(
+                StreamEvent(
+                    tool_name=tool_name,
+                    stream_type=stream_type,
+                    content=line,
+                    line_number=line_num,
+                )
+            )
+    handler.end_tool(tool_name, returncode == 0)
+    return subprocess.CompletedProcess(
+        args=cmd, returncode=returncode, stdout=stdout, stderr=stderr
+    )
+
+
+def merge_env(overlay: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """Build the environment of a child process from an overlay.
+
+    Args:
+        overlay: Variables to add or override (e.g. an extended PATH).
+
+    Returns:
+        A copy of ``os.environ`` updated with ``overlay``, or None (inherit
+        the current environment) if there is nothing to add.
+    """
+    if not overlay:
+        return None
+    return {**os.environ, **overlay}
+
+
 @contextmanager
 def temporary_env(env_vars: Dict[str, str]) -> Generator[None, None, None]:
     """Context manager for temporarily setting environment variables.
@@ -175,6 +242,10 @@ def temporary_env(env_vars: Dict[str, str]) -> Generator[None, None, None]:
     Saves the current state of the specified environment variables,
     sets the new values, and restores the originals on exit.
 
+    This modifies the process-wide ``os.environ`` and is therefore not
+    safe while other threads start subprocesses. Plugins should pass
+    ``env`` to :func:`run_with_streaming` instead.
+
     Args:
         env_vars: Dictionary of environment variable names to values.
 
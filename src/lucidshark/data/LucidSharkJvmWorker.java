@@ -0,0 +1,344 @@
+/*
+ * Persistent JVM worker for LucidShark.
+ *
+ * Runs the main class of JVM-based tools (Checkstyle, PMD, ktlint, detekt,
+ * SpotBugs) inside one long-lived JVM, so their JARs are loaded and
+ * JIT-compiled once instead of on every scan. Started by
+ * lucidshark.plugins.jvm_worker in source-file mode:
+ *
+ *     java -Djava.security.manager=allow LucidSharkJvmWorker.java PORT_FILE IDLE_SECONDS
+ *
+ * with the project root as working directory and the access token in the
+ * LUCIDSHARK_JVM_WORKER_TOKEN environment variable. The listening port is
+ * written to PORT_FILE; the worker exits after IDLE_SECONDS without a
+ * request. Requests are served one at a time (see jvm_worker.py for the
+ * wire format). System.exit() calls made by a tool are intercepted with a
+ * security manager, which is why Java 24+ is not supported.
+ */
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.File;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.net.InetAddress;
+import java.net.ServerSocket;
+import java.net.Socket;
+import java.net.SocketTimeoutException;
+import java.net.URL;
+import java.net.URLClassLoader;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.Paths;
+import java.nio.file.StandardCopyOption;
+import java.security.MessageDigest;
+import java.security.Permission;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.jar.Attributes;
+import java.util.jar.JarFile;
+import java.util.jar.Manifest;
+
+public final class LucidSharkJvmWorker {
+
+    private static final int STATUS_OK = 0;
+    private static final int STATUS_ERROR = 1;
+    private static final int MAX_FIELD_BYTES = 64 * 1024 * 1024;
+
+    /** Thrown in place of terminating the worker when a tool calls System.exit. */
+    private static final class ExitTrapped extends SecurityException {
+        private static final long serialVersionUID = 1L;
+        final int status;
+
+        ExitTrapped(int status) {
+            super("System.exit(" + status + ")");
+            this.status = status;
+        }
+    }
+
+    /** Forwards to the output buffer of the running request. */
+    private static final class SwitchingStream extends OutputStream {
+        private volatile OutputStream target = OutputStream.nullOutputStream();
+
+        void setTarget(OutputStream target) {
+            this.target = target;
+        }
+
+        @Override
+        public void write(int b) throws IOException {
+            target.write(b);
+        }
+
+        @Override
+        public void write(byte[] b, int off, int len) throws IOException {
+            target.write(b, off, len);
+        }
+
+        @Override
+        public void flush() throws IOException {
+            target.flush();
+        }
+
+        @Override
+        public void close() {
+            // Shared by all requests; tools closing System.out must not break it
+        }
+    }
+
+    private static volatile boolean trapExit = false;
+    private static final SwitchingStream OUT = new SwitchingStream();
+    private static final SwitchingStream ERR = new SwitchingStream();
+    private static final Map<String, String> LOADER_STAMPS = new HashMap<>();
+    private static final Map<String, URLClassLoader> LOADERS = new HashMap<>();
+
+    private LucidSharkJvmWorker() {
+    }
+
+    @SuppressWarnings("removal")
+    public static void main(String[] argv) throws Exception {
+        Path portFile = Paths.get(argv[0]);
+        int idleSeconds = Integer.parseInt(argv[1]);
+        String token = System.getenv("LUCIDSHARK_JVM_WORKER_TOKEN");
+        PrintStream log = System.err;
+        if (token == null || token.isEmpty()) {
+            log.println("LUCIDSHARK_JVM_WORKER_TOKEN is not set");
+            System.exit(2);
+        }
+
+        try {
+            System.setSecurityManager(new SecurityManager() {
+                @Override
+                public void checkPermission(Permission perm) {
+                }
+
+                @Override
+                public void checkPermission(Permission perm, Object context) {
+                }
+
+                @Override
+                public void checkExit(int status) {
+                    if (trapExit) {
+                        throw new ExitTrapped(status);
+                    }
+                }
+            });
+        } catch (UnsupportedOperationException | SecurityException e) {
+            log.println("Cannot intercept System.exit: " + e);
+            System.exit(3);
+        }
+
+        ServerSocket server = new ServerSocket(0, 50, InetAddress.getLoopbackAddress());
+        server.setSoTimeout(idleSeconds * 1000);
+        Path tmp = portFile.resolveSibling(portFile.getFileName() + ".tmp");
+        Files.write(tmp, Integer.toString(server.getLocalPort()).getBytes(StandardCharsets.UTF_8));
+        Files.move(tmp, portFile, StandardCopyOption.REPLACE_EXISTING, StandardCopyOption.ATOMIC_MOVE);
+        log.println("Listening on port " + server.getLocalPort());
+
+        System.setOut(new PrintStream(OUT, true, "UTF-8"));
+        System.setErr(new PrintStream(ERR, true, "UTF-8"));
+
+        try {
+            boolean running = true;
+            while (running) {
+                Socket socket;
+                try {
+                    socket = server.accept();
+                } catch (SocketTimeoutException e) {
+                    log.println("Idle for " + idleSeconds + "s, exiting");
+                    break;
+                }
+                try (Socket s = socket) {
+                    running = serve(s, token);
+                } catch (IOException | RuntimeException e) {
+                    log.println("Request failed: " + e);
+                }
+            }
+        } finally {
+            server.close();
+            Files.deleteIfExists(portFile);
+        }
+        // Tools may leave non-daemon threads behind
+        System.exit(0);
+    }
+
+    private static boolean serve(Socket socket, String token) throws IOException {
+        DataInputStream in = new DataInputStream(new BufferedInputStream(socket.getInputStream()));
+        DataOutputStream out = new DataOutputStream(new BufferedOutputStream(socket.getOutputStream()));
+
+        byte[] expected = token.getBytes(StandardCharsets.UTF_8);
+        if (!MessageDigest.isEqual(expected, readBytes(in))) {
+            writeError(out, "invalid token");
+            return true;
+        }
+
+        String op = readString(in);
+        switch (op) {
+            case "ping":
+                writeResult(out, 0, System.getProperty("user.dir").getBytes(StandardCharsets.UTF_8), new byte[0]);
+                return true;
+            case "stop":
+                writeResult(out, 0, new byte[0], new byte[0]);
+                return false;
+            case "run":
+                String mainClass = readString(in);
+                List<String> classpath = readStrings(in);
+                List<String> args = readStrings(in);
+                runTool(out, mainClass, classpath, args.toArray(new String[0]));
+                return true;
+            default:
+                writeError(out, "unknown operation: " + op);
+                return true;
+        }
+    }
+
+    private static void runTool(DataOutputStream out, String mainClass, List<String> classpath, String[] args)
+            throws IOException {
+        Method main;
+        try {
+            if (classpath.isEmpty()) {
+                throw new IOException("empty classpath");
+            }
+            ClassLoader loader = loaderFor(classpath);
+            String name = mainClass.isEmpty() ? manifestMainClass(classpath.get(0)) : mainClass;
+            main = Class.forName(name, true, loader).getMethod("main", String[].class);
+        } catch (Exception | LinkageError e) {
+            writeError(out, "cannot load tool: " + e);
+            return;
+        }
+
+        ByteArrayOutputStream stdout = new ByteArrayOutputStream();
+        ByteArrayOutputStream stderr = new ByteArrayOutputStream();
+        OUT.setTarget(stdout);
+        ERR.setTarget(stderr);
+        // Fresh streams per request: a tool closing System.out only closes its own
+        PrintStream toolOut = new PrintStream(OUT, true, "UTF-8");
+        PrintStream toolErr = new PrintStream(ERR, true, "UTF-8");
+        System.setOut(toolOut);
+        System.setErr(toolErr);
+
+        Thread thread = Thread.currentThread();
+        ClassLoader previous = thread.getContextClassLoader();
+        thread.setContextClassLoader(main.getDeclaringClass().getClassLoader());
+        int exitCode = 0;
+        trapExit = true;
+        try {
+            main.invoke(null, (Object) args);
+        } catch (InvocationTargetException e) {
+            exitCode = exitStatus(e.getCause(), toolErr);
+        } catch (ExitTrapped e) {
+            exitCode = e.status;
+        } catch (Throwable e) {
+            e.printStackTrace(toolErr);
+            exitCode = 1;
+        } finally {
+            trapExit = false;
+            thread.setContextClassLoader(previous);
+            toolOut.flush();
+            toolErr.flush();
+            OUT.setTarget(OutputStream.nullOutputStream());
+            ERR.setTarget(OutputStream.nullOutputStream());
+        }
+        writeResult(out, exitCode, stdout.toByteArray(), stderr.toByteArray());
+    }
+
+    private static int exitStatus(Throwable error, PrintStream err) {
+        for (Throwable t = error; t != null; t = t.getCause()) {
+            if (t instanceof ExitTrapped) {
+                return ((ExitTrapped) t).status;
+            }
+        }
+        error.printStackTrace(err);
+        return 1;
+    }
+
+    /** Class loader of a classpath, recreated when one of its JARs changes. */
+    private static ClassLoader loaderFor(List<String> classpath) throws IOException {
+        StringBuilder key = new StringBuilder();
+        StringBuilder stamp = new StringBuilder();
+        URL[] urls = new URL[classpath.size()];
+        for (int i = 0; i < urls.length; i++) {
+            File jar = new File(classpath.get(i)).getAbsoluteFile();
+            key.append(jar.getPath()).append('\n');
+            stamp.append(jar.lastModified()).append(':').append(jar.length()).append('\n');
+            urls[i] = jar.toURI().toURL();
+        }
+        String cacheKey = key.toString();
+        URLClassLoader loader = LOADERS.get(cacheKey);
+        if (loader != null && !stamp.toString().equals(LOADER_STAMPS.get(cacheKey))) {
+            loader.close();
+            loader = null;
+        }
+        if (loader == null) {
+            loader = new URLClassLoader(urls, ClassLoader.getPlatformClassLoader());
+            LOADERS.put(cacheKey, loader);
+            LOADER_STAMPS.put(cacheKey, stamp.toString());
+        }
+        return loader;
+    }
+
+    private static String manifestMainClass(String jar) throws IOException {
+        try (JarFile file = new JarFile(jar)) {
+            Manifest manifest = file.getManifest();
+            String name = manifest == null ? null : manifest.getMainAttributes().getValue(Attributes.Name.MAIN_CLASS);
+            if (name == null) {
+                throw new IOException("no Main-Class in " + jar);
+            }
+            return name.trim();
+        }
+    }
+
+    private static byte[] readBytes(DataInputStream in) throws IOException {
+        int length = in.readInt();
+        if (length < 0 || length > MAX_FIELD_BYTES) {
+            throw new IOException("invalid field length " + length);
+        }
+        byte[] data = new byte[length];
+        in.readFully(data);
+        return data;
+    }
+
+    private static String readString(DataInputStream in) throws IOException {
+        return new String(readBytes(in), StandardCharsets.UTF_8);
+    }
+
+    private static List<String> readStrings(DataInputStream in) throws IOException {
+        int count = in.readInt();
+        if (count < 0 || count > MAX_FIELD_BYTES) {
+            throw new IOException("invalid list length " + count);
+        }
+        List<String> values = new ArrayList<>(count);
+        for (int i = 0; i < count; i++) {
+            values.add(readString(in));
+        }
+        return values;
+    }
+
+    private static void writeBytes(DataOutputStream out, byte[] data) throws IOException {
+        out.writeInt(data.length);
+        out.write(data);
+    }
+
+    private static void writeResult(DataOutputStream out, int exitCode, byte[] stdout, byte[] stderr)
+            throws IOException {
+        out.writeInt(STATUS_OK);
+        out.writeInt(exitCode);
+        writeBytes(out, stdout);
+        writeBytes(out, stderr);
+        out.flush();
+    }
+
+    private static void writeError(DataOutputStream out, String message) throws IOException {
+        out.writeInt(STATUS_ERROR);
+        writeBytes(out, message.getBytes(StandardCharsets.UTF_8));
+        out.flush();
+    }
+}
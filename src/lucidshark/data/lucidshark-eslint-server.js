@@ -0,0 +1,152 @@
+/*
+ * Persistent ESLint server for LucidShark.
+ *
+ * Runs the project's ESLint command line in one long-lived Node process, so
+ * ESLint, its plugins and parsers are loaded once instead of on every scan.
+ * Started by lucidshark.plugins.linters.eslint_server:
+ *
+ *     node lucidshark-eslint-server.js ESLINT_PACKAGE_DIR PORT_FILE IDLE_SECONDS
+ *
+ * with the project root as working directory and the access token in the
+ * LUCIDSHARK_ESLINT_SERVER_TOKEN environment variable. The listening port is
+ * written to PORT_FILE; the server exits after IDLE_SECONDS without a
+ * request.
+ *
+ * Each connection carries one JSON request line, {"token", "op"} with op
+ * "ping", "stop" or "run" (plus "args", the ESLint command-line arguments),
+ * and receives one JSON response line: {"ok": true, "exitCode", "stdout",
+ * "stderr"} or {"ok": false, "error"}. Requests run one at a time.
+ */
+
+"use strict";
+
+const crypto = require("crypto");
+const fs = require("fs");
+const net = require("net");
+const path = require("path");
+
+const [packageDir, portFile, idleArg] = process.argv.slice(2);
+const idleMs = Number(idleArg) * 1000;
+const token = Buffer.from(process.env.LUCIDSHARK_ESLINT_SERVER_TOKEN || "");
+
+if (!packageDir || !portFile || !token.length) {
+    console.error("usage: LUCIDSHARK_ESLINT_SERVER_TOKEN=... node " +
+        "lucidshark-eslint-server.js ESLINT_PACKAGE_DIR PORT_FILE IDLE_SECONDS");
+    process.exit(2);
+}
+
+// lib/cli.js is not exported by the package, so load it by path
+const cli = require(path.join(packageDir, "lib", "cli.js"));
+
+let queue = Promise.resolve();
+let idleTimer = null;
+let server = null;
+
+function resetIdleTimer() {
+    if (idleTimer) {
+        clearTimeout(idleTimer);
+    }
+    idleTimer = setTimeout(() => {
+        console.error(`Idle for ${idleArg}s, exiting`);
+        shutdown();
+    }, idleMs);
+}
+
+function shutdown() {
+    server.close();
+    fs.rmSync(portFile, { force: true });
+    // Plugins may leave handles (watchers, timers) behind
+    process.exit(0);
+}
+
+function validToken(value) {
+    const given = Buffer.from(String(value || ""));
+    return given.length === token.length && crypto.timingSafeEqual(given, token);
+}
+
+async function runEslint(args) {
+    const stdout = [];
+    const stderr = [];
+    const saved = {
+        log: console.log,
+        info: console.info,
+        warn: console.warn,
+        error: console.error,
+        exitCode: process.exitCode,
+    };
+    const format = (values) => values.map(String).join(" ");
+    console.log = console.info = (...values) => stdout.push(format(values));
+    console.warn = console.error = (...values) => stderr.push(format(values));
+    try {
+        // Same argv layout as process.argv: node, script, args...
+        const exitCode = await cli.execute(["node", "eslint", ...args]);
+        return { ok: true, exitCode, stdout: stdout.join("\n"), stderr: stderr.join("\n") };
+    } catch (error) {
+        stderr.push(String(error && error.stack ? error.stack : error));
+        return { ok: true, exitCode: 2, stdout: stdout.join("\n"), stderr: stderr.join("\n") };
+    } finally {
+        console.log = saved.log;
+        console.info = saved.info;
+        console.warn = saved.warn;
+        console.error = saved.error;
+        process.exitCode = saved.exitCode;
+    }
+}
+
+async function handle(line) {
+    let request;
+    try {
+        request = JSON.parse(line);
+    } catch (error) {
+        return { ok: false, error: `invalid request: ${error.message}` };
+    }
+    if (!validToken(request.token)) {
+        return { ok: false, error: "invalid token" };
+    }
+    switch (request.op) {
+        case "ping":
+            return { ok: true, exitCode: 0, stdout: process.cwd(), stderr: "" };
+        case "stop":
+            return { ok: true, exitCode: 0, stdout: "", stderr: "", stop: true };
+        case "run":
+            if (!Array.isArray(request.args)) {
+                return { ok: false, error: "args must be a list" };
+            }
+            return runEslint(request.args.map(String));
+        default:
+            return { ok: false, error: `unknown operation: ${request.op}` };
+    }
+}
+
+server = net.createServer((socket) => {
+    let buffer = "";
+    socket.setEncoding("utf8");
+    socket.on("data", (chunk) => {
+        buffer += chunk;
+        const newline = buffer.indexOf("\n");
+        if (newline < 0) {
+            return;
+        }
+        const line = buffer.slice(0, newline);
+        socket.removeAllListeners("data");
+        resetIdleTimer();
+        queue = queue.then(async () => {
+            const response = await handle(line);
+            socket.end(JSON.stringify(response) + "\n");
+            if (response.stop) {
+                shutdown();
+            }
+            resetIdleTimer();
+        });
+    });
+    socket.on("error", () => {});
+});
+
+server.listen(0, "127.0.0.1", () => {
+    const port = server.address().port;
+    const tmp = `${portFile}.tmp`;
+    fs.writeFileSync(tmp, String(port));
+    fs.renameSync(tmp, portFile);
+    console.error(`Listening on port ${port}`);
+    resetIdleTimer();
+});
@@ -179,24 +179,14 @@ def _walk_files(root: Path, max_depth: int = 10) -> list[Path]:
     Returns:
         List of file paths.
     """
-    files = []
-
-    def _walk(path: Path, depth: int) -> None:
-        if depth > max_depth:
-            return
-
-        try:
-            for item in path.iterdir():
-                if item.is_dir():
-                    if item.name not in SKIP_DIRS and not item.name.startswith("."):
-                        _walk(item, depth + 1)
-                elif item.is_file():
-                    files.append(item)
-        except PermissionError:
-            pass
-
-    _walk(root, 0)
-    return files
+    from lucidshark.core.file_enumeration import FileEnumerator
+
+    return FileEnumerator(
+        root,
+        include_defaults=False,
+        skip_dirs=SKIP_DIRS,
+        skip_hidden_dirs=True,
+    ).walk(max_depth=max_depth)
 
 
 def _detect_version(language: str, project_root: Path) -> Optional[str]:
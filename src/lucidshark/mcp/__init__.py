@@ -6,19 +6,33 @@ enabling tools like Claude Code to invoke LucidShark checks.
 
 from __future__ import annotations
 
-# These don't require the mcp library
-from lucidshark.mcp.formatter import FixInstruction, InstructionFormatter
-from lucidshark.mcp.tools import MCPToolExecutor
-from lucidshark.mcp.watcher import LucidSharkFileWatcher
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lucidshark.mcp.formatter import FixInstruction, InstructionFormatter
+    from lucidshark.mcp.server import LucidSharkMCPServer
+    from lucidshark.mcp.tools import MCPToolExecutor
+    from lucidshark.mcp.watcher import LucidSharkFileWatcher
+
+# Submodules are imported on first access: the server needs the mcp library,
+# the watcher needs watchdog and the tool executor pulls in the whole pipeline
+_LAZY_ATTRIBUTES = {
+    "LucidSharkMCPServer": "lucidshark.mcp.server",
+    "InstructionFormatter": "lucidshark.mcp.formatter",
+    "FixInstruction": "lucidshark.mcp.formatter",
+    "MCPToolExecutor": "lucidshark.mcp.tools",
+    "LucidSharkFileWatcher": "lucidshark.mcp.watcher",
+}
 
 
 def __getattr__(name: str):
-    """Lazy import for MCP server."""
-    if name == "LucidSharkMCPServer":
-        from lucidshark.mcp.server import LucidSharkMCPServer
+    """Lazy import for MCP components."""
+    module_path = _LAZY_ATTRIBUTES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
 
-        return LucidSharkMCPServer
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_path), name)
 
 
 __all__ = [
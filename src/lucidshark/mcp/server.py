@@ -382,9 +382,12 @@ class LucidSharkMCPServer:
         """Run the MCP server over stdio."""
         LOGGER.info(f"LucidShark MCP server starting for {self.project_root}")
 
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options(),
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(),
+                )
+        finally:
+            self.executor.close()
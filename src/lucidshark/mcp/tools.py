@@ -55,6 +55,12 @@ class MCPToolExecutor:
         # Use DomainRunner with debug logging for MCP (less verbose)
         self._runner = DomainRunner(project_root, config, log_level="debug")
 
+    def close(self) -> None:
+        """Stop the tool daemons started by scans of this session."""
+        from lucidshark.core.daemons import shutdown_daemons
+
+        shutdown_daemons()
+
     def _bootstrap_security_tools(self, security_domains: List[ScanDomain]) -> None:
         """Ensure security tool binaries are available.
 
@@ -1934,7 +1940,7 @@ ignore:
         Returns:
             ScanContext instance.
         """
-        return ScanContext.create(
+        context = ScanContext.create(
             project_root=self.project_root,
             config=self.config,
             enabled_domains=domains,
@@ -1942,6 +1948,10 @@ ignore:
             all_files=all_files,
             stream_handler=stream_handler,
         )
+        # The server and watcher rescan the project repeatedly: keep tool
+        # daemons (e.g. dmypy) alive between scans
+        context.persistent_tools = True
+        return context
 
     async def _run_linting(
         self,
@@ -109,6 +109,7 @@ class LucidSharkFileWatcher:
             self._observer.stop()
             self._observer.join()
             self._observer = None
+        self.executor.close()
         LOGGER.info("File watcher stopped")
 
     def _on_file_change(self, path: Path):
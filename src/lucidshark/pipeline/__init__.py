@@ -4,14 +4,20 @@ Manages the execution of scan pipeline stages:
 1. Scanner execution (parallel by default)
 2. Enricher execution (sequential, in configured order)
 3. Result aggregation (metadata and summary)
+
+Tool domains (linting, testing, ...) are scheduled concurrently by
+DomainScheduler according to their dependencies.
 """
 
 from lucidshark.pipeline.executor import PipelineConfig, PipelineExecutor
 from lucidshark.pipeline.parallel import ParallelScannerExecutor, ScannerResult
+from lucidshark.pipeline.scheduler import DomainScheduler, DomainTask
 
 __all__ = [
     "PipelineConfig",
     "PipelineExecutor",
     "ParallelScannerExecutor",
     "ScannerResult",
+    "DomainScheduler",
+    "DomainTask",
 ]
@@ -0,0 +1,204 @@
+"""Dependency-aware scheduling of tool domains.
+
+Runs independent domains (linting, type checking, duplication, security, ...)
+concurrently on a shared thread pool while honouring ordering constraints
+between domains, such as coverage reading the data produced by testing and
+testing waiting for type checking, whose builds write the same directories.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from lucidshark.core.logging import get_logger
+from lucidshark.core.models import UnifiedIssue
+from lucidshark.pipeline.parallel import DEFAULT_MAX_WORKERS
+
+LOGGER = get_logger(__name__)
+
+
+@dataclass
+class DomainTask:
+    """A unit of work scheduled for a single domain."""
+
+    name: str
+    run: Callable[[], List[UnifiedIssue]]
+    depends_on: List[str] = field(default_factory=list)
+
+
+def domain_dependencies(domain: str, fix: bool = False) -> List[str]:
+    """Return the domains that must finish before ``domain`` may start.
+
+    Args:
+        domain: Domain name (linting, formatting, testing, coverage, ...).
+        fix: Whether auto-fixes are enabled for this scan.
+
+    Returns:
+        List of prerequisite domain names.
+    """
+    dependencies: List[str] = []
+    if domain == "coverage":
+        # Coverage only parses the data files written by the test run
+        dependencies.append("testing")
+    if domain == "testing":
+        # Test runners and type checkers of compiled languages share build
+        # directories (Maven target/classes read by SpotBugs, sbt/Gradle
+        # Scala builds, Cargo targets); running them together races on them
+        dependencies.append("type_checking")
+    if fix and domain != "linting":
+        # Lint fixes and formatters rewrite source files in place; every
+        # other domain must read the result, not a half-written file
+        dependencies.append("linting")
+        if domain != "formatting":
+            dependencies.append("formatting")
+    return dependencies
+
+
+class DomainScheduler:
+    """Executes domain tasks in parallel, respecting their dependencies.
+
+    Tasks whose prerequisites have completed are submitted to a thread pool
+    bounded by ``max_workers``. Results are returned in registration order so
+    the aggregated issue list is deterministic regardless of completion order.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        sequential: bool = False,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_workers: Maximum number of domains running concurrently.
+            sequential: If True, run tasks one at a time in registration order.
+        """
+        self._max_workers = max(1, max_workers)
+        self._sequential = sequential
+        self._tasks: Dict[str, DomainTask] = {}
+
+    def add(
+        self,
+        name: str,
+        run: Callable[[], List[UnifiedIssue]],
+        depends_on: Optional[List[str]] = None,
+    ) -> None:
+        """Register a domain task.
+
+        Dependencies on domains that are never registered are ignored, so
+        callers can declare the full dependency model unconditionally.
+
+        Args:
+            name: Unique task name (usually the domain name).
+            run: Callable returning the issues found by the domain.
+            depends_on: Names of tasks that must complete first.
+        """
+        if name in self._tasks:
+            raise ValueError(f"Domain task '{name}' is already registered")
+        self._tasks[name] = DomainTask(
+            name=name, run=run, depends_on=list(depends_on or [])
+        )
+
+    def execute(self) -> Dict[str, List[UnifiedIssue]]:
+        """Run all registered tasks.
+
+        Returns:
+            Mapping of task name to its issues, in registration order.
+
+        Raises:
+            ValueError: If the dependency graph contains a cycle.
+            Exception: The first exception raised by a task (in registration
+                order). Tasks that depend on a failed task are not started.
+        """
+        self._check_cycles()
+        if not self._tasks:
+            return {}
+        if self._sequential or self._max_workers == 1 or len(self._tasks) == 1:
+            return self._execute_sequential()
+        return self._execute_parallel()
+
+    def _pending_dependencies(self, task: DomainTask) -> List[str]:
+        """Return the registered dependencies of a task."""
+        return [dep for dep in task.depends_on if dep in self._tasks]
+
+    def _check_cycles(self) -> None:
+        """Raise ValueError if the registered tasks form a dependency cycle."""
+        visiting: set[str] = set()
+        done: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at domain '{name}'")
+            visiting.add(name)
+            for dep in self._pending_dependencies(self._tasks[name]):
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self._tasks:
+            visit(name)
+
+    def _execute_sequential(self) -> Dict[str, List[UnifiedIssue]]:
+        """Run tasks one at a time in dependency-respecting order."""
+        completed: Dict[str, List[UnifiedIssue]] = {}
+        remaining = list(self._tasks.values())
+
+        while remaining:
+            # The graph is acyclic, so some remaining task is always ready
+            task = next(
+                t
+                for t in remaining
+                if all(d in completed for d in self._pending_dependencies(t))
+            )
+            remaining.remove(task)
+            LOGGER.debug(f"Running domain: {task.name}")
+            completed[task.name] = task.run() or []
+
+        return {name: completed[name] for name in self._tasks}
+
+    def _execute_parallel(self) -> Dict[str, List[UnifiedIssue]]:
+        """Run ready tasks concurrently until the graph is exhausted."""
+        completed: Dict[str, List[UnifiedIssue]] = {}
+        errors: Dict[str, BaseException] = {}
+        waiting = list(self._tasks.values())
+        running: Dict[Future[List[UnifiedIssue]], str] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(self._tasks)),
+            thread_name_prefix="lucidshark-domain",
+        ) as executor:
+            while waiting or running:
+                # Submit every task whose prerequisites have all succeeded
+                if not errors:
+                    for task in list(waiting):
+                        deps = self._pending_dependencies(task)
+                        if all(d in completed for d in deps):
+                            waiting.remove(task)
+                            LOGGER.debug(f"Starting domain: {task.name}")
+                            running[executor.submit(task.run)] = task.name
+                else:
+                    # A task failed: do not start anything new
+                    waiting.clear()
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        completed[name] = future.result() or []
+                        LOGGER.debug(f"Finished domain: {name}")
+                    except Exception as e:
+                        LOGGER.error(f"Domain {name} failed: {e}")
+                        errors[name] = e
+
+        for name in self._tasks:
+            if name in errors:
+                raise errors[name]
+
+        return {name: completed[name] for name in self._tasks}
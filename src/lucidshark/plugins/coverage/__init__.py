@@ -19,7 +19,7 @@ def discover_coverage_plugins():
     """Discover all installed coverage plugins.
 
     Returns:
-        Dictionary mapping plugin names to plugin classes.
+        Mapping of plugin names to plugin classes (imported on access).
     """
     return discover_plugins(COVERAGE_ENTRY_POINT_GROUP, CoveragePlugin)
 
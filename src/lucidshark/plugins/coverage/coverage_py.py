@@ -114,12 +114,21 @@ class CoveragePyPlugin(CoveragePlugin):
             result.issues.append(self._create_no_data_issue())
             return result
 
-        # Generate JSON report from existing coverage data
-        # Pass explicit data file path to ensure coverage finds it regardless of cwd
-        result = self._generate_and_parse_report(
-            binary, context, threshold, coverage_data
+        # Read the data file directly; generate a JSON report from it when
+        # it holds data the native reader does not handle
+        from lucidshark.plugins.coverage.coverage_py_data import (
+            NativeReportUnavailable,
         )
 
+        try:
+            result = self._read_native_report(binary, context, threshold, coverage_data)
+        except NativeReportUnavailable as e:
+            LOGGER.debug(f"Using coverage json: {e}")
+            # Pass explicit data file path to ensure coverage finds it regardless of cwd
+            result = self._generate_and_parse_report(
+                binary, context, threshold, coverage_data
+            )
+
         # If report generation returned an empty result (failure), add no-data issue
         if result.total_lines == 0 and not result.issues:
             result.issues.append(self._create_no_data_issue())
@@ -139,6 +148,104 @@ class CoveragePyPlugin(CoveragePlugin):
         """
         return detect_source_directory(project_root)
 
+    def _read_native_report(
+        self,
+        binary: Path,
+        context: ScanContext,
+        threshold: float,
+        data_file: Path,
+    ) -> CoverageResult:
+        """Build the coverage result from the .coverage data file directly.
+
+        Produces the numbers ``coverage json`` would, without starting a
+        coverage process. Files matching the ignore patterns are left out.
+
+        Args:
+            binary: Path to coverage binary (identifies the test environment).
+            context: Scan context.
+            threshold: Coverage percentage threshold.
+            data_file: Path to .coverage data file.
+
+        Returns:
+            CoverageResult with coverage statistics.
+
+        Raises:
+            NativeReportUnavailable: If the data must be reported by coverage.py.
+        """
+        from lucidshark.plugins.coverage import coverage_py_data
+
+        project_root = context.project_root
+        coverage_py_data.python_version_matches(binary)
+        exclude = coverage_py_data.load_exclude_regex(project_root)
+        measured = coverage_py_data.read_executed_lines(data_file)
+
+        result = CoverageResult(threshold=threshold, tool="coverage_py")
+        excluded_count = 0
+        for recorded_path, lines in measured.items():
+            file_path = Path(recorded_path)
+            if not file_path.is_absolute():
+                file_path = project_root / file_path
+            if file_path.suffix not in (".py", ".pyw"):
+                raise coverage_py_data.NativeReportUnavailable(
+                    f"Non-Python source {file_path}"
+                )
+            if context.ignore_patterns is not None and context.ignore_patterns.matches(
+                file_path, project_root
+            ):
+                excluded_count += 1
+                LOGGER.debug(f"Excluding from coverage: {file_path}")
+                continue
+
+            try:
+                text = coverage_py_data.read_python_source(file_path)
+            except OSError as e:
+                # Same as --ignore-errors: skip files without source
+                LOGGER.debug(f"Skipping coverage of {file_path}: {e}")
+                continue
+            try:
+                analysis = coverage_py_data.analyze_python_source(text, exclude)
+            except (SyntaxError, ValueError) as e:
+                raise coverage_py_data.NativeReportUnavailable(
+                    f"Cannot analyze {file_path}: {e}"
+                ) from e
+
+            executed = analysis.executed(lines)
+            missing = sorted(analysis.statements - executed)
+            try:
+                rel_path = str(file_path.relative_to(project_root))
+            except ValueError:
+                rel_path = str(file_path)
+            result.files[rel_path] = FileCoverage(
+                file_path=file_path,
+                total_lines=len(analysis.statements),
+                covered_lines=len(executed),
+                missing_lines=missing,
+                excluded_lines=len(analysis.excluded),
+            )
+            result.total_lines += len(analysis.statements)
+            result.covered_lines += len(executed)
+            result.missing_lines += len(missing)
+            result.excluded_lines += len(analysis.excluded)
+
+        # coverage.py reports 100% when there are no statements at all
+        percent_covered = result.percentage if result.total_lines else 100.0
+        if percent_covered < threshold:
+            result.issues.append(
+                self._create_coverage_issue(
+                    percent_covered, threshold, result.total_lines, result.covered_lines
+                )
+            )
+
+        exclude_msg = (
+            f" ({excluded_count} files excluded)" if excluded_count > 0 else ""
+        )
+        LOGGER.info(
+            f"Coverage: {percent_covered:.1f}% "
+            f"({result.covered_lines}/{result.total_lines} lines) "
+            f"- threshold: {threshold}%{exclude_msg}"
+        )
+        return result
+
     def _generate_and_parse_report(
         self,
         binary: Path,
@@ -0,0 +1,493 @@
+"""Native reader for coverage.py data files.
+
+``coverage json`` starts a Python process that loads the ``.coverage``
+SQLite database, analyzes every measured source file and writes a JSON
+document, which LucidShark then parses again. This module produces the
+same line coverage numbers in-process: it queries the database directly,
+decodes the executed-line bitmaps in bulk and finds the statements of each
+file with the same static analysis as coverage.py's ``PythonParser``
+(tokens, bytecode line table, docstrings and exclusion regexes).
+
+Data or settings the reader does not handle exactly raise
+:class:`NativeReportUnavailable` so callers can fall back to
+``coverage json``: branch coverage, file tracer plugins, ``[report]``
+include/omit patterns, non-Python sources, data written by a coverage.py
+release outside :data:`SUPPORTED_COVERAGE_VERSIONS` and analysis under a
+different Python version than the one that measured the code.
+"""
+
+from __future__ import annotations
+
+import ast
+import configparser
+import io
+import os
+import re
+import sqlite3
+import sys
+import token
+import tokenize
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from lucidshark.core.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+# coverage.py's default exclusion regexes (``[report] exclude_lines``)
+DEFAULT_EXCLUDE = [
+    r"#\s*(pragma|PRAGMA)[:\s]?\s*(no|NO)\s*(cover|COVER)",
+    r"^\s*(((async )?def .*?)?[\])]+(\s*->.*?)?:\s*)?\.\.\.\s*(#|$)",
+    r"if (typing\.)?TYPE_CHECKING:",
+]
+
+# Data file schema versions with the tables queried here
+SUPPORTED_SCHEMAS = frozenset({7})
+
+# coverage.py versions (from inclusive, to exclusive) whose statement
+# analysis and default exclusions the reader reproduces. The default
+# ``TYPE_CHECKING`` and ``...`` exclusions first appeared in 7.10.
+SUPPORTED_COVERAGE_VERSIONS = ((7, 10), (8, 0))
+
+# Settings whose effect on a report is not reproduced natively
+UNSUPPORTED_SETTINGS = {
+    "run": ("plugins",),
+    "report": ("include", "omit"),
+}
+
+# Statement-level AST nodes; only these can contain further statements
+_STMT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+# Set bit offsets of every byte value, for decoding line bitmaps
+_BYTE_BITS = [
+    tuple(bit for bit in range(8) if value & (1 << bit)) for value in range(256)
+]
+
+
+class NativeReportUnavailable(Exception):
+    """The data cannot be reported natively; use ``coverage json`` instead."""
+
+
+def read_executed_lines(data_file: Path) -> Dict[str, List[int]]:
+    """Read the executed lines of every measured file.
+
+    Lines recorded under different contexts (e.g. per test) are merged.
+
+    Args:
+        data_file: coverage.py SQLite data file (``.coverage``).
+
+    Returns:
+        Sorted executed line numbers per measured file path, as recorded.
+
+    Raises:
+        NativeReportUnavailable: If the file is not a supported line
+            coverage database.
+    """
+    try:
+        connection = sqlite3.connect(
+            f"{data_file.resolve().as_uri()}?mode=ro", uri=True
+        )
+    except (OSError, sqlite3.Error) as e:
+        raise NativeReportUnavailable(f"Cannot open {data_file}: {e}") from e
+    try:
+        schema = connection.execute("SELECT version FROM coverage_schema").fetchone()
+        if schema is None or schema[0] not in SUPPORTED_SCHEMAS:
+            raise NativeReportUnavailable(f"Unsupported coverage data schema {schema}")
+        meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+        if not _supported_coverage_version(meta.get("version")):
+            raise NativeReportUnavailable(
+                f"Data written by coverage.py {meta.get('version')}"
+            )
+        if meta.get("has_arcs") == "1":
+            raise NativeReportUnavailable("Branch coverage data")
+        if connection.execute(
+            "SELECT 1 FROM tracer WHERE tracer != '' LIMIT 1"
+        ).fetchone():
+            raise NativeReportUnavailable("Files measured by a coverage plugin")
+
+        bitmaps: Dict[str, int] = {
+            path: 0 for (path,) in connection.execute("SELECT path FROM file")
+        }
+        for path, numbits in connection.execute(
+            "SELECT file.path, line_bits.numbits FROM line_bits "
+            "JOIN file ON file.id = line_bits.file_id"
+        ):
+            bitmaps[path] |= int.from_bytes(numbits, "little")
+    except sqlite3.Error as e:
+        raise NativeReportUnavailable(f"Cannot read {data_file}: {e}") from e
+    finally:
+        connection.close()
+
+    return {path: _bitmap_lines(bitmap) for path, bitmap in bitmaps.items()}
+
+
+def _supported_coverage_version(version: Optional[str]) -> bool:
+    """Whether data of a coverage.py version is reported like coverage does."""
+    match = re.match(r"(\d+)\.(\d+)", version or "")
+    if match is None:
+        return False
+    low, high = SUPPORTED_COVERAGE_VERSIONS
+    return low <= (int(match.group(1)), int(match.group(2))) < high
+
+
+def _bitmap_lines(bitmap: int) -> List[int]:
+    """Decode a coverage.py line bitmap (bit N set: line N executed)."""
+    lines: List[int] = []
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for index, byte in enumerate(data):
+        if byte:
+            base = index * 8
+            lines.extend(base + bit for bit in _BYTE_BITS[byte])
+    return lines
+
+
+def load_exclude_regex(project_root: Path) -> str:
+    """Build the line exclusion regex of a project's coverage.py config.
+
+    The config is looked up like coverage.py does: ``$COVERAGE_RCFILE``,
+    ``.coveragerc``, then the ``coverage:`` sections of ``setup.cfg`` and
+    ``tox.ini``, then ``[tool.coverage]`` in ``pyproject.toml``.
+
+    Args:
+        project_root: Project root directory.
+
+    Returns:
+        Regex matching excluded lines.
+
+    Raises:
+        NativeReportUnavailable: If the config uses settings that are not
+            reproduced natively or cannot be read.
+    """
+    settings = _read_coverage_config(project_root)
+    for section, keys in UNSUPPORTED_SETTINGS.items():
+        for key in keys:
+            if settings.get(section, {}).get(key):
+                raise NativeReportUnavailable(f"[{section}] {key} is configured")
+
+    report = settings.get("report", {})
+    exclude = report.get("exclude_lines")
+    regexes = list(DEFAULT_EXCLUDE if exclude is None else exclude)
+    regexes += report.get("exclude_also") or []
+    if any(re.search(r"\$(\w|\{)", regex) for regex in regexes):
+        raise NativeReportUnavailable("Environment variables in exclusion regexes")
+    if len(regexes) == 1:
+        return regexes[0]
+    return "|".join(f"(?:{regex})" for regex in regexes)
+
+
+def _read_coverage_config(project_root: Path) -> Dict[str, Dict[str, List[str]]]:
+    """Read the ``run`` and ``report`` settings of a coverage.py config.
+
+    Returns:
+        Setting values (as lists of lines) per section name.
+    """
+    rcfile = os.environ.get("COVERAGE_RCFILE")
+    candidates = [
+        (Path(rcfile) if rcfile else project_root / ".coveragerc", True),
+        (project_root / "setup.cfg", False),
+        (project_root / "tox.ini", False),
+    ]
+    for path, our_file in candidates:
+        if not path.is_file():
+            continue
+        parser = configparser.RawConfigParser()
+        try:
+            parser.read(path, encoding="utf-8")
+        except (OSError, configparser.Error) as e:
+            raise NativeReportUnavailable(f"Cannot read {path.name}: {e}") from e
+        prefixes = ["", "coverage:"] if our_file else ["coverage:"]
+        settings: Dict[str, Dict[str, List[str]]] = {}
+        for section in ("run", "report"):
+            for prefix in prefixes:
+                if parser.has_section(prefix + section):
+                    settings[section] = {
+                        key: [
+                            line.strip() for line in value.splitlines() if line.strip()
+                        ]
+                        for key, value in parser.items(prefix + section)
+                    }
+                    break
+        if our_file or any(s.startswith("coverage:") for s in parser.sections()):
+            return settings
+
+    pyproject = project_root / "pyproject.toml"
+    if not pyproject.is_file():
+        return {}
+    from lucidshark.plugins.utils import get_tomllib
+
+    tomllib = get_tomllib()
+    try:
+        content = pyproject.read_text(encoding="utf-8")
+        if tomllib is None:
+            if "[tool.coverage" in content:
+                raise NativeReportUnavailable("Cannot parse pyproject.toml")
+            return {}
+        coverage = tomllib.loads(content).get("tool", {}).get("coverage", {})
+    except (OSError, ValueError) as e:
+        raise NativeReportUnavailable(f"Cannot read pyproject.toml: {e}") from e
+    settings = {}
+    for section in ("run", "report"):
+        values = coverage.get(section, {})
+        settings[section] = {
+            key: value if isinstance(value, list) else [str(value)]
+            for key, value in values.items()
+        }
+    return settings
+
+
+def environment_python_version(binary: Path) -> Optional[Tuple[int, int]]:
+    """Python version of the environment a coverage.py script belongs to.
+
+    Args:
+        binary: Path to the ``coverage`` executable.
+
+    Returns:
+        ``(major, minor)``, or None if it cannot be determined without
+        running the interpreter.
+    """
+    pattern = re.compile(r"(\d+)\.(\d+)")
+    try:
+        for line in (binary.parent.parent / "pyvenv.cfg").read_text().splitlines():
+            key, _, value = line.partition("=")
+            if key.strip() in ("version", "version_info"):
+                match = pattern.match(value.strip())
+                if match:
+                    return int(match.group(1)), int(match.group(2))
+    except OSError:
+        pass
+    try:
+        with open(binary, "rb") as f:
+            shebang = f.readline(512).decode("utf-8", "replace")
+    except OSError:
+        return None
+    match = re.search(r"python(\d+)\.(\d+)", shebang)
+    if shebang.startswith("#!") and match:
+        return int(match.group(1)), int(match.group(2))
+    return None
+
+
+def read_python_source(path: Path) -> str:
+    """Read a Python source file the way coverage.py does.
+
+    Args:
+        path: Source file.
+
+    Returns:
+        The decoded source with normalized newlines.
+    """
+    source = path.read_bytes().replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    source = source.replace(b"\f", b" ")
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+    text = source.decode(encoding, "replace")
+    if text and not text.endswith("\n"):
+        text += "\n"
+    return text
+
+
+@dataclass
+class SourceAnalysis:
+    """Statements of a Python source file, as coverage.py finds them."""
+
+    statements: Set[int]
+    excluded: Set[int]
+    multiline: Dict[int, int] = field(default_factory=dict)
+
+    def executed(self, lines: Iterable[int]) -> Set[int]:
+        """Map measured lines to the statements they executed.
+
+        Args:
+            lines: Executed line numbers from the data file.
+        """
+        return {self.multiline.get(line, line) for line in lines} & self.statements
+
+
+def analyze_python_source(text: str, exclude: str) -> SourceAnalysis:
+    """Find the statements and excluded lines of Python source.
+
+    Mirrors coverage.py's ``PythonParser``: statements are the lines with
+    bytecode, mapped to the first line of multi-line statements, without
+    docstrings and excluded code. A line matching ``exclude`` that opens a
+    block (``if``, ``def``, ``class``, decorators...) excludes the block.
+
+    Args:
+        text: Python source.
+        exclude: Regex of excluded lines (empty to exclude nothing).
+
+    Returns:
+        The statement analysis.
+
+    Raises:
+        SyntaxError: If the source cannot be parsed.
+    """
+    tree = ast.parse(text)
+    tokens = list(tokenize.generate_tokens(io.StringIO(text).readline))
+    multiline = _multiline_map(tokens)
+
+    def first_line(line: int) -> int:
+        return multiline.get(line, line)
+
+    excluded = _lines_matching(text, exclude, multiline) if exclude else set()
+    excluded |= _excluded_suites(tokens, excluded)
+
+    raw_statements: Set[int] = set()
+    code = compile(text, "<source>", "exec", dont_inherit=True)
+    for child in _code_objects(code):
+        raw_statements.update(line for _, _, line in child.co_lines() if line)
+
+    excluded = {first_line(line) for line in excluded}
+    docstrings: Set[int] = set()
+    for node in _walk_statement_nodes(tree):
+        if isinstance(
+            node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef, ast.Module)
+        ):
+            if node.body:
+                first = node.body[0]
+                if (
+                    isinstance(first, ast.Expr)
+                    and isinstance(first.value, ast.Constant)
+                    and isinstance(first.value.value, str)
+                ):
+                    docstrings.update(range(first.lineno, (first.end_lineno or 0) + 1))
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            start = min((d.lineno for d in node.decorator_list), default=node.lineno)
+            if excluded.intersection(range(start, node.lineno + 1)):
+                excluded.update(range(start, (node.end_lineno or 0) + 1))
+        if isinstance(node, ast.match_case) and _case_is_irrefutable(node):
+            body = range(node.body[0].lineno, (node.body[-1].end_lineno or 0) + 1)
+            body_statements = raw_statements.intersection(body)
+            if body_statements and body_statements <= excluded:
+                pattern = node.pattern
+                excluded.update(range(pattern.lineno, (pattern.end_lineno or 0) + 1))
+
+    ignore = excluded | docstrings
+    statements = {first_line(line) for line in raw_statements - ignore} - ignore
+    return SourceAnalysis(statements=statements, excluded=excluded, multiline=multiline)
+
+
+def _multiline_map(tokens: Iterable[tokenize.TokenInfo]) -> Dict[int, int]:
+    """Map the lines of multi-line statements to their first line."""
+    multiline: Dict[int, int] = {}
+    first_line = 0
+    for toktype, ttext, (slineno, _), (elineno, _), _ in tokens:
+        if toktype == token.NEWLINE:
+            if first_line and elineno != first_line:
+                for line in range(first_line, elineno + 1):
+                    multiline[line] = first_line
+            first_line = 0
+        if ttext.strip() and toktype != tokenize.COMMENT and not first_line:
+            first_line = slineno
+    return multiline
+
+
+def _lines_matching(text: str, regex: str, multiline: Dict[int, int]) -> Set[int]:
+    """Lines containing a match of a (possibly multi-line) regex."""
+    matches: Set[int] = set()
+    last_start = 0
+    last_start_line = 0
+    for match in re.finditer(regex, text, flags=re.MULTILINE):
+        start, end = match.span()
+        start_line = last_start_line + text.count("\n", last_start, start)
+        end_line = last_start_line + text.count("\n", last_start, end)
+        matches.update(multiline.get(i, i) for i in range(start_line + 1, end_line + 2))
+        last_start = start
+        last_start_line = start_line
+    return matches
+
+
+def _excluded_suites(tokens: List[tokenize.TokenInfo], excluded: Set[int]) -> Set[int]:
+    """Lines of the blocks opened by excluded lines."""
+    suites: Set[int] = set()
+    indent = 0
+    exclude_indent = 0
+    excluding = False
+    first_line = 0
+    nesting = 0
+    for toktype, ttext, (slineno, _), (elineno, _), _ in tokens:
+        if toktype == token.INDENT:
+            indent += 1
+        elif toktype == token.DEDENT:
+            indent -= 1
+        elif toktype == token.OP:
+            if ttext == ":" and nesting == 0:
+                in_suite = excluded | suites
+                if not excluding and in_suite.intersection(
+                    range(first_line, elineno + 1)
+                ):
+                    suites.add(elineno)
+                    exclude_indent = indent
+                    excluding = True
+            elif ttext in "([{":
+                nesting += 1
+            elif ttext in ")]}":
+                nesting -= 1
+        elif toktype == token.NEWLINE:
+            first_line = 0
+
+        if ttext.strip() and toktype != tokenize.COMMENT and not first_line:
+            first_line = slineno
+            if excluding and indent <= exclude_indent:
+                excluding = False
+            if excluding:
+                suites.add(elineno)
+    return suites
+
+
+def _code_objects(code: CodeType) -> Iterator[CodeType]:
+    """Iterate over a code object and all code objects nested in it.
+
+    Deferred annotation functions (``__annotate__``) are skipped, as they
+    usually never run.
+    """
+    stack = [code]
+    while stack:
+        current = stack.pop()
+        stack.extend(c for c in current.co_consts if isinstance(c, CodeType))
+        if current.co_name != "__annotate__":
+            yield current
+
+
+def _walk_statement_nodes(root: ast.AST) -> Iterator[ast.AST]:
+    """Yield ``root`` and its descendant statement-level nodes."""
+    todo = [root]
+    while todo:
+        node = todo.pop()
+        yield node
+        todo.extend(
+            child
+            for child in ast.iter_child_nodes(node)
+            if isinstance(child, _STMT_CONTAINERS)
+        )
+
+
+def _case_is_irrefutable(case: ast.match_case) -> bool:
+    """Whether a ``case`` clause always matches, like ``case _:``."""
+    if case.guard is not None:
+        return False
+    pattern = case.pattern
+    while isinstance(pattern, ast.MatchOr):
+        pattern = pattern.patterns[-1]
+    while isinstance(pattern, ast.MatchAs) and pattern.pattern is not None:
+        pattern = pattern.pattern
+    return isinstance(pattern, ast.MatchAs) and pattern.pattern is None
+
+
+def python_version_matches(binary: Path) -> None:
+    """Check that sources can be analyzed like the measuring interpreter does.
+
+    Which lines have bytecode differs between Python versions, so sources
+    are only analyzed natively under the version that ran the tests.
+
+    Args:
+        binary: Path to the project's ``coverage`` executable.
+
+    Raises:
+        NativeReportUnavailable: If the versions differ or are unknown.
+    """
+    version = environment_python_version(binary)
+    if version != sys.version_info[:2]:
+        raise NativeReportUnavailable(
+            f"Tests ran under Python {version}, LucidShark runs "
+            f"{sys.version_info[0]}.{sys.version_info[1]}"
+        )
@@ -7,10 +7,14 @@ ctest, lcov, clang-format) to avoid code duplication.
 from __future__ import annotations
 
 import hashlib
+import json
 import os
+import re
+import shlex
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from lucidshark.core.logging import get_logger
 
@@ -22,6 +26,121 @@ CPP_EXTENSIONS = {".cpp", ".cc", ".cxx", ".hpp", ".h", ".hh", ".hxx"}
 # C++ source file extensions (excluding headers)
 CPP_SOURCE_EXTENSIONS = {".cpp", ".cc", ".cxx"}
 
+# Compilation database written by CMake (CMAKE_EXPORT_COMPILE_COMMANDS)
+COMPILE_COMMANDS_FILE = "compile_commands.json"
+
+# Matches #include "file" and #include <file>
+_INCLUDE_RE = re.compile(r'^\s*#\s*include\s*([<"])([^>"]+)[>"]', re.MULTILINE)
+
+
+@dataclass
+class CompileCommand:
+    """One translation unit of a compilation database."""
+
+    file: Path
+    directory: Path
+    arguments: List[str]
+
+    def include_dirs(self) -> List[Path]:
+        """Return the ``-I`` and ``-iquote`` directories, in search order."""
+        dirs: List[Path] = []
+        args = self.arguments
+        for i, arg in enumerate(args):
+            value = None
+            for flag in ("-I", "-iquote"):
+                if arg == flag and i + 1 < len(args):
+                    value = args[i + 1]
+                elif arg.startswith(flag) and len(arg) > len(flag):
+                    value = arg[len(flag) :]
+            if value is not None:
+                path = Path(value)
+                dirs.append(path if path.is_absolute() else self.directory / path)
+        return dirs
+
+
+def load_compile_commands(build_dir: Path) -> Dict[Path, CompileCommand]:
+    """Read ``compile_commands.json`` from a build directory.
+
+    Args:
+        build_dir: Build directory (as returned by :func:`find_build_dir`).
+
+    Returns:
+        Compile commands keyed by resolved source path (empty if the
+        database is missing or unreadable).
+    """
+    db_path = build_dir / COMPILE_COMMANDS_FILE
+    try:
+        entries = json.loads(db_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        LOGGER.debug(f"No usable compilation database at {db_path}: {e}")
+        return {}
+
+    commands: Dict[Path, CompileCommand] = {}
+    for entry in entries if isinstance(entries, list) else []:
+        try:
+            directory = Path(entry["directory"])
+            arguments = entry.get("arguments") or shlex.split(entry["command"])
+            file = Path(entry["file"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if not file.is_absolute():
+            file = directory / file
+        file = file.resolve()
+        # The first entry wins, as in clang tooling
+        commands.setdefault(file, CompileCommand(file, directory, list(arguments)))
+    return commands
+
+
+def local_includes(
+    source: Path,
+    include_dirs: Iterable[Path],
+    project_root: Path,
+    parsed: Optional[Dict[Path, List[Tuple[str, str]]]] = None,
+) -> Set[Path]:
+    """Find the project headers a source file includes, transitively.
+
+    Includes are resolved like the preprocessor does for quoted and angled
+    includes (the including file's directory, then the include
+    directories). Headers outside the project (system and third-party
+    headers) are not followed.
+
+    Args:
+        source: Source file.
+        include_dirs: Include directories of the translation unit.
+        project_root: Only headers below this directory are returned.
+        parsed: Optional memo of the includes of each file, shared between
+            calls to avoid re-reading headers.
+
+    Returns:
+        Resolved paths of the included project headers.
+    """
+    parsed = {} if parsed is None else parsed
+    root = project_root.resolve()
+    search_dirs = list(include_dirs)
+    found: Set[Path] = set()
+    stack = [source.resolve()]
+    while stack:
+        current = stack.pop()
+        includes = parsed.get(current)
+        if includes is None:
+            try:
+                text = current.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                text = ""
+            includes = _INCLUDE_RE.findall(text)
+            parsed[current] = includes
+        for kind, name in includes:
+            candidates = [current.parent] if kind == '"' else []
+            for directory in candidates + search_dirs:
+                header = directory / name
+                if header.is_file():
+                    header = header.resolve()
+                    if header.is_relative_to(root) and header not in found:
+                        found.add(header)
+                        stack.append(header)
+                    break
+    return found
+
 
 def find_clang_tidy() -> Path:
     """Find clang-tidy binary in PATH.
@@ -8,9 +8,13 @@ Supports discovering different plugin types:
 
 from __future__ import annotations
 
+import importlib
 import sys
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
 from importlib.metadata import entry_points
-from typing import Dict, List, Type, TypeVar
+from typing import Dict, Iterator, List, Optional, Tuple, Type, TypeVar
 
 from lucidshark.core.logging import get_logger
 
@@ -38,227 +42,402 @@ FORMATTER_ENTRY_POINT_GROUP = "lucidshark.formatters"
 T = TypeVar("T")
 
 
-def _get_frozen_plugins(group: str) -> Dict[str, Type]:
-    """Get plugins for frozen binary (PyInstaller) where entry_points don't work.
-
-    This manually imports and registers all built-in plugins since entry_points()
-    doesn't work in frozen binaries.
+# Built-in plugins for frozen binaries (PyInstaller), where entry_points()
+# doesn't work: group -> [(plugin_name, module_path, class_name), ...]
+FROZEN_PLUGIN_REGISTRY: Dict[str, List[Tuple[str, str, str]]] = {
+    LINTER_ENTRY_POINT_GROUP: [
+        ("ruff", "lucidshark.plugins.linters.ruff", "RuffLinter"),
+        ("eslint", "lucidshark.plugins.linters.eslint", "ESLintLinter"),
+        ("biome", "lucidshark.plugins.linters.biome", "BiomeLinter"),
+        ("clippy", "lucidshark.plugins.linters.clippy", "ClippyLinter"),
+        (
+            "golangci_lint",
+            "lucidshark.plugins.linters.golangci_lint",
+            "GoLangCILintLinter",
+        ),
+        ("checkstyle", "lucidshark.plugins.linters.checkstyle", "CheckstyleLinter"),
+        ("pmd", "lucidshark.plugins.linters.pmd", "PmdLinter"),
+        ("ktlint", "lucidshark.plugins.linters.ktlint", "KtlintLinter"),
+        (
+            "dotnet_format",
+            "lucidshark.plugins.linters.dotnet_format",
+            "DotnetFormatLinter",
+        ),
+        ("clang_tidy", "lucidshark.plugins.linters.clang_tidy", "ClangTidyLinter"),
+        ("scalafix", "lucidshark.plugins.linters.scalafix", "ScalafixLinter"),
+        ("swiftlint", "lucidshark.plugins.linters.swiftlint", "SwiftLintLinter"),
+        ("rubocop", "lucidshark.plugins.linters.rubocop", "RubocopLinter"),
+        ("phpcs", "lucidshark.plugins.linters.phpcs", "PhpcsLinter"),
+    ],
+    SCANNER_ENTRY_POINT_GROUP: [
+        ("trivy", "lucidshark.plugins.scanners.trivy", "TrivyScanner"),
+        ("opengrep", "lucidshark.plugins.scanners.opengrep", "OpenGrepScanner"),
+        ("checkov", "lucidshark.plugins.scanners.checkov", "CheckovScanner"),
+        ("gosec", "lucidshark.plugins.scanners.gosec", "GosecScanner"),
+    ],
+    REPORTER_ENTRY_POINT_GROUP: [
+        ("ai", "lucidshark.plugins.reporters.ai_reporter", "AIReporter"),
+        ("json", "lucidshark.plugins.reporters.json_reporter", "JSONReporter"),
+        ("sarif", "lucidshark.plugins.reporters.sarif_reporter", "SARIFReporter"),
+        (
+            "summary",
+            "lucidshark.plugins.reporters.summary_reporter",
+            "SummaryReporter",
+        ),
+        ("table", "lucidshark.plugins.reporters.table_reporter", "TableReporter"),
+    ],
+    TYPE_CHECKER_ENTRY_POINT_GROUP: [
+        ("mypy", "lucidshark.plugins.type_checkers.mypy", "MypyChecker"),
+        ("pyright", "lucidshark.plugins.type_checkers.pyright", "PyrightChecker"),
+        (
+            "typescript",
+            "lucidshark.plugins.type_checkers.typescript",
+            "TypeScriptChecker",
+        ),
+        (
+            "spotbugs",
+            "lucidshark.plugins.type_checkers.spotbugs",
+            "SpotBugsChecker",
+        ),
+        (
+            "cargo_check",
+            "lucidshark.plugins.type_checkers.cargo_check",
+            "CargoCheckChecker",
+        ),
+        ("go_vet", "lucidshark.plugins.type_checkers.go_vet", "GoVetChecker"),
+        ("detekt", "lucidshark.plugins.type_checkers.detekt", "DetektChecker"),
+        (
+            "dotnet_build",
+            "lucidshark.plugins.type_checkers.dotnet_build",
+            "DotnetBuildChecker",
+        ),
+        (
+            "cppcheck",
+            "lucidshark.plugins.type_checkers.cppcheck",
+            "CppcheckChecker",
+        ),
+        (
+            "scala_compile",
+            "lucidshark.plugins.type_checkers.scala_compile",
+            "ScalaCompileChecker",
+        ),
+        (
+            "swift_compiler",
+            "lucidshark.plugins.type_checkers.swift_compiler",
+            "SwiftCompilerChecker",
+        ),
+        ("sorbet", "lucidshark.plugins.type_checkers.sorbet", "SorbetChecker"),
+        ("phpstan", "lucidshark.plugins.type_checkers.phpstan", "PhpstanChecker"),
+    ],
+    TEST_RUNNER_ENTRY_POINT_GROUP: [
+        ("pytest", "lucidshark.plugins.test_runners.pytest", "PytestRunner"),
+        ("jest", "lucidshark.plugins.test_runners.jest", "JestRunner"),
+        ("karma", "lucidshark.plugins.test_runners.karma", "KarmaRunner"),
+        (
+            "playwright",
+            "lucidshark.plugins.test_runners.playwright",
+            "PlaywrightRunner",
+        ),
+        ("maven", "lucidshark.plugins.test_runners.maven", "MavenTestRunner"),
+        ("cargo", "lucidshark.plugins.test_runners.cargo", "CargoTestRunner"),
+        ("go_test", "lucidshark.plugins.test_runners.go_test", "GoTestRunner"),
+        ("vitest", "lucidshark.plugins.test_runners.vitest", "VitestRunner"),
+        ("mocha", "lucidshark.plugins.test_runners.mocha", "MochaRunner"),
+        (
+            "dotnet_test",
+            "lucidshark.plugins.test_runners.dotnet_test",
+            "DotnetTestRunner",
+        ),
+        ("ctest", "lucidshark.plugins.test_runners.ctest", "CTestRunner"),
+        ("sbt", "lucidshark.plugins.test_runners.sbt", "SbtTestRunner"),
+        (
+            "swift_test",
+            "lucidshark.plugins.test_runners.swift_test",
+            "SwiftTestRunner",
+        ),
+        ("rspec", "lucidshark.plugins.test_runners.rspec", "RspecRunner"),
+        ("phpunit", "lucidshark.plugins.test_runners.phpunit", "PhpunitRunner"),
+    ],
+    COVERAGE_ENTRY_POINT_GROUP: [
+        (
+            "coverage_py",
+            "lucidshark.plugins.coverage.coverage_py",
+            "CoveragePyPlugin",
+        ),
+        ("istanbul", "lucidshark.plugins.coverage.istanbul", "IstanbulPlugin"),
+        ("jacoco", "lucidshark.plugins.coverage.jacoco", "JaCoCoPlugin"),
+        ("tarpaulin", "lucidshark.plugins.coverage.tarpaulin", "TarpaulinPlugin"),
+        ("go_cover", "lucidshark.plugins.coverage.go_cover", "GoCoverPlugin"),
+        (
+            "vitest_coverage",
+            "lucidshark.plugins.coverage.vitest",
+            "VitestCoveragePlugin",
+        ),
+        (
+            "dotnet_coverage",
+            "lucidshark.plugins.coverage.dotnet_coverage",
+            "DotnetCoveragePlugin",
+        ),
+        ("gcov", "lucidshark.plugins.coverage.gcov", "GcovPlugin"),
+        ("lcov", "lucidshark.plugins.coverage.lcov", "LcovPlugin"),
+        ("scoverage", "lucidshark.plugins.coverage.scoverage", "ScoveragePlugin"),
+        (
+            "swift_coverage",
+            "lucidshark.plugins.coverage.swift_coverage",
+            "SwiftCoveragePlugin",
+        ),
+        ("simplecov", "lucidshark.plugins.coverage.simplecov", "SimpleCovPlugin"),
+        (
+            "phpunit_coverage",
+            "lucidshark.plugins.coverage.phpunit_coverage",
+            "PhpunitCoveragePlugin",
+        ),
+    ],
+    DUPLICATION_ENTRY_POINT_GROUP: [
+        ("duplo", "lucidshark.plugins.duplication.duplo", "DuploPlugin"),
+    ],
+    FORMATTER_ENTRY_POINT_GROUP: [
+        (
+            "ruff_format",
+            "lucidshark.plugins.formatters.ruff_format",
+            "RuffFormatter",
+        ),
+        ("prettier", "lucidshark.plugins.formatters.prettier", "PrettierFormatter"),
+        ("rustfmt", "lucidshark.plugins.formatters.rustfmt", "RustfmtFormatter"),
+        ("gofmt", "lucidshark.plugins.formatters.gofmt", "GofmtFormatter"),
+        (
+            "ktlint_format",
+            "lucidshark.plugins.formatters.ktlint_format",
+            "KtlintFormatter",
+        ),
+        (
+            "dotnet_format_whitespace",
+            "lucidshark.plugins.formatters.dotnet_format",
+            "DotnetFormatFormatter",
+        ),
+        (
+            "clang_format",
+            "lucidshark.plugins.formatters.clang_format",
+            "ClangFormatFormatter",
+        ),
+        ("scalafmt", "lucidshark.plugins.formatters.scalafmt", "ScalafmtFormatter"),
+        (
+            "swiftformat",
+            "lucidshark.plugins.formatters.swiftformat",
+            "SwiftFormatFormatter",
+        ),
+        (
+            "rubocop_format",
+            "lucidshark.plugins.formatters.rubocop_format",
+            "RubocopFormatter",
+        ),
+        (
+            "php_cs_fixer",
+            "lucidshark.plugins.formatters.php_cs_fixer",
+            "PhpCsFixerFormatter",
+        ),
+    ],
+}
+
+
+@dataclass(frozen=True)
+class PluginSpec:
+    """Entry point metadata for a plugin, available without importing it."""
+
+    name: str
+    group: str
+    value: str  # "module.path:ClassName"
+
+    def load(self) -> Type:
+        """Import the plugin module and return the plugin class."""
+        module_path, _, attr = self.value.split("[")[0].strip().partition(":")
+        target = importlib.import_module(module_path)
+        for part in attr.split(".") if attr else []:
+            target = getattr(target, part)
+        return target  # type: ignore[return-value]
+
+
+class PluginRegistry:
+    """Process-wide index of plugins, loaded on first use.
+
+    Entry point metadata is read once per group. Plugin modules are only
+    imported when a plugin is actually requested, and loaded classes (as
+    well as load failures) are remembered for the lifetime of the process.
+    Safe to use from multiple threads.
     """
-    plugins: Dict[str, Type] = {}
-
-    # Map of group names to (plugin_name, module_path, class_name) tuples
-    FROZEN_PLUGIN_REGISTRY = {
-        LINTER_ENTRY_POINT_GROUP: [
-            ("ruff", "lucidshark.plugins.linters.ruff", "RuffLinter"),
-            ("eslint", "lucidshark.plugins.linters.eslint", "ESLintLinter"),
-            ("biome", "lucidshark.plugins.linters.biome", "BiomeLinter"),
-            ("clippy", "lucidshark.plugins.linters.clippy", "ClippyLinter"),
-            (
-                "golangci_lint",
-                "lucidshark.plugins.linters.golangci_lint",
-                "GoLangCILintLinter",
-            ),
-            ("checkstyle", "lucidshark.plugins.linters.checkstyle", "CheckstyleLinter"),
-            ("pmd", "lucidshark.plugins.linters.pmd", "PmdLinter"),
-            ("ktlint", "lucidshark.plugins.linters.ktlint", "KtlintLinter"),
-            (
-                "dotnet_format",
-                "lucidshark.plugins.linters.dotnet_format",
-                "DotnetFormatLinter",
-            ),
-            ("clang_tidy", "lucidshark.plugins.linters.clang_tidy", "ClangTidyLinter"),
-            ("scalafix", "lucidshark.plugins.linters.scalafix", "ScalafixLinter"),
-            ("swiftlint", "lucidshark.plugins.linters.swiftlint", "SwiftLintLinter"),
-            ("rubocop", "lucidshark.plugins.linters.rubocop", "RubocopLinter"),
-            ("phpcs", "lucidshark.plugins.linters.phpcs", "PhpcsLinter"),
-        ],
-        SCANNER_ENTRY_POINT_GROUP: [
-            ("trivy", "lucidshark.plugins.scanners.trivy", "TrivyScanner"),
-            ("opengrep", "lucidshark.plugins.scanners.opengrep", "OpenGrepScanner"),
-            ("checkov", "lucidshark.plugins.scanners.checkov", "CheckovScanner"),
-            ("gosec", "lucidshark.plugins.scanners.gosec", "GosecScanner"),
-        ],
-        REPORTER_ENTRY_POINT_GROUP: [
-            ("ai", "lucidshark.plugins.reporters.ai_reporter", "AIReporter"),
-            ("json", "lucidshark.plugins.reporters.json_reporter", "JSONReporter"),
-            ("sarif", "lucidshark.plugins.reporters.sarif_reporter", "SARIFReporter"),
-            (
-                "summary",
-                "lucidshark.plugins.reporters.summary_reporter",
-                "SummaryReporter",
-            ),
-            ("table", "lucidshark.plugins.reporters.table_reporter", "TableReporter"),
-        ],
-        TYPE_CHECKER_ENTRY_POINT_GROUP: [
-            ("mypy", "lucidshark.plugins.type_checkers.mypy", "MypyChecker"),
-            ("pyright", "lucidshark.plugins.type_checkers.pyright", "PyrightChecker"),
-            (
-                "typescript",
-                "lucidshark.plugins.type_checkers.typescript",
-                "TypeScriptChecker",
-            ),
-            (
-                "spotbugs",
-                "lucidshark.plugins.type_checkers.spotbugs",
-                "SpotBugsChecker",
-            ),
-            (
-                "cargo_check",
-                "lucidshark.plugins.type_checkers.cargo_check",
-                "CargoCheckChecker",
-            ),
-            ("go_vet", "lucidshark.plugins.type_checkers.go_vet", "GoVetChecker"),
-            ("detekt", "lucidshark.plugins.type_checkers.detekt", "DetektChecker"),
-            (
-                "dotnet_build",
-                "lucidshark.plugins.type_checkers.dotnet_build",
-                "DotnetBuildChecker",
-            ),
-            (
-                "cppcheck",
-                "lucidshark.plugins.type_checkers.cppcheck",
-                "CppcheckChecker",
-            ),
-            (
-                "scala_compile",
-                "lucidshark.plugins.type_checkers.scala_compile",
-                "ScalaCompileChecker",
-            ),
-            (
-                "swift_compiler",
-                "lucidshark.plugins.type_checkers.swift_compiler",
-                "SwiftCompilerChecker",
-            ),
-            ("sorbet", "lucidshark.plugins.type_checkers.sorbet", "SorbetChecker"),
-            ("phpstan", "lucidshark.plugins.type_checkers.phpstan", "PhpstanChecker"),
-        ],
-        TEST_RUNNER_ENTRY_POINT_GROUP: [
-            ("pytest", "lucidshark.plugins.test_runners.pytest", "PytestRunner"),
-            ("jest", "lucidshark.plugins.test_runners.jest", "JestRunner"),
-            ("karma", "lucidshark.plugins.test_runners.karma", "KarmaRunner"),
-            (
-                "playwright",
-                "lucidshark.plugins.test_runners.playwright",
-                "PlaywrightRunner",
-            ),
-            ("maven", "lucidshark.plugins.test_runners.maven", "MavenTestRunner"),
-            ("cargo", "lucidshark.plugins.test_runners.cargo", "CargoTestRunner"),
-            ("go_test", "lucidshark.plugins.test_runners.go_test", "GoTestRunner"),
-            ("vitest", "lucidshark.plugins.test_runners.vitest", "VitestRunner"),
-            ("mocha", "lucidshark.plugins.test_runners.mocha", "MochaRunner"),
-            (
-                "dotnet_test",
-                "lucidshark.plugins.test_runners.dotnet_test",
-                "DotnetTestRunner",
-            ),
-            ("ctest", "lucidshark.plugins.test_runners.ctest", "CTestRunner"),
-            ("sbt", "lucidshark.plugins.test_runners.sbt", "SbtTestRunner"),
-            (
-                "swift_test",
-                "lucidshark.plugins.test_runners.swift_test",
-                "SwiftTestRunner",
-            ),
-            ("rspec", "lucidshark.plugins.test_runners.rspec", "RspecRunner"),
-            ("phpunit", "lucidshark.plugins.test_runners.phpunit", "PhpunitRunner"),
-        ],
-        COVERAGE_ENTRY_POINT_GROUP: [
-            (
-                "coverage_py",
-                "lucidshark.plugins.coverage.coverage_py",
-                "CoveragePyPlugin",
-            ),
-            ("istanbul", "lucidshark.plugins.coverage.istanbul", "IstanbulPlugin"),
-            ("jacoco", "lucidshark.plugins.coverage.jacoco", "JaCoCoPlugin"),
-            ("tarpaulin", "lucidshark.plugins.coverage.tarpaulin", "TarpaulinPlugin"),
-            ("go_cover", "lucidshark.plugins.coverage.go_cover", "GoCoverPlugin"),
-            (
-                "vitest_coverage",
-                "lucidshark.plugins.coverage.vitest",
-                "VitestCoveragePlugin",
-            ),
-            (
-                "dotnet_coverage",
-                "lucidshark.plugins.coverage.dotnet_coverage",
-                "DotnetCoveragePlugin",
-            ),
-            ("gcov", "lucidshark.plugins.coverage.gcov", "GcovPlugin"),
-            ("lcov", "lucidshark.plugins.coverage.lcov", "LcovPlugin"),
-            ("scoverage", "lucidshark.plugins.coverage.scoverage", "ScoveragePlugin"),
-            (
-                "swift_coverage",
-                "lucidshark.plugins.coverage.swift_coverage",
-                "SwiftCoveragePlugin",
-            ),
-            ("simplecov", "lucidshark.plugins.coverage.simplecov", "SimpleCovPlugin"),
-            (
-                "phpunit_coverage",
-                "lucidshark.plugins.coverage.phpunit_coverage",
-                "PhpunitCoveragePlugin",
-            ),
-        ],
-        DUPLICATION_ENTRY_POINT_GROUP: [
-            ("duplo", "lucidshark.plugins.duplication.duplo", "DuploPlugin"),
-        ],
-        FORMATTER_ENTRY_POINT_GROUP: [
-            (
-                "ruff_format",
-                "lucidshark.plugins.formatters.ruff_format",
-                "RuffFormatter",
-            ),
-            ("prettier", "lucidshark.plugins.formatters.prettier", "PrettierFormatter"),
-            ("rustfmt", "lucidshark.plugins.formatters.rustfmt", "RustfmtFormatter"),
-            ("gofmt", "lucidshark.plugins.formatters.gofmt", "GofmtFormatter"),
-            (
-                "ktlint_format",
-                "lucidshark.plugins.formatters.ktlint_format",
-                "KtlintFormatter",
-            ),
-            (
-                "dotnet_format_whitespace",
-                "lucidshark.plugins.formatters.dotnet_format",
-                "DotnetFormatFormatter",
-            ),
-            (
-                "clang_format",
-                "lucidshark.plugins.formatters.clang_format",
-                "ClangFormatFormatter",
-            ),
-            ("scalafmt", "lucidshark.plugins.formatters.scalafmt", "ScalafmtFormatter"),
-            (
-                "swiftformat",
-                "lucidshark.plugins.formatters.swiftformat",
-                "SwiftFormatFormatter",
-            ),
-            (
-                "rubocop_format",
-                "lucidshark.plugins.formatters.rubocop_format",
-                "RubocopFormatter",
-            ),
-            (
-                "php_cs_fixer",
-                "lucidshark.plugins.formatters.php_cs_fixer",
-                "PhpCsFixerFormatter",
-            ),
-        ],
-    }
 
-    plugin_specs = FROZEN_PLUGIN_REGISTRY.get(group, [])
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._specs: Dict[str, Dict[str, PluginSpec]] = {}
+        self._classes: Dict[Tuple[str, str], Optional[Type]] = {}
+
+    def specs(self, group: str) -> Dict[str, PluginSpec]:
+        """Get the indexed plugins of a group, reading entry points once.
+
+        Args:
+            group: Entry point group name.
+
+        Returns:
+            Dictionary mapping plugin names to their specs.
+        """
+        with self._lock:
+            if group not in self._specs:
+                self._specs[group] = self._index(group)
+            return self._specs[group]
+
+    def names(self, group: str) -> List[str]:
+        """List plugin names in a group without importing any plugin.
+
+        Args:
+            group: Entry point group name.
+
+        Returns:
+            List of plugin names.
+        """
+        return list(self.specs(group))
+
+    def load(
+        self, group: str, name: str, base_class: Type[T] | None = None
+    ) -> Optional[Type[T]]:
+        """Import and return a single plugin class.
+
+        Args:
+            group: Entry point group name.
+            name: Plugin name.
+            base_class: Optional base class to validate the plugin against.
+
+        Returns:
+            Plugin class, or None if unknown, broken, or of the wrong type.
+        """
+        spec = self.specs(group).get(name)
+        if spec is None:
+            return None
+
+        with self._lock:
+            key = (group, name)
+            if key not in self._classes:
+                try:
+                    self._classes[key] = spec.load()
+                    LOGGER.debug(f"Loaded plugin: {name} (group: {group})")
+                except Exception as e:
+                    LOGGER.warning(f"Failed to load plugin '{name}': {e}")
+                    self._classes[key] = None
+            plugin_class = self._classes[key]
+
+        if plugin_class is None:
+            return None
+        if base_class is not None and not (
+            isinstance(plugin_class, type) and issubclass(plugin_class, base_class)
+        ):
+            LOGGER.warning(
+                f"Plugin '{name}' does not inherit from {base_class.__name__}, skipping"
+            )
+            return None
+        return plugin_class
+
+    def clear(self) -> None:
+        """Forget all indexed and loaded plugins (e.g. after installing one)."""
+        with self._lock:
+            self._specs.clear()
+            self._classes.clear()
+
+    @staticmethod
+    def _index(group: str) -> Dict[str, PluginSpec]:
+        """Read plugin metadata for a group without importing plugins."""
+        if _is_frozen():
+            # Use manual plugin registry for frozen binaries (PyInstaller)
+            LOGGER.debug(
+                f"Running in frozen binary, using manual plugin registry for group: {group}"
+            )
+            return {
+                name: PluginSpec(name, group, f"{module_path}:{class_name}")
+                for name, module_path, class_name in FROZEN_PLUGIN_REGISTRY.get(
+                    group, []
+                )
+            }
 
-    for plugin_name, module_path, class_name in plugin_specs:
         try:
-            module = __import__(module_path, fromlist=[class_name])
-            plugin_class = getattr(module, class_name)
-            plugins[plugin_name] = plugin_class
-            LOGGER.debug(f"Loaded frozen plugin: {plugin_name} (group: {group})")
-        except Exception as e:
-            LOGGER.warning(f"Failed to load frozen plugin '{plugin_name}': {e}")
+            eps = entry_points(group=group)
+        except TypeError:
+            # Python 3.9 compatibility
+            all_eps = entry_points()
+            eps = getattr(all_eps, group, [])  # type: ignore[assignment]
+
+        specs: Dict[str, PluginSpec] = {}
+        for ep in eps:
+            specs[ep.name] = PluginSpec(ep.name, group, ep.value)
+            LOGGER.debug(f"Discovered plugin: {ep.name} (group: {group})")
+        return specs
+
+
+_REGISTRY = PluginRegistry()
+
+
+def get_plugin_registry() -> PluginRegistry:
+    """Get the process-wide plugin registry."""
+    return _REGISTRY
+
 
-    return plugins
+class LazyPluginMap(Mapping[str, Type[T]]):
+    """Read-only mapping of plugin names to classes that imports on access.
+
+    Iterating and ``len()`` only use entry point metadata. A plugin module
+    is imported when its class is looked up or tested with ``in``. Plugins
+    that fail to load raise KeyError on lookup, are not ``in`` the mapping,
+    and are dropped from it (and skipped by ``items()``/``values()``).
+    """
+
+    def __init__(
+        self,
+        registry: PluginRegistry,
+        group: str,
+        base_class: Type[T] | None = None,
+    ) -> None:
+        self._registry = registry
+        self._group = group
+        self._base_class = base_class
+        self._names = registry.names(group)
+
+    def __getitem__(self, name: str) -> Type[T]:
+        if name not in self._names:
+            raise KeyError(name)
+        plugin_class = self._registry.load(self._group, name, self._base_class)
+        if plugin_class is None:
+            self._names = [n for n in self._names if n != name]
+            raise KeyError(name)
+        return plugin_class
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        return self.get(name) is not None
+
+    def items(self) -> List[Tuple[str, Type[T]]]:  # type: ignore[override]
+        """Load every plugin, skipping those that fail to load."""
+        loaded = []
+        for name in self._names:
+            plugin_class = self.get(name)
+            if plugin_class is not None:
+                loaded.append((name, plugin_class))
+        return loaded
+
+    def values(self) -> List[Type[T]]:  # type: ignore[override]
+        """Load every plugin class, skipping those that fail to load."""
+        return [plugin_class for _, plugin_class in self.items()]
+
+    def __repr__(self) -> str:
+        return f"LazyPluginMap({self._group!r}, {self._names!r})"
 
 
 def discover_plugins(
     group: str, base_class: Type[T] | None = None
-) -> Dict[str, Type[T]]:
+) -> Mapping[str, Type[T]]:
     """Discover all installed plugins for a given entry point group.
 
     Plugins register themselves in their pyproject.toml:
@@ -266,44 +445,17 @@ def discover_plugins(
         [project.entry-points."lucidshark.scanners"]
         trivy = "lucidshark.scanners.trivy:TrivyScanner"
 
+    Entry points are read once per process. Plugin modules are imported
+    lazily, when a plugin class is first looked up in the returned mapping.
+
     Args:
         group: Entry point group name (e.g., 'lucidshark.scanners').
         base_class: Optional base class to validate plugins against.
 
     Returns:
-        Dictionary mapping plugin names to plugin classes.
+        Mapping of plugin names to plugin classes.
     """
-    # Use manual plugin registry for frozen binaries (PyInstaller)
-    if _is_frozen():
-        LOGGER.debug(
-            f"Running in frozen binary, using manual plugin registry for group: {group}"
-        )
-        return _get_frozen_plugins(group)  # type: ignore[return-value]
-
-    # Normal entry_points discovery for non-frozen execution
-    plugins: Dict[str, Type[T]] = {}
-
-    try:
-        eps = entry_points(group=group)
-    except TypeError:
-        # Python 3.9 compatibility
-        all_eps = entry_points()
-        eps = getattr(all_eps, group, [])  # type: ignore[assignment]
-
-    for ep in eps:
-        try:
-            plugin_class = ep.load()
-            if base_class is not None and not issubclass(plugin_class, base_class):
-                LOGGER.warning(
-                    f"Plugin '{ep.name}' does not inherit from {base_class.__name__}, skipping"
-                )
-                continue
-            plugins[ep.name] = plugin_class
-            LOGGER.debug(f"Discovered plugin: {ep.name} (group: {group})")
-        except Exception as e:
-            LOGGER.warning(f"Failed to load plugin '{ep.name}': {e}")
-
-    return plugins
+    return LazyPluginMap(_REGISTRY, group, base_class)
 
 
 def get_plugin(
@@ -314,6 +466,8 @@ def get_plugin(
 ) -> T | None:
     """Get an instantiated plugin by name.
 
+    Only the requested plugin's module is imported.
+
     Args:
         group: Entry point group name.
         name: Plugin name (e.g., 'trivy').
@@ -325,8 +479,7 @@ def get_plugin(
     Returns:
         Instantiated plugin or None if not found.
     """
-    plugins = discover_plugins(group, base_class)
-    plugin_class = plugins.get(name)
+    plugin_class = _REGISTRY.load(group, name, base_class)
     if plugin_class:
         return plugin_class(**kwargs)
     return None
@@ -341,7 +494,7 @@ def list_available_plugins(group: str) -> List[str]:
     Returns:
         List of plugin names.
     """
-    return list(discover_plugins(group).keys())
+    return _REGISTRY.names(group)
 
 
 def get_all_available_tools() -> Dict[str, List[str]]:
@@ -2,18 +2,59 @@
 
 Common functionality used across dotnet-based plugins (dotnet format,
 dotnet build, dotnet test, dotnet coverage) to avoid code duplication.
+
+dotnet build (type checking) and dotnet test (testing) share a single
+build per scan: whichever plugin runs first builds the project into
+``.lucidshark/cache/dotnet/artifacts`` and the other reuses the result.
+The type checker reads its diagnostics from the build output, and tests
+run with ``--no-build`` against the artifacts. The artifacts directory is
+restored explicitly, once per change of the project files; when that
+restore fails (e.g. offline) the build falls back to the projects' own,
+already restored ``obj`` directories.
 """
 
 from __future__ import annotations
 
+import re
 import shutil
+import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional
 
 from lucidshark.core.logging import get_logger
+from lucidshark.core.subprocess_runner import run_with_streaming
 
 LOGGER = get_logger(__name__)
 
+# Timeout of the shared dotnet build in seconds
+DOTNET_BUILD_TIMEOUT = 300
+
+# Directories that never hold build inputs
+DOTNET_SKIP_DIRS = frozenset({"bin", "obj", "TestResults", "node_modules"})
+
+# First SDK supporting --artifacts-path
+ARTIFACTS_SDK_MAJOR = 8
+
+# Files whose change requires restoring the artifacts directory again
+RESTORE_INPUT_SUFFIXES = (".sln", ".csproj", ".fsproj", ".vbproj", ".props", ".targets")
+RESTORE_INPUT_NAMES = frozenset({"packages.lock.json", "nuget.config", "global.json"})
+
+
+@dataclass
+class DotnetBuild:
+    """Outcome of a shared ``dotnet build``."""
+
+    output: str
+    succeeded: bool
+    artifacts_path: Optional[Path] = None
+
+    def artifacts_args(self) -> List[str]:
+        """Arguments pointing dotnet commands at the build output."""
+        if self.artifacts_path is None:
+            return []
+        return ["--artifacts-path", str(self.artifacts_path)]
+
 
 def find_dotnet() -> Path:
     """Find the dotnet CLI binary.
@@ -62,3 +103,177 @@ def find_project_file(project_root: Path) -> Optional[Path]:
         return csproj_files[0]
 
     return None
+
+
+def whitespace_format_target(project_root: Path, project_file: Path) -> List[str]:
+    """Target arguments for ``dotnet format whitespace``.
+
+    Whitespace formatting needs no semantic model, so the directory of the
+    project or solution file is formatted in ``--folder`` mode instead of
+    loading the MSBuild workspace.
+
+    Args:
+        project_root: Project root directory.
+        project_file: Solution or project file.
+
+    Returns:
+        Folder, ``--folder`` and exclusions of LucidShark's own files.
+    """
+    folder = project_file.parent
+    args = [str(folder), "--folder"]
+    if folder.resolve() == project_root.resolve():
+        args.extend(["--exclude", ".lucidshark"])
+    return args
+
+
+def _sdk_major(dotnet: Path) -> Optional[int]:
+    """Major version of the .NET SDK, or None if unknown."""
+    from lucidshark.plugins.utils import get_cli_version
+
+    match = re.match(r"(\d+)\.", get_cli_version(dotnet))
+    return int(match.group(1)) if match else None
+
+
+def _is_restore_input(name: str) -> bool:
+    """Whether a file is a project, solution or NuGet input of a restore."""
+    lower = name.lower()
+    return lower.endswith(RESTORE_INPUT_SUFFIXES) or lower in RESTORE_INPUT_NAMES
+
+
+def _restore_artifacts(
+    context: Any, dotnet: Path, project_file: Path, artifacts_path: Path
+) -> bool:
+    """Restore a project into the artifacts directory unless already done.
+
+    The outcome is remembered until a project, solution or NuGet file
+    changes, so a failing restore (e.g. offline) is not retried every scan.
+
+    Returns:
+        True if the artifacts directory is restored.
+    """
+    from lucidshark.plugins.utils import memoized_build
+
+    return memoized_build(
+        "dotnet restore",
+        project_file,
+        project_file.parent,
+        DOTNET_SKIP_DIRS,
+        lambda: _run_restore(context, dotnet, project_file, artifacts_path),
+        include=_is_restore_input,
+    )
+
+
+def _run_restore(
+    context: Any, dotnet: Path, project_file: Path, artifacts_path: Path
+) -> bool:
+    """Run ``dotnet restore`` into the artifacts directory.
+
+    Returns:
+        True if the restore succeeded.
+    """
+    cmd = [
+        str(dotnet),
+        "restore",
+        str(project_file),
+        "--artifacts-path",
+        str(artifacts_path),
+        "-v",
+        "quiet",
+        "-nologo",
+    ]
+    LOGGER.debug(f"Running: {' '.join(cmd)}")
+    try:
+        result = run_with_streaming(
+            cmd=cmd,
+            cwd=context.project_root,
+            tool_name="dotnet-restore",
+            stream_handler=context.stream_handler,
+            timeout=DOTNET_BUILD_TIMEOUT,
+        )
+        restored = result.returncode == 0
+    except subprocess.TimeoutExpired:
+        restored = False
+    if not restored:
+        LOGGER.info(
+            "dotnet restore failed, building in the projects' own obj directories"
+        )
+    return restored
+
+
+def _run_build(context: Any, dotnet: Path, project_file: Path) -> DotnetBuild:
+    """Build a project or solution without restoring.
+
+    With SDK 8 or later the build goes to a LucidShark-managed artifacts
+    directory, restored beforehand by :func:`_restore_artifacts`. Older
+    SDKs, and SDK 8 when that restore fails, build into the projects' own
+    ``bin``/``obj`` directories.
+
+    Raises:
+        subprocess.TimeoutExpired: If the build times out.
+    """
+    from lucidshark.bootstrap.paths import LucidsharkPaths
+
+    cmd = [
+        str(dotnet),
+        "build",
+        str(project_file),
+        "-v",
+        "quiet",
+        "-nologo",
+        "--no-restore",
+    ]
+    artifacts_path: Optional[Path] = None
+    major = _sdk_major(dotnet)
+    if major is not None and major >= ARTIFACTS_SDK_MAJOR:
+        cache_dir = LucidsharkPaths.for_project(context.project_root).plugin_cache_dir(
+            "dotnet"
+        )
+        if _restore_artifacts(context, dotnet, project_file, cache_dir / "artifacts"):
+            artifacts_path = cache_dir / "artifacts"
+            cmd.extend(["--artifacts-path", str(artifacts_path)])
+
+    LOGGER.debug(f"Running: {' '.join(cmd)}")
+    result = run_with_streaming(
+        cmd=cmd,
+        cwd=context.project_root,
+        tool_name="dotnet-build",
+        stream_handler=context.stream_handler,
+        timeout=DOTNET_BUILD_TIMEOUT,
+    )
+    return DotnetBuild(
+        output=(result.stdout or "") + "\n" + (result.stderr or ""),
+        succeeded=result.returncode == 0,
+        artifacts_path=artifacts_path,
+    )
+
+
+def shared_build(context: Any, dotnet: Path, project_file: Path) -> DotnetBuild:
+    """Build a project or solution once for all dotnet plugins.
+
+    Concurrent callers wait for a build in progress. A finished build is
+    reused until a file below the project directory changes.
+
+    Args:
+        context: Scan context.
+        dotnet: Path to the dotnet binary.
+        project_file: Solution or project file to build.
+
+    Returns:
+        The build outcome.
+
+    Raises:
+        subprocess.TimeoutExpired: If the build times out.
+    """
+    from lucidshark.plugins.utils import memoized_build
+
+    key = project_file.resolve()
+    return memoized_build(
+        "dotnet build",
+        key,
+        key.parent,
+        DOTNET_SKIP_DIRS,
+        lambda: _run_build(context, dotnet, key),
+        reusable=lambda build: (
+            build.artifacts_path is None or build.artifacts_path.is_dir()
+        ),
+    )
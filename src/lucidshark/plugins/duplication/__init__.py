@@ -19,7 +19,7 @@ def discover_duplication_plugins():
     """Discover all installed duplication plugins.
 
     Returns:
-        Dictionary mapping plugin names to plugin classes.
+        Mapping of plugin names to plugin classes (imported on access).
     """
     return discover_plugins(DUPLICATION_ENTRY_POINT_GROUP, DuplicationPlugin)
 
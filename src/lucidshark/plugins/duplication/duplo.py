@@ -13,7 +13,6 @@ import tarfile
 import tempfile
 from pathlib import Path
 from typing import List, Optional
-import pathspec
 
 from lucidshark.bootstrap.download import secure_urlopen
 from lucidshark.bootstrap.paths import LucidsharkPaths
@@ -23,6 +22,11 @@ from lucidshark.bootstrap.validation import (
     remove_stale_binary_dir,
 )
 from lucidshark.bootstrap.versions import get_tool_version
+from lucidshark.core.file_enumeration import (
+    DEFAULT_EXCLUDES,
+    FileEnumerator,
+    compile_patterns,
+)
 from lucidshark.core.git import is_git_repo
 from lucidshark.core.logging import get_logger
 from lucidshark.core.models import (
@@ -38,12 +42,23 @@ from lucidshark.plugins.duplication.base import (
     DuplicationPlugin,
     DuplicationResult,
 )
+from lucidshark.plugins.duplication.index import (
+    DuplicationIndex,
+    IndexUpdate,
+    assign_lines,
+    canonical_blocks,
+    line_totals,
+    relative_path,
+)
 
 LOGGER = get_logger(__name__)
 
 # Default version from pyproject.toml [tool.lucidshark.tools]
 DEFAULT_VERSION = get_tool_version("duplo")
 
+# Above this many changed files a full run is cheaper than an incremental one
+MAX_INCREMENTAL_FILES = 50
+
 # Supported file extensions per language
 SUPPORTED_EXTENSIONS = {
     ".py": "python",
@@ -223,9 +238,13 @@ class DuploPlugin(DuplicationPlugin):
         )
         use_git_flag = in_git_repo and not has_exclude_patterns
 
-        file_list_path: Optional[Path] = None
+        # The incremental index needs the explicit file list.  Baselines
+        # are tracked by the binary itself, so they always get a full run.
+        use_index = use_cache and not use_baseline
+
+        source_files: Optional[List[Path]] = None
 
-        if use_git_flag:
+        if use_git_flag and not use_index:
             LOGGER.debug("Using git mode for file discovery")
         elif in_git_repo:
             # In a git repo but we have exclude patterns (global and/or
@@ -239,24 +258,103 @@ class DuploPlugin(DuplicationPlugin):
                 context,
                 all_exclude_patterns,
             )
-            if not source_files:
-                LOGGER.debug("No source files found for duplication detection")
-                return DuplicationResult(threshold=threshold)
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False, encoding="utf-8"
-            ) as f:
-                for file_path in source_files:
-                    f.write(f"{file_path}\n")
-                file_list_path = Path(f.name)
         else:
             # Collect all source files in project (always full scan)
             source_files = self._collect_source_files(context, exclude_patterns)
 
-            if not source_files:
-                LOGGER.debug("No source files found for duplication detection")
-                return DuplicationResult(threshold=threshold)
+        if source_files is not None and not source_files:
+            LOGGER.debug("No source files found for duplication detection")
+            return DuplicationResult(threshold=threshold)
+
+        if use_index:
+            assert source_files is not None
+            return self._detect_incremental(
+                binary,
+                context,
+                [Path(f) for f in source_files],
+                threshold,
+                min_lines,
+                min_chars,
+            )
+
+        try:
+            output = self._run_duplo(
+                binary,
+                context,
+                source_files,
+                min_lines,
+                min_chars,
+                use_cache=use_cache,
+                use_baseline=use_baseline,
+            )
+        except subprocess.TimeoutExpired:
+            return self._execution_failed(
+                context, "Duplo timed out after 300 seconds", threshold
+            )
+        except Exception as e:
+            return self._execution_failed(
+                context, f"Failed to run Duplo: {e}", threshold
+            )
+
+        # Parse JSON output
+        return self._parse_output(output, context.project_root, threshold)
+
+    def _execution_failed(
+        self,
+        context: ScanContext,
+        message: str,
+        threshold: float,
+    ) -> DuplicationResult:
+        """Record a failed Duplo run and return a failed result.
+
+        Args:
+            context: Scan context.
+            message: Reason shown to the user.
+            threshold: Maximum allowed duplication percentage.
+
+        Returns:
+            DuplicationResult with ``execution_failed`` set.
+        """
+        LOGGER.warning(message)
+        context.record_skip(
+            tool_name=self.name,
+            domain=ToolDomain.DUPLICATION,
+            reason=SkipReason.EXECUTION_FAILED,
+            message=message,
+        )
+        return DuplicationResult(threshold=threshold, execution_failed=True)
+
+    def _run_duplo(
+        self,
+        binary: Path,
+        context: ScanContext,
+        source_files: Optional[List[Path]],
+        min_lines: int,
+        min_chars: int,
+        use_cache: bool = True,
+        use_baseline: bool = False,
+    ) -> str:
+        """Run the Duplo binary and return its JSON output.
+
+        Args:
+            binary: Path to the Duplo binary.
+            context: Scan context.
+            source_files: Files to analyze, or None to let Duplo discover
+                files itself via ``--git``.
+            min_lines: Minimum lines for a duplicate block.
+            min_chars: Minimum characters per line.
+            use_cache: If True, pass Duplo's own file cache flags.
+            use_baseline: If True, compare against and update the baseline.
+
+        Returns:
+            Duplo stdout.
 
+        Raises:
+            subprocess.TimeoutExpired: If Duplo does not finish in time.
+            Exception: If Duplo cannot be run.
+        """
+        file_list_path: Optional[Path] = None
+        if source_files is not None:
             # Write file list to temp file
             with tempfile.NamedTemporaryFile(
                 mode="w", suffix=".txt", delete=False, encoding="utf-8"
@@ -271,10 +369,9 @@ class DuploPlugin(DuplicationPlugin):
             # Using "-" as output means stdout
             cmd = [str(binary)]
 
-            if use_git_flag:
+            if file_list_path is None:
                 cmd.append("--git")
             else:
-                assert file_list_path is not None
                 cmd.append(str(file_list_path))
 
             cmd.extend(
@@ -307,45 +404,305 @@ class DuploPlugin(DuplicationPlugin):
 
             LOGGER.debug(f"Running: {' '.join(cmd)}")
 
-            try:
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="duplo",
-                    stream_handler=context.stream_handler,
-                    timeout=300,  # 5 minutes for large projects
-                )
-            except subprocess.TimeoutExpired:
-                LOGGER.warning("Duplo timed out after 300 seconds")
-                context.record_skip(
-                    tool_name=self.name,
-                    domain=ToolDomain.DUPLICATION,
-                    reason=SkipReason.EXECUTION_FAILED,
-                    message="Duplo timed out after 300 seconds",
-                )
-                return DuplicationResult(threshold=threshold, execution_failed=True)
-            except Exception as e:
-                LOGGER.error(f"Failed to run Duplo: {e}")
-                context.record_skip(
-                    tool_name=self.name,
-                    domain=ToolDomain.DUPLICATION,
-                    reason=SkipReason.EXECUTION_FAILED,
-                    message=f"Failed to run Duplo: {e}",
-                )
-                return DuplicationResult(threshold=threshold, execution_failed=True)
-
-            # Parse JSON output
-            return self._parse_output(
-                result.stdout,
-                context.project_root,
-                threshold,
+            result = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="duplo",
+                stream_handler=context.stream_handler,
+                timeout=300,  # 5 minutes for large projects
             )
+            return result.stdout
 
         finally:
             # Clean up temp file
             if file_list_path is not None:
                 file_list_path.unlink(missing_ok=True)
 
+    def _detect_incremental(
+        self,
+        binary: Path,
+        context: ScanContext,
+        source_files: List[Path],
+        threshold: float,
+        min_lines: int,
+        min_chars: int,
+    ) -> DuplicationResult:
+        """Detect duplication, re-analyzing only files changed since last scan.
+
+        Blocks between two unchanged files are taken from the persistent
+        index. Duplo is run on the changed files plus the unchanged files
+        that share a normalized line window with them, so every block
+        involving a changed file is found again. Falls back to a full run
+        when there is no usable previous result.
+
+        Args:
+            binary: Path to the Duplo binary.
+            context: Scan context.
+            source_files: Every file the scan covers.
+            threshold: Maximum allowed duplication percentage.
+            min_lines: Minimum lines for a duplicate block.
+            min_chars: Minimum characters per line.
+
+        Returns:
+            DuplicationResult equal to that of a full run.
+        """
+        project_root = context.project_root
+        index = DuplicationIndex(
+            project_root,
+            LucidsharkPaths.for_project(project_root).plugin_cache_dir(self.name),
+            DuplicationIndex.compute_fingerprint(self._version, min_lines, min_chars),
+        )
+        update = index.refresh(source_files, min_lines, min_chars)
+
+        if index.result is not None and not update.touched:
+            LOGGER.info("No source files changed since the last duplication scan")
+            return self._result_from_index(index, project_root, threshold)
+
+        incremental = (
+            index.incremental
+            and index.result is not None
+            and len(update.changed) <= MAX_INCREMENTAL_FILES
+            and all(lines is not None for lines in update.previous_lines.values())
+        )
+        if incremental:
+            result = self._run_incremental(
+                binary, context, index, update, threshold, min_lines, min_chars
+            )
+        else:
+            result = self._run_full(
+                binary, context, index, update, threshold, min_lines, min_chars
+            )
+
+        if result is not None:
+            return result
+        return DuplicationResult(threshold=threshold, execution_failed=True)
+
+    def _run_full(
+        self,
+        binary: Path,
+        context: ScanContext,
+        index: DuplicationIndex,
+        update: IndexUpdate,
+        threshold: float,
+        min_lines: int,
+        min_chars: int,
+    ) -> Optional[DuplicationResult]:
+        """Analyze every indexed file and store the result in the index.
+
+        Returns:
+            The result, or None if Duplo failed (a skip is recorded).
+        """
+        project_root = context.project_root
+        result = self._run_subset(
+            binary, context, sorted(index.files), threshold, min_lines, min_chars
+        )
+        if result is None:
+            return None
+
+        blocks = canonical_blocks(result.duplicates, project_root)
+        # Incremental runs rebuild the summary from per-file line counts and
+        # per-block line counts; only do so if Duplo's summary is additive.
+        index.incremental = (
+            index.incremental
+            and result.files_analyzed == len(index.files)
+            and result.duplicate_blocks == len(blocks)
+            and result.duplicate_lines == sum(b.line_count for b in blocks)
+        )
+        index.store_result(
+            result.files_analyzed,
+            result.total_lines,
+            result.duplicate_blocks,
+            result.duplicate_lines,
+            blocks,
+        )
+
+        if index.incremental:
+            # Per-file line counts come for free when an estimate adds up to
+            # the total; otherwise measure the changed files
+            if (
+                not assign_lines(index, sorted(index.files), result.total_lines)
+                and len(update.changed) <= MAX_INCREMENTAL_FILES
+            ):
+                self._measure_lines(
+                    binary, context, index, update.changed, min_lines, min_chars
+                )
+            known, unknown = line_totals(index, index.files)
+            if not unknown and known != result.total_lines:
+                index.incremental = False
+
+        index.save()
+        return self._result_from_index(index, project_root, threshold)
+
+    def _run_incremental(
+        self,
+        binary: Path,
+        context: ScanContext,
+        index: DuplicationIndex,
+        update: IndexUpdate,
+        threshold: float,
+        min_lines: int,
+        min_chars: int,
+    ) -> Optional[DuplicationResult]:
+        """Analyze changed files and their candidates, reusing other blocks.
+
+        Returns:
+            The result, or None if Duplo failed (a skip is recorded).
+        """
+        assert index.result is not None
+        project_root = context.project_root
+        changed = set(update.changed)
+        candidates = index.candidates(update)
+        LOGGER.info(
+            f"Re-analyzing {len(changed)} changed file(s) and "
+            f"{len(candidates)} related file(s) for duplication"
+        )
+
+        blocks = index.cached_blocks(update.touched)
+        if changed:
+            result = self._run_subset(
+                binary,
+                context,
+                sorted(changed | set(candidates)),
+                threshold,
+                min_lines,
+                min_chars,
+            )
+            if result is None:
+                return None
+            blocks.extend(
+                block
+                for block in result.duplicates
+                if relative_path(block.file1, project_root) in changed
+                or relative_path(block.file2, project_root) in changed
+            )
+
+            # Line counts of the new versions: the subset total minus the
+            # candidates' known counts is the changed files' total
+            known, unknown = line_totals(index, candidates)
+            if unknown:
+                measured = self._measure_lines(
+                    binary, context, index, update.changed, min_lines, min_chars
+                )
+            else:
+                measured = assign_lines(
+                    index, update.changed, result.total_lines - known
+                )
+            if not measured:
+                return self._run_full(
+                    binary, context, index, update, threshold, min_lines, min_chars
+                )
+
+        total_lines = (
+            index.result["total_lines"]
+            - sum(lines or 0 for lines in update.previous_lines.values())
+            + sum(index.files[rel].lines or 0 for rel in changed)
+        )
+        blocks = canonical_blocks(blocks, project_root)
+        index.store_result(
+            len(index.files),
+            total_lines,
+            len(blocks),
+            sum(b.line_count for b in blocks),
+            blocks,
+        )
+        index.save()
+        return self._result_from_index(index, project_root, threshold)
+
+    def _run_subset(
+        self,
+        binary: Path,
+        context: ScanContext,
+        files: List[str],
+        threshold: float,
+        min_lines: int,
+        min_chars: int,
+    ) -> Optional[DuplicationResult]:
+        """Run Duplo on project-relative ``files`` and parse the output.
+
+        Returns:
+            Parsed result, or None if Duplo failed (a skip is recorded).
+        """
+        try:
+            output = self._run_duplo(
+                binary,
+                context,
+                [context.project_root / rel for rel in files],
+                min_lines,
+                min_chars,
+            )
+        except subprocess.TimeoutExpired:
+            self._execution_failed(
+                context, "Duplo timed out after 300 seconds", threshold
+            )
+            return None
+        except Exception as e:
+            self._execution_failed(context, f"Failed to run Duplo: {e}", threshold)
+            return None
+        return self._parse_output(output, context.project_root, threshold)
+
+    def _measure_lines(
+        self,
+        binary: Path,
+        context: ScanContext,
+        index: DuplicationIndex,
+        files: List[str],
+        min_lines: int,
+        min_chars: int,
+    ) -> bool:
+        """Record the number of lines Duplo counts for each file.
+
+        All files are analyzed in one run and its total is split with
+        :func:`assign_lines`. These counts let later incremental runs update
+        the project total.
+
+        Returns:
+            True if every file got a count.
+        """
+        if not files:
+            return True
+        try:
+            output = self._run_duplo(
+                binary,
+                context,
+                [context.project_root / rel for rel in files],
+                min_lines,
+                min_chars,
+            )
+        except Exception as e:
+            LOGGER.debug(f"Failed to measure line counts with Duplo: {e}")
+            return False
+        try:
+            summary = json.loads(output).get("summary", {})
+        except (AttributeError, json.JSONDecodeError):
+            return False
+        if summary.get("files_analyzed") != len(files):
+            return False
+        return assign_lines(index, files, summary.get("total_lines", 0))
+
+    def _result_from_index(
+        self,
+        index: DuplicationIndex,
+        project_root: Path,
+        threshold: float,
+    ) -> DuplicationResult:
+        """Build a DuplicationResult from the result stored in the index."""
+        assert index.result is not None
+        duplicates = index.cached_blocks(set())
+        result = DuplicationResult(
+            files_analyzed=index.result["files_analyzed"],
+            total_lines=index.result["total_lines"],
+            duplicate_blocks=index.result["duplicate_blocks"],
+            duplicate_lines=index.result["duplicate_lines"],
+            threshold=threshold,
+            duplicates=duplicates,
+            issues=[self._block_to_issue(b, project_root) for b in duplicates],
+        )
+        LOGGER.info(
+            f"Duplo found {result.duplicate_blocks} duplicate blocks "
+            f"({result.duplication_percent:.1f}% duplication)"
+        )
+        return result
+
     def _collect_git_files_filtered(
         self,
         context: ScanContext,
@@ -363,30 +720,11 @@ class DuploPlugin(DuplicationPlugin):
         Returns:
             List of source file paths.
         """
-        try:
-            result = subprocess.run(
-                ["git", "ls-files", "--cached", "--others", "--exclude-standard"],
-                cwd=context.project_root,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-        except Exception:
+        enumerator = FileEnumerator(context.project_root, exclude_patterns)
+        source_files = enumerator.git_files(SUPPORTED_EXTENSIONS)
+        if source_files is None:
             LOGGER.warning("git ls-files failed, falling back to file walk")
-            return self._collect_source_files(context, exclude_patterns)
-
-        source_files = []
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            path = context.project_root / line
-            if not path.is_file():
-                continue
-            if self._should_exclude(line, exclude_patterns):
-                continue
-            if path.suffix.lower() in SUPPORTED_EXTENSIONS:
-                source_files.append(path)
+            return enumerator.walk(SUPPORTED_EXTENSIONS)
 
         LOGGER.debug(
             f"Found {len(source_files)} source files via git ls-files (filtered)"
@@ -401,7 +739,8 @@ class DuploPlugin(DuplicationPlugin):
         """Collect all source files in the project.
 
         Always scans entire project for duplication detection to catch
-        cross-file duplicates.
+        cross-file duplicates. Files come from the scan's shared file
+        inventory.
 
         Args:
             context: Scan context.
@@ -410,23 +749,16 @@ class DuploPlugin(DuplicationPlugin):
         Returns:
             List of source file paths.
         """
-        source_files = []
-        exclude_patterns = context.get_exclude_patterns()
-        if extra_exclude_patterns:
-            exclude_patterns = list(exclude_patterns) + list(extra_exclude_patterns)
-
-        for path in context.project_root.rglob("*"):
-            if not path.is_file():
-                continue
-
-            # Skip excluded patterns
-            relative_path = str(path.relative_to(context.project_root))
-            if self._should_exclude(relative_path, exclude_patterns):
-                continue
-
-            # Check if supported file type
-            if path.suffix.lower() in SUPPORTED_EXTENSIONS:
-                source_files.append(path)
+        # The inventory already applies the global ignore patterns
+        spec = compile_patterns(DEFAULT_EXCLUDES + tuple(extra_exclude_patterns or ()))
+        root = context.project_root
+        source_files = [
+            path
+            for path in context.get_file_inventory().with_extensions(
+                SUPPORTED_EXTENSIONS
+            )
+            if not spec.match_file(path.relative_to(root).as_posix())
+        ]
 
         LOGGER.debug(
             f"Found {len(source_files)} source files for duplication detection"
@@ -436,6 +768,9 @@ class DuploPlugin(DuplicationPlugin):
     def _should_exclude(self, path: str, patterns: List[str]) -> bool:
         """Check if path should be excluded using gitignore-style patterns.
 
+        Common vendor and build directories are always excluded. The
+        combined pattern set is compiled once and reused across calls.
+
         Args:
             path: Relative path to check (forward slashes).
             patterns: List of gitignore-style exclude patterns.
@@ -443,26 +778,7 @@ class DuploPlugin(DuplicationPlugin):
         Returns:
             True if path should be excluded.
         """
-        # Always exclude common directories
-        default_excludes = [
-            ".git/**",
-            "**/node_modules/**",
-            "**/__pycache__/**",
-            "**/.venv/**",
-            "**/venv/**",
-            "**/target/**",
-            "**/build/**",
-            "**/dist/**",
-            "**/.lucidshark/**",
-        ]
-
-        all_patterns = default_excludes + list(patterns)
-
-        # Use pathspec for proper gitignore-style matching (supports **)
-        spec = pathspec.PathSpec.from_lines(
-            "gitignore",
-            all_patterns,
-        )
+        spec = compile_patterns(DEFAULT_EXCLUDES + tuple(patterns))
 
         # Normalize path to forward slashes for pathspec
         normalized_path = path.replace("\\", "/")
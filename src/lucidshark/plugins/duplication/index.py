@@ -0,0 +1,560 @@
+"""Persistent block-hash index for incremental duplication detection.
+
+The index lives under ``.lucidshark/cache/duplo/index.json`` and records,
+for every source file of the last scan:
+
+- its size, mtime and SHA-256 (so unchanged files are not even re-read)
+- the hashes of its normalized line windows (``min_lines`` consecutive
+  non-trivial lines, both with whitespace collapsed and with comments and
+  all whitespace removed, as Duplo matches them)
+- a few estimates of its line count, and the number of lines Duplo counted
+  for it once known
+
+together with the duplicate blocks and summary of the last result. On the
+next scan only added or modified files are rehashed, and the window hashes
+select the unchanged files that can share a block with them. Duplo then
+only has to compare that subset; blocks between two unchanged files are
+reused from the index.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from lucidshark.core.logging import get_logger
+from lucidshark.core.result_cache import hash_file
+from lucidshark.plugins.duplication.base import DuplicateBlock
+
+LOGGER = get_logger(__name__)
+
+# Bump when the on-disk format changes to discard old indexes
+INDEX_FORMAT = 2
+
+INDEX_FILE_NAME = "index.json"
+
+# Comment syntax per extension: (line comment markers, block comment delimiters)
+_CommentSyntax = Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+_C_COMMENTS: _CommentSyntax = (("//",), (("/*", "*/"),))
+_COMMENT_SYNTAX: Dict[str, _CommentSyntax] = {
+    **dict.fromkeys(
+        (
+            ".rs .java .js .jsx .mjs .cjs .ts .tsx .mts .cts .c .cpp .cxx .cc .h .hh"
+            " .hpp .hxx .kt .kts .cs .go .swift .scala .sc"
+        ).split(),
+        _C_COMMENTS,
+    ),
+    ".py": (("#",), ()),
+    ".rb": (("#",), ()),
+    ".php": (("//", "#"), (("/*", "*/"),)),
+    ".erl": (("%",), ()),
+    ".hrl": (("%",), ()),
+    ".vb": (("'",), ()),
+    ".html": ((), (("<!--", "-->"),)),
+    ".htm": ((), (("<!--", "-->"),)),
+    ".css": ((), (("/*", "*/"),)),
+}
+
+# Number of values returned by line_estimates()
+LINE_ESTIMATES = 3
+
+
+def strip_comments(text: str, suffix: str) -> List[str]:
+    """Split a file into lines with comments removed.
+
+    String literals are not recognized, so a comment marker inside a string
+    also cuts the line. That only makes the index select more candidates.
+
+    Args:
+        text: File content.
+        suffix: File extension selecting the comment syntax.
+
+    Returns:
+        One entry per physical line, without its comments.
+    """
+    line_markers, block_markers = _COMMENT_SYNTAX.get(suffix.lower(), ((), ()))
+    lines = []
+    closing: Optional[str] = None
+    for raw in text.splitlines():
+        line = ""
+        rest = raw
+        while rest:
+            if closing is not None:
+                end = rest.find(closing)
+                if end < 0:
+                    break
+                rest = rest[end + len(closing) :]
+                closing = None
+                continue
+            cut = len(rest)
+            opened: Optional[Tuple[str, str]] = None
+            for marker in line_markers:
+                pos = rest.find(marker)
+                if 0 <= pos < cut:
+                    cut, opened = pos, None
+            for start, end_marker in block_markers:
+                pos = rest.find(start)
+                if 0 <= pos < cut:
+                    cut, opened = pos, (start, end_marker)
+            line += rest[:cut]
+            if opened is None:
+                break
+            rest = rest[cut + len(opened[0]) :]
+            closing = opened[1]
+        lines.append(line)
+    return lines
+
+
+def window_hashes(
+    text: str, min_lines: int, min_chars: int, suffix: str = ""
+) -> Set[int]:
+    """Hash every window of ``min_lines`` normalized lines in a file.
+
+    Lines are normalized twice: stripped with runs of whitespace collapsed,
+    and with comments and all whitespace removed as Duplo does. Lines
+    shorter than ``min_chars`` are dropped, as Duplo ignores them when
+    matching. The windows of both normalizations are returned, so a file
+    that Duplo could match is selected even where the two disagree.
+
+    Args:
+        text: File content.
+        min_lines: Window size (Duplo's minimum block length).
+        min_chars: Minimum characters for a line to be considered.
+        suffix: File extension selecting the comment syntax.
+
+    Returns:
+        Set of 32-bit window hashes.
+    """
+    collapsed = [" ".join(raw.split()) for raw in text.splitlines()]
+    code = ["".join(line.split()) for line in strip_comments(text, suffix)]
+    hashes = _hash_windows(collapsed, min_lines, min_chars)
+    hashes |= _hash_windows(code, min_lines, min_chars)
+    return hashes
+
+
+def line_estimates(text: str, suffix: str = "") -> List[int]:
+    """Candidate values for the number of lines Duplo counts in a file.
+
+    Returns the number of physical lines, of non-blank lines and of lines
+    with code once comments are removed. Whichever one adds up to Duplo's
+    total for a set of files gives the count of each file in the set.
+
+    Args:
+        text: File content.
+        suffix: File extension selecting the comment syntax.
+
+    Returns:
+        List of ``LINE_ESTIMATES`` counts.
+    """
+    lines = text.splitlines()
+    return [
+        len(lines),
+        sum(1 for line in lines if line.strip()),
+        sum(1 for line in strip_comments(text, suffix) if line.strip()),
+    ]
+
+
+def _hash_windows(lines: List[str], min_lines: int, min_chars: int) -> Set[int]:
+    """Hash every window of ``min_lines`` lines of at least ``min_chars``."""
+    lines = [line for line in lines if len(line) >= max(min_chars, 1)]
+    size = max(min_lines, 1)
+    hashes: Set[int] = set()
+    for start in range(len(lines) - size + 1):
+        window = "\n".join(lines[start : start + size]).encode("utf-8")
+        digest = hashlib.blake2b(window, digest_size=4).digest()
+        hashes.add(int.from_bytes(digest, "little"))
+    return hashes
+
+
+def _encode_windows(windows: Iterable[int]) -> str:
+    """Pack window hashes into a compact base64 string."""
+    return base64.b64encode(array("I", sorted(windows)).tobytes()).decode("ascii")
+
+
+def _decode_windows(data: str) -> Set[int]:
+    """Unpack window hashes written by :func:`_encode_windows`."""
+    values = array("I")
+    values.frombytes(base64.b64decode(data))
+    return set(values)
+
+
+@dataclass
+class IndexedFile:
+    """Index entry for one source file."""
+
+    sha256: str
+    size: int
+    mtime_ns: int
+    windows: Set[int] = field(default_factory=set)
+    estimates: List[int] = field(default_factory=list)  # See line_estimates()
+    lines: Optional[int] = None  # Lines counted by Duplo, once known
+
+
+@dataclass
+class IndexUpdate:
+    """Files that differ from the previous scan."""
+
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    # Duplo line counts of the previous versions of changed/deleted files
+    previous_lines: Dict[str, Optional[int]] = field(default_factory=dict)
+
+    @property
+    def touched(self) -> Set[str]:
+        """Relative paths whose cached blocks are no longer valid."""
+        return set(self.changed) | set(self.deleted)
+
+
+def block_to_dict(block: DuplicateBlock, project_root: Path) -> Dict[str, Any]:
+    """Serialize a duplicate block with project-relative paths."""
+    return {
+        "file1": relative_path(block.file1, project_root),
+        "file2": relative_path(block.file2, project_root),
+        "start_line1": block.start_line1,
+        "end_line1": block.end_line1,
+        "start_line2": block.start_line2,
+        "end_line2": block.end_line2,
+        "line_count": block.line_count,
+        "code_snippet": block.code_snippet,
+    }
+
+
+def block_from_dict(data: Dict[str, Any], project_root: Path) -> DuplicateBlock:
+    """Deserialize a duplicate block written by :func:`block_to_dict`."""
+    return DuplicateBlock(
+        file1=project_root / data["file1"],
+        file2=project_root / data["file2"],
+        start_line1=data["start_line1"],
+        end_line1=data["end_line1"],
+        start_line2=data["start_line2"],
+        end_line2=data["end_line2"],
+        line_count=data["line_count"],
+        code_snippet=data.get("code_snippet"),
+    )
+
+
+def canonical_blocks(
+    blocks: Iterable[DuplicateBlock], project_root: Path
+) -> List[DuplicateBlock]:
+    """Orient and sort blocks so equal results compare equal.
+
+    Duplo reports a pair of files in the order it compared them, which
+    depends on the file list it was given. Blocks are oriented so that
+    ``file1`` is the lexically smaller path and sorted by location.
+
+    Args:
+        blocks: Blocks as reported by Duplo.
+        project_root: Project root directory.
+
+    Returns:
+        Oriented, sorted list of blocks.
+    """
+    oriented = []
+    for block in blocks:
+        key1 = (relative_path(block.file1, project_root), block.start_line1)
+        key2 = (relative_path(block.file2, project_root), block.start_line2)
+        if key2 < key1:
+            block = DuplicateBlock(
+                file1=block.file2,
+                file2=block.file1,
+                start_line1=block.start_line2,
+                end_line1=block.end_line2,
+                start_line2=block.start_line1,
+                end_line2=block.end_line1,
+                line_count=block.line_count,
+                code_snippet=block.code_snippet,
+            )
+        oriented.append(block)
+    oriented.sort(
+        key=lambda b: (
+            relative_path(b.file1, project_root),
+            b.start_line1,
+            relative_path(b.file2, project_root),
+            b.start_line2,
+        )
+    )
+    return oriented
+
+
+def relative_path(path: Path, project_root: Path) -> str:
+    """Return a forward-slash path relative to the project root.
+
+    Args:
+        path: Absolute path inside the project.
+        project_root: Project root directory.
+
+    Returns:
+        Relative POSIX path, or the path itself if it is outside the project.
+    """
+    try:
+        return path.relative_to(project_root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+class DuplicationIndex:
+    """Per-project index of source files and the last duplication result."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        cache_dir: Path,
+        fingerprint: str,
+    ) -> None:
+        """Load the index, discarding it if the fingerprint changed.
+
+        Args:
+            project_root: Project root directory.
+            cache_dir: Directory holding the index (``.lucidshark/cache/duplo``).
+            fingerprint: Digest of the Duplo version and options.
+        """
+        self.project_root = project_root
+        self.path = cache_dir / INDEX_FILE_NAME
+        self.fingerprint = fingerprint
+        self.files: Dict[str, IndexedFile] = {}
+        self.result: Optional[Dict[str, Any]] = None
+        # False once Duplo's summary proved not to be additive per file
+        self.incremental = True
+        self._load()
+
+    @staticmethod
+    def compute_fingerprint(version: str, min_lines: int, min_chars: int) -> str:
+        """Digest of everything that changes Duplo's output for a file set."""
+        payload = json.dumps([INDEX_FORMAT, version, min_lines, min_chars])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load(self) -> None:
+        """Read the index from disk, ignoring missing or stale files."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("fingerprint") != self.fingerprint:
+            LOGGER.debug("Duplication index is stale, rebuilding")
+            return
+        try:
+            for rel, entry in data.get("files", {}).items():
+                self.files[rel] = IndexedFile(
+                    sha256=entry["sha256"],
+                    size=entry["size"],
+                    mtime_ns=entry["mtime_ns"],
+                    windows=_decode_windows(entry["windows"]),
+                    estimates=list(entry["estimates"]),
+                    lines=entry.get("lines"),
+                )
+        except (KeyError, TypeError, ValueError):
+            LOGGER.debug("Duplication index is corrupt, rebuilding")
+            self.files = {}
+            return
+        self.result = data.get("result")
+        self.incremental = bool(data.get("incremental", True))
+
+    def refresh(
+        self,
+        source_files: List[Path],
+        min_lines: int,
+        min_chars: int,
+    ) -> IndexUpdate:
+        """Bring the index in line with the current file set.
+
+        Files whose size and mtime are unchanged are not read. Files whose
+        content hash is unchanged keep their window hashes and line count.
+
+        Args:
+            source_files: Every file the scan covers.
+            min_lines: Duplo minimum block length (window size).
+            min_chars: Duplo minimum characters per line.
+
+        Returns:
+            The changed and deleted files.
+        """
+        update = IndexUpdate()
+        current: Dict[str, IndexedFile] = {}
+
+        for path in source_files:
+            rel = relative_path(path, self.project_root)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entry = self.files.get(rel)
+            if (
+                entry is not None
+                and entry.size == stat.st_size
+                and entry.mtime_ns == stat.st_mtime_ns
+            ):
+                current[rel] = entry
+                continue
+
+            sha = hash_file(path)
+            if sha is None:
+                continue
+            if entry is not None and entry.sha256 == sha:
+                # Touched but not modified
+                entry.size = stat.st_size
+                entry.mtime_ns = stat.st_mtime_ns
+                current[rel] = entry
+                continue
+
+            text = path.read_text(encoding="utf-8", errors="replace")
+            current[rel] = IndexedFile(
+                sha256=sha,
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                windows=window_hashes(text, min_lines, min_chars, path.suffix),
+                estimates=line_estimates(text, path.suffix),
+            )
+            update.changed.append(rel)
+            if entry is not None:
+                update.previous_lines[rel] = entry.lines
+
+        for rel, entry in self.files.items():
+            if rel not in current:
+                update.deleted.append(rel)
+                update.previous_lines[rel] = entry.lines
+
+        self.files = current
+        return update
+
+    def candidates(self, update: IndexUpdate) -> List[str]:
+        """Unchanged files that may share a duplicate block with a changed file.
+
+        A file qualifies if it shares a window hash with a changed file or
+        had a cached block with a changed or deleted file.
+
+        Args:
+            update: Result of :meth:`refresh`.
+
+        Returns:
+            Sorted relative paths of unchanged candidate files.
+        """
+        touched = update.touched
+        wanted: Set[int] = set()
+        for rel in update.changed:
+            wanted |= self.files[rel].windows
+
+        selected: Set[str] = set()
+        for rel, entry in self.files.items():
+            if rel not in touched and not wanted.isdisjoint(entry.windows):
+                selected.add(rel)
+
+        for block in (self.result or {}).get("blocks", []):
+            pair = {block["file1"], block["file2"]}
+            if pair & touched:
+                selected |= pair - touched
+
+        return sorted(rel for rel in selected if rel in self.files)
+
+    def cached_blocks(self, exclude: Set[str]) -> List[DuplicateBlock]:
+        """Cached blocks not involving any of the ``exclude`` files."""
+        return [
+            block_from_dict(block, self.project_root)
+            for block in (self.result or {}).get("blocks", [])
+            if block["file1"] not in exclude and block["file2"] not in exclude
+        ]
+
+    def store_result(
+        self,
+        files_analyzed: int,
+        total_lines: int,
+        duplicate_blocks: int,
+        duplicate_lines: int,
+        blocks: List[DuplicateBlock],
+    ) -> None:
+        """Remember a result for the current file set."""
+        self.result = {
+            "files_analyzed": files_analyzed,
+            "total_lines": total_lines,
+            "duplicate_blocks": duplicate_blocks,
+            "duplicate_lines": duplicate_lines,
+            "blocks": [block_to_dict(b, self.project_root) for b in blocks],
+        }
+
+    def save(self) -> None:
+        """Write the index atomically."""
+        data = {
+            "fingerprint": self.fingerprint,
+            "incremental": self.incremental,
+            "files": {
+                rel: {
+                    "sha256": entry.sha256,
+                    "size": entry.size,
+                    "mtime_ns": entry.mtime_ns,
+                    "windows": _encode_windows(entry.windows),
+                    "estimates": entry.estimates,
+                    "lines": entry.lines,
+                }
+                for rel, entry in self.files.items()
+            },
+            "result": self.result,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            LOGGER.debug(f"Failed to write duplication index: {e}")
+
+
+def line_totals(index: DuplicationIndex, files: Iterable[str]) -> Tuple[int, List[str]]:
+    """Sum known Duplo line counts.
+
+    Args:
+        index: Duplication index.
+        files: Relative paths to sum.
+
+    Returns:
+        Tuple of (sum of known counts, paths whose count is unknown).
+    """
+    total = 0
+    unknown = []
+    for rel in files:
+        lines = index.files[rel].lines
+        if lines is None:
+            unknown.append(rel)
+        else:
+            total += lines
+    return total, unknown
+
+
+def assign_lines(index: DuplicationIndex, files: List[str], total: int) -> bool:
+    """Record per-file Duplo line counts from their total over ``files``.
+
+    A single file gets the total. Several files get the kind of estimate
+    (see :func:`line_estimates`) whose sum equals the total. When kinds
+    giving different per-file counts both add up, the match may be a
+    coincidence, so no count is recorded.
+
+    Args:
+        index: Duplication index.
+        files: Relative paths Duplo counted ``total`` lines for.
+        total: Duplo's ``total_lines`` for exactly these files.
+
+    Returns:
+        True if every file got a count.
+    """
+    if len(files) == 1:
+        index.files[files[0]].lines = total
+        return True
+    entries = [index.files[rel] for rel in files]
+    if any(len(entry.estimates) != LINE_ESTIMATES for entry in entries):
+        return False
+    matches = {
+        tuple(entry.estimates[kind] for entry in entries)
+        for kind in range(LINE_ESTIMATES)
+        if sum(entry.estimates[kind] for entry in entries) == total
+    }
+    if len(matches) != 1:
+        return False
+    for entry, lines in zip(entries, matches.pop()):
+        entry.lines = lines
+    return True
@@ -12,7 +12,7 @@ Example registration in pyproject.toml:
     epss = "lucidshark_epss:EPSSEnricher"
 """
 
-from typing import Dict, List, Optional, Type
+from typing import List, Mapping, Optional, Type
 
 from lucidshark.plugins.enrichers.base import EnricherPlugin
 from lucidshark.plugins.discovery import (
@@ -23,11 +23,11 @@ from lucidshark.plugins.discovery import (
 )
 
 
-def discover_enricher_plugins() -> Dict[str, Type[EnricherPlugin]]:
+def discover_enricher_plugins() -> Mapping[str, Type[EnricherPlugin]]:
     """Discover all installed enricher plugins via entry points.
 
     Returns:
-        Dictionary mapping plugin names to plugin classes.
+        Mapping of plugin names to plugin classes.
     """
     return discover_plugins(ENRICHER_ENTRY_POINT_GROUP, EnricherPlugin)
 
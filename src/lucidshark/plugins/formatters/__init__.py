@@ -15,7 +15,7 @@ def discover_formatter_plugins():
     """Discover all installed formatter plugins.
 
     Returns:
-        Dictionary mapping plugin names to plugin classes.
+        Mapping of plugin names to plugin classes (imported on access).
     """
     return discover_plugins(FORMATTER_ENTRY_POINT_GROUP, FormatterPlugin)
 
@@ -86,7 +86,7 @@ class FormatterPlugin(ABC):
             extensions: File extensions this formatter handles (e.g., {".py"}).
             fallback_to_cwd: If True and no paths given, return ["."] (for tools
                 that support directory recursion like ruff, prettier). If False
-                and no paths given, discover files via rglob (for tools like
+                and no paths given, discover files in the project (for tools like
                 rustfmt, google-java-format that need explicit file paths).
 
         Returns:
@@ -95,11 +95,9 @@ class FormatterPlugin(ABC):
         if context.paths:
             paths_to_use = context.paths
             if context.ignore_patterns is not None:
-                paths_to_use = [
-                    p
-                    for p in paths_to_use
-                    if not context.ignore_patterns.matches(p, context.project_root)
-                ]
+                paths_to_use = context.ignore_patterns.filter_paths(
+                    paths_to_use, context.project_root
+                )
             filtered: List[str] = []
             for path in paths_to_use:
                 if path.is_dir():
@@ -107,15 +105,9 @@ class FormatterPlugin(ABC):
                         filtered.append(str(path))
                     else:
                         # Tools that don't support dirs: find files within
-                        for ext in extensions:
-                            for f in path.rglob(f"*{ext}"):
-                                if (
-                                    context.ignore_patterns is None
-                                    or not context.ignore_patterns.matches(
-                                        f, context.project_root
-                                    )
-                                ):
-                                    filtered.append(str(f))
+                        filtered.extend(
+                            str(f) for f in context.find_files(extensions, [path])
+                        )
                 elif path.suffix.lower() in extensions:
                     filtered.append(str(path))
             return filtered
@@ -123,13 +115,5 @@ class FormatterPlugin(ABC):
         if fallback_to_cwd:
             return ["."]
 
-        # Discover files via rglob from project root
-        found: List[str] = []
-        for ext in extensions:
-            for path in context.project_root.rglob(f"*{ext}"):
-                if (
-                    context.ignore_patterns is None
-                    or not context.ignore_patterns.matches(path, context.project_root)
-                ):
-                    found.append(str(path))
-        return found
+        # Discover files from the project-wide file inventory
+        return [str(f) for f in context.find_files(extensions, [context.project_root])]
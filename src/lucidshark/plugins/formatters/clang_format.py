@@ -19,7 +19,7 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
+from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.cpp_utils import (
     CPP_EXTENSIONS,
     ensure_cpp_tools_in_path,
@@ -76,14 +76,14 @@ class ClangFormatFormatter(FormatterPlugin):
         env_vars = ensure_cpp_tools_in_path()
 
         try:
-            with temporary_env(env_vars):
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="clang-format",
-                    stream_handler=context.stream_handler,
-                    timeout=120,
-                )
+            result = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="clang-format",
+                stream_handler=context.stream_handler,
+                timeout=120,
+                env=env_vars,
+            )
         except subprocess.TimeoutExpired:
             LOGGER.warning("clang-format check timed out after 120 seconds")
             context.record_skip(
@@ -137,14 +137,14 @@ class ClangFormatFormatter(FormatterPlugin):
         env_vars = ensure_cpp_tools_in_path()
 
         try:
-            with temporary_env(env_vars):
-                run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="clang-format-fix",
-                    stream_handler=context.stream_handler,
-                    timeout=120,
-                )
+            run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="clang-format-fix",
+                stream_handler=context.stream_handler,
+                timeout=120,
+                env=env_vars,
+            )
         except Exception as e:
             LOGGER.error(f"Failed to run clang-format: {e}")
             return FixResult()
@@ -1,6 +1,7 @@
 """dotnet format formatter plugin.
 
-Uses `dotnet format whitespace` for C# code formatting.
+Uses `dotnet format whitespace` for C# code formatting. Runs in folder
+mode, which does not load the MSBuild workspace.
 https://learn.microsoft.com/en-us/dotnet/core/tools/dotnet-format
 """
 
@@ -20,7 +21,11 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
-from lucidshark.plugins.dotnet_utils import find_dotnet, find_project_file
+from lucidshark.plugins.dotnet_utils import (
+    find_dotnet,
+    find_project_file,
+    whitespace_format_target,
+)
 from lucidshark.plugins.formatters.base import FormatterPlugin
 from lucidshark.plugins.linters.base import FixResult
 from lucidshark.plugins.utils import get_cli_version
@@ -78,7 +83,7 @@ class DotnetFormatFormatter(FormatterPlugin):
             str(dotnet),
             "format",
             "whitespace",
-            str(project_file),
+            *whitespace_format_target(context.project_root, project_file),
             "--verify-no-changes",
             "--verbosity",
             "diagnostic",
@@ -189,7 +194,12 @@ class DotnetFormatFormatter(FormatterPlugin):
 
         pre_issues = self.check(context)
 
-        cmd = [str(dotnet), "format", "whitespace", str(project_file)]
+        cmd = [
+            str(dotnet),
+            "format",
+            "whitespace",
+            *whitespace_format_target(context.project_root, project_file),
+        ]
 
         LOGGER.debug(f"Running: {' '.join(cmd)}")
 
@@ -18,7 +18,7 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
+from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.formatters.base import FormatterPlugin
 from lucidshark.plugins.go_utils import ensure_go_in_path, find_gofmt
 from lucidshark.plugins.linters.base import FixResult
@@ -68,14 +68,14 @@ class GofmtFormatter(FormatterPlugin):
         env_vars = ensure_go_in_path()
 
         try:
-            with temporary_env(env_vars):
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="gofmt",
-                    stream_handler=context.stream_handler,
-                    timeout=120,
-                )
+            result = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="gofmt",
+                stream_handler=context.stream_handler,
+                timeout=120,
+                env=env_vars,
+            )
         except subprocess.TimeoutExpired:
             LOGGER.warning("gofmt check timed out after 120 seconds")
             context.record_skip(
@@ -151,14 +151,14 @@ class GofmtFormatter(FormatterPlugin):
         env_vars = ensure_go_in_path()
 
         try:
-            with temporary_env(env_vars):
-                run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="gofmt-fix",
-                    stream_handler=context.stream_handler,
-                    timeout=120,
-                )
+            run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="gofmt-fix",
+                stream_handler=context.stream_handler,
+                timeout=120,
+                env=env_vars,
+            )
         except Exception as e:
             LOGGER.error(f"Failed to run gofmt: {e}")
             return FixResult()
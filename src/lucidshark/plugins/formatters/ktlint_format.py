@@ -21,6 +21,7 @@ from lucidshark.core.models import (
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.formatters.base import FormatterPlugin
+from lucidshark.plugins.jvm_worker import run_in_jvm_worker
 from lucidshark.plugins.linters.base import FixResult
 from lucidshark.plugins.linters.ktlint import KtlintLinter
 
@@ -79,13 +80,15 @@ class KtlintFormatter(FormatterPlugin):
         cmd.extend(paths)
 
         try:
-            result = run_with_streaming(
-                cmd=cmd,
-                cwd=context.project_root,
-                tool_name="ktlint-format-check",
-                stream_handler=context.stream_handler,
-                timeout=120,
-            )
+            result = run_in_jvm_worker(context, cmd, "ktlint-format-check", timeout=120)
+            if result is None:
+                result = run_with_streaming(
+                    cmd=cmd,
+                    cwd=context.project_root,
+                    tool_name="ktlint-format-check",
+                    stream_handler=context.stream_handler,
+                    timeout=120,
+                )
         except subprocess.TimeoutExpired:
             LOGGER.warning("ktlint format check timed out after 120 seconds")
             context.record_skip(
@@ -167,13 +170,17 @@ class KtlintFormatter(FormatterPlugin):
         cmd.extend(paths)
 
         try:
-            run_with_streaming(
-                cmd=cmd,
-                cwd=context.project_root,
-                tool_name="ktlint-format-fix",
-                stream_handler=context.stream_handler,
-                timeout=120,
-            )
+            if (
+                run_in_jvm_worker(context, cmd, "ktlint-format-fix", timeout=120)
+                is None
+            ):
+                run_with_streaming(
+                    cmd=cmd,
+                    cwd=context.project_root,
+                    tool_name="ktlint-format-fix",
+                    stream_handler=context.stream_handler,
+                    timeout=120,
+                )
         except Exception as e:
             LOGGER.error(f"Failed to run ktlint format: {e}")
             return FixResult()
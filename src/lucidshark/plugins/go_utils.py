@@ -2,22 +2,41 @@
 
 Common functionality used across Go-based plugins (golangci-lint, go vet,
 go test, go cover, gofmt) to avoid code duplication.
+
+Incremental scans are scoped with the module's package graph: Go tools
+receive only the packages containing changed files and the packages that
+(transitively) import them. The graph comes from ``go list -json ./...``
+and is cached in ``.lucidshark/cache/go/packages.json`` until ``go.mod``,
+``go.sum``, ``go.work`` or the module's directories and ``.go`` files
+change.
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 import re
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from lucidshark.core.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
+# Package pattern covering the whole module
+GO_ALL_PACKAGES = "./..."
+
+# Bump when the on-disk format changes to discard old graphs
+GO_GRAPH_FORMAT = 1
+
+GO_GRAPH_FILE = "packages.json"
+
+# Root files whose change can affect every package
+GO_MODULE_FILES = ("go.mod", "go.sum", "go.work", "go.work.sum")
+
 
 def find_go() -> Path:
     """Find go binary in PATH.
@@ -233,7 +252,7 @@ def ensure_go_in_path() -> Dict[str, str]:
 
     Returns:
         Dict of environment variables to set (may be empty if go already in PATH).
-        Use with lucidshark.core.subprocess_runner.temporary_env().
+        Pass as ``env`` to lucidshark.core.subprocess_runner.run_with_streaming().
     """
     current_path = os.environ.get("PATH", "")
 
@@ -270,3 +289,197 @@ def ensure_go_in_path() -> Dict[str, str]:
         LOGGER.warning("Could not find 'go' binary - Go tools may fail")
 
     return env_vars
+
+
+def _module_fingerprint(project_root: Path) -> str:
+    """Fingerprint the inputs of a module's package graph.
+
+    Covers the module files and the mtimes of the directories and ``.go``
+    files that ``./...`` matches. Directory mtimes change when files are
+    added or removed; file mtimes catch edited imports.
+
+    Args:
+        project_root: Module root directory.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.sha256(f"{GO_GRAPH_FORMAT}\0".encode())
+    for name in GO_MODULE_FILES:
+        try:
+            digest.update(f"{name}\0".encode())
+            digest.update(hashlib.sha256((project_root / name).read_bytes()).digest())
+        except OSError:
+            continue
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        # Same directories the go command skips when matching ./...
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if not d.startswith((".", "_"))
+            and d not in ("testdata", "vendor")
+            and not (Path(dirpath) / d / "go.mod").exists()
+        )
+        try:
+            digest.update(f"{dirpath}\0{os.stat(dirpath).st_mtime_ns}\0".encode())
+        except OSError:
+            continue
+        for name in sorted(filenames):
+            if not name.endswith(".go"):
+                continue
+            try:
+                stat = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            digest.update(f"{name}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode())
+    return digest.hexdigest()
+
+
+def _list_packages(project_root: Path) -> Optional[Dict[str, List[str]]]:
+    """Build the package graph of a module with ``go list``.
+
+    Args:
+        project_root: Module root directory.
+
+    Returns:
+        Imported module packages per package directory (root-relative,
+        ``"."`` for the root), or None if ``go list`` failed.
+    """
+    try:
+        go_bin = find_go()
+        result = subprocess.run(
+            [str(go_bin), "list", "-e", "-json", GO_ALL_PACKAGES],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            cwd=project_root,
+            env={**os.environ, **ensure_go_in_path()},
+            timeout=120,
+        )
+    except (FileNotFoundError, OSError, subprocess.TimeoutExpired) as e:
+        LOGGER.debug(f"go list failed: {e}")
+        return None
+    if result.returncode != 0:
+        LOGGER.debug(f"go list failed: {result.stderr[:500]}")
+        return None
+
+    # go list -json prints one JSON object per package, not an array
+    packages: List[Dict[str, Any]] = []
+    decoder = json.JSONDecoder()
+    output = result.stdout
+    index = 0
+    try:
+        while True:
+            while index < len(output) and output[index].isspace():
+                index += 1
+            if index >= len(output):
+                break
+            package, index = decoder.raw_decode(output, index)
+            packages.append(package)
+    except ValueError as e:
+        LOGGER.debug(f"Cannot parse go list output: {e}")
+        return None
+
+    root = project_root.resolve()
+    dirs: Dict[str, str] = {}
+    for package in packages:
+        try:
+            relative = Path(package["Dir"]).resolve().relative_to(root)
+        except (KeyError, TypeError, ValueError):
+            continue
+        dirs[package.get("ImportPath", "")] = relative.as_posix()
+
+    graph: Dict[str, List[str]] = {}
+    for package in packages:
+        package_dir = dirs.get(package.get("ImportPath", ""))
+        if package_dir is None:
+            continue
+        imports: Set[str] = set()
+        for key in ("Imports", "TestImports", "XTestImports"):
+            imports.update(package.get(key) or [])
+        graph[package_dir] = sorted(
+            dirs[i] for i in imports if i in dirs and dirs[i] != package_dir
+        )
+    return graph
+
+
+def load_package_graph(project_root: Path) -> Optional[Dict[str, List[str]]]:
+    """Return a module's package graph, from the cache when still current.
+
+    Args:
+        project_root: Module root directory.
+
+    Returns:
+        Imported module package directories per package directory, or None
+        if the graph cannot be built.
+    """
+    from lucidshark.bootstrap.paths import LucidsharkPaths
+    from lucidshark.plugins.utils import cached_json
+
+    cache_file = (
+        LucidsharkPaths.for_project(project_root).plugin_cache_dir("go") / GO_GRAPH_FILE
+    )
+    try:
+        # Before fingerprinting: creating it changes the root's mtime
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        LOGGER.debug(f"Cannot create Go cache directory: {e}")
+    return cached_json(
+        cache_file,
+        "packages",
+        GO_GRAPH_FORMAT,
+        _module_fingerprint(project_root),
+        lambda: _list_packages(project_root),
+    )
+
+
+def affected_packages(
+    graph: Dict[str, List[str]], changed: List[str]
+) -> Optional[Set[str]]:
+    """Find the packages affected by changed files.
+
+    Args:
+        graph: Package graph from :func:`load_package_graph`.
+        changed: Changed files relative to the module root (posix).
+
+    Returns:
+        Directories of the packages containing a changed file (or, for
+        non-Go files such as embedded assets, the nearest enclosing
+        package) and of all packages importing them; None if a module file
+        changed and every package is affected.
+    """
+    from lucidshark.plugins.utils import affected_closure
+
+    return affected_closure(
+        {package_dir: package_dir for package_dir in graph},
+        graph,
+        changed,
+        GO_MODULE_FILES,
+    )
+
+
+def go_package_targets(context: Any) -> List[str]:
+    """Package patterns for a Go tool to analyze in a scan.
+
+    Args:
+        context: Scan context.
+
+    Returns:
+        ``["./..."]`` for full scans (or when the package graph is
+        unavailable); for scans of specific files, the affected packages as
+        ``./dir`` patterns, which may be empty.
+    """
+    from lucidshark.plugins.utils import changed_files
+
+    changed = changed_files(context)
+    if changed is None:
+        return [GO_ALL_PACKAGES]
+
+    graph = load_package_graph(context.project_root)
+    if graph is None:
+        return [GO_ALL_PACKAGES]
+    affected = affected_packages(graph, changed)
+    if affected is None:
+        return [GO_ALL_PACKAGES]
+    return ["." if d == "." else f"./{d}" for d in sorted(affected)]
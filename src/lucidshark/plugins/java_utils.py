@@ -0,0 +1,332 @@
+"""Shared utilities for Maven and Gradle plugins.
+
+Incremental scans run the Maven/Gradle test runner only on the modules
+affected by changed files: the innermost module containing each changed
+file plus every module depending on it. Modules are read from the build
+files (``<modules>`` in ``pom.xml``, ``include`` in ``settings.gradle``)
+and module dependencies from ``<dependency>``/``<parent>`` entries and
+``project(":name")`` references.
+
+SpotBugs analyzes only the classes compiled from changed ``.java`` files
+(``-onlyAnalyze``), with the remaining class directories on the
+auxiliary classpath.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import defusedxml.ElementTree as ET  # type: ignore[import-untyped]
+from xml.etree.ElementTree import Element
+
+from lucidshark.core.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Root-level files that configure every module
+JAVA_BUILD_FILES = frozenset(
+    {
+        "settings.gradle",
+        "settings.gradle.kts",
+        "build.gradle",
+        "build.gradle.kts",
+        "gradle.properties",
+    }
+)
+
+# Root-level directories that configure every module
+JAVA_BUILD_DIRS = (".mvn/", "gradle/", "buildSrc/")
+
+# Class output directories per source set
+CLASS_OUTPUT_DIRS = {
+    "main": ("target/classes", "build/classes/java/main"),
+    "test": ("target/test-classes", "build/classes/java/test"),
+}
+
+_SOURCE_FILE = re.compile(r"^(?:(.+)/)?src/([^/]+)/java/(.+)\.java$")
+_GRADLE_INCLUDE = re.compile(r"\binclude\s*\(?((?:\s*[\"'][^\"']+[\"']\s*,?)+)")
+_GRADLE_PROJECT = re.compile(r"\bproject\(\s*(?:path\s*[:=]\s*)?[\"'](:[^\"']*)[\"']")
+_QUOTED = re.compile(r"[\"']([^\"']+)[\"']")
+
+
+def _local(tag: str) -> str:
+    """Strip the XML namespace from a tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child(element: Element, name: str) -> Optional[Element]:
+    """First child element with a local name."""
+    for child in element:
+        if _local(child.tag) == name:
+            return child
+    return None
+
+
+def _child_text(element: Optional[Element], name: str) -> str:
+    """Stripped text of a child element, or an empty string."""
+    if element is None:
+        return ""
+    child = _child(element, name)
+    return (child.text or "").strip() if child is not None else ""
+
+
+def maven_modules(project_root: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Read the modules of a Maven reactor.
+
+    Args:
+        project_root: Directory of the root ``pom.xml``.
+
+    Returns:
+        Modules by directory relative to the project root (``"."`` for the
+        root), each with the directories of the reactor modules it depends
+        on (``deps``), or None if a ``pom.xml`` cannot be read.
+    """
+    poms: Dict[str, Element] = {}
+    pending = ["."]
+    while pending:
+        module_dir = pending.pop()
+        if module_dir in poms:
+            continue
+        try:
+            pom = ET.parse(project_root / module_dir / "pom.xml").getroot()
+        except Exception as e:
+            LOGGER.debug(f"Cannot read {module_dir}/pom.xml: {e}")
+            return None
+        poms[module_dir] = pom
+        modules = _child(pom, "modules")
+        for module in modules if modules is not None else ():
+            relative = (module.text or "").strip()
+            if relative.endswith(".xml"):
+                relative = os.path.dirname(relative)
+            path = os.path.normpath(os.path.join(module_dir, relative))
+            if path != ".." and not path.startswith("../"):
+                pending.append(Path(path).as_posix())
+
+    ids: Dict[str, str] = {}
+    for module_dir, pom in poms.items():
+        parent = _child(pom, "parent")
+        group = _child_text(pom, "groupId") or _child_text(parent, "groupId")
+        ids[f"{group}:{_child_text(pom, 'artifactId')}"] = module_dir
+
+    graph: Dict[str, Dict[str, Any]] = {}
+    for module_dir, pom in poms.items():
+        parent = _child(pom, "parent")
+        group = _child_text(pom, "groupId") or _child_text(parent, "groupId")
+        coordinates = []
+        if parent is not None:
+            coordinates.append(
+                (_child_text(parent, "groupId"), _child_text(parent, "artifactId"))
+            )
+        dependencies = _child(pom, "dependencies")
+        for dependency in dependencies if dependencies is not None else ():
+            dep_group = _child_text(dependency, "groupId")
+            if dep_group in ("${project.groupId}", "${project.parent.groupId}"):
+                dep_group = group
+            coordinates.append((dep_group, _child_text(dependency, "artifactId")))
+        deps = {
+            ids[f"{g}:{a}"]
+            for g, a in coordinates
+            if f"{g}:{a}" in ids and ids[f"{g}:{a}"] != module_dir
+        }
+        graph[module_dir] = {"deps": sorted(deps)}
+    return graph
+
+
+def _gradle_build_file(directory: Path) -> Optional[Path]:
+    """The ``build.gradle(.kts)`` of a Gradle project directory."""
+    for name in ("build.gradle.kts", "build.gradle"):
+        if (directory / name).is_file():
+            return directory / name
+    return None
+
+
+def gradle_task(module_dir: str, task: str) -> str:
+    """Gradle task path in a project directory (``a/b``, ``test`` -> ``:a:b:test``).
+
+    Args:
+        module_dir: Project directory relative to the project root.
+        task: Task name.
+    """
+    if module_dir == ".":
+        return f":{task}"
+    return ":" + module_dir.replace("/", ":") + f":{task}"
+
+
+def gradle_modules(project_root: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Read the projects of a Gradle multi-project build.
+
+    Only the default layout (project ``:a:b`` in directory ``a/b``) is
+    understood.
+
+    Args:
+        project_root: Directory of ``settings.gradle(.kts)``.
+
+    Returns:
+        Projects by directory relative to the project root (``"."`` for
+        the root project), each with the directories of the projects it
+        depends on (``deps``), or None if the build cannot be read (no
+        settings file, custom project directories, composite builds or
+        type-safe project accessors).
+    """
+    settings = None
+    for name in ("settings.gradle.kts", "settings.gradle"):
+        if (project_root / name).is_file():
+            settings = project_root / name
+            break
+    if settings is None:
+        return None
+    try:
+        text = settings.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    if "projectDir" in text or "includeBuild" in text:
+        return None
+
+    module_dirs = {"."}
+    for match in _GRADLE_INCLUDE.finditer(text):
+        for project in _QUOTED.findall(match.group(1)):
+            module_dirs.add(project.strip(":").replace(":", "/") or ".")
+
+    graph: Dict[str, Dict[str, Any]] = {}
+    for module_dir in module_dirs:
+        deps: Set[str] = set()
+        build_file = _gradle_build_file(project_root / module_dir)
+        if build_file is not None:
+            try:
+                build = build_file.read_text(encoding="utf-8")
+            except OSError:
+                return None
+            if re.search(r"\bprojects\.\w", build):
+                return None
+            for path in _GRADLE_PROJECT.findall(build):
+                dep = path.strip(":").replace(":", "/") or "."
+                if dep in module_dirs and dep != module_dir:
+                    deps.add(dep)
+        graph[module_dir] = {"deps": sorted(deps)}
+    return graph
+
+
+def affected_modules(
+    modules: Dict[str, Dict[str, Any]], changed: List[str]
+) -> Optional[Set[str]]:
+    """Find the modules affected by changed files.
+
+    Args:
+        modules: Module graph from :func:`maven_modules` or
+            :func:`gradle_modules`.
+        changed: Changed files relative to the project root (posix).
+
+    Returns:
+        Directories of the innermost modules containing a changed file and
+        of all modules depending on them; None if a build-wide file changed.
+    """
+    from lucidshark.plugins.utils import affected_closure
+
+    return affected_closure(
+        {module_dir: module_dir for module_dir in modules},
+        {module_dir: module["deps"] for module_dir, module in modules.items()},
+        changed,
+        JAVA_BUILD_FILES | set(JAVA_BUILD_DIRS),
+    )
+
+
+def upstream_modules(
+    modules: Dict[str, Dict[str, Any]], selected: Set[str]
+) -> Set[str]:
+    """Modules that selected modules depend on, excluding the selection.
+
+    Args:
+        modules: Module graph.
+        selected: Selected module directories.
+    """
+    upstream: Set[str] = set()
+    pending = [dep for module_dir in selected for dep in modules[module_dir]["deps"]]
+    while pending:
+        module_dir = pending.pop()
+        if module_dir in upstream or module_dir in selected:
+            continue
+        upstream.add(module_dir)
+        pending.extend(modules.get(module_dir, {}).get("deps", ()))
+    return upstream
+
+
+def java_module_selection(context: Any, build_system: str) -> Optional[Dict[str, Any]]:
+    """Modules a Maven or Gradle command should cover in a scan.
+
+    Args:
+        context: Scan context.
+        build_system: ``"maven"`` or ``"gradle"``.
+
+    Returns:
+        None for the whole build (full scans, single-module builds, or when
+        the modules cannot be read or a build-wide file changed). Otherwise
+        the module graph (``modules``), the affected module directories
+        (``affected``, possibly empty) and the modules they depend on
+        (``upstream``).
+    """
+    from lucidshark.plugins.utils import changed_files
+
+    changed = changed_files(context)
+    if changed is None:
+        return None
+    if build_system == "maven":
+        modules = maven_modules(context.project_root)
+    else:
+        modules = gradle_modules(context.project_root)
+    if modules is None or len(modules) < 2:
+        return None
+    affected = affected_modules(modules, changed)
+    if affected is None:
+        return None
+    return {
+        "modules": modules,
+        "affected": affected,
+        "upstream": upstream_modules(modules, affected),
+    }
+
+
+def changed_classes(context: Any) -> Optional[Dict[Path, List[str]]]:
+    """Compiled classes of the ``.java`` files changed in a scan.
+
+    Class files are looked up in the Maven and Gradle output directories
+    of each file's source set, including nested and anonymous classes.
+
+    Args:
+        context: Scan context.
+
+    Returns:
+        None for full scans; otherwise binary class names per class
+        directory, empty if no changed file has been compiled.
+    """
+    from lucidshark.plugins.utils import changed_files
+
+    changed = changed_files(context)
+    if changed is None:
+        return None
+    classes: Dict[Path, List[str]] = {}
+    for path in changed:
+        match = _SOURCE_FILE.match(path)
+        if not match:
+            continue
+        module_dir, source_set, relative = match.groups()
+        module_root = context.project_root / (module_dir or "")
+        outputs = CLASS_OUTPUT_DIRS.get(
+            source_set, (f"build/classes/java/{source_set}",)
+        )
+        for output in outputs:
+            class_dir = module_root / output
+            source_class = class_dir / f"{relative}.class"
+            if not source_class.is_file():
+                continue
+            package = relative.rpartition("/")[0].replace("/", ".")
+            prefix = f"{package}." if package else ""
+            names = [source_class.stem] + [
+                p.stem for p in source_class.parent.glob(f"{source_class.stem}$*.class")
+            ]
+            classes.setdefault(class_dir, []).extend(
+                prefix + name for name in sorted(names)
+            )
+    return classes
@@ -0,0 +1,489 @@
+"""Persistent JVM worker for Java and Kotlin tools.
+
+Checkstyle, PMD, ktlint, detekt and SpotBugs run on the JVM; starting a
+fresh ``java -jar`` process for every scan costs seconds of JVM startup,
+class loading and JIT warm-up before any file is analyzed. With
+``settings.jvm_worker: true`` these tools run inside a long-lived JVM
+instead (``LucidSharkJvmWorker.java`` in ``lucidshark.data``), which keeps
+each tool's class loader between scans.
+
+The worker is started on first use, listens on a loopback port and exits
+after :data:`WORKER_IDLE_TIMEOUT` seconds without a request. Its state
+(port, pid, access token) lives under ``.lucidshark/jvm-worker/``. The
+worker is restarted when the Java installation or the worker source
+changes, and reloads a tool when its JARs change. Whenever the worker
+cannot be used (no suitable Java, worker busy or crashed), tools fall back
+to a fresh JVM process.
+
+Wire format (big-endian): strings are an ``int32`` byte length followed by
+UTF-8 bytes, lists an ``int32`` count followed by strings. A request is
+``token, op`` followed for ``op == "run"`` by ``main_class, classpath,
+args``. The response is ``int32 status``; status 0 is followed by
+``int32 exit_code, stdout, stderr``, any other status by an error message.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.resources  # nosemgrep: python37-compatibility-importlib2 (requires-python>=3.10)
+import json
+import os
+import re
+import secrets
+import shutil
+import signal
+import socket
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple
+
+from lucidshark.core.logging import get_logger
+from lucidshark.core.models import ScanContext
+
+LOGGER = get_logger(__name__)
+
+WORKER_SOURCE = "LucidSharkJvmWorker.java"
+WORKER_DIR = "jvm-worker"
+STATE_FILE = "state.json"
+PORT_FILE = "port"
+LOG_FILE = "worker.log"
+TOKEN_ENV = "LUCIDSHARK_JVM_WORKER_TOKEN"
+
+# Bump when the wire format or state file changes
+PROTOCOL_VERSION = 1
+
+# Seconds without a request before the worker exits
+WORKER_IDLE_TIMEOUT = 1800
+
+# Seconds to wait for a new worker to listen (includes compiling the source)
+STARTUP_TIMEOUT = 60
+
+# System.exit() is intercepted with a security manager, removed in Java 24
+MIN_JAVA_VERSION = 11
+MAX_JAVA_VERSION = 23
+
+_STATUS_OK = 0
+_JAVA_VERSION_RE = re.compile(r'version "(\d+)(?:\.(\d+))?')
+
+
+class WorkerUnavailable(Exception):
+    """The JVM worker cannot serve a request; use a fresh JVM instead."""
+
+
+def jvm_worker_enabled(context: ScanContext) -> bool:
+    """Whether ``settings.jvm_worker`` is enabled for a scan.
+
+    Args:
+        context: Scan context.
+
+    Returns:
+        True if JVM tools should run in the persistent worker.
+    """
+    settings = getattr(context.config, "settings", None)
+    return getattr(settings, "jvm_worker", False) is True
+
+
+def java_major_version(java: str) -> Optional[int]:
+    """Return the major version of a Java runtime.
+
+    Args:
+        java: Path to the ``java`` executable.
+
+    Returns:
+        The major version (``8`` for ``1.8``), or None if unknown.
+    """
+    from lucidshark.core.capability_cache import cached_probe
+
+    def probe() -> Optional[int]:
+        try:
+            result = subprocess.run(
+                [java, "-version"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        # java -version prints to stderr
+        match = _JAVA_VERSION_RE.search(result.stderr + result.stdout)
+        if not match:
+            return None
+        major = int(match.group(1))
+        if major == 1 and match.group(2):
+            major = int(match.group(2))
+        return major
+
+    return cached_probe("java-major-version", [java], [Path(java).resolve()], probe)
+
+
+def _pack_string(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return struct.pack(">i", len(data)) + data
+
+
+def _pack_strings(values: Sequence[str]) -> bytes:
+    return struct.pack(">i", len(values)) + b"".join(_pack_string(v) for v in values)
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if data is None or len(data) != size:
+        raise WorkerUnavailable("JVM worker closed the connection")
+    return data
+
+
+def _read_int(stream: BinaryIO) -> int:
+    return struct.unpack(">i", _read_exact(stream, 4))[0]
+
+
+def _read_bytes(stream: BinaryIO) -> bytes:
+    return _read_exact(stream, _read_int(stream))
+
+
+class JvmWorker:
+    """Client of the persistent JVM worker of one project.
+
+    Requests are serialized: while one tool runs in the worker, concurrent
+    callers get :class:`WorkerUnavailable` and start their own JVM rather
+    than wait.
+    """
+
+    def __init__(self, project_root: Path, java: str = "java") -> None:
+        """Initialize the client.
+
+        Args:
+            project_root: Project root; the worker runs with it as
+                working directory.
+            java: Java executable name or path.
+        """
+        from lucidshark.bootstrap.paths import LucidsharkPaths
+
+        self.project_root = project_root
+        self.java = java
+        # The lucidshark home may be shared (LUCIDSHARK_HOME), so key by root
+        digest = hashlib.sha256(str(project_root.resolve()).encode()).hexdigest()
+        self.state_dir = (
+            LucidsharkPaths.for_project(project_root).home / WORKER_DIR / digest[:16]
+        )
+        self._lock = threading.Lock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._disabled: Optional[str] = None
+
+    def run(
+        self,
+        classpath: Sequence[Path],
+        args: Sequence[str],
+        main_class: Optional[str] = None,
+        timeout: int = 120,
+    ) -> Tuple[int, str, str]:
+        """Run a tool's main class in the worker.
+
+        Args:
+            classpath: JARs of the tool.
+            args: Command-line arguments of the tool.
+            main_class: Class to run; defaults to the ``Main-Class`` of the
+                first JAR's manifest.
+            timeout: Seconds to wait for the tool.
+
+        Returns:
+            Tuple of (exit code, stdout, stderr).
+
+        Raises:
+            WorkerUnavailable: If the worker is busy or cannot be used.
+            subprocess.TimeoutExpired: If the tool timed out; the worker
+                is killed.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise WorkerUnavailable("JVM worker is busy")
+        try:
+            state = self._ensure_running()
+            payload = (
+                _pack_string("run")
+                + _pack_string(main_class or "")
+                + _pack_strings([str(p) for p in classpath])
+                + _pack_strings(list(args))
+            )
+            try:
+                exit_code, stdout, stderr = self._request(state, payload, timeout)
+            except socket.timeout:
+                self._kill(state)
+                raise subprocess.TimeoutExpired(
+                    ["jvm-worker", main_class or str(classpath[0]), *args], timeout
+                ) from None
+            except (OSError, struct.error, WorkerUnavailable) as e:
+                self._state = None
+                raise WorkerUnavailable(f"JVM worker request failed: {e}") from e
+            return (
+                exit_code,
+                stdout.decode("utf-8", errors="replace"),
+                stderr.decode("utf-8", errors="replace"),
+            )
+        finally:
+            self._lock.release()
+
+    def stop(self) -> None:
+        """Ask a running worker to exit."""
+        with self._lock:
+            state = self._state or self._read_state()
+            if state is not None:
+                self._stop(state)
+            self._state = None
+
+    def _ensure_running(self) -> Dict[str, Any]:
+        """Connect to the worker, (re)starting it when needed."""
+        if self._disabled is not None:
+            raise WorkerUnavailable(self._disabled)
+        if self._state is not None:
+            return self._state
+
+        java_path = shutil.which(self.java)
+        if java_path is None:
+            self._disabled = "java not found in PATH"
+            raise WorkerUnavailable(self._disabled)
+        major = java_major_version(java_path)
+        if major is not None and not (MIN_JAVA_VERSION <= major <= MAX_JAVA_VERSION):
+            self._disabled = (
+                f"JVM worker needs Java {MIN_JAVA_VERSION}-{MAX_JAVA_VERSION}, "
+                f"found Java {major}"
+            )
+            raise WorkerUnavailable(self._disabled)
+
+        source = self._install_source()
+        fingerprint = self._fingerprint(java_path, source)
+        state = self._read_state()
+        if state is not None:
+            if state.get("fingerprint") == fingerprint and self._ping(state):
+                self._state = state
+                return state
+            LOGGER.debug("Restarting JVM worker (Java or worker changed)")
+            self._stop(state)
+
+        try:
+            state = self._start(java_path, major, source, fingerprint)
+        except WorkerUnavailable as e:
+            self._disabled = str(e)
+            raise
+        self._state = state
+        return state
+
+    def _install_source(self) -> Path:
+        """Copy the worker source next to its state, if it changed."""
+        resource = importlib.resources.files("lucidshark.data").joinpath(WORKER_SOURCE)
+        content = resource.read_bytes()
+        target = self.state_dir / WORKER_SOURCE
+        try:
+            if not target.exists() or target.read_bytes() != content:
+                self.state_dir.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(content)
+        except OSError as e:
+            self._disabled = f"Cannot install JVM worker: {e}"
+            raise WorkerUnavailable(self._disabled) from e
+        return target
+
+    def _fingerprint(self, java_path: str, source: Path) -> List[Any]:
+        """Identify the Java installation and worker a state belongs to."""
+        java = Path(java_path).resolve()
+        try:
+            stat = java.stat()
+            java_stamp: List[Any] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            java_stamp = [None, None]
+        digest = hashlib.sha256(source.read_bytes()).hexdigest()
+        return [PROTOCOL_VERSION, str(java), *java_stamp, digest]
+
+    def _read_state(self) -> Optional[Dict[str, Any]]:
+        """Load the state of a previously started worker."""
+        state_file = self.state_dir / STATE_FILE
+        try:
+            state = json.loads(state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) else None
+
+    def _write_state(self, state: Dict[str, Any]) -> None:
+        """Write the state atomically, readable by the current user only."""
+        fd, tmp = tempfile.mkstemp(dir=self.state_dir, suffix=".tmp", prefix="state")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_dir / STATE_FILE)
+
+    def _start(
+        self,
+        java_path: str,
+        major: Optional[int],
+        source: Path,
+        fingerprint: List[Any],
+    ) -> Dict[str, Any]:
+        """Launch a new worker and wait until it listens."""
+        from lucidshark.core.subprocess_runner import merge_env
+
+        port_file = self.state_dir / PORT_FILE
+        port_file.unlink(missing_ok=True)
+        token = secrets.token_hex(16)
+
+        cmd = [java_path]
+        # Java 12+ refuses System.setSecurityManager() without this
+        if major is None or major >= 12:
+            cmd.append("-Djava.security.manager=allow")
+        cmd.extend([str(source), str(port_file), str(WORKER_IDLE_TIMEOUT)])
+
+        log_path = self.state_dir / LOG_FILE
+        LOGGER.info("Starting JVM worker...")
+        try:
+            with open(log_path, "ab") as log:
+                proc = subprocess.Popen(  # nosemgrep: python36-compatibility-Popen1, python36-compatibility-Popen2
+                    cmd,
+                    cwd=self.project_root,
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=log,
+                    env=merge_env({TOKEN_ENV: token}),
+                    # Outlive this scan and ignore its Ctrl-C
+                    start_new_session=os.name != "nt",
+                )
+        except OSError as e:
+            raise WorkerUnavailable(f"Cannot start JVM worker: {e}") from e
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while not port_file.exists():
+            if proc.poll() is not None:
+                raise WorkerUnavailable(
+                    f"JVM worker exited with code {proc.returncode}, see {log_path}"
+                )
+            if time.monotonic() > deadline:
+                proc.kill()
+                raise WorkerUnavailable(
+                    f"JVM worker did not start within {STARTUP_TIMEOUT} seconds"
+                )
+            time.sleep(0.05)
+
+        try:
+            port = int(port_file.read_text(encoding="utf-8").strip())
+            state = {
+                "pid": proc.pid,
+                "port": port,
+                "token": token,
+                "fingerprint": fingerprint,
+            }
+            self._write_state(state)
+        except (OSError, ValueError) as e:
+            proc.kill()
+            raise WorkerUnavailable(f"Cannot record JVM worker state: {e}") from e
+        LOGGER.debug(f"JVM worker {proc.pid} listening on port {port}")
+        return state
+
+    def _request(
+        self,
+        state: Dict[str, Any],
+        payload: bytes,
+        timeout: float,
+    ) -> Tuple[int, bytes, bytes]:
+        """Send one request and read the response."""
+        with socket.create_connection(
+            ("127.0.0.1", int(state["port"])), timeout=timeout
+        ) as sock:
+            sock.sendall(_pack_string(str(state["token"])) + payload)
+            with sock.makefile("rb") as stream:
+                if _read_int(stream) != _STATUS_OK:
+                    message = _read_bytes(stream).decode("utf-8", errors="replace")
+                    raise WorkerUnavailable(f"JVM worker error: {message}")
+                exit_code = _read_int(stream)
+                return exit_code, _read_bytes(stream), _read_bytes(stream)
+
+    def _ping(self, state: Dict[str, Any]) -> bool:
+        """Whether the worker of a state answers."""
+        try:
+            self._request(state, _pack_string("ping"), timeout=5)
+        except (OSError, KeyError, ValueError, struct.error, WorkerUnavailable):
+            return False
+        return True
+
+    def _stop(self, state: Dict[str, Any]) -> None:
+        """Ask a worker to exit; an unreachable one exits when idle."""
+        try:
+            self._request(state, _pack_string("stop"), timeout=5)
+        except (OSError, KeyError, ValueError, struct.error, WorkerUnavailable):
+            pass
+        (self.state_dir / STATE_FILE).unlink(missing_ok=True)
+
+    def _kill(self, state: Dict[str, Any]) -> None:
+        """Kill a worker stuck in a request."""
+        self._state = None
+        try:
+            os.kill(int(state["pid"]), getattr(signal, "SIGKILL", signal.SIGTERM))
+        except (OSError, KeyError, ValueError) as e:
+            LOGGER.debug(f"Failed to kill JVM worker: {e}")
+        (self.state_dir / STATE_FILE).unlink(missing_ok=True)
+
+
+_workers: Dict[Path, JvmWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_jvm_worker(project_root: Path) -> JvmWorker:
+    """Return the worker client of a project, shared by all plugins."""
+    with _workers_lock:
+        worker = _workers.get(project_root)
+        if worker is None:
+            worker = JvmWorker(project_root)
+            _workers[project_root] = worker
+        return worker
+
+
+def run_in_jvm_worker(
+    context: ScanContext,
+    cmd: List[str],
+    tool_name: str,
+    timeout: int = 120,
+    classpath: Optional[Sequence[Path]] = None,
+    main_class: Optional[str] = None,
+) -> Optional[subprocess.CompletedProcess]:
+    """Run a JVM tool command in the persistent worker, if enabled.
+
+    Output is replayed to the context's stream handler once the tool
+    finishes.
+
+    Args:
+        context: Scan context.
+        cmd: The equivalent ``java -jar <jar> args...`` command, or a
+            launcher command whose arguments start at ``cmd[1]`` when
+            ``classpath`` is given.
+        tool_name: Tool name for stream events.
+        timeout: Timeout in seconds.
+        classpath: JARs of the tool, for tools started by a launcher script.
+        main_class: Main class to run with ``classpath``.
+
+    Returns:
+        The completed process, or None if the worker is disabled or
+        unavailable and the caller should run ``cmd`` itself.
+
+    Raises:
+        subprocess.TimeoutExpired: If the tool timed out.
+    """
+    if not jvm_worker_enabled(context):
+        return None
+    if classpath is not None:
+        jars, args = list(classpath), cmd[1:]
+    elif len(cmd) >= 3 and cmd[1] == "-jar":
+        jars, args = [Path(cmd[2])], cmd[3:]
+    else:
+        return None
+    if not jars:
+        return None
+
+    from lucidshark.core.subprocess_runner import replay_output
+
+    worker = get_jvm_worker(context.project_root)
+    try:
+        exit_code, stdout, stderr = worker.run(jars, args, main_class, timeout)
+    except WorkerUnavailable as e:
+        LOGGER.debug(f"Running {tool_name} in a new JVM: {e}")
+        return None
+
+    return replay_output(
+        cmd, tool_name, exit_code, stdout, stderr, context.stream_handler
+    )
@@ -15,7 +15,7 @@ def discover_linter_plugins():
     """Discover all installed linter plugins.
 
     Returns:
-        Dictionary mapping plugin names to plugin classes.
+        Mapping of plugin names to plugin classes (imported on access).
     """
     return discover_plugins(LINTER_ENTRY_POINT_GROUP, LinterPlugin)
 
@@ -84,6 +84,29 @@ class LinterPlugin(ABC):
         """
         return False
 
+    @property
+    def cache_extensions(self) -> Tuple[str, ...]:
+        """File extensions whose results may be cached per file.
+
+        Linters whose findings for a file depend only on that file's
+        content override this to opt into the result cache.
+
+        Returns:
+            Lowercase extensions (e.g., ('.py', '.pyi')). Empty disables caching.
+        """
+        return ()
+
+    @property
+    def cache_config_files(self) -> Tuple[str, ...]:
+        """Config files (relative to the project root) that affect results.
+
+        Their content is part of the result cache key.
+
+        Returns:
+            Tuple of relative file names.
+        """
+        return ()
+
     def get_version(self) -> str:
         """Get the version of the underlying linting tool.
 
@@ -151,13 +174,15 @@ class LinterPlugin(ABC):
         """
         label = tool_label or self.name
         try:
-            result = run_with_streaming(
-                cmd=cmd,
-                cwd=context.project_root,
-                tool_name=label,
-                stream_handler=context.stream_handler,
-                timeout=timeout,
-            )
+            result = self._run_in_server(cmd, context, label, timeout)
+            if result is None:
+                result = run_with_streaming(
+                    cmd=cmd,
+                    cwd=context.project_root,
+                    tool_name=label,
+                    stream_handler=context.stream_handler,
+                    timeout=timeout,
+                )
             return result.stdout
         except subprocess.TimeoutExpired:
             LOGGER.warning(f"{label} timed out after {timeout} seconds")
@@ -178,6 +203,32 @@ class LinterPlugin(ABC):
             )
             return None
 
+    def _run_in_server(
+        self,
+        cmd: List[str],
+        context: ScanContext,
+        tool_label: str,
+        timeout: int,
+    ) -> Optional[subprocess.CompletedProcess]:
+        """Run a linter command in a persistent tool server.
+
+        Override for linters that can keep a server running between scans
+        of long-lived sessions (``context.persistent_tools``).
+
+        Args:
+            cmd: Command to execute.
+            context: Scan context.
+            tool_label: Tool name for logging and stream events.
+            timeout: Timeout in seconds.
+
+        Returns:
+            The completed process, or None to run ``cmd`` as a subprocess.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command timed out.
+        """
+        return None
+
     @staticmethod
     def _calculate_fix_stats(
         pre_issues: List[UnifiedIssue],
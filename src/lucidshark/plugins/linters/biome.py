@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import hashlib
 import json
+import subprocess
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from lucidshark.core.logging import get_logger
 from lucidshark.core.models import (
@@ -18,6 +20,7 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
+from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.linters.base import FixResult, LinterPlugin
 from lucidshark.plugins.utils import ensure_node_binary, get_cli_version
 
@@ -30,6 +33,143 @@ SEVERITY_MAP = {
     "info": Severity.LOW,
 }
 
+# Lockfiles whose change (e.g. a Biome upgrade) restarts an owned daemon
+BIOME_DAEMON_LOCKFILES = (
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "bun.lock",
+    "bun.lockb",
+)
+
+
+class BiomeDaemon:
+    """Biome's own daemon (``biome start``), used by long-lived sessions.
+
+    Commands run with ``--use-server`` then reuse the daemon's loaded
+    workspace instead of starting from scratch. The daemon watches and
+    reloads the Biome configuration itself. A daemon this session started
+    is restarted when the Biome version or a lockfile changes (an upgrade
+    keeps the binary path), and stopped with the session (see
+    ``core.daemons``); one that was already running (for example for an
+    editor) is used but left alone.
+    """
+
+    def __init__(self, binary: Path, project_root: Path) -> None:
+        """Initialize the daemon handle.
+
+        Args:
+            binary: Path to the ``biome`` executable.
+            project_root: Project root.
+        """
+        self.binary = binary
+        self.project_root = project_root
+        self.key = f"biome:{binary}:{project_root}"
+        self._lock = threading.Lock()
+        self._running = False
+        self._started = False
+        self._failed = False
+        self._state: Optional[List[Any]] = None
+
+    def ensure_running(self) -> bool:
+        """Start the daemon, or restart it after a Biome upgrade.
+
+        Returns:
+            True if commands may use ``--use-server``.
+        """
+        from lucidshark.core.daemons import register_daemon
+
+        with self._lock:
+            if self._failed:
+                return False
+            state = self._current_state()
+            if self._running:
+                if not self._started or state == self._state:
+                    return True
+                LOGGER.debug("Restarting Biome daemon (version or lockfile changed)")
+                self._command("stop")
+                self._running = False
+            output = self._command("start")
+            if output is None:
+                self._failed = True
+                return False
+            self._running = True
+            self._state = state
+            # "The server was already running" means someone else owns it
+            self._started = "already running" not in output.lower()
+            if not self._started:
+                LOGGER.debug("Using an already running Biome daemon")
+                return True
+        register_daemon(self.key, self.stop)
+        return True
+
+    def mark_failed(self) -> None:
+        """Stop using the daemon for this session."""
+        with self._lock:
+            self._failed = True
+
+    def stop(self) -> None:
+        """Stop the daemon if it was started by this session."""
+        from lucidshark.core.daemons import unregister_daemon
+
+        unregister_daemon(self.key)
+        with self._lock:
+            if self._started:
+                self._command("stop")
+            self._running = False
+            self._started = False
+
+    def _current_state(self) -> List[Any]:
+        """Describe the Biome version and the project's lockfiles."""
+        state: List[Any] = [get_cli_version(self.binary)]
+        for name in BIOME_DAEMON_LOCKFILES:
+            try:
+                stat = (self.project_root / name).stat()
+                state.append([name, stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                state.append([name, None, None])
+        return state
+
+    def _command(self, command: str) -> Optional[str]:
+        """Run ``biome start`` or ``biome stop``.
+
+        Returns:
+            The command's output, or None if it failed.
+        """
+        try:
+            result = subprocess.run(
+                [str(self.binary), command],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            LOGGER.debug(f"biome {command} failed: {e}")
+            return None
+        if result.returncode != 0:
+            LOGGER.debug(f"biome {command} failed: {result.stderr.strip()}")
+            return None
+        return (result.stdout or "") + (result.stderr or "")
+
+
+_daemons: Dict[Tuple[Path, Path], BiomeDaemon] = {}
+_daemons_lock = threading.Lock()
+
+
+def get_biome_daemon(binary: Path, project_root: Path) -> BiomeDaemon:
+    """Return the daemon handle of a Biome binary and project.
+
+    Handles are keyed by ``(binary, project_root)``, the same pair their
+    ``core.daemons`` registration key is built from.
+    """
+    with _daemons_lock:
+        daemon = _daemons.get((binary, project_root))
+        if daemon is None:
+            daemon = BiomeDaemon(binary, project_root)
+            _daemons[(binary, project_root)] = daemon
+        return daemon
+
 
 class BiomeLinter(LinterPlugin):
     """Biome linter plugin for JavaScript/TypeScript code analysis."""
@@ -161,6 +301,47 @@ class BiomeLinter(LinterPlugin):
         post_issues = self.lint(context)
         return self._calculate_fix_stats(pre_issues, post_issues)
 
+    def _run_in_server(
+        self,
+        cmd: List[str],
+        context: ScanContext,
+        tool_label: str,
+        timeout: int,
+    ) -> Optional[subprocess.CompletedProcess]:
+        """Run Biome through its daemon in long-lived sessions."""
+        if not context.persistent_tools:
+            return None
+        daemon = get_biome_daemon(Path(cmd[0]), context.project_root)
+        if not daemon.ensure_running():
+            return None
+
+        server_cmd = [cmd[0], cmd[1], "--use-server", *cmd[2:]]
+        LOGGER.debug(f"Running: {' '.join(server_cmd)}")
+        try:
+            result = run_with_streaming(
+                cmd=server_cmd,
+                cwd=context.project_root,
+                tool_name=tool_label,
+                stream_handler=context.stream_handler,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            raise
+        except subprocess.SubprocessError as e:
+            LOGGER.debug(f"Biome daemon unavailable: {e}")
+            daemon.mark_failed()
+            return None
+
+        # Exit code 1 reports diagnostics; anything else, or no output at
+        # all, means the daemon could not be reached
+        if result.returncode not in (0, 1) or (
+            result.returncode and not result.stdout.strip()
+        ):
+            LOGGER.debug(f"Biome daemon unavailable: {result.stderr.strip()}")
+            daemon.mark_failed()
+            return None
+        return result
+
     def _parse_output(self, output: str, project_root: Path) -> List[UnifiedIssue]:
         """Parse Biome JSON output.
 
@@ -28,6 +28,7 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
+from lucidshark.plugins.jvm_worker import run_in_jvm_worker
 from lucidshark.plugins.linters.base import LinterPlugin
 
 LOGGER = get_logger(__name__)
@@ -209,13 +210,15 @@ class CheckstyleLinter(LinterPlugin):
             LOGGER.debug(f"Running: {' '.join(cmd[:10])}...")
 
             try:
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="checkstyle",
-                    stream_handler=context.stream_handler,
-                    timeout=120,
-                )
+                result = run_in_jvm_worker(context, cmd, "checkstyle", timeout=120)
+                if result is None:
+                    result = run_with_streaming(
+                        cmd=cmd,
+                        cwd=context.project_root,
+                        tool_name="checkstyle",
+                        stream_handler=context.stream_handler,
+                        timeout=120,
+                    )
             except subprocess.TimeoutExpired:
                 LOGGER.warning("Checkstyle timed out after 120 seconds")
                 context.record_skip(
@@ -298,8 +301,6 @@ class CheckstyleLinter(LinterPlugin):
         Returns:
             List of Java file paths.
         """
-        java_files = []
-
         # Search in specified paths or common Java directories
         search_dirs = []
         if context.paths:
@@ -321,35 +322,7 @@ class CheckstyleLinter(LinterPlugin):
         if not search_dirs:
             search_dirs = [context.project_root]
 
-        for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
-
-            # Handle both files and directories
-            if search_dir.is_file():
-                # If it's a Java file, add it directly
-                if search_dir.suffix == ".java":
-                    # Check if file should be excluded
-                    if (
-                        context.ignore_patterns is None
-                        or not context.ignore_patterns.matches(
-                            search_dir, context.project_root
-                        )
-                    ):
-                        java_files.append(str(search_dir))
-            else:
-                # If it's a directory, search recursively
-                for java_file in search_dir.rglob("*.java"):
-                    # Check if file should be excluded using proper gitignore matching
-                    if (
-                        context.ignore_patterns is None
-                        or not context.ignore_patterns.matches(
-                            java_file, context.project_root
-                        )
-                    ):
-                        java_files.append(str(java_file))
-
-        return java_files
+        return [str(f) for f in context.find_files({".java"}, search_dirs)]
 
     def _parse_output(self, output: str, project_root: Path) -> List[UnifiedIssue]:
         """Parse Checkstyle XML output.
@@ -8,10 +8,13 @@ https://clang.llvm.org/extra/clang-tidy/
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
 import subprocess
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from lucidshark.core.logging import get_logger
 from lucidshark.core.models import (
@@ -21,16 +24,20 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
+from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.cpp_utils import (
     CPP_EXTENSIONS,
+    CompileCommand,
     ensure_cpp_tools_in_path,
     find_build_dir,
     find_clang_tidy,
     generate_issue_id,
     get_tool_version,
+    load_compile_commands,
+    local_includes,
 )
 from lucidshark.plugins.linters.base import FixResult, LinterPlugin
+from lucidshark.plugins.utils import domain_cache_enabled
 
 LOGGER = get_logger(__name__)
 
@@ -77,6 +84,112 @@ _DIAG_RE = re.compile(
     r"^(.+?):(\d+):(\d+):\s+(error|warning|note):\s+(.+?)(?:\s+\[([^\]]+)\])?$"
 )
 
+# Translation units needed before lint fans out one process per TU
+SHARD_MIN_TUS = 2
+
+# Timeout for one clang-tidy process, in seconds
+CLANG_TIDY_TIMEOUT = 300
+
+# Bump when the per-TU cache format changes to discard old caches
+TU_CACHE_FORMAT = 1
+
+
+class TUResultCache:
+    """clang-tidy output per translation unit.
+
+    Stored in ``.lucidshark/cache/clang-tidy/tu-results.json``. An entry is
+    reused while its key (clang-tidy version, ``.clang-tidy`` files, the
+    TU's compile command and the content of the source and the project
+    headers it includes) is unchanged.
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        from lucidshark.bootstrap.paths import LucidsharkPaths
+
+        self.project_root = project_root
+        self.path = (
+            LucidsharkPaths.for_project(project_root).cache_dir
+            / "clang-tidy"
+            / "tu-results.json"
+        )
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._hashes: Dict[Path, Optional[str]] = {}
+        self._includes: Dict[Path, List[Tuple[str, str]]] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("format") == TU_CACHE_FORMAT:
+                self._entries = data.get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def _hash(self, path: Path) -> Optional[str]:
+        """Content hash of a file, computed once per scan."""
+        if path not in self._hashes:
+            from lucidshark.core.result_cache import hash_file
+
+            self._hashes[path] = hash_file(path)
+        return self._hashes[path]
+
+    def _tidy_configs(self, directory: Path) -> Dict[str, Optional[str]]:
+        """Hashes of the .clang-tidy files clang-tidy may read for a TU."""
+        configs: Dict[str, Optional[str]] = {}
+        root = self.project_root.resolve()
+        current = directory
+        while True:
+            config = current / ".clang-tidy"
+            if config.is_file():
+                configs[str(config)] = self._hash(config)
+            if current == root or current.parent == current:
+                break
+            current = current.parent
+        return configs
+
+    def key(self, command: CompileCommand, base_cmd: List[str], version: str) -> str:
+        """Compute the cache key of a translation unit."""
+        headers = local_includes(
+            command.file,
+            command.include_dirs(),
+            self.project_root,
+            self._includes,
+        )
+        payload = {
+            "format": TU_CACHE_FORMAT,
+            "version": version,
+            "cmd": base_cmd,
+            "directory": str(command.directory),
+            "arguments": command.arguments,
+            "source": self._hash(command.file),
+            "headers": {str(h): self._hash(h) for h in sorted(headers)},
+            "configs": self._tidy_configs(command.file.parent),
+        }
+        encoded = json.dumps(payload, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, tu: Path, key: str) -> Optional[str]:
+        """Return the cached output of a TU if its key matches."""
+        entry = self._entries.get(str(tu))
+        if entry is not None and entry.get("key") == key:
+            return entry.get("output")
+        return None
+
+    def put(self, tu: Path, key: str, output: str) -> None:
+        """Record the output of a TU."""
+        self._entries[str(tu)] = {"key": key, "output": output}
+
+    def save(self) -> None:
+        """Write the cache, dropping entries of deleted files."""
+        entries = {tu: e for tu, e in self._entries.items() if Path(tu).exists()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps({"format": TU_CACHE_FORMAT, "entries": entries}),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+        except OSError as e:
+            LOGGER.debug(f"Failed to write clang-tidy cache: {e}")
+
 
 class ClangTidyLinter(LinterPlugin):
     """clang-tidy linter plugin for C/C++ code analysis."""
@@ -130,6 +243,11 @@ class ClangTidyLinter(LinterPlugin):
         if build_dir:
             cmd.extend(["-p", str(build_dir)])
 
+            commands = load_compile_commands(build_dir)
+            tus = [f for f in files if Path(f).resolve() in commands]
+            if len(tus) >= SHARD_MIN_TUS:
+                return self._lint_sharded(cmd, context, files, commands)
+
         cmd.extend(files)
 
         LOGGER.debug(f"Running: {' '.join(cmd[:5])}... ({len(files)} files)")
@@ -137,14 +255,14 @@ class ClangTidyLinter(LinterPlugin):
         env_vars = ensure_cpp_tools_in_path()
 
         try:
-            with temporary_env(env_vars):
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="clang-tidy",
-                    stream_handler=context.stream_handler,
-                    timeout=300,
-                )
+            result = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="clang-tidy",
+                stream_handler=context.stream_handler,
+                timeout=300,
+                env=env_vars,
+            )
         except subprocess.TimeoutExpired:
             LOGGER.warning("clang-tidy timed out after 300 seconds")
             context.record_skip(
@@ -205,20 +323,147 @@ class ClangTidyLinter(LinterPlugin):
         env_vars = ensure_cpp_tools_in_path()
 
         try:
-            with temporary_env(env_vars):
-                run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="clang-tidy-fix",
-                    stream_handler=context.stream_handler,
-                    timeout=300,
-                )
+            run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="clang-tidy-fix",
+                stream_handler=context.stream_handler,
+                timeout=300,
+                env=env_vars,
+            )
         except Exception as e:
             LOGGER.debug(f"clang-tidy fix completed with: {e}")
 
         post_issues = self.lint(context)
         return self._calculate_fix_stats(pre_issues, post_issues)
 
+    def _lint_sharded(
+        self,
+        base_cmd: List[str],
+        context: ScanContext,
+        files: List[str],
+        commands: Dict[Path, CompileCommand],
+    ) -> List[UnifiedIssue]:
+        """Lint one translation unit per clang-tidy process, in parallel.
+
+        Files listed in the compilation database each get their own
+        process, run on a pool sized to the CPU count; the remaining files
+        (usually headers) are linted together as before. Diagnostics in
+        headers shared by several TUs are reported once. With
+        ``linting.cache`` enabled, a TU whose compile command, source and
+        included project headers are unchanged reuses its previous output.
+
+        Args:
+            base_cmd: clang-tidy binary and ``-p <build_dir>``.
+            context: Scan context.
+            files: Files to lint.
+            commands: Compilation database keyed by resolved source path.
+
+        Returns:
+            List of linting issues.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        tus: List[Tuple[Path, CompileCommand]] = []
+        rest: List[str] = []
+        for f in files:
+            command = commands.get(Path(f).resolve())
+            if command is None:
+                rest.append(f)
+            else:
+                tus.append((command.file, command))
+
+        cache = (
+            TUResultCache(context.project_root)
+            if domain_cache_enabled(context, "linting")
+            else None
+        )
+        version = self.get_version() if cache is not None else "unknown"
+        if version == "unknown":
+            cache = None
+
+        outputs: Dict[Path, str] = {}
+        keys: Dict[Path, str] = {}
+        jobs: List[Tuple[Optional[Path], List[str]]] = []
+        for tu, command in tus:
+            if cache is not None:
+                keys[tu] = cache.key(command, base_cmd, version)
+                cached = cache.get(tu, keys[tu])
+                if cached is not None:
+                    outputs[tu] = cached
+                    continue
+            jobs.append((tu, base_cmd + [str(tu)]))
+        if rest:
+            jobs.append((None, base_cmd + rest))
+
+        LOGGER.debug(
+            f"Running clang-tidy on {len(tus)} translation units "
+            f"({len(tus) - len(outputs)} not cached) and {len(rest)} other files"
+        )
+
+        env_vars = ensure_cpp_tools_in_path()
+
+        def run(cmd: List[str]) -> subprocess.CompletedProcess:
+            return run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="clang-tidy",
+                timeout=CLANG_TIDY_TIMEOUT,
+                env=env_vars,
+            )
+
+        handler = context.stream_handler
+        if handler is not None:
+            handler.start_tool("clang-tidy")
+
+        rest_output = ""
+        failures: List[str] = []
+        workers = max(1, min(os.cpu_count() or 1, len(jobs)))
+        if jobs:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="lucidshark-clang-tidy"
+            ) as executor:
+                futures = [(job_tu, executor.submit(run, cmd)) for job_tu, cmd in jobs]
+            for job_tu, future in futures:
+                try:
+                    result = future.result()
+                except subprocess.TimeoutExpired:
+                    failures.append(f"{job_tu or 'headers'}: timed out")
+                    continue
+                except Exception as e:
+                    failures.append(f"{job_tu or 'headers'}: {e}")
+                    continue
+                output = (result.stdout or "") + "\n" + (result.stderr or "")
+                if job_tu is None:
+                    rest_output = output
+                    continue
+                outputs[job_tu] = output
+                if cache is not None:
+                    cache.put(job_tu, keys[job_tu], output)
+
+        if handler is not None:
+            handler.end_tool("clang-tidy", not failures)
+        if cache is not None:
+            cache.save()
+
+        if failures:
+            LOGGER.warning(f"clang-tidy failed on {len(failures)} file(s)")
+            context.record_skip(
+                tool_name=self.name,
+                domain=ToolDomain.LINTING,
+                reason=SkipReason.EXECUTION_FAILED,
+                message=(
+                    f"clang-tidy failed on {len(failures)} file(s): "
+                    + "; ".join(failures[:3])
+                ),
+            )
+
+        # Merge in TU order so results do not depend on completion order
+        combined = "\n".join([outputs[tu] for tu, _ in tus if tu in outputs])
+        issues = self._parse_output(combined + "\n" + rest_output, context.project_root)
+        LOGGER.info(f"clang-tidy found {len(issues)} issues")
+        return issues
+
     def _collect_files(self, context: ScanContext) -> List[str]:
         """Collect C/C++ files to lint.
 
@@ -228,33 +473,7 @@ class ClangTidyLinter(LinterPlugin):
         Returns:
             List of file path strings.
         """
-        if context.paths:
-            files = []
-            for path in context.paths:
-                if path.is_dir():
-                    for ext in CPP_EXTENSIONS:
-                        for f in path.rglob(f"*{ext}"):
-                            if (
-                                context.ignore_patterns is None
-                                or not context.ignore_patterns.matches(
-                                    f, context.project_root
-                                )
-                            ):
-                                files.append(str(f))
-                elif path.suffix.lower() in CPP_EXTENSIONS:
-                    files.append(str(path))
-            return files
-
-        # Default: find all C/C++ files in project
-        files = []
-        for ext in CPP_EXTENSIONS:
-            for f in context.project_root.rglob(f"*{ext}"):
-                if (
-                    context.ignore_patterns is None
-                    or not context.ignore_patterns.matches(f, context.project_root)
-                ):
-                    files.append(str(f))
-        return files
+        return [str(f) for f in context.find_files(CPP_EXTENSIONS)]
 
     def _parse_output(self, output: str, project_root: Path) -> List[UnifiedIssue]:
         """Parse clang-tidy text output.
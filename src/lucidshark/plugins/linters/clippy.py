@@ -23,6 +23,8 @@ from lucidshark.core.models import (
 from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.linters.base import FixResult, LinterPlugin
 from lucidshark.plugins.rust_utils import (
+    cargo_env,
+    cargo_package_args,
     ensure_cargo_subcommand,
     extract_suggestion,
     generate_issue_id,
@@ -166,9 +168,15 @@ class ClippyLinter(LinterPlugin):
             LOGGER.info("No Cargo.toml found, skipping Clippy")
             return []
 
+        packages = cargo_package_args(context)
+        if packages == []:
+            LOGGER.info("No workspace members affected by the changes, skipping Clippy")
+            return []
+
         cmd = [
             str(cargo),
             "clippy",
+            *(packages or []),
             "--message-format=json",
             "--quiet",
             "--",
@@ -185,6 +193,7 @@ class ClippyLinter(LinterPlugin):
                 tool_name="clippy",
                 stream_handler=context.stream_handler,
                 timeout=300,
+                env=cargo_env(context.project_root),
             )
         except subprocess.TimeoutExpired:
             LOGGER.warning("Clippy timed out after 300 seconds")
@@ -227,12 +236,17 @@ class ClippyLinter(LinterPlugin):
         if not (context.project_root / "Cargo.toml").exists():
             return FixResult()
 
+        packages = cargo_package_args(context)
+        if packages == []:
+            return FixResult()
+
         # Count issues before fix
         pre_issues = self.lint(context)
 
         cmd = [
             str(cargo),
             "clippy",
+            *(packages or []),
             "--fix",
             "--allow-dirty",
             "--allow-staged",
@@ -252,6 +266,7 @@ class ClippyLinter(LinterPlugin):
                 tool_name="clippy-fix",
                 stream_handler=context.stream_handler,
                 timeout=300,
+                env=cargo_env(context.project_root),
             )
         except subprocess.TimeoutExpired:
             LOGGER.warning("Clippy fix timed out after 300 seconds")
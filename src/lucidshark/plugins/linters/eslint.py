@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -19,7 +20,12 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.plugins.linters.base import FixResult, LinterPlugin
-from lucidshark.plugins.utils import ensure_node_binary, get_cli_version
+from lucidshark.plugins.linters.eslint_server import run_in_eslint_server
+from lucidshark.plugins.utils import (
+    domain_cache_enabled,
+    ensure_node_binary,
+    get_cli_version,
+)
 
 LOGGER = get_logger(__name__)
 
@@ -119,7 +125,7 @@ class ESLintLinter(LinterPlugin):
         if binary is None:
             return []
 
-        cmd = [str(binary), "--format", "json"]
+        cmd = [str(binary), "--format", "json", *self._cache_args(context)]
 
         paths = self._resolve_target_paths(context)
         if not paths:
@@ -158,7 +164,7 @@ class ESLintLinter(LinterPlugin):
 
         pre_issues = self.lint(context)
 
-        cmd = [str(binary), "--fix", "--format", "json"]
+        cmd = [str(binary), "--fix", "--format", "json", *self._cache_args(context)]
 
         paths = self._resolve_target_paths(context)
         if not paths:
@@ -180,6 +186,49 @@ class ESLintLinter(LinterPlugin):
         post_issues = self._parse_output(stdout, context.project_root)
         return self._calculate_fix_stats(pre_issues, post_issues)
 
+    def _cache_args(self, context: ScanContext) -> List[str]:
+        """Arguments enabling ESLint's result cache.
+
+        The cache is keyed by file content rather than modification time,
+        so checkouts and formatters touching files do not invalidate it.
+
+        Args:
+            context: Scan context.
+
+        Returns:
+            ``--cache`` arguments, or an empty list if ``linting.cache`` is
+            disabled.
+        """
+        if not domain_cache_enabled(context, "linting"):
+            return []
+        from lucidshark.bootstrap.paths import LucidsharkPaths
+
+        cache_dir = LucidsharkPaths.for_project(context.project_root).plugin_cache_dir(
+            "eslint"
+        )
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            LOGGER.debug(f"Cannot create ESLint cache directory: {e}")
+            return []
+        return [
+            "--cache",
+            "--cache-location",
+            str(cache_dir / "eslintcache"),
+            "--cache-strategy",
+            "content",
+        ]
+
+    def _run_in_server(
+        self,
+        cmd: List[str],
+        context: ScanContext,
+        tool_label: str,
+        timeout: int,
+    ) -> Optional[subprocess.CompletedProcess]:
+        """Run ESLint in the persistent ESLint server when available."""
+        return run_in_eslint_server(context, cmd, tool_label, timeout)
+
     def _filter_paths(
         self,
         paths: List[Path],
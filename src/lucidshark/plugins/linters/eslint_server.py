@@ -0,0 +1,379 @@
+"""Persistent ESLint server for long-lived LucidShark processes.
+
+Every ``eslint`` invocation starts Node and loads ESLint, its plugins,
+parsers and config before linting a single file, which often takes seconds.
+In the MCP server and the file watcher (see ``ScanContext.persistent_tools``)
+ESLint runs inside a long-lived Node process instead
+(``lucidshark-eslint-server.js`` in ``lucidshark.data``), which executes the
+project's ESLint command line in-process so loaded modules are reused.
+
+The server is started lazily on the first lint of a session, listens on a
+loopback port and is stopped with the session (or after
+:data:`SERVER_IDLE_TIMEOUT` seconds without a request). It is restarted
+when the ESLint config, ``package.json`` or a lockfile changes, since
+plugins loaded by an old config would otherwise stay in memory. Whenever the
+server cannot be used, ESLint runs as a regular subprocess.
+"""
+
+from __future__ import annotations
+
+import importlib.resources  # nosemgrep: python37-compatibility-importlib2 (requires-python>=3.10)
+import json
+import os
+import secrets
+import shutil
+import socket
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from lucidshark.core.logging import get_logger
+from lucidshark.core.models import ScanContext
+
+LOGGER = get_logger(__name__)
+
+SERVER_SCRIPT = "lucidshark-eslint-server.js"
+PORT_FILE = "server.port"
+LOG_FILE = "server.log"
+TOKEN_ENV = "LUCIDSHARK_ESLINT_SERVER_TOKEN"
+
+# Seconds without a request before the server exits
+SERVER_IDLE_TIMEOUT = 1800
+
+# Seconds to wait for a new server to listen
+STARTUP_TIMEOUT = 30
+
+# Files whose change restarts the server
+ESLINT_CONFIG_FILES = (
+    "eslint.config.js",
+    "eslint.config.mjs",
+    "eslint.config.cjs",
+    "eslint.config.ts",
+    "eslint.config.mts",
+    "eslint.config.cts",
+    ".eslintrc",
+    ".eslintrc.js",
+    ".eslintrc.cjs",
+    ".eslintrc.json",
+    ".eslintrc.yaml",
+    ".eslintrc.yml",
+    "package.json",
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "bun.lock",
+    "bun.lockb",
+)
+
+
+class ServerUnavailable(Exception):
+    """The ESLint server cannot serve a request; run ESLint directly."""
+
+
+def eslint_package_dir(binary: Path) -> Optional[Path]:
+    """Find the ESLint package a binary belongs to.
+
+    ``node_modules/.bin/eslint`` and global installs link to
+    ``<package>/bin/eslint.js``.
+
+    Args:
+        binary: Path to the ``eslint`` executable.
+
+    Returns:
+        The package directory, or None if it cannot be determined (e.g. a
+        Windows ``.cmd`` shim).
+    """
+    try:
+        script = binary.resolve()
+    except OSError:
+        return None
+    package_dir = script.parent.parent
+    if script.parent.name != "bin" or not (package_dir / "lib" / "cli.js").is_file():
+        return None
+    return package_dir
+
+
+class ESLintServer:
+    """Client of the persistent ESLint server of one project.
+
+    Requests are serialized: while one lint runs in the server, concurrent
+    callers get :class:`ServerUnavailable` and run ESLint themselves rather
+    than wait.
+    """
+
+    def __init__(self, project_root: Path, package_dir: Path) -> None:
+        """Initialize the client.
+
+        Args:
+            project_root: Project root; the server runs with it as working
+                directory.
+            package_dir: ESLint package to load.
+        """
+        from lucidshark.bootstrap.paths import LucidsharkPaths
+
+        self.project_root = project_root
+        self.package_dir = package_dir
+        self.state_dir = LucidsharkPaths.for_project(project_root).plugin_cache_dir(
+            "eslint"
+        )
+        self.key = f"eslint-server:{project_root}"
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._port: Optional[int] = None
+        self._token = ""
+        self._fingerprint: Optional[List[Any]] = None
+        self._disabled: Optional[str] = None
+
+    def run(self, args: List[str], timeout: int = 120) -> Tuple[int, str, str]:
+        """Run ESLint with command-line arguments in the server.
+
+        Args:
+            args: ESLint arguments (without the executable).
+            timeout: Seconds to wait for ESLint.
+
+        Returns:
+            Tuple of (exit code, stdout, stderr).
+
+        Raises:
+            ServerUnavailable: If the server is busy or cannot be used.
+            subprocess.TimeoutExpired: If ESLint timed out; the server is
+                killed.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ServerUnavailable("ESLint server is busy")
+        try:
+            self._ensure_running()
+            try:
+                response = self._request({"op": "run", "args": args}, timeout)
+            except socket.timeout:
+                self._kill()
+                raise subprocess.TimeoutExpired(["eslint", *args], timeout) from None
+            except (OSError, ValueError, ServerUnavailable) as e:
+                self._kill()
+                raise ServerUnavailable(f"ESLint server request failed: {e}") from e
+            return (
+                int(response.get("exitCode", 2)),
+                str(response.get("stdout", "")),
+                str(response.get("stderr", "")),
+            )
+        finally:
+            self._lock.release()
+
+    def stop(self) -> None:
+        """Stop the server."""
+        from lucidshark.core.daemons import unregister_daemon
+
+        unregister_daemon(self.key)
+        with self._lock:
+            if self._proc is None:
+                return
+            try:
+                self._request({"op": "stop"}, timeout=5)
+                self._proc.wait(timeout=5)
+            except (OSError, ValueError, ServerUnavailable, subprocess.SubprocessError):
+                pass
+            self._kill()
+
+    def _ensure_running(self) -> None:
+        """Start the server, or restart it when the ESLint setup changed."""
+        if self._disabled is not None:
+            raise ServerUnavailable(self._disabled)
+
+        fingerprint = self._current_fingerprint()
+        if self._proc is not None:
+            if self._proc.poll() is None and fingerprint == self._fingerprint:
+                return
+            LOGGER.debug("Restarting ESLint server (config or dependencies changed)")
+            self._kill()
+
+        try:
+            self._start()
+        except ServerUnavailable as e:
+            self._disabled = str(e)
+            raise
+        self._fingerprint = fingerprint
+
+    def _current_fingerprint(self) -> List[Any]:
+        """Describe the ESLint config and installed dependencies."""
+        fingerprint: List[Any] = []
+        for path in [
+            *(self.project_root / name for name in ESLINT_CONFIG_FILES),
+            self.package_dir / "package.json",
+        ]:
+            try:
+                stat = path.stat()
+                fingerprint.append([path.name, stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                fingerprint.append([path.name, None, None])
+        return fingerprint
+
+    def _install_script(self) -> Path:
+        """Copy the server script next to its state, if it changed."""
+        resource = importlib.resources.files("lucidshark.data").joinpath(SERVER_SCRIPT)
+        content = resource.read_bytes()
+        target = self.state_dir / SERVER_SCRIPT
+        try:
+            if not target.exists() or target.read_bytes() != content:
+                self.state_dir.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(content)
+        except OSError as e:
+            raise ServerUnavailable(f"Cannot install ESLint server: {e}") from e
+        return target
+
+    def _start(self) -> None:
+        """Launch a new server and wait until it listens."""
+        from lucidshark.core.daemons import register_daemon
+        from lucidshark.core.subprocess_runner import merge_env
+
+        node = shutil.which("node")
+        if node is None:
+            raise ServerUnavailable("node not found in PATH")
+        script = self._install_script()
+        port_file = self.state_dir / PORT_FILE
+        port_file.unlink(missing_ok=True)
+        token = secrets.token_hex(16)
+
+        cmd = [
+            node,
+            str(script),
+            str(self.package_dir),
+            str(port_file),
+            str(SERVER_IDLE_TIMEOUT),
+        ]
+        log_path = self.state_dir / LOG_FILE
+        LOGGER.info("Starting ESLint server...")
+        try:
+            with open(log_path, "ab") as log:
+                proc = subprocess.Popen(  # nosemgrep: python36-compatibility-Popen1, python36-compatibility-Popen2
+                    cmd,
+                    cwd=self.project_root,
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=log,
+                    env=merge_env({TOKEN_ENV: token}),
+                    # Ignore the Ctrl-C of a running scan; stopped with the session
+                    start_new_session=os.name != "nt",
+                )
+        except OSError as e:
+            raise ServerUnavailable(f"Cannot start ESLint server: {e}") from e
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while not port_file.exists():
+            if proc.poll() is not None:
+                raise ServerUnavailable(
+                    f"ESLint server exited with code {proc.returncode}, see {log_path}"
+                )
+            if time.monotonic() > deadline:
+                proc.kill()
+                raise ServerUnavailable(
+                    f"ESLint server did not start within {STARTUP_TIMEOUT} seconds"
+                )
+            time.sleep(0.05)
+
+        try:
+            self._port = int(port_file.read_text(encoding="utf-8").strip())
+        except (OSError, ValueError) as e:
+            proc.kill()
+            raise ServerUnavailable(f"Cannot read ESLint server port: {e}") from e
+        self._proc = proc
+        self._token = token
+        register_daemon(self.key, self.stop)
+        LOGGER.debug(f"ESLint server {proc.pid} listening on port {self._port}")
+
+    def _request(self, request: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one request and read the response."""
+        if self._port is None:
+            raise ServerUnavailable("ESLint server is not running")
+        payload = json.dumps({"token": self._token, **request}) + "\n"
+        with socket.create_connection(
+            ("127.0.0.1", self._port), timeout=timeout
+        ) as sock:
+            sock.sendall(payload.encode("utf-8"))
+            with sock.makefile("r", encoding="utf-8") as stream:
+                line = stream.readline()
+        if not line:
+            raise ServerUnavailable("ESLint server closed the connection")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise ServerUnavailable(f"ESLint server error: {response.get('error')}")
+        return response
+
+    def _kill(self) -> None:
+        """Kill the server process."""
+        proc, self._proc, self._port = self._proc, None, None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+
+
+_servers: Dict[Tuple[Path, Path], ESLintServer] = {}
+_servers_lock = threading.Lock()
+
+
+def get_eslint_server(project_root: Path, binary: Path) -> Optional[ESLintServer]:
+    """Return the server client of a project and ESLint installation.
+
+    Args:
+        project_root: Project root.
+        binary: Path to the ``eslint`` executable.
+
+    Returns:
+        The shared client, or None if the ESLint package cannot be located.
+    """
+    package_dir = eslint_package_dir(binary)
+    if package_dir is None:
+        return None
+    with _servers_lock:
+        server = _servers.get((project_root, package_dir))
+        if server is None:
+            server = ESLintServer(project_root, package_dir)
+            _servers[(project_root, package_dir)] = server
+        return server
+
+
+def run_in_eslint_server(
+    context: ScanContext,
+    cmd: List[str],
+    tool_name: str,
+    timeout: int = 120,
+) -> Optional[subprocess.CompletedProcess]:
+    """Run an ESLint command in the persistent server, if available.
+
+    Only long-lived sessions (``context.persistent_tools``) use the server.
+    Output is replayed to the context's stream handler once ESLint finishes.
+
+    Args:
+        context: Scan context.
+        cmd: The ESLint command line (executable followed by arguments).
+        tool_name: Tool name for stream events.
+        timeout: Timeout in seconds.
+
+    Returns:
+        The completed process, or None if the caller should run ``cmd``
+        itself.
+
+    Raises:
+        subprocess.TimeoutExpired: If ESLint timed out.
+    """
+    if not context.persistent_tools:
+        return None
+    from lucidshark.core.subprocess_runner import replay_output
+
+    server = get_eslint_server(context.project_root, Path(cmd[0]))
+    if server is None:
+        return None
+    try:
+        exit_code, stdout, stderr = server.run(cmd[1:], timeout)
+    except ServerUnavailable as e:
+        LOGGER.debug(f"Running {tool_name} without the ESLint server: {e}")
+        return None
+
+    return replay_output(
+        cmd, tool_name, exit_code, stdout, stderr, context.stream_handler
+    )
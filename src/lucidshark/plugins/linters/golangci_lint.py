@@ -20,12 +20,13 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
+from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.go_utils import (
     ensure_go_in_path,
     find_golangci_lint,
     generate_issue_id,
     get_golangci_lint_version,
+    go_package_targets,
     has_go_mod,
 )
 from lucidshark.plugins.linters.base import FixResult, LinterPlugin
@@ -145,12 +146,19 @@ class GoLangCILintLinter(LinterPlugin):
             LOGGER.info("No go.mod found, skipping golangci-lint")
             return []
 
+        targets = go_package_targets(context)
+        if not targets:
+            LOGGER.info(
+                "No Go packages affected by the changes, skipping golangci-lint"
+            )
+            return []
+
         cmd = [
             str(binary),
             "run",
             "--out-format",
             "json",
-            "./...",
+            *targets,
         ]
 
         LOGGER.debug(f"Running: {' '.join(cmd)}")
@@ -160,14 +168,14 @@ class GoLangCILintLinter(LinterPlugin):
         env_vars = ensure_go_in_path()
 
         try:
-            with temporary_env(env_vars):
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="golangci-lint",
-                    stream_handler=context.stream_handler,
-                    timeout=300,
-                )
+            result = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="golangci-lint",
+                stream_handler=context.stream_handler,
+                timeout=300,
+                env=env_vars,
+            )
         except subprocess.TimeoutExpired:
             LOGGER.warning("golangci-lint timed out after 300 seconds")
             context.record_skip(
@@ -209,6 +217,10 @@ class GoLangCILintLinter(LinterPlugin):
         if not has_go_mod(context.project_root):
             return FixResult()
 
+        targets = go_package_targets(context)
+        if not targets:
+            return FixResult()
+
         # Count issues before fix
         pre_issues = self.lint(context)
 
@@ -218,7 +230,7 @@ class GoLangCILintLinter(LinterPlugin):
             "--fix",
             "--out-format",
             "json",
-            "./...",
+            *targets,
         ]
 
         LOGGER.debug(f"Running: {' '.join(cmd)}")
@@ -226,14 +238,14 @@ class GoLangCILintLinter(LinterPlugin):
         env_vars = ensure_go_in_path()
 
         try:
-            with temporary_env(env_vars):
-                run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="golangci-lint-fix",
-                    stream_handler=context.stream_handler,
-                    timeout=300,
-                )
+            run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="golangci-lint-fix",
+                stream_handler=context.stream_handler,
+                timeout=300,
+                env=env_vars,
+            )
         except subprocess.TimeoutExpired:
             LOGGER.warning("golangci-lint fix timed out after 300 seconds")
             return FixResult()
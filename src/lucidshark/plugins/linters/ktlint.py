@@ -26,6 +26,7 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
+from lucidshark.plugins.jvm_worker import run_in_jvm_worker
 from lucidshark.plugins.linters.base import FixResult, LinterPlugin
 
 LOGGER = get_logger(__name__)
@@ -163,13 +164,15 @@ class KtlintLinter(LinterPlugin):
         LOGGER.debug(f"Running: {' '.join(cmd[:10])}...")
 
         try:
-            result = run_with_streaming(
-                cmd=cmd,
-                cwd=context.project_root,
-                tool_name="ktlint",
-                stream_handler=context.stream_handler,
-                timeout=120,
-            )
+            result = run_in_jvm_worker(context, cmd, "ktlint", timeout=120)
+            if result is None:
+                result = run_with_streaming(
+                    cmd=cmd,
+                    cwd=context.project_root,
+                    tool_name="ktlint",
+                    stream_handler=context.stream_handler,
+                    timeout=120,
+                )
         except subprocess.TimeoutExpired:
             LOGGER.warning("ktlint timed out after 120 seconds")
             context.record_skip(
@@ -216,13 +219,14 @@ class KtlintLinter(LinterPlugin):
         cmd.extend(kotlin_files)
 
         try:
-            run_with_streaming(
-                cmd=cmd,
-                cwd=context.project_root,
-                tool_name="ktlint-fix",
-                stream_handler=context.stream_handler,
-                timeout=120,
-            )
+            if run_in_jvm_worker(context, cmd, "ktlint-fix", timeout=120) is None:
+                run_with_streaming(
+                    cmd=cmd,
+                    cwd=context.project_root,
+                    tool_name="ktlint-fix",
+                    stream_handler=context.stream_handler,
+                    timeout=120,
+                )
         except Exception as e:
             LOGGER.error(f"Failed to run ktlint fix: {e}")
             return FixResult()
@@ -232,8 +236,6 @@ class KtlintLinter(LinterPlugin):
 
     def _find_kotlin_files(self, context: ScanContext) -> List[str]:
         """Find Kotlin source files to check."""
-        kotlin_files = []
-
         search_dirs = []
         if context.paths:
             search_dirs = list(context.paths)
@@ -256,31 +258,7 @@ class KtlintLinter(LinterPlugin):
         if not search_dirs:
             search_dirs = [context.project_root]
 
-        for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
-
-            if search_dir.is_file():
-                if search_dir.suffix in (".kt", ".kts"):
-                    if (
-                        context.ignore_patterns is None
-                        or not context.ignore_patterns.matches(
-                            search_dir, context.project_root
-                        )
-                    ):
-                        kotlin_files.append(str(search_dir))
-            else:
-                for ext in ("*.kt", "*.kts"):
-                    for kt_file in search_dir.rglob(ext):
-                        if (
-                            context.ignore_patterns is None
-                            or not context.ignore_patterns.matches(
-                                kt_file, context.project_root
-                            )
-                        ):
-                            kotlin_files.append(str(kt_file))
-
-        return kotlin_files
+        return [str(f) for f in context.find_files({".kt", ".kts"}, search_dirs)]
 
     def _parse_output(self, output: str, project_root: Path) -> List[UnifiedIssue]:
         """Parse ktlint JSON output.
@@ -11,7 +11,7 @@ import hashlib
 import json
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from lucidshark.core.logging import get_logger
 from lucidshark.core.models import (
@@ -103,6 +103,22 @@ class PhpcsLinter(LinterPlugin):
     def supports_fix(self) -> bool:
         return True
 
+    @property
+    def cache_extensions(self) -> Tuple[str, ...]:
+        """PHP_CodeSniffer findings depend only on the linted file."""
+        return tuple(sorted(PHP_EXTENSIONS))
+
+    @property
+    def cache_config_files(self) -> Tuple[str, ...]:
+        """PHP_CodeSniffer configuration files."""
+        return (
+            "phpcs.xml",
+            "phpcs.xml.dist",
+            ".phpcs.xml",
+            ".phpcs.xml.dist",
+            "composer.lock",
+        )
+
     def get_version(self) -> str:
         try:
             binary = self.ensure_binary()
@@ -29,6 +29,7 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
+from lucidshark.plugins.jvm_worker import run_in_jvm_worker
 from lucidshark.plugins.linters.base import LinterPlugin
 
 LOGGER = get_logger(__name__)
@@ -36,6 +37,9 @@ LOGGER = get_logger(__name__)
 # Default version from pyproject.toml [tool.lucidshark.tools]
 DEFAULT_VERSION = get_tool_version("pmd")
 
+# Class run by the bin/pmd launcher script
+PMD_MAIN_CLASS = "net.sourceforge.pmd.cli.PmdCli"
+
 # PMD priority mapping to unified severity
 # PMD priorities: 1=highest, 5=lowest
 PRIORITY_SEVERITY_MAP: Dict[int, Severity] = {
@@ -223,13 +227,22 @@ class PmdLinter(LinterPlugin):
             LOGGER.debug(f"Running: {' '.join(cmd[:10])}...")
 
             try:
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="pmd",
-                    stream_handler=context.stream_handler,
+                result = run_in_jvm_worker(
+                    context,
+                    cmd,
+                    "pmd",
                     timeout=120,
+                    classpath=self._worker_classpath(binary),
+                    main_class=PMD_MAIN_CLASS,
                 )
+                if result is None:
+                    result = run_with_streaming(
+                        cmd=cmd,
+                        cwd=context.project_root,
+                        tool_name="pmd",
+                        stream_handler=context.stream_handler,
+                        timeout=120,
+                    )
             except subprocess.TimeoutExpired:
                 LOGGER.warning("PMD timed out after 120 seconds")
                 context.record_skip(
@@ -257,6 +270,22 @@ class PmdLinter(LinterPlugin):
         LOGGER.info(f"PMD found {len(issues)} issues")
         return issues
 
+    def _worker_classpath(self, binary: Path) -> List[Path]:
+        """Build the classpath the ``bin/pmd`` launcher would use.
+
+        Args:
+            binary: Path to the PMD launcher script.
+
+        Returns:
+            The ``conf`` directory (if present) and the JARs of ``lib``.
+        """
+        pmd_home = binary.parent.parent
+        classpath = sorted((pmd_home / "lib").glob("*.jar"))
+        conf_dir = pmd_home / "conf"
+        if conf_dir.is_dir():
+            classpath.insert(0, conf_dir)
+        return classpath
+
     def _find_ruleset_config(self, project_root: Path) -> str:
         """Find PMD ruleset configuration file.
 
@@ -311,8 +340,6 @@ class PmdLinter(LinterPlugin):
         Returns:
             List of Java file paths.
         """
-        java_files = []
-
         # Search in specified paths or common Java directories
         search_dirs = []
         if context.paths:
@@ -334,32 +361,7 @@ class PmdLinter(LinterPlugin):
         if not search_dirs:
             search_dirs = [context.project_root]
 
-        for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
-
-            # Handle both files and directories
-            if search_dir.is_file():
-                if search_dir.suffix == ".java":
-                    if (
-                        context.ignore_patterns is None
-                        or not context.ignore_patterns.matches(
-                            search_dir, context.project_root
-                        )
-                    ):
-                        java_files.append(str(search_dir))
-            else:
-                for java_file in search_dir.rglob("*.java"):
-                    # Check if file should be excluded using proper gitignore matching
-                    if (
-                        context.ignore_patterns is None
-                        or not context.ignore_patterns.matches(
-                            java_file, context.project_root
-                        )
-                    ):
-                        java_files.append(str(java_file))
-
-        return java_files
+        return [str(f) for f in context.find_files({".java"}, search_dirs)]
 
     def _parse_output(self, output: str, project_root: Path) -> List[UnifiedIssue]:
         """Parse PMD JSON output.
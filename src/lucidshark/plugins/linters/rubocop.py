@@ -10,7 +10,7 @@ import hashlib
 import json
 import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from lucidshark.core.logging import get_logger
 from lucidshark.core.models import (
@@ -97,6 +97,20 @@ class RubocopLinter(LinterPlugin):
     def supports_fix(self) -> bool:
         return True
 
+    @property
+    def cache_extensions(self) -> Tuple[str, ...]:
+        """RuboCop findings depend only on the linted file."""
+        return tuple(sorted(RUBY_EXTENSIONS))
+
+    @property
+    def cache_config_files(self) -> Tuple[str, ...]:
+        """RuboCop configuration files."""
+        return (
+            ".rubocop.yml",
+            ".rubocop_todo.yml",
+            "Gemfile.lock",
+        )
+
     def get_version(self) -> str:
         try:
             binary = self.ensure_binary()
@@ -177,11 +191,9 @@ class RubocopLinter(LinterPlugin):
         if context.paths:
             paths_to_use = context.paths
             if context.ignore_patterns is not None:
-                paths_to_use = [
-                    p
-                    for p in paths_to_use
-                    if not context.ignore_patterns.matches(p, context.project_root)
-                ]
+                paths_to_use = context.ignore_patterns.filter_paths(
+                    paths_to_use, context.project_root
+                )
             return self._filter_paths(paths_to_use) or None
         return ["."]
 
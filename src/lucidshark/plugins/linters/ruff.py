@@ -9,7 +9,7 @@ from __future__ import annotations
 import hashlib
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from lucidshark.core.logging import get_logger
 from lucidshark.core.models import (
@@ -115,6 +115,20 @@ class RuffLinter(LinterPlugin):
         """Ruff supports auto-fix."""
         return True
 
+    @property
+    def cache_extensions(self) -> Tuple[str, ...]:
+        """Ruff findings depend only on the linted file."""
+        return tuple(sorted(PYTHON_EXTENSIONS))
+
+    @property
+    def cache_config_files(self) -> Tuple[str, ...]:
+        """Ruff configuration files."""
+        return (
+            "pyproject.toml",
+            "ruff.toml",
+            ".ruff.toml",
+        )
+
     def get_version(self) -> str:
         """Get Ruff version."""
         try:
@@ -152,11 +166,9 @@ class RuffLinter(LinterPlugin):
         if context.paths:
             paths_to_use = context.paths
             if context.ignore_patterns is not None:
-                paths_to_use = [
-                    p
-                    for p in paths_to_use
-                    if not context.ignore_patterns.matches(p, context.project_root)
-                ]
+                paths_to_use = context.ignore_patterns.filter_paths(
+                    paths_to_use, context.project_root
+                )
             return self._filter_paths(paths_to_use, context.project_root) or None
         return ["."]
 
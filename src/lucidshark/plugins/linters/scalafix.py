@@ -2,11 +2,15 @@
 
 Scalafix is a refactoring and linting tool for Scala.
 https://scalacenter.github.io/scalafix/
+
+When the build writes SemanticDB files, semantic rules read them from the
+compile shared with scala_compile (see ``scala_utils``).
 """
 
 from __future__ import annotations
 
 import hashlib
+import os
 import re
 import shutil
 import subprocess
@@ -23,6 +27,12 @@ from lucidshark.core.models import (
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.linters.base import LinterPlugin
+from lucidshark.plugins.scala_utils import (
+    semanticdb_enabled,
+    semanticdb_targetroots,
+    shared_compile,
+)
+from lucidshark.plugins.utils import find_scala_build_tool
 
 LOGGER = get_logger(__name__)
 
@@ -121,8 +131,8 @@ class ScalafixLinter(LinterPlugin):
             LOGGER.info("No Scala files found to check")
             return []
 
-        # Build command: scalafix --check <files>
-        cmd = [str(binary), "--check"] + scala_files
+        # Build command: scalafix --check [semanticdb args] <files>
+        cmd = [str(binary), "--check"] + self._semanticdb_args(context) + scala_files
 
         LOGGER.debug(f"Running: {' '.join(cmd[:10])}...")
 
@@ -154,7 +164,7 @@ class ScalafixLinter(LinterPlugin):
         pre_issues = self.lint(context)
 
         # Run scalafix without --check to apply fixes
-        cmd = [str(binary)] + scala_files
+        cmd = [str(binary)] + self._semanticdb_args(context) + scala_files
 
         try:
             run_with_streaming(
@@ -173,6 +183,32 @@ class ScalafixLinter(LinterPlugin):
 
         return self._calculate_fix_stats(pre_issues, post_issues)
 
+    def _semanticdb_args(self, context: ScanContext) -> List[str]:
+        """Point Scalafix at the SemanticDB files of the shared compile.
+
+        Returns no arguments unless the build enables SemanticDB. The
+        compile is reused when scala_compile already ran (or is running)
+        for the current sources.
+        """
+        if not semanticdb_enabled(context.project_root):
+            return []
+        try:
+            build_binary, build_system = find_scala_build_tool(context.project_root)
+            shared_compile(context, build_binary, build_system)
+        except Exception as e:
+            # Fall back to SemanticDB files of an earlier compile
+            LOGGER.debug(f"Compile for SemanticDB failed: {e}")
+
+        targetroots = semanticdb_targetroots(context.project_root)
+        if not targetroots:
+            return []
+        return [
+            "--sourceroot",
+            str(context.project_root),
+            "--classpath",
+            os.pathsep.join(str(root) for root in targetroots),
+        ]
+
     def _run_linter_command_with_stderr(
         self,
         cmd: List[str],
@@ -213,8 +249,6 @@ class ScalafixLinter(LinterPlugin):
 
     def _find_scala_files(self, context: ScanContext) -> List[str]:
         """Find Scala source files to check."""
-        scala_files = []
-
         search_dirs = []
         if context.paths:
             search_dirs = list(context.paths)
@@ -232,31 +266,7 @@ class ScalafixLinter(LinterPlugin):
         if not search_dirs:
             search_dirs = [context.project_root]
 
-        for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
-
-            if search_dir.is_file():
-                if search_dir.suffix in (".scala", ".sc"):
-                    if (
-                        context.ignore_patterns is None
-                        or not context.ignore_patterns.matches(
-                            search_dir, context.project_root
-                        )
-                    ):
-                        scala_files.append(str(search_dir))
-            else:
-                for ext in ("*.scala", "*.sc"):
-                    for scala_file in search_dir.rglob(ext):
-                        if (
-                            context.ignore_patterns is None
-                            or not context.ignore_patterns.matches(
-                                scala_file, context.project_root
-                            )
-                        ):
-                            scala_files.append(str(scala_file))
-
-        return scala_files
+        return [str(f) for f in context.find_files({".scala", ".sc"}, search_dirs)]
 
     def _parse_output(self, output: str, project_root: Path) -> List[UnifiedIssue]:
         """Parse Scalafix output.
@@ -145,7 +145,7 @@ class SwiftLintLinter(LinterPlugin):
             return []
 
         # Check for Swift files
-        swift_files = list(context.project_root.rglob("*.swift"))
+        swift_files = context.get_file_inventory().with_extensions({".swift"})
         if not swift_files:
             LOGGER.info("No Swift files found, skipping SwiftLint")
             return []
@@ -198,7 +198,7 @@ class SwiftLintLinter(LinterPlugin):
             LOGGER.warning(str(e))
             return FixResult()
 
-        swift_files = list(context.project_root.rglob("*.swift"))
+        swift_files = context.get_file_inventory().with_extensions({".swift"})
         if not swift_files:
             return FixResult()
 
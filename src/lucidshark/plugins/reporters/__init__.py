@@ -3,7 +3,7 @@
 Plugins are discovered via Python entry points (lucidshark.reporters group).
 """
 
-from typing import Dict, Type
+from typing import Mapping, Type
 
 from lucidshark.plugins.reporters.base import ReporterPlugin
 from lucidshark.plugins.reporters.json_reporter import JSONReporter
@@ -19,7 +19,7 @@ from lucidshark.plugins.discovery import (
 )
 
 
-def discover_reporter_plugins() -> Dict[str, Type[ReporterPlugin]]:
+def discover_reporter_plugins() -> Mapping[str, Type[ReporterPlugin]]:
     """Discover all installed reporter plugins via entry points."""
     return discover_plugins(REPORTER_ENTRY_POINT_GROUP, ReporterPlugin)
 
@@ -2,20 +2,48 @@
 
 Common functionality used across cargo-based plugins (clippy, cargo check,
 cargo test, tarpaulin) to avoid code duplication.
+
+Clippy, cargo check and cargo test build into one managed target directory
+(``.lucidshark/cache/cargo/target``), so dependencies compiled for one are
+reused by the others. Incremental scans pass ``-p`` selections: the
+workspace members containing changed files and the members depending on
+them, read from ``cargo metadata`` and cached until a ``Cargo.toml``
+changes.
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
+import os
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set
 
 from lucidshark.core.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
+# Bump when the on-disk format changes to discard old workspace graphs
+CARGO_GRAPH_FORMAT = 1
+
+CARGO_GRAPH_FILE = "workspace.json"
+
+# Root-relative files whose change can affect every workspace member
+CARGO_WORKSPACE_FILES = frozenset(
+    {
+        "Cargo.toml",
+        "Cargo.lock",
+        "rust-toolchain",
+        "rust-toolchain.toml",
+        ".cargo/config",
+        ".cargo/config.toml",
+        "clippy.toml",
+        ".clippy.toml",
+    }
+)
+
 
 def find_cargo() -> Path:
     """Find cargo binary in PATH.
@@ -34,6 +62,36 @@ def find_cargo() -> Path:
     )
 
 
+def cargo_watched_paths(cargo: Path, subcommand: Optional[str] = None) -> List[Path]:
+    """Files whose change can alter the output of a cargo command.
+
+    Used to invalidate cached cargo probes: the cargo binary (a rustup
+    proxy in most installs), the subcommand binary next to it, rustup's
+    default toolchain setting, its toolchains directory and update hashes
+    (which change when a toolchain is installed, removed or updated) and
+    the toolchain file of the working directory.
+
+    Args:
+        cargo: Path to the cargo binary.
+        subcommand: Cargo subcommand (e.g., "tarpaulin").
+
+    Returns:
+        Paths to watch (some may not exist).
+    """
+    rustup_home = Path(os.environ.get("RUSTUP_HOME", Path.home() / ".rustup"))
+    paths = [
+        cargo,
+        rustup_home / "settings.toml",
+        rustup_home / "toolchains",
+        rustup_home / "update-hashes",
+        Path.cwd() / "rust-toolchain",
+        Path.cwd() / "rust-toolchain.toml",
+    ]
+    if subcommand:
+        paths.append(cargo.parent / f"cargo-{subcommand}")
+    return paths
+
+
 def get_cargo_version(subcommand: Optional[str] = None) -> str:
     """Get version string for a cargo subcommand.
 
@@ -44,22 +102,34 @@ def get_cargo_version(subcommand: Optional[str] = None) -> str:
     Returns:
         Version string or "unknown".
     """
+    from lucidshark.core.capability_cache import cached_probe
+
     try:
         cargo = find_cargo()
         cmd = [str(cargo)]
         if subcommand:
             cmd.append(subcommand)
         cmd.append("--version")
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=30,
+
+        def probe() -> Optional[str]:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=30,
+            )
+            return result.stdout.strip() if result.returncode == 0 else None
+
+        output = cached_probe(
+            "cargo-version",
+            [*cmd, os.getcwd()],
+            cargo_watched_paths(cargo, subcommand),
+            probe,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
+        if output is not None:
+            return output
     except Exception:
         pass
     return "unknown"
@@ -189,3 +259,189 @@ def extract_suggestion(message: dict) -> Optional[str]:
         if child.get("level") == "help":
             return child.get("message", "")
     return None
+
+
+def cargo_env(project_root: Path) -> Dict[str, str]:
+    """Environment for cargo builds that share LucidShark's target directory.
+
+    Args:
+        project_root: Project root directory.
+
+    Returns:
+        ``CARGO_TARGET_DIR`` pointing to the managed target directory, or an
+        empty dict if the user already set ``CARGO_TARGET_DIR``. Pass as
+        ``env`` to lucidshark.core.subprocess_runner.run_with_streaming().
+    """
+    if os.environ.get("CARGO_TARGET_DIR"):
+        return {}
+    from lucidshark.bootstrap.paths import LucidsharkPaths
+
+    cache_dir = LucidsharkPaths.for_project(project_root).plugin_cache_dir("cargo")
+    return {"CARGO_TARGET_DIR": str(cache_dir / "target")}
+
+
+def _manifest_fingerprint(project_root: Path) -> str:
+    """Fingerprint the ``Cargo.toml`` files below a project root.
+
+    Args:
+        project_root: Workspace root directory.
+
+    Returns:
+        Hex digest changing when a manifest is added, removed or edited.
+    """
+    digest = hashlib.sha256(f"{CARGO_GRAPH_FORMAT}\0".encode())
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = sorted(
+            d for d in dirnames if not d.startswith(".") and d != "target"
+        )
+        if "Cargo.toml" not in filenames:
+            continue
+        manifest = os.path.join(dirpath, "Cargo.toml")
+        try:
+            stat = os.stat(manifest)
+        except OSError:
+            continue
+        digest.update(f"{manifest}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode())
+    return digest.hexdigest()
+
+
+def _read_workspace(project_root: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Read the workspace members and their path dependencies.
+
+    Args:
+        project_root: Workspace root directory.
+
+    Returns:
+        Per member name, its directory (root-relative, ``"."`` for the
+        root) and the names of the members it depends on; None if
+        ``cargo metadata`` failed.
+    """
+    try:
+        cargo = find_cargo()
+        result = subprocess.run(
+            [str(cargo), "metadata", "--format-version", "1", "--no-deps"],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            cwd=project_root,
+            timeout=60,
+        )
+    except (FileNotFoundError, OSError, subprocess.TimeoutExpired) as e:
+        LOGGER.debug(f"cargo metadata failed: {e}")
+        return None
+    if result.returncode != 0:
+        LOGGER.debug(f"cargo metadata failed: {result.stderr[:500]}")
+        return None
+    try:
+        packages = json.loads(result.stdout).get("packages", [])
+    except (ValueError, AttributeError) as e:
+        LOGGER.debug(f"Cannot parse cargo metadata: {e}")
+        return None
+
+    root = project_root.resolve()
+    dirs: Dict[Path, str] = {}
+    for package in packages:
+        try:
+            dirs[Path(package["manifest_path"]).resolve().parent] = package["name"]
+        except (KeyError, TypeError):
+            continue
+
+    members: Dict[str, Dict[str, Any]] = {}
+    for member_dir, name in dirs.items():
+        try:
+            relative = member_dir.relative_to(root).as_posix()
+        except ValueError:
+            continue
+        members[name] = {"dir": relative, "deps": []}
+    for package in packages:
+        name = package.get("name")
+        if name not in members:
+            continue
+        deps: Set[str] = set()
+        for dependency in package.get("dependencies") or []:
+            path = dependency.get("path")
+            dep_name = dirs.get(Path(path).resolve()) if path else None
+            if dep_name in members and dep_name != name:
+                deps.add(dep_name)
+        members[name]["deps"] = sorted(deps)
+    return members
+
+
+def load_workspace_graph(project_root: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Return the workspace member graph, from the cache when still current.
+
+    Args:
+        project_root: Workspace root directory.
+
+    Returns:
+        Member directories and dependencies per member name (see
+        :func:`_read_workspace`), or None if the graph cannot be read.
+    """
+    from lucidshark.bootstrap.paths import LucidsharkPaths
+    from lucidshark.plugins.utils import cached_json
+
+    cache_file = (
+        LucidsharkPaths.for_project(project_root).plugin_cache_dir("cargo")
+        / CARGO_GRAPH_FILE
+    )
+    return cached_json(
+        cache_file,
+        "members",
+        CARGO_GRAPH_FORMAT,
+        _manifest_fingerprint(project_root),
+        lambda: _read_workspace(project_root),
+    )
+
+
+def affected_members(
+    members: Dict[str, Dict[str, Any]], changed: List[str]
+) -> Optional[Set[str]]:
+    """Find the workspace members affected by changed files.
+
+    Args:
+        members: Workspace graph from :func:`load_workspace_graph`.
+        changed: Changed files relative to the workspace root (posix).
+
+    Returns:
+        Names of the innermost members containing a changed file and of all
+        members depending on them; None if a workspace-wide file changed.
+    """
+    from lucidshark.plugins.utils import affected_closure
+
+    return affected_closure(
+        {name: member["dir"] for name, member in members.items()},
+        {name: member["deps"] for name, member in members.items()},
+        changed,
+        CARGO_WORKSPACE_FILES,
+    )
+
+
+def cargo_package_args(context: Any) -> Optional[List[str]]:
+    """Package selection arguments for a cargo command in a scan.
+
+    Args:
+        context: Scan context.
+
+    Returns:
+        None to build the default packages (full scans, or when the
+        workspace cannot be read); for scans of specific files, ``-p``
+        arguments for the affected members, which may be empty when no
+        member is affected.
+    """
+    from lucidshark.plugins.utils import changed_files
+
+    changed = changed_files(context)
+    if changed is None:
+        return None
+
+    members = load_workspace_graph(context.project_root)
+    if members is None:
+        return None
+    affected = affected_members(members, changed)
+    if affected is None:
+        return None
+    args: List[str] = []
+    for name in sorted(affected):
+        args.extend(["-p", name])
+    return args
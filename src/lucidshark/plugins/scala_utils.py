@@ -0,0 +1,415 @@
+"""Shared utilities for Scala plugins.
+
+scala_compile (type checking) and Scalafix (linting) share a single
+compile per scan: whichever plugin runs first compiles the project and the
+other reuses the result. When the build writes SemanticDB files, Scalafix
+reads them from that compile instead of needing its own.
+
+With ``settings.scala_build_server: true`` sbt tasks run through the sbt
+thin client (``sbt --client``) against a long-lived sbt server, and Gradle
+tasks use the Gradle daemon, so scans compile incrementally in a warm JVM
+instead of starting a cold build each time. LucidShark starts the sbt
+server on first use, checks that it accepts connections before every
+task, reloads it when the build definition changes and, if it started the
+server, stops it together with the MCP server or file watcher (see
+``core.daemons``). The server outlives one-shot ``lucidshark scan`` runs
+so the next scan can reuse it; ``sbt --client shutdown`` stops it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import socket
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from lucidshark.core.logging import get_logger
+from lucidshark.core.subprocess_runner import run_with_streaming
+
+LOGGER = get_logger(__name__)
+
+# Timeout of the shared compile in seconds
+SCALA_COMPILE_TIMEOUT = 300
+
+# Seconds to wait for a new sbt server (includes loading the build)
+SBT_SERVER_STARTUP_TIMEOUT = 300
+
+# First sbt version with the thin client
+MIN_SBT_CLIENT_VERSION = (1, 4)
+
+# Directories that never hold build inputs
+SCALA_SKIP_DIRS = frozenset({"target", "build", "node_modules"})
+
+# Build definition files whose change requires an sbt ``reload``
+SBT_BUILD_PATTERNS = ("*.sbt", "project/*.sbt", "project/*.scala")
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+_SEMANTICDB_SETTING = re.compile(
+    r"semanticdbEnabled\s*:=\s*true|-Xsemanticdb|-Ysemanticdb|semanticdb-scalac"
+)
+_SBT_VERSION = re.compile(r"^\s*sbt\.version\s*=\s*(\d+)\.(\d+)", re.MULTILINE)
+
+
+@dataclass
+class ScalaCompile:
+    """Outcome of a shared Scala compile."""
+
+    output: str
+    succeeded: bool
+
+
+def scala_build_server_enabled(context: Any) -> bool:
+    """Whether ``settings.scala_build_server`` is enabled for a scan.
+
+    Args:
+        context: Scan context.
+
+    Returns:
+        True if Scala builds should reuse an sbt server or Gradle daemon.
+    """
+    settings = getattr(context.config, "settings", None)
+    return getattr(settings, "scala_build_server", False) is True
+
+
+def _sbt_client_supported(project_root: Path) -> bool:
+    """Whether the project's sbt version has the thin client."""
+    try:
+        text = (project_root / "project" / "build.properties").read_text(
+            encoding="utf-8"
+        )
+    except OSError:
+        return False
+    match = _SBT_VERSION.search(text)
+    if not match:
+        return False
+    return (int(match.group(1)), int(match.group(2))) >= MIN_SBT_CLIENT_VERSION
+
+
+class SbtServer:
+    """sbt server of a project, used through the thin client.
+
+    The server writes its address to ``project/target/active.json``; it
+    is healthy when that address accepts connections.
+    """
+
+    def __init__(self, binary: Path, project_root: Path) -> None:
+        """Initialize the server handle.
+
+        Args:
+            binary: Path to the ``sbt`` launcher.
+            project_root: Directory of ``build.sbt``.
+        """
+        self.binary = binary
+        self.project_root = project_root
+        self.key = f"sbt-server:{project_root}"
+        self._lock = threading.Lock()
+        self._failed = False
+        self._started = False
+
+    def command(self, task: str) -> Optional[List[str]]:
+        """Thin client command running an sbt task.
+
+        Starts the server if none is running, and reloads it when the
+        build definition changed since LucidShark last used it.
+
+        Args:
+            task: sbt task (e.g. ``"compile"``).
+
+        Returns:
+            The command, or None if the server cannot be used and the
+            task should run in a new sbt process.
+        """
+        with self._lock:
+            if self._failed:
+                return None
+            if not self._ensure_running():
+                LOGGER.debug("sbt server unavailable; running sbt in a new JVM")
+                self._failed = True
+                return None
+        return [str(self.binary), "--client", task]
+
+    def stop(self) -> None:
+        """Shut the server down if it was started by this session."""
+        from lucidshark.core.daemons import unregister_daemon
+
+        unregister_daemon(self.key)
+        with self._lock:
+            if self._started:
+                self._client("shutdown", timeout=60)
+                self._started = False
+
+    def is_alive(self) -> bool:
+        """Whether a server accepts connections at its advertised address."""
+        try:
+            active = json.loads(
+                (self.project_root / "project" / "target" / "active.json").read_text(
+                    encoding="utf-8"
+                )
+            )
+            uri = str(active["uri"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        try:
+            if uri.startswith("local://") and hasattr(socket, "AF_UNIX"):
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.settimeout(2)
+                    sock.connect(uri[len("local://") :])
+                return True
+            if uri.startswith("tcp://"):
+                host, _, port = uri[len("tcp://") :].rpartition(":")
+                with socket.create_connection((host, int(port)), timeout=2):
+                    return True
+        except (OSError, ValueError):
+            return False
+        # Named pipes (Windows) cannot be probed; trust the active file
+        return uri.startswith("local:")
+
+    def _ensure_running(self) -> bool:
+        """Start the server or reload a running one as needed."""
+        from lucidshark.core.daemons import register_daemon
+
+        if not _sbt_client_supported(self.project_root):
+            return False
+        fingerprint = self._build_fingerprint()
+        if self.is_alive():
+            if fingerprint != self._read_build_fingerprint():
+                LOGGER.debug("Reloading sbt server (build definition changed)")
+                if not self._client("reload", timeout=SBT_SERVER_STARTUP_TIMEOUT):
+                    return False
+                self._write_build_fingerprint(fingerprint)
+            return True
+
+        # A stale address makes the client wait for a server that is gone
+        (self.project_root / "project" / "target" / "active.json").unlink(
+            missing_ok=True
+        )
+        LOGGER.info("Starting sbt server")
+        if not self._client("sbtVersion", timeout=SBT_SERVER_STARTUP_TIMEOUT):
+            return False
+        if not self.is_alive():
+            return False
+        self._started = True
+        self._write_build_fingerprint(fingerprint)
+        register_daemon(self.key, self.stop)
+        return True
+
+    def _client(self, task: str, timeout: int) -> bool:
+        """Run a task through the thin client and report success."""
+        try:
+            result = subprocess.run(
+                [str(self.binary), "--client", task],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=timeout,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            LOGGER.debug(f"sbt --client {task} failed: {e}")
+            return False
+        if result.returncode != 0:
+            LOGGER.debug(f"sbt --client {task} failed: {result.stdout[-500:]}")
+        return result.returncode == 0
+
+    def _fingerprint_file(self) -> Path:
+        from lucidshark.bootstrap.paths import LucidsharkPaths
+
+        paths = LucidsharkPaths.for_project(self.project_root)
+        return paths.plugin_cache_dir("sbt") / "build-fingerprint"
+
+    def _build_fingerprint(self) -> str:
+        """Fingerprint the sbt build definition."""
+        digest = hashlib.sha256()
+        files = [
+            path
+            for pattern in SBT_BUILD_PATTERNS
+            for path in self.project_root.glob(pattern)
+        ]
+        files.append(self.project_root / "project" / "build.properties")
+        for path in sorted(files):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode())
+        return digest.hexdigest()
+
+    def _read_build_fingerprint(self) -> Optional[str]:
+        try:
+            return self._fingerprint_file().read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+
+    def _write_build_fingerprint(self, fingerprint: str) -> None:
+        try:
+            path = self._fingerprint_file()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(fingerprint, encoding="utf-8")
+        except OSError as e:
+            LOGGER.debug(f"Failed to record sbt build fingerprint: {e}")
+
+
+_servers: Dict[Path, SbtServer] = {}
+_servers_lock = threading.Lock()
+
+
+def get_sbt_server(binary: Path, project_root: Path) -> SbtServer:
+    """Return the sbt server handle of a project, shared by all plugins."""
+    with _servers_lock:
+        server = _servers.get(project_root)
+        if server is None:
+            server = SbtServer(binary, project_root)
+            _servers[project_root] = server
+        return server
+
+
+def sbt_command(context: Any, binary: Path, task: str) -> List[str]:
+    """Command running an sbt task.
+
+    Args:
+        context: Scan context.
+        binary: Path to the ``sbt`` launcher.
+        task: sbt task (e.g. ``"test"``).
+
+    Returns:
+        A thin client command when the build server is enabled and
+        usable, otherwise a new sbt process without colors.
+    """
+    if scala_build_server_enabled(context):
+        command = get_sbt_server(binary, context.project_root).command(task)
+        if command is not None:
+            return command
+    return [str(binary), "--no-colors", task]
+
+
+def gradle_daemon_args(context: Any) -> List[str]:
+    """Gradle arguments selecting whether the Gradle daemon is used.
+
+    Args:
+        context: Scan context.
+    """
+    return [] if scala_build_server_enabled(context) else ["--no-daemon"]
+
+
+def compile_command(context: Any, binary: Path, build_system: str) -> List[str]:
+    """Command compiling a Scala project.
+
+    Args:
+        context: Scan context.
+        binary: Path to the build tool.
+        build_system: ``"sbt"``, ``"maven"`` or ``"gradle"``.
+    """
+    if build_system == "sbt":
+        return sbt_command(context, binary, "compile")
+    if build_system == "maven":
+        return [str(binary), "compile", "-B"]
+    return [str(binary), "compileScala", *gradle_daemon_args(context)]
+
+
+def _run_compile(context: Any, binary: Path, build_system: str) -> ScalaCompile:
+    """Compile a Scala project.
+
+    Raises:
+        subprocess.TimeoutExpired: If the compile times out.
+    """
+    cmd = compile_command(context, binary, build_system)
+    LOGGER.debug(f"Running: {' '.join(cmd)}")
+    result = run_with_streaming(
+        cmd=cmd,
+        cwd=context.project_root,
+        tool_name=f"{build_system}-compile",
+        stream_handler=context.stream_handler,
+        timeout=SCALA_COMPILE_TIMEOUT,
+    )
+    output = (result.stdout or "") + "\n" + (result.stderr or "")
+    return ScalaCompile(
+        output=_ANSI_ESCAPE.sub("", output),
+        succeeded=result.returncode == 0,
+    )
+
+
+def shared_compile(context: Any, binary: Path, build_system: str) -> ScalaCompile:
+    """Compile a Scala project once for all Scala plugins.
+
+    Concurrent callers wait for a compile in progress. A finished compile
+    is reused until a file of the project changes.
+
+    Args:
+        context: Scan context.
+        binary: Path to the build tool.
+        build_system: ``"sbt"``, ``"maven"`` or ``"gradle"``.
+
+    Returns:
+        The compile outcome, with ANSI escapes removed from the output.
+
+    Raises:
+        subprocess.TimeoutExpired: If the compile times out.
+    """
+    from lucidshark.plugins.utils import memoized_build
+
+    key = context.project_root.resolve()
+    return memoized_build(
+        f"{build_system} compile",
+        key,
+        key,
+        SCALA_SKIP_DIRS,
+        lambda: _run_compile(context, binary, build_system),
+    )
+
+
+def semanticdb_enabled(project_root: Path) -> bool:
+    """Whether the build writes SemanticDB files when compiling.
+
+    Looks for ``semanticdbEnabled := true`` in sbt builds and for the
+    SemanticDB compiler flags or plugin in sbt, Maven and Gradle builds.
+
+    Args:
+        project_root: Project root directory.
+    """
+    build_files = [
+        *project_root.glob("*.sbt"),
+        *project_root.glob("project/*.sbt"),
+        project_root / "pom.xml",
+        project_root / "build.gradle",
+        project_root / "build.gradle.kts",
+    ]
+    for path in build_files:
+        try:
+            if _SEMANTICDB_SETTING.search(path.read_text(encoding="utf-8")):
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def semanticdb_targetroots(project_root: Path) -> List[Path]:
+    """Find the directories holding compiled SemanticDB files.
+
+    A target root contains ``META-INF/semanticdb`` (for sbt
+    ``target/scala-*/meta``, for the compiler plugin the class directory).
+
+    Args:
+        project_root: Project root directory.
+
+    Returns:
+        Target roots, sorted.
+    """
+    roots: List[Path] = []
+    for dirpath, dirnames, _ in os.walk(project_root):
+        if "META-INF" in dirnames and os.path.isdir(
+            os.path.join(dirpath, "META-INF", "semanticdb")
+        ):
+            roots.append(Path(dirpath))
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if not d.startswith(".") and d not in ("META-INF", "node_modules")
+        ]
+    return sorted(roots)
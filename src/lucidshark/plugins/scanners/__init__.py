@@ -4,7 +4,7 @@ Plugins are discovered via Python entry points (lucidshark.scanners group).
 """
 
 from pathlib import Path
-from typing import Dict, Optional, Type
+from typing import Mapping, Optional, Type
 
 from lucidshark.plugins.scanners.base import ScannerPlugin
 from lucidshark.plugins.scanners.trivy import TrivyScanner
@@ -19,7 +19,7 @@ from lucidshark.plugins.discovery import (
 )
 
 
-def discover_scanner_plugins() -> Dict[str, Type[ScannerPlugin]]:
+def discover_scanner_plugins() -> Mapping[str, Type[ScannerPlugin]]:
     """Discover all installed scanner plugins via entry points."""
     return discover_plugins(SCANNER_ENTRY_POINT_GROUP, ScannerPlugin)
 
@@ -26,7 +26,7 @@ from lucidshark.bootstrap.validation import (
 )
 from lucidshark.bootstrap.versions import get_tool_version
 from lucidshark.core.logging import get_logger
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
+from lucidshark.core.subprocess_runner import run_with_streaming
 
 LOGGER = get_logger(__name__)
 
@@ -266,26 +266,26 @@ class CheckovScanner(ScannerPlugin):
         LOGGER.debug(f"Running: {' '.join(cmd)}")
 
         try:
-            with temporary_env(self._get_scan_env()):
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="checkov",
-                    stream_handler=context.stream_handler,
-                    timeout=180,
-                )
-
-                # Checkov returns non-zero exit code when findings exist
-                # Exit code 1 means findings found (expected)
-                # Exit code 2 means error
-                if result.returncode == 2 and result.stderr:
-                    LOGGER.warning(f"Checkov stderr: {result.stderr}")
-
-                if not result.stdout.strip():
-                    LOGGER.debug("Checkov returned empty output")
-                    return []
-
-                return self._parse_checkov_json(result.stdout, context.project_root)
+            result = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="checkov",
+                stream_handler=context.stream_handler,
+                timeout=180,
+                env=self._get_scan_env(),
+            )
+
+            # Checkov returns non-zero exit code when findings exist
+            # Exit code 1 means findings found (expected)
+            # Exit code 2 means error
+            if result.returncode == 2 and result.stderr:
+                LOGGER.warning(f"Checkov stderr: {result.stderr}")
+
+            if not result.stdout.strip():
+                LOGGER.debug("Checkov returned empty output")
+                return []
+
+            return self._parse_checkov_json(result.stdout, context.project_root)
 
         except subprocess.TimeoutExpired:
             LOGGER.warning("Checkov scan timed out after 180 seconds")
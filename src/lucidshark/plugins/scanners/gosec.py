@@ -31,8 +31,13 @@ from lucidshark.core.models import (
     SkipReason,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
-from lucidshark.plugins.go_utils import ensure_go_in_path, find_go, has_go_mod
+from lucidshark.core.subprocess_runner import run_with_streaming
+from lucidshark.plugins.go_utils import (
+    ensure_go_in_path,
+    find_go,
+    go_package_targets,
+    has_go_mod,
+)
 from lucidshark.plugins.scanners.base import ScannerPlugin
 
 LOGGER = get_logger(__name__)
@@ -277,6 +282,11 @@ class GosecScanner(ScannerPlugin):
         Returns:
             List of unified issues from the SAST scan.
         """
+        targets = go_package_targets(context)
+        if not targets:
+            LOGGER.info("No Go packages affected by the changes, skipping gosec")
+            return []
+
         cmd = [
             str(binary),
             "-fmt=json",
@@ -299,22 +309,22 @@ class GosecScanner(ScannerPlugin):
                 sorted_dirs = sorted(gosec_dirs)
                 cmd.extend(["-exclude-dir", ",".join(sorted_dirs)])
 
-        # Scan all packages
-        cmd.append("./...")
+        # Scan all packages, or the packages affected by the changed files
+        cmd.extend(targets)
 
         LOGGER.debug(f"Running: {' '.join(cmd)}")
 
         env_vars = ensure_go_in_path()
 
         try:
-            with temporary_env(env_vars):
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="gosec",
-                    stream_handler=context.stream_handler,
-                    timeout=300,
-                )
+            result = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="gosec",
+                stream_handler=context.stream_handler,
+                timeout=300,
+                env=env_vars,
+            )
 
             # Log stderr for debugging (even on success)
             if result.stderr:
@@ -24,7 +24,7 @@ from lucidshark.bootstrap.validation import (
 )
 from lucidshark.bootstrap.versions import get_tool_version
 from lucidshark.core.logging import get_logger
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
+from lucidshark.core.subprocess_runner import run_with_streaming
 
 LOGGER = get_logger(__name__)
 
@@ -217,25 +217,25 @@ class OpenGrepScanner(ScannerPlugin):
         LOGGER.debug(f"Running: {' '.join(cmd)}")
 
         try:
-            with temporary_env(self._get_scan_env()):
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="opengrep",
-                    stream_handler=context.stream_handler,
-                    timeout=180,
-                )
-
-                # OpenGrep returns non-zero exit code when findings exist
-                # This is expected behavior, not an error
-                if result.returncode not in (0, 1) and result.stderr:
-                    LOGGER.warning(f"OpenGrep stderr: {result.stderr}")
-
-                if not result.stdout.strip():
-                    LOGGER.debug("OpenGrep returned empty output")
-                    return []
-
-                return self._parse_opengrep_json(result.stdout, context.project_root)
+            result = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="opengrep",
+                stream_handler=context.stream_handler,
+                timeout=180,
+                env=self._get_scan_env(),
+            )
+
+            # OpenGrep returns non-zero exit code when findings exist
+            # This is expected behavior, not an error
+            if result.returncode not in (0, 1) and result.stderr:
+                LOGGER.warning(f"OpenGrep stderr: {result.stderr}")
+
+            if not result.stdout.strip():
+                LOGGER.debug("OpenGrep returned empty output")
+                return []
+
+            return self._parse_opengrep_json(result.stdout, context.project_root)
 
         except subprocess.TimeoutExpired:
             LOGGER.warning("OpenGrep scan timed out after 180 seconds")
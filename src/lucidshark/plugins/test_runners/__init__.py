@@ -15,7 +15,7 @@ def discover_test_runner_plugins():
     """Discover all installed test runner plugins.
 
     Returns:
-        Dictionary mapping plugin names to plugin classes.
+        Mapping of plugin names to plugin classes (imported on access).
     """
     return discover_plugins(TEST_RUNNER_ENTRY_POINT_GROUP, TestRunnerPlugin)
 
@@ -7,6 +7,7 @@ for test results and failures.
 from __future__ import annotations
 
 import hashlib
+import os
 import re
 import subprocess
 from pathlib import Path
@@ -21,7 +22,13 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
-from lucidshark.plugins.rust_utils import find_cargo, get_cargo_version
+from lucidshark.plugins.rust_utils import (
+    cargo_env,
+    cargo_package_args,
+    cargo_watched_paths,
+    find_cargo,
+    get_cargo_version,
+)
 from lucidshark.plugins.test_runners.base import TestRunnerPlugin, TestResult
 
 LOGGER = get_logger(__name__)
@@ -69,14 +76,25 @@ class CargoTestRunner(TestRunnerPlugin):
         Returns:
             True if tarpaulin is installed and runnable.
         """
+        from lucidshark.core.capability_cache import cached_probe
+
         try:
             cargo = find_cargo()
-            result = subprocess.run(
-                [str(cargo), "tarpaulin", "--version"],
-                capture_output=True,
-                timeout=10,
+
+            def probe() -> bool:
+                result = subprocess.run(
+                    [str(cargo), "tarpaulin", "--version"],
+                    capture_output=True,
+                    timeout=10,
+                )
+                return result.returncode == 0
+
+            return cached_probe(
+                "cargo-tarpaulin",
+                [str(cargo), os.getcwd()],
+                cargo_watched_paths(cargo, "tarpaulin"),
+                probe,
             )
-            return result.returncode == 0
         except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
             return False
 
@@ -181,6 +199,8 @@ class CargoTestRunner(TestRunnerPlugin):
     def _run_cargo_test(self, cargo: Path, context: ScanContext) -> TestResult:
         """Run tests via plain cargo test.
 
+        Scans of specific files only test the affected workspace members.
+
         Args:
             cargo: Path to cargo binary.
             context: Scan context.
@@ -188,7 +208,14 @@ class CargoTestRunner(TestRunnerPlugin):
         Returns:
             TestResult with test statistics and issues for failures.
         """
-        cmd = [str(cargo), "test"]
+        packages = cargo_package_args(context)
+        if packages == []:
+            LOGGER.info(
+                "No workspace members affected by the changes, skipping cargo test"
+            )
+            return TestResult(tool="cargo")
+
+        cmd = [str(cargo), "test", *(packages or [])]
 
         LOGGER.debug(f"Running: {' '.join(cmd)}")
 
@@ -201,6 +228,7 @@ class CargoTestRunner(TestRunnerPlugin):
                 tool_name="cargo-test",
                 stream_handler=context.stream_handler,
                 timeout=600,
+                env=cargo_env(context.project_root),
             )
             stdout = result.stdout
             stderr = result.stderr
@@ -22,7 +22,7 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
+from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.cpp_utils import (
     ensure_cpp_tools_in_path,
     find_build_dir,
@@ -116,14 +116,14 @@ class CTestRunner(TestRunnerPlugin):
         stdout = ""
         stderr = ""
         try:
-            with temporary_env(env_vars):
-                proc = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="ctest",
-                    stream_handler=context.stream_handler,
-                    timeout=600,
-                )
+            proc = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="ctest",
+                stream_handler=context.stream_handler,
+                timeout=600,
+                env=env_vars,
+            )
             stdout = proc.stdout or ""
             stderr = proc.stderr or ""
             if proc.returncode != 0:
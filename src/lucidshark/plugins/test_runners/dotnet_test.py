@@ -24,7 +24,11 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
-from lucidshark.plugins.dotnet_utils import find_dotnet, find_project_file
+from lucidshark.plugins.dotnet_utils import (
+    find_dotnet,
+    find_project_file,
+    shared_build,
+)
 from lucidshark.plugins.test_runners.base import TestRunnerPlugin, TestResult
 from lucidshark.plugins.utils import get_cli_version
 
@@ -76,6 +80,10 @@ class DotnetTestRunner(TestRunnerPlugin):
         When the coverage domain is enabled, adds --collect:"XPlat Code Coverage"
         to generate Cobertura coverage data in the same pass.
 
+        Tests run with --no-build against the build shared with the dotnet
+        build type checker. If that build fails, dotnet test builds itself
+        so build errors surface as before.
+
         Args:
             context: Scan context with paths and configuration.
 
@@ -105,8 +113,8 @@ class DotnetTestRunner(TestRunnerPlugin):
             str(results_dir),
             "-v",
             "quiet",
-            "--no-restore",
         ]
+        cmd.extend(self._build_args(context, dotnet, project_file))
 
         # Add coverage collection if coverage domain is enabled
         if ToolDomain.COVERAGE in context.enabled_domains:
@@ -149,6 +157,29 @@ class DotnetTestRunner(TestRunnerPlugin):
         # Fall back to parsing console output
         return self._parse_console_output(stdout + "\n" + stderr, context.project_root)
 
+    def _build_args(
+        self, context: ScanContext, dotnet: Path, project_file: Path
+    ) -> List[str]:
+        """Build the project and return the dotnet test build arguments.
+
+        Args:
+            context: Scan context.
+            dotnet: Path to dotnet binary.
+            project_file: Solution or project file.
+
+        Returns:
+            Arguments running tests against the shared build, or
+            ``--no-restore`` if dotnet test has to build itself.
+        """
+        try:
+            build = shared_build(context, dotnet, project_file)
+        except Exception as e:
+            LOGGER.debug(f"Shared dotnet build failed: {e}")
+            return ["--no-restore"]
+        if not build.succeeded:
+            return ["--no-restore"]
+        return ["--no-build", *build.artifacts_args()]
+
     def _parse_trx_reports(
         self, results_dir: Path, project_root: Path
     ) -> Optional[TestResult]:
@@ -21,11 +21,13 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
+from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.go_utils import (
+    GO_ALL_PACKAGES,
     ensure_go_in_path,
     find_go,
     get_go_version,
+    go_package_targets,
     has_go_mod,
 )
 from lucidshark.plugins.test_runners.base import TestResult, TestRunnerPlugin
@@ -75,6 +77,11 @@ class GoTestRunner(TestRunnerPlugin):
         When the coverage domain is enabled, adds -coverprofile=coverage.out
         so that coverage data is generated alongside test execution.
 
+        Full scans run every package with ``-count=1``. Scans of specific
+        files run only the affected packages and let Go reuse its cached
+        results; with coverage, all packages run so the profile stays
+        complete, with the unaffected ones served from the test cache.
+
         Args:
             context: Scan context with paths and configuration.
 
@@ -92,13 +99,24 @@ class GoTestRunner(TestRunnerPlugin):
             LOGGER.info("No go.mod found, skipping go test")
             return TestResult(tool="go_test")
 
-        cmd = [str(go_bin), "test", "-json", "-count=1"]
+        targets = go_package_targets(context)
+        incremental = targets != [GO_ALL_PACKAGES]
+        measure_coverage = ToolDomain.COVERAGE in context.enabled_domains
+        if incremental and measure_coverage:
+            targets = [GO_ALL_PACKAGES]
+        if not targets:
+            LOGGER.info("No Go packages affected by the changes, skipping go test")
+            return TestResult(tool="go_test")
+
+        cmd = [str(go_bin), "test", "-json"]
+        if not incremental:
+            cmd.append("-count=1")
 
         # Add coverage instrumentation when coverage domain is enabled
-        if ToolDomain.COVERAGE in context.enabled_domains:
+        if measure_coverage:
             cmd.append("-coverprofile=coverage.out")
 
-        cmd.append("./...")
+        cmd.extend(targets)
 
         LOGGER.debug(f"Running: {' '.join(cmd)}")
 
@@ -108,14 +126,14 @@ class GoTestRunner(TestRunnerPlugin):
         stdout = ""
         stderr = ""
         try:
-            with temporary_env(env_vars):
-                proc = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="go-test",
-                    stream_handler=context.stream_handler,
-                    timeout=600,
-                )
+            proc = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="go-test",
+                stream_handler=context.stream_handler,
+                timeout=600,
+                env=env_vars,
+            )
             stdout = proc.stdout
             stderr = proc.stderr
             # go test returns non-zero on test failures or build failures — that's normal
@@ -0,0 +1,268 @@
+"""Change-based test selection (test impact analysis).
+
+With ``pipeline.testing.impact`` enabled, test runners that support it
+record which source files every test executes, using coverage.py dynamic
+contexts (one context per test). The resulting map is kept in
+``.lucidshark/cache/<runner>/impact.json``.
+
+Incremental scans then run only the tests whose recorded footprint includes
+a changed file, plus tests in changed test files and tests the map does not
+know yet. The full suite runs instead whenever the selection could miss
+affected tests: on full scans, when there is no map yet or it was recorded
+with a different test setup, when a file affecting every test changed
+(``conftest.py``, tool configuration, requirements and lockfiles), and when
+a changed file other than documentation is not in the map.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set
+
+from lucidshark.core.logging import get_logger
+from lucidshark.plugins.utils import read_json_cache, write_json_cache
+
+LOGGER = get_logger(__name__)
+
+# Bump when the on-disk format changes to discard old maps
+IMPACT_FORMAT = 1
+
+IMPACT_FILE = "impact.json"
+
+# Files that can affect every test, wherever they are in the project
+GLOBAL_FILES = frozenset(
+    {
+        "conftest.py",
+        "pytest.ini",
+        "pyproject.toml",
+        "setup.cfg",
+        "setup.py",
+        "tox.ini",
+        ".coveragerc",
+        "Pipfile",
+        "Pipfile.lock",
+        "poetry.lock",
+        "uv.lock",
+        "pdm.lock",
+    }
+)
+
+# Files that never affect what tests do (documentation)
+IGNORED_SUFFIXES = (".md", ".rst", ".adoc")
+IGNORED_DIRS = ("docs/",)
+
+
+def impact_enabled(context: Any) -> bool:
+    """Whether ``pipeline.testing.impact`` is enabled for a scan.
+
+    Args:
+        context: Scan context.
+    """
+    pipeline = getattr(context.config, "pipeline", None)
+    testing = getattr(pipeline, "testing", None)
+    return getattr(testing, "impact", False) is True
+
+
+def is_global_file(path: str) -> bool:
+    """Whether a change to a file can affect every test.
+
+    Args:
+        path: File path relative to the project root.
+    """
+    name = path.rsplit("/", 1)[-1]
+    return name in GLOBAL_FILES or (
+        name.startswith("requirements") and name.endswith(".txt")
+    )
+
+
+def is_ignored_file(path: str) -> bool:
+    """Whether a change to a file cannot affect any test.
+
+    Args:
+        path: File path relative to the project root.
+    """
+    return path.lower().endswith(IGNORED_SUFFIXES) or path.startswith(IGNORED_DIRS)
+
+
+def config_fingerprint(project_root: Path, *extra: str) -> str:
+    """Fingerprint the project-wide test setup.
+
+    Args:
+        project_root: Project root directory.
+        extra: Further values the map depends on (e.g. the runner binary).
+
+    Returns:
+        Hex digest changing whenever a global file in the project root or
+        one of ``extra`` changes.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{IMPACT_FORMAT}\0".encode())
+    for value in extra:
+        digest.update(f"{value}\0".encode())
+    names = sorted(
+        entry.name
+        for entry in project_root.iterdir()
+        if entry.is_file() and is_global_file(entry.name)
+    )
+    for name in names:
+        try:
+            content = (project_root / name).read_bytes()
+        except OSError:
+            continue
+        digest.update(f"{name}\0".encode())
+        digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()
+
+
+def read_coverage_contexts(data_file: Path, project_root: Path) -> Dict[str, Set[str]]:
+    """Read the files executed per dynamic context from coverage data.
+
+    Args:
+        data_file: coverage.py SQLite data file (``.coverage``).
+        project_root: Project root; files outside it are ignored.
+
+    Returns:
+        Project-relative file paths per non-empty context (empty if the
+        file cannot be read).
+    """
+    query = """
+        SELECT context.context, file.path FROM line_bits
+        JOIN file ON file.id = line_bits.file_id
+        JOIN context ON context.id = line_bits.context_id
+        UNION
+        SELECT context.context, file.path FROM arc
+        JOIN file ON file.id = arc.file_id
+        JOIN context ON context.id = arc.context_id
+    """
+    root = project_root.resolve()
+    contexts: Dict[str, Set[str]] = {}
+    try:
+        connection = sqlite3.connect(
+            f"{data_file.resolve().as_uri()}?mode=ro", uri=True
+        )
+        try:
+            rows = connection.execute(query).fetchall()
+        finally:
+            connection.close()
+    except (OSError, sqlite3.Error) as e:
+        LOGGER.debug(f"Cannot read coverage contexts from {data_file}: {e}")
+        return {}
+
+    for context_name, file_path in rows:
+        if not context_name:
+            continue
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = root / path
+        try:
+            relative = path.relative_to(root).as_posix()
+        except ValueError:
+            continue
+        contexts.setdefault(context_name, set()).add(relative)
+    return contexts
+
+
+def select_tests(
+    tests: Sequence[str],
+    changed: Iterable[str],
+    footprints: Mapping[str, Sequence[str]],
+) -> Optional[List[str]]:
+    """Select the tests affected by changed files.
+
+    Args:
+        tests: Collected test IDs (``path::name``), in collection order.
+        changed: Changed files relative to the project root.
+        footprints: Recorded files executed per test ID.
+
+    A changed file that is neither a collected test file nor in any
+    footprint (a test helper that is only imported, a data fixture, a
+    template, a module no test has run yet ...) may still change what tests
+    do, so it selects every test. Only documentation is exempt (see
+    :func:`is_ignored_file`).
+
+    Returns:
+        Affected tests in collection order, or None if every test may be
+        affected.
+    """
+    changed_set = set(changed)
+    if any(is_global_file(path) for path in changed_set):
+        return None
+    known = {test.split("::", 1)[0] for test in tests}
+    for files in footprints.values():
+        known.update(files)
+    if any(path not in known and not is_ignored_file(path) for path in changed_set):
+        return None
+    selected = []
+    for test in tests:
+        footprint = footprints.get(test)
+        if (
+            footprint is None
+            or test.split("::", 1)[0] in changed_set
+            or not changed_set.isdisjoint(footprint)
+        ):
+            selected.append(test)
+    return selected
+
+
+class ImpactMap:
+    """Files executed per test, recorded by earlier runs of a test runner."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the map.
+
+        Args:
+            path: JSON file holding the map.
+        """
+        self.path = path
+
+    @classmethod
+    def for_project(cls, project_root: Path, runner: str) -> "ImpactMap":
+        """Return the map of a test runner in a project.
+
+        Args:
+            project_root: Project root directory.
+            runner: Test runner name (e.g. ``"pytest"``).
+        """
+        from lucidshark.bootstrap.paths import LucidsharkPaths
+
+        cache_dir = LucidsharkPaths.for_project(project_root).plugin_cache_dir(runner)
+        return cls(cache_dir / IMPACT_FILE)
+
+    def load(self, fingerprint: str) -> Optional[Dict[str, List[str]]]:
+        """Read the recorded footprints.
+
+        Args:
+            fingerprint: Current :func:`config_fingerprint`.
+
+        Returns:
+            Files per test ID, or None if no map was recorded for the
+            current fingerprint.
+        """
+        return read_json_cache(self.path, "tests", IMPACT_FORMAT, fingerprint)
+
+    def record(
+        self,
+        footprints: Mapping[str, Iterable[str]],
+        fingerprint: str,
+        complete: bool,
+    ) -> None:
+        """Store the footprints measured by a run.
+
+        Args:
+            footprints: Files executed per test that ran.
+            fingerprint: Current :func:`config_fingerprint`.
+            complete: True if the whole suite ran, replacing the map. Partial
+                runs only update the tests that ran, and are dropped if
+                there is no current map to update.
+        """
+        if complete:
+            tests: Dict[str, List[str]] = {}
+        else:
+            current = self.load(fingerprint)
+            if current is None:
+                return
+            tests = current
+        tests.update({test: sorted(files) for test, files in footprints.items()})
+        write_json_cache(self.path, "tests", tests, IMPACT_FORMAT, fingerprint)
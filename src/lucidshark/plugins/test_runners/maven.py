@@ -5,6 +5,9 @@ Supports running Java tests via:
 - Gradle Test task (gradle test)
 
 Automatically detects the build system and parses JUnit XML reports.
+
+Scans of specific files run only the modules affected by the changes
+(Maven ``-pl <modules> -amd``, Gradle ``:<module>:test`` tasks).
 """
 
 from __future__ import annotations
@@ -12,7 +15,7 @@ from __future__ import annotations
 import hashlib
 import subprocess
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import defusedxml.ElementTree as ET  # type: ignore[import-untyped]
 from xml.etree.ElementTree import Element
@@ -26,6 +29,7 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
+from lucidshark.plugins.java_utils import gradle_task, java_module_selection
 from lucidshark.plugins.test_runners.base import TestRunnerPlugin, TestResult
 from lucidshark.plugins.utils import find_java_build_tool
 
@@ -116,7 +120,9 @@ class MavenTestRunner(TestRunnerPlugin):
     def run_tests(self, context: ScanContext) -> TestResult:
         """Run tests using Maven or Gradle.
 
-        Always generates JaCoCo coverage data.
+        Always generates JaCoCo coverage data. Unless the coverage domain is
+        enabled, scans of specific files test only the affected modules
+        (Gradle then skips the JaCoCo report).
 
         Args:
             context: Scan context with paths and configuration.
@@ -135,6 +141,26 @@ class MavenTestRunner(TestRunnerPlugin):
         else:
             return self._run_gradle_tests(binary, context)
 
+    def _module_selection(
+        self, context: ScanContext, build_system: str
+    ) -> Optional[Dict[str, Any]]:
+        """Modules to test in a scan.
+
+        With the coverage domain enabled the whole build runs, so the
+        JaCoCo report covers every module.
+
+        Args:
+            context: Scan context.
+            build_system: Build system (maven or gradle).
+
+        Returns:
+            Selection from :func:`java_module_selection`, or None to run
+            the whole build.
+        """
+        if ToolDomain.COVERAGE in context.enabled_domains:
+            return None
+        return java_module_selection(context, build_system)
+
     def _run_maven_tests(
         self,
         binary: Path,
@@ -156,6 +182,20 @@ class MavenTestRunner(TestRunnerPlugin):
             "-B",
         ]  # Always generate JaCoCo coverage
 
+        module_dirs: Optional[List[str]] = None
+        selection = self._module_selection(context, "maven")
+        if selection is not None:
+            if not selection["affected"]:
+                LOGGER.info("No Maven modules affected by the changes, skipping tests")
+                return TestResult(tool="maven")
+            module_dirs = sorted(selection["affected"])
+            cmd.extend(["-pl", ",".join(module_dirs), "-amd"])
+            if selection["upstream"]:
+                # Build the reactor modules they depend on instead of
+                # resolving them from the local repository
+                cmd.append("-am")
+                module_dirs.extend(sorted(selection["upstream"]))
+
         LOGGER.debug(f"Running: {' '.join(cmd)}")
 
         try:
@@ -181,7 +221,7 @@ class MavenTestRunner(TestRunnerPlugin):
             LOGGER.debug(f"Maven test completed with: {e}")
 
         # Parse Surefire reports
-        return self._parse_surefire_reports(context.project_root)
+        return self._parse_surefire_reports(context.project_root, module_dirs)
 
     def _run_gradle_tests(
         self,
@@ -204,6 +244,25 @@ class MavenTestRunner(TestRunnerPlugin):
             "--no-daemon",
         ]  # Always generate JaCoCo coverage
 
+        module_dirs: Optional[List[str]] = None
+        selection = self._module_selection(context, "gradle")
+        if selection is not None:
+            # Projects without sources (e.g. an aggregating root) have no
+            # test task
+            module_dirs = [
+                module_dir
+                for module_dir in sorted(selection["affected"])
+                if (context.project_root / module_dir / "src").is_dir()
+            ]
+            if not module_dirs:
+                LOGGER.info(
+                    "No Gradle projects affected by the changes, skipping tests"
+                )
+                return TestResult(tool="gradle")
+            cmd = [str(binary)]
+            cmd.extend(gradle_task(d, "test") for d in module_dirs)
+            cmd.append("--no-daemon")
+
         LOGGER.debug(f"Running: {' '.join(cmd)}")
 
         try:
@@ -228,18 +287,29 @@ class MavenTestRunner(TestRunnerPlugin):
             LOGGER.debug(f"Gradle test completed with: {e}")
 
         # Parse Gradle test reports
-        return self._parse_gradle_reports(context.project_root)
+        return self._parse_gradle_reports(context.project_root, module_dirs)
 
-    def _parse_surefire_reports(self, project_root: Path) -> TestResult:
+    def _parse_surefire_reports(
+        self, project_root: Path, module_dirs: Optional[Iterable[str]] = None
+    ) -> TestResult:
         """Parse Maven Surefire JUnit XML reports.
 
         Args:
             project_root: Project root directory.
+            module_dirs: Directories of the modules that ran, relative to
+                the project root; None for the whole build.
 
         Returns:
             TestResult with parsed data.
         """
         result = TestResult(tool="maven")
+        if module_dirs is not None:
+            for module_dir in module_dirs:
+                reports_dir = project_root / module_dir / "target" / "surefire-reports"
+                if reports_dir.exists():
+                    module_result = self._parse_junit_xml_dir(reports_dir, project_root)
+                    result = self._merge_results(result, module_result)
+            return result
         reports_dir = project_root / "target" / "surefire-reports"
 
         if not reports_dir.exists():
@@ -255,16 +325,30 @@ class MavenTestRunner(TestRunnerPlugin):
 
         return self._parse_junit_xml_dir(reports_dir, project_root)
 
-    def _parse_gradle_reports(self, project_root: Path) -> TestResult:
+    def _parse_gradle_reports(
+        self, project_root: Path, module_dirs: Optional[Iterable[str]] = None
+    ) -> TestResult:
         """Parse Gradle JUnit XML reports.
 
         Args:
             project_root: Project root directory.
+            module_dirs: Directories of the projects that ran, relative to
+                the project root; None for the whole build.
 
         Returns:
             TestResult with parsed data.
         """
         result = TestResult(tool="gradle")
+        if module_dirs is not None:
+            for module_dir in module_dirs:
+                reports_dir = project_root / module_dir / "build" / "test-results"
+                for task in ("test", "testDebug", "testRelease"):
+                    if (reports_dir / task).exists():
+                        module_result = self._parse_junit_xml_dir(
+                            reports_dir / task, project_root, "gradle"
+                        )
+                        result = self._merge_results(result, module_result)
+            return result
 
         # Standard Gradle test report locations
         report_dirs = [
@@ -8,11 +8,14 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import shutil
 import subprocess
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import defusedxml.ElementTree as ElementTree  # type: ignore[import-untyped]
 from xml.etree.ElementTree import Element
 
@@ -26,16 +29,107 @@ from lucidshark.core.models import (
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.test_runners.base import TestRunnerPlugin, TestResult
+from lucidshark.plugins.test_runners.impact import (
+    ImpactMap,
+    config_fingerprint,
+    impact_enabled,
+    read_coverage_contexts,
+    select_tests,
+)
+from lucidshark.plugins.test_runners.sharding import (
+    DurationStore,
+    partition,
+    shard_count,
+)
 from lucidshark.plugins.utils import (
     ensure_python_binary,
     get_cli_version,
     coverage_has_source_config,
     detect_source_directory,
     _is_binary_executable,
+    changed_files,
+    site_packages_dirs,
 )
 
 LOGGER = get_logger(__name__)
 
+# Project files that can load pytest plugins (and thus change --help)
+PYTEST_CONFIG_FILES = (
+    "pyproject.toml",
+    "pytest.ini",
+    "setup.cfg",
+    "tox.ini",
+    "conftest.py",
+)
+
+PYTEST_TIMEOUT = 600
+
+# Helper plugin loaded with "-p" when running a subset of the tests or
+# recording test impact. It deselects tests after collection, so node IDs
+# never hit command-line limits, and switches coverage.py's dynamic context
+# to the node ID of the running test.
+HELPER_PLUGIN = "_lucidshark_pytest"
+SELECT_FILE_ENV = "LUCIDSHARK_PYTEST_SELECT_FILE"
+CONTEXTS_ENV = "LUCIDSHARK_PYTEST_CONTEXTS"
+HELPER_PLUGIN_SOURCE = f"""\
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    path = os.environ.get("{SELECT_FILE_ENV}")
+    if not path:
+        return
+    with open(path, encoding="utf-8") as f:
+        wanted = set(f.read().splitlines())
+    selected = [item for item in items if item.nodeid in wanted]
+    deselected = [item for item in items if item.nodeid not in wanted]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def _coverage():
+    if os.environ.get("{CONTEXTS_ENV}") != "1":
+        return None
+    try:
+        import coverage
+    except ImportError:
+        return None
+    return coverage.Coverage.current()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    cov = _coverage()
+    if cov is not None:
+        cov.switch_context(item.nodeid)
+    yield
+    if cov is not None:
+        cov.switch_context("")
+"""
+
+
+def _junit_test_id(nodeid: str) -> str:
+    """Return the ID a JUnit XML report gives to a pytest node.
+
+    ``tests/test_a.py::TestX::test_y`` is reported as classname
+    ``tests.test_a.TestX`` and name ``test_y``.
+
+    Args:
+        nodeid: pytest node ID.
+
+    Returns:
+        ``"<classname>::<name>"``.
+    """
+    path, *names = nodeid.split("::")
+    module = path.removesuffix(".py")
+    if not names:
+        return module.replace("/", ".")
+    classname = ".".join([module.replace("/", "."), *names[:-1]])
+    return f"{classname}::{names[-1]}"
+
 
 class PytestRunner(TestRunnerPlugin):
     """pytest test runner plugin for Python test execution."""
@@ -113,33 +207,95 @@ class PytestRunner(TestRunnerPlugin):
             LOGGER.debug("Coverage binary not found, running pytest without coverage")
 
         # Check if pytest-json-report is available
-        if self._has_json_report_plugin(binary, context.project_root):
-            return self._run_with_json_report(binary, context, coverage_binary)
+        use_json = self._has_json_report_plugin(binary, context.project_root)
+
+        shards = shard_count(context)
+        impact = impact_enabled(context)
+        collected: List[str] = []
+        if shards > 1 or impact:
+            collected = self._collect_tests(binary, context.project_root)
+
+        # Test impact analysis needs coverage.py to record what tests execute
+        record_contexts = impact and bool(collected) and coverage_binary is not None
+        if impact and collected and coverage_binary is None:
+            LOGGER.debug("coverage.py not found, running all tests (impact analysis)")
+        selected: Optional[List[str]] = None
+        if record_contexts:
+            fingerprint = config_fingerprint(context.project_root, str(binary))
+            selected = self._select_affected_tests(collected, context, fingerprint)
+            if selected is not None and not selected:
+                LOGGER.info("No tests affected by the changed files")
+                return TestResult()
+
+        tests = collected if selected is None else selected
+        started = time.time()
+        if shards > 1 and len(tests) >= 2:
+            result = self._run_sharded(
+                binary,
+                context,
+                coverage_binary,
+                shards,
+                use_json,
+                tests,
+                record_contexts,
+            )
+        elif use_json:
+            result = self._run_with_json_report(
+                binary, context, coverage_binary, selected, record_contexts
+            )
         else:
-            return self._run_with_junit_xml(binary, context, coverage_binary)
+            result = self._run_with_junit_xml(
+                binary, context, coverage_binary, selected, record_contexts
+            )
+
+        if record_contexts:
+            self._record_impact(context, tests, fingerprint, selected is None, started)
+        return result
 
     def _find_coverage_binary(self) -> Optional[Path]:
         """Find coverage.py binary.
 
+        The lookup is cached until the project venv or a PATH directory
+        changes.
+
         Returns:
             Path to coverage binary, or None if not found.
         """
-        # Check project venv first (with shebang validation)
-        if self._project_root:
-            venv_coverage = self._project_root / ".venv" / "bin" / "coverage"
-            if venv_coverage.exists() and _is_binary_executable(venv_coverage):
-                return venv_coverage
+        from lucidshark.core.capability_cache import cached_probe
 
-        # Check system PATH
-        coverage_path = shutil.which("coverage")
-        if coverage_path:
-            return Path(coverage_path)
+        venv_coverage = (
+            self._project_root / ".venv" / "bin" / "coverage"
+            if self._project_root
+            else None
+        )
 
-        return None
+        def probe() -> Optional[str]:
+            # Check project venv first (with shebang validation)
+            if venv_coverage is not None:
+                if venv_coverage.exists() and _is_binary_executable(venv_coverage):
+                    return str(venv_coverage)
+
+            # Check system PATH
+            return shutil.which("coverage")
+
+        search_path = os.environ.get("PATH", "")
+        watched = [Path(d) for d in search_path.split(os.pathsep) if d]
+        if venv_coverage is not None:
+            watched[:0] = [venv_coverage, venv_coverage.parent]
+        coverage_path = cached_probe(
+            "coverage-binary",
+            [str(self._project_root), search_path],
+            watched,
+            probe,
+        )
+        return Path(coverage_path) if coverage_path else None
 
     def _has_json_report_plugin(self, binary: Path, project_root: Path) -> bool:
         """Check if pytest-json-report plugin is available.
 
+        The answer is cached until the pytest binary, its site-packages or
+        the project's pytest configuration changes.
+
         Args:
             binary: Path to pytest binary.
             project_root: Project root directory.
@@ -147,16 +303,9 @@ class PytestRunner(TestRunnerPlugin):
         Returns:
             True if pytest-json-report is installed.
         """
-        try:
-            subprocess.run(
-                [str(binary), "--co", "-q"],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                cwd=str(project_root),
-                timeout=60,
-            )
+        from lucidshark.core.capability_cache import cached_probe
+
+        def probe() -> bool:
             # Check if json-report option is available
             help_result = subprocess.run(
                 [str(binary), "--help"],
@@ -168,6 +317,16 @@ class PytestRunner(TestRunnerPlugin):
                 timeout=30,
             )
             return "--json-report" in help_result.stdout
+
+        watched = [binary, *site_packages_dirs(binary)]
+        watched.extend(project_root / name for name in PYTEST_CONFIG_FILES)
+        try:
+            return cached_probe(
+                "pytest-json-report",
+                [str(binary), get_cli_version(binary), str(project_root)],
+                watched,
+                probe,
+            )
         except Exception:
             return False
 
@@ -202,6 +361,8 @@ class PytestRunner(TestRunnerPlugin):
         self,
         cmd: List[str],
         context: ScanContext,
+        tool_name: str = "pytest",
+        env: Optional[Dict[str, str]] = None,
     ) -> bool:
         """Execute pytest command with streaming output.
 
@@ -212,6 +373,12 @@ class PytestRunner(TestRunnerPlugin):
         2. Coverage measurement requires running ALL tests
         3. Pytest's own test discovery (via testpaths) is more reliable
 
+        Args:
+            cmd: Command to run.
+            context: Scan context.
+            tool_name: Name shown in stream events (one per shard).
+            env: Extra environment variables for the command.
+
         Returns:
             True if execution succeeded, False on timeout/error.
         """
@@ -224,27 +391,28 @@ class PytestRunner(TestRunnerPlugin):
             run_with_streaming(
                 cmd=cmd,
                 cwd=context.project_root,
-                tool_name="pytest",
+                tool_name=tool_name,
                 stream_handler=context.stream_handler,
-                timeout=600,
+                timeout=PYTEST_TIMEOUT,
+                env=env,
             )
             return True
         except subprocess.TimeoutExpired:
-            LOGGER.warning("pytest timed out after 600 seconds")
+            LOGGER.warning(f"{tool_name} timed out after {PYTEST_TIMEOUT} seconds")
             context.record_skip(
                 tool_name=self.name,
                 domain=ToolDomain.TESTING,
                 reason=SkipReason.EXECUTION_FAILED,
-                message="pytest timed out after 600 seconds",
+                message=f"{tool_name} timed out after {PYTEST_TIMEOUT} seconds",
             )
             return False
         except Exception as e:
-            LOGGER.error(f"Failed to run pytest: {e}")
+            LOGGER.error(f"Failed to run {tool_name}: {e}")
             context.record_skip(
                 tool_name=self.name,
                 domain=ToolDomain.TESTING,
                 reason=SkipReason.EXECUTION_FAILED,
-                message=f"Failed to run pytest: {e}",
+                message=f"Failed to run {tool_name}: {e}",
             )
             return False
 
@@ -287,14 +455,28 @@ class PytestRunner(TestRunnerPlugin):
         binary: Path,
         context: ScanContext,
         coverage_binary: Optional[Path] = None,
+        tests: Optional[List[str]] = None,
+        record_contexts: bool = False,
     ) -> TestResult:
-        """Run pytest with JSON report output."""
+        """Run pytest with JSON report output.
+
+        Args:
+            binary: Path to pytest binary.
+            context: Scan context.
+            coverage_binary: Path to coverage binary, if available.
+            tests: Node IDs to run (all tests if None).
+            record_contexts: Record a coverage context per test.
+        """
         with tempfile.TemporaryDirectory() as tmpdir:
             report_file = Path(tmpdir) / "report.json"
+            plugin_args, env = self._helper_plugin(
+                Path(tmpdir), "selected", tests, record_contexts
+            )
 
             cmd = self._build_base_cmd(binary, coverage_binary, context.project_root)
             cmd.extend(
                 [
+                    *plugin_args,
                     "--tb=short",
                     "-v",
                     "--json-report",
@@ -302,10 +484,11 @@ class PytestRunner(TestRunnerPlugin):
                 ]
             )
 
-            if not self._execute_pytest(cmd, context):
+            if not self._execute_pytest(cmd, context, env=env):
                 return self._execution_failure_result(cmd)
 
             if report_file.exists():
+                self._record_durations([report_file], context.project_root)
                 return self._parse_json_report(report_file, context.project_root)
             LOGGER.warning("JSON report file not generated")
             return self._execution_failure_result(cmd)
@@ -315,22 +498,329 @@ class PytestRunner(TestRunnerPlugin):
         binary: Path,
         context: ScanContext,
         coverage_binary: Optional[Path] = None,
+        tests: Optional[List[str]] = None,
+        record_contexts: bool = False,
     ) -> TestResult:
-        """Run pytest with JUnit XML output (fallback)."""
+        """Run pytest with JUnit XML output (fallback).
+
+        Args:
+            binary: Path to pytest binary.
+            context: Scan context.
+            coverage_binary: Path to coverage binary, if available.
+            tests: Node IDs to run (all tests if None).
+            record_contexts: Record a coverage context per test.
+        """
         with tempfile.TemporaryDirectory() as tmpdir:
             report_file = Path(tmpdir) / "junit.xml"
+            plugin_args, env = self._helper_plugin(
+                Path(tmpdir), "selected", tests, record_contexts
+            )
 
             cmd = self._build_base_cmd(binary, coverage_binary, context.project_root)
-            cmd.extend(["--tb=short", "-v", f"--junit-xml={report_file}"])
+            cmd.extend([*plugin_args, "--tb=short", "-v", f"--junit-xml={report_file}"])
 
-            if not self._execute_pytest(cmd, context):
+            if not self._execute_pytest(cmd, context, env=env):
                 return self._execution_failure_result(cmd)
 
             if report_file.exists():
+                self._record_durations([report_file], context.project_root)
                 return self._parse_junit_xml(report_file, context.project_root)
             LOGGER.warning("JUnit XML report file not generated")
             return self._execution_failure_result(cmd)
 
+    def _run_sharded(
+        self,
+        binary: Path,
+        context: ScanContext,
+        coverage_binary: Optional[Path],
+        shards: int,
+        use_json: bool,
+        tests: List[str],
+        record_contexts: bool = False,
+    ) -> TestResult:
+        """Run tests in parallel shards.
+
+        Tests are balanced by the durations recorded from earlier reports.
+        With coverage, every shard runs under ``coverage run
+        --parallel-mode`` and the data files are combined afterwards.
+
+        Args:
+            binary: Path to pytest binary.
+            context: Scan context.
+            coverage_binary: Path to coverage binary, if available.
+            shards: Maximum number of shards.
+            use_json: Whether pytest-json-report is available.
+            tests: Node IDs to run, in collection order.
+            record_contexts: Record a coverage context per test.
+
+        Returns:
+            Merged result of all shards.
+        """
+        project_root = context.project_root
+        recorded = DurationStore.for_project(project_root, self.name).load()
+        durations = {
+            test: recorded.get(test, recorded.get(_junit_test_id(test)))
+            for test in tests
+        }
+        groups = partition(tests, durations, shards)
+        LOGGER.info(f"Running {len(tests)} tests in {len(groups)} pytest shards")
+
+        base_cmd = self._build_base_cmd(binary, coverage_binary, project_root)
+        if coverage_binary:
+            # Each shard writes its own .coverage.<suffix> data file
+            base_cmd.insert(2, "--parallel-mode")
+            self._run_coverage(coverage_binary, "erase", project_root)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            jobs: List[Tuple[List[str], Path, Optional[Dict[str, str]], str]] = []
+            for index, group in enumerate(groups):
+                plugin_args, env = self._helper_plugin(
+                    tmp, f"shard-{index}", group, record_contexts
+                )
+                if use_json:
+                    report_file = tmp / f"report-{index}.json"
+                    report_args = ["--json-report", f"--json-report-file={report_file}"]
+                else:
+                    report_file = tmp / f"junit-{index}.xml"
+                    report_args = [f"--junit-xml={report_file}"]
+                cmd = [*base_cmd, *plugin_args, "--tb=short", "-v", *report_args]
+                jobs.append(
+                    (cmd, report_file, env, f"pytest[{index + 1}/{len(groups)}]")
+                )
+
+            started = time.monotonic()
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                succeeded = list(
+                    executor.map(
+                        lambda job: self._execute_pytest(
+                            job[0], context, tool_name=job[3], env=job[2]
+                        ),
+                        jobs,
+                    )
+                )
+            elapsed_ms = int((time.monotonic() - started) * 1000)
+
+            if coverage_binary:
+                self._run_coverage(coverage_binary, "combine", project_root)
+
+            result = TestResult(duration_ms=elapsed_ms)
+            for ok, (cmd, report_file, _, tool_name) in zip(succeeded, jobs):
+                if not ok:
+                    return self._execution_failure_result(cmd)
+                if not report_file.exists():
+                    LOGGER.warning(f"Report file of {tool_name} not generated")
+                    return self._execution_failure_result(cmd)
+                if use_json:
+                    shard = self._parse_json_report(report_file, project_root)
+                else:
+                    shard = self._parse_junit_xml(report_file, project_root)
+                result.passed += shard.passed
+                result.failed += shard.failed
+                result.skipped += shard.skipped
+                result.errors += shard.errors
+                result.issues.extend(shard.issues)
+
+            self._record_durations([job[1] for job in jobs], project_root)
+
+        LOGGER.info(
+            f"pytest ({len(groups)} shards): {result.passed} passed, "
+            f"{result.failed} failed, {result.skipped} skipped, "
+            f"{result.errors} errors"
+        )
+        return result
+
+    def _helper_plugin(
+        self,
+        tmp: Path,
+        name: str,
+        tests: Optional[List[str]],
+        record_contexts: bool,
+    ) -> Tuple[List[str], Optional[Dict[str, str]]]:
+        """Prepare the helper plugin for a pytest command.
+
+        Args:
+            tmp: Temporary directory for the plugin and the selection.
+            name: Name of the selection file (unique per command).
+            tests: Node IDs to run (all tests if None).
+            record_contexts: Record a coverage context per test.
+
+        Returns:
+            Tuple of (extra pytest arguments, environment overlay); empty
+            arguments and None if the plugin is not needed.
+        """
+        if tests is None and not record_contexts:
+            return [], None
+        plugin = tmp / f"{HELPER_PLUGIN}.py"
+        if not plugin.exists():
+            plugin.write_text(HELPER_PLUGIN_SOURCE, encoding="utf-8")
+        env = {
+            "PYTHONPATH": os.pathsep.join(
+                p for p in (str(tmp), os.environ.get("PYTHONPATH")) if p
+            )
+        }
+        if tests is not None:
+            select_file = tmp / f"{name}.txt"
+            select_file.write_text("\n".join(tests), encoding="utf-8")
+            env[SELECT_FILE_ENV] = str(select_file)
+        if record_contexts:
+            env[CONTEXTS_ENV] = "1"
+        return ["-p", HELPER_PLUGIN], env
+
+    def _select_affected_tests(
+        self, tests: List[str], context: ScanContext, fingerprint: str
+    ) -> Optional[List[str]]:
+        """Select the tests affected by the files changed in a scan.
+
+        Args:
+            tests: Collected node IDs.
+            context: Scan context.
+            fingerprint: Fingerprint of the current test setup.
+
+        Returns:
+            Affected node IDs, or None to run the full suite.
+        """
+        if ToolDomain.COVERAGE in context.enabled_domains:
+            # Coverage percentages need the whole suite
+            return None
+        changed = changed_files(context)
+        if changed is None:
+            return None
+        footprints = ImpactMap.for_project(context.project_root, self.name).load(
+            fingerprint
+        )
+        if footprints is None:
+            LOGGER.info("No current test impact map, running all tests")
+            return None
+        selected = select_tests(tests, changed, footprints)
+        if selected is None:
+            LOGGER.info("Test configuration changed, running all tests")
+        else:
+            LOGGER.info(
+                f"Running {len(selected)} of {len(tests)} tests affected by "
+                f"{len(changed)} changed file(s)"
+            )
+        return selected
+
+    def _record_impact(
+        self,
+        context: ScanContext,
+        tests: List[str],
+        fingerprint: str,
+        complete: bool,
+        since: float,
+    ) -> None:
+        """Update the test impact map from the coverage data of a run.
+
+        Args:
+            context: Scan context.
+            tests: Node IDs that ran.
+            fingerprint: Fingerprint of the current test setup.
+            complete: True if the whole suite ran.
+            since: Start time of the run; older coverage data is ignored.
+        """
+        data_file = context.project_root / ".coverage"
+        try:
+            if data_file.stat().st_mtime < since:
+                return
+        except OSError:
+            return
+        contexts = read_coverage_contexts(data_file, context.project_root)
+        if not contexts:
+            LOGGER.debug("No per-test coverage contexts recorded")
+            return
+        ImpactMap.for_project(context.project_root, self.name).record(
+            {test: contexts.get(test, set()) for test in tests},
+            fingerprint,
+            complete,
+        )
+
+    def _collect_tests(self, binary: Path, project_root: Path) -> List[str]:
+        """List the node IDs of the tests pytest would run.
+
+        Args:
+            binary: Path to pytest binary.
+            project_root: Project root directory.
+
+        Returns:
+            Node IDs in collection order (empty if collection failed).
+        """
+        try:
+            result = subprocess.run(
+                [str(binary), "--collect-only", "-q"],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                cwd=str(project_root),
+                timeout=PYTEST_TIMEOUT,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            LOGGER.debug(f"pytest collection failed: {e}")
+            return []
+        if result.returncode != 0:
+            # Collection errors are reported by the regular, unsharded run
+            LOGGER.debug(f"pytest collection exited with {result.returncode}")
+            return []
+        # Node IDs come first, followed by a blank line and the summary
+        tests = []
+        for line in result.stdout.splitlines():
+            if not line.strip():
+                break
+            if "::" in line:
+                tests.append(line.strip())
+        return tests
+
+    def _run_coverage(
+        self, coverage_binary: Path, command: str, project_root: Path
+    ) -> None:
+        """Run ``coverage erase`` or ``coverage combine`` in the project."""
+        try:
+            result = subprocess.run(
+                [str(coverage_binary), command],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                cwd=str(project_root),
+                timeout=120,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            LOGGER.warning(f"coverage {command} failed: {e}")
+            return
+        if result.returncode != 0:
+            LOGGER.warning(f"coverage {command} failed: {result.stderr.strip()}")
+
+    def _record_durations(self, report_files: List[Path], project_root: Path) -> None:
+        """Remember the test durations of JSON or JUnit XML reports.
+
+        JSON reports are keyed by node ID, JUnit XML reports by
+        ``classname::name`` (see :func:`_junit_test_id`).
+
+        Args:
+            report_files: Reports of the latest run.
+            project_root: Project root directory.
+        """
+        durations: Dict[str, float] = {}
+        for report_file in report_files:
+            try:
+                if report_file.suffix == ".json":
+                    with open(report_file, encoding="utf-8") as f:
+                        report = json.load(f)
+                    for test in report.get("tests", []):
+                        durations[test["nodeid"]] = sum(
+                            test.get(phase, {}).get("duration", 0.0)
+                            for phase in ("setup", "call", "teardown")
+                        )
+                else:
+                    root = ElementTree.parse(report_file).getroot()
+                    for testcase in root.iter("testcase"):
+                        test_id = f"{testcase.get('classname', '')}::{testcase.get('name', '')}"
+                        durations[test_id] = float(testcase.get("time", 0))
+            except Exception as e:
+                LOGGER.debug(f"Cannot read test durations from {report_file}: {e}")
+        DurationStore.for_project(project_root, self.name).record(durations)
+
     def _parse_json_report(
         self,
         report_file: Path,
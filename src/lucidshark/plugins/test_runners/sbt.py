@@ -6,6 +6,8 @@ Supports running Scala tests via:
 - Gradle Test task (Scala plugin projects)
 
 Automatically detects the build system and parses JUnit XML reports.
+With ``settings.scala_build_server`` sbt tests run in the sbt server and
+Gradle tests in the Gradle daemon (see ``scala_utils``).
 """
 
 from __future__ import annotations
@@ -28,6 +30,7 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
+from lucidshark.plugins.scala_utils import gradle_daemon_args, sbt_command
 from lucidshark.plugins.test_runners.base import TestRunnerPlugin, TestResult
 from lucidshark.plugins.utils import find_scala_build_tool
 
@@ -113,7 +116,7 @@ class SbtTestRunner(TestRunnerPlugin):
 
     def _run_sbt_tests(self, binary: Path, context: ScanContext) -> TestResult:
         """Run tests using sbt."""
-        cmd = [str(binary), "--no-colors", "test"]
+        cmd = sbt_command(context, binary, "test")
 
         LOGGER.debug(f"Running: {' '.join(cmd)}")
 
@@ -171,7 +174,7 @@ class SbtTestRunner(TestRunnerPlugin):
 
     def _run_gradle_tests(self, binary: Path, context: ScanContext) -> TestResult:
         """Run tests using Gradle."""
-        cmd = [str(binary), "test", "--no-daemon"]
+        cmd = [str(binary), "test", *gradle_daemon_args(context)]
 
         LOGGER.debug(f"Running: {' '.join(cmd)}")
 
@@ -0,0 +1,130 @@
+"""Duration-balanced test sharding.
+
+With ``pipeline.testing.shards`` set, test runners that support it split the
+collected tests across several worker processes. Tests are assigned so that
+every shard needs about the same time, based on the durations recorded by
+earlier runs in ``.lucidshark/cache/<runner>/durations.json``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from lucidshark.core.logging import get_logger
+from lucidshark.plugins.utils import read_json_cache, write_json_cache
+
+LOGGER = get_logger(__name__)
+
+# Bump when the on-disk format changes to discard old durations
+DURATIONS_FORMAT = 1
+
+DURATIONS_FILE = "durations.json"
+
+# Seconds assumed for a test when no test has a recorded duration yet
+DEFAULT_TEST_DURATION = 1.0
+
+
+def shard_count(context: Any) -> int:
+    """Number of test shards configured for a scan.
+
+    Args:
+        context: Scan context.
+
+    Returns:
+        The value of ``pipeline.testing.shards`` (``"auto"`` is one shard
+        per CPU), or 0 if sharding is disabled.
+    """
+    pipeline = getattr(context.config, "pipeline", None)
+    testing = getattr(pipeline, "testing", None)
+    shards = getattr(testing, "shards", 0)
+    if shards == "auto":
+        return os.cpu_count() or 1
+    if isinstance(shards, int) and not isinstance(shards, bool):
+        return max(shards, 0)
+    return 0
+
+
+class DurationStore:
+    """Test durations recorded by earlier runs of a test runner."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            path: JSON file holding the durations.
+        """
+        self.path = path
+
+    @classmethod
+    def for_project(cls, project_root: Path, runner: str) -> "DurationStore":
+        """Return the store of a test runner in a project.
+
+        Args:
+            project_root: Project root directory.
+            runner: Test runner name (e.g. ``"pytest"``).
+        """
+        from lucidshark.bootstrap.paths import LucidsharkPaths
+
+        cache_dir = LucidsharkPaths.for_project(project_root).plugin_cache_dir(runner)
+        return cls(cache_dir / DURATIONS_FILE)
+
+    def load(self) -> Dict[str, float]:
+        """Read the recorded durations.
+
+        Returns:
+            Seconds per test ID (empty if nothing was recorded yet).
+        """
+        return read_json_cache(self.path, "durations", DURATIONS_FORMAT) or {}
+
+    def record(self, durations: Mapping[str, float]) -> None:
+        """Merge new durations into the store.
+
+        Args:
+            durations: Seconds per test ID measured by the latest run.
+        """
+        if not durations:
+            return
+        merged = self.load()
+        merged.update(durations)
+        write_json_cache(self.path, "durations", merged, DURATIONS_FORMAT)
+
+
+def partition(
+    tests: Sequence[str],
+    durations: Mapping[str, Optional[float]],
+    shards: int,
+) -> List[List[str]]:
+    """Split tests into shards of about equal total duration.
+
+    Tests are assigned longest first to the shard with the least work
+    (LPT scheduling). Tests without a recorded duration count as the
+    average recorded duration.
+
+    Args:
+        tests: Test IDs in collection order.
+        durations: Recorded seconds per test ID (None or missing if unknown).
+        shards: Maximum number of shards.
+
+    Returns:
+        Non-empty shards, each keeping the collection order of its tests.
+    """
+    known = [d for d in (durations.get(t) for t in tests) if d is not None]
+    fallback = sum(known) / len(known) if known else DEFAULT_TEST_DURATION
+
+    def estimate(test: str) -> float:
+        duration = durations.get(test)
+        return fallback if duration is None else duration
+
+    order = {test: index for index, test in enumerate(tests)}
+    estimated = sorted(tests, key=lambda t: (-estimate(t), order[t]))
+    heap = [(0.0, index) for index in range(max(min(shards, len(tests)), 1))]
+    assigned: List[List[str]] = [[] for _ in heap]
+    for test in estimated:
+        total, index = heapq.heappop(heap)
+        assigned[index].append(test)
+        heapq.heappush(heap, (total + estimate(test), index))
+
+    return [sorted(group, key=order.__getitem__) for group in assigned if group]
@@ -15,7 +15,7 @@ def discover_type_checker_plugins():
     """Discover all installed type checker plugins.
 
     Returns:
-        Dictionary mapping plugin names to plugin classes.
+        Mapping of plugin names to plugin classes (imported on access).
     """
     return discover_plugins(TYPE_CHECKER_ENTRY_POINT_GROUP, TypeCheckerPlugin)
 
@@ -8,7 +8,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from lucidshark.core.models import ScanContext, UnifiedIssue, ToolDomain
 
@@ -76,6 +76,59 @@ class TypeCheckerPlugin(ABC):
         """
         return False
 
+    @property
+    def cache_extensions(self) -> Tuple[str, ...]:
+        """Source file extensions covered by the project result cache.
+
+        Type checkers that override this have their results cached until
+        a matching source file or config file in the project changes.
+
+        Returns:
+            Lowercase extensions (e.g., ('.py', '.pyi')). Empty disables caching.
+        """
+        return ()
+
+    @property
+    def cache_config_files(self) -> Tuple[str, ...]:
+        """Config files (relative to the project root) that affect results.
+
+        Their content is part of the result cache key.
+
+        Returns:
+            Tuple of relative file names.
+        """
+        return ()
+
+    def cache_config_paths(self, context: ScanContext) -> List[Path]:
+        """Config files found in the project that affect results.
+
+        Complements :attr:`cache_config_files` with files that depend on
+        the project layout (e.g. configs of referenced sub-projects). Their
+        content is part of the result cache key.
+
+        Args:
+            context: Scan context.
+
+        Returns:
+            Paths of the config files.
+        """
+        return []
+
+    def cache_environment(self, context: ScanContext) -> List[Path]:
+        """Paths reflecting the installed dependencies the checker reads.
+
+        Their modification times are part of the result cache key, so
+        installing or upgrading a typed package invalidates cached results
+        even when no lockfile changed.
+
+        Args:
+            context: Scan context.
+
+        Returns:
+            Files or directories (missing ones are allowed).
+        """
+        return []
+
     def get_version(self) -> str:
         """Get the version of the underlying type checking tool.
 
@@ -21,6 +21,8 @@ from lucidshark.core.models import (
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.rust_utils import (
+    cargo_env,
+    cargo_package_args,
     extract_suggestion,
     find_cargo,
     generate_issue_id,
@@ -102,9 +104,17 @@ class CargoCheckChecker(TypeCheckerPlugin):
             LOGGER.info("No Cargo.toml found, skipping cargo check")
             return []
 
+        packages = cargo_package_args(context)
+        if packages == []:
+            LOGGER.info(
+                "No workspace members affected by the changes, skipping cargo check"
+            )
+            return []
+
         cmd = [
             str(cargo),
             "check",
+            *(packages or []),
             "--message-format=json",
             "--quiet",
         ]
@@ -118,6 +128,7 @@ class CargoCheckChecker(TypeCheckerPlugin):
                 tool_name="cargo-check",
                 stream_handler=context.stream_handler,
                 timeout=300,
+                env=cargo_env(context.project_root),
             )
         except subprocess.TimeoutExpired:
             LOGGER.warning("cargo check timed out after 300 seconds")
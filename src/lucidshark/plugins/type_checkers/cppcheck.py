@@ -8,11 +8,12 @@ https://cppcheck.sourceforge.io/
 
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from lucidshark.core.logging import get_logger
 from lucidshark.core.models import (
@@ -22,7 +23,7 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
+from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.cpp_utils import (
     CPP_EXTENSIONS,
     ensure_cpp_tools_in_path,
@@ -30,8 +31,11 @@ from lucidshark.plugins.cpp_utils import (
     find_cppcheck,
     generate_issue_id,
     get_tool_version,
+    load_compile_commands,
+    local_includes,
 )
 from lucidshark.plugins.type_checkers.base import TypeCheckerPlugin
+from lucidshark.plugins.utils import domain_cache_enabled
 
 LOGGER = get_logger(__name__)
 
@@ -105,12 +109,31 @@ class CppcheckChecker(TypeCheckerPlugin):
             "--inline-suppr",
         ]
 
+        # Reuse analysis of unchanged TUs; whole-program checks
+        # (unusedFunction) only work with -j when a build dir is used
+        if domain_cache_enabled(context, "type_checking"):
+            cppcheck_dir = self._cppcheck_build_dir(context.project_root)
+            if cppcheck_dir is not None:
+                cmd.append(f"--cppcheck-build-dir={cppcheck_dir}")
+                jobs = os.cpu_count() or 1
+                if jobs > 1:
+                    cmd.append(f"-j{jobs}")
+
         # Use compile_commands.json if available
         build_dir = find_build_dir(context.project_root)
         if build_dir:
             compile_db = build_dir / "compile_commands.json"
             if compile_db.exists():
                 cmd.append(f"--project={compile_db}")
+                affected = self._affected_tus(context, targets, build_dir)
+                if affected is not None:
+                    if not affected:
+                        LOGGER.debug("No translation unit affected by the changes")
+                        return []
+                    cmd.extend(f"--file-filter={tu}" for tu in sorted(affected))
+                    # Callers in the filtered-out TUs are not seen, so every
+                    # function used only there would be reported as unused
+                    cmd.append("--suppress=unusedFunction")
             else:
                 cmd.extend(targets)
         else:
@@ -121,14 +144,14 @@ class CppcheckChecker(TypeCheckerPlugin):
         env_vars = ensure_cpp_tools_in_path()
 
         try:
-            with temporary_env(env_vars):
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="cppcheck",
-                    stream_handler=context.stream_handler,
-                    timeout=300,
-                )
+            result = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="cppcheck",
+                stream_handler=context.stream_handler,
+                timeout=300,
+                env=env_vars,
+            )
         except subprocess.TimeoutExpired:
             LOGGER.warning("cppcheck timed out after 300 seconds")
             context.record_skip(
@@ -162,6 +185,58 @@ class CppcheckChecker(TypeCheckerPlugin):
         LOGGER.info(f"cppcheck found {len(issues)} issues")
         return issues
 
+    def _cppcheck_build_dir(self, project_root: Path) -> Optional[Path]:
+        """Return the persistent cppcheck build directory of a project.
+
+        Args:
+            project_root: Project root directory.
+
+        Returns:
+            ``.lucidshark/cache/cppcheck``, or None if it cannot be created.
+        """
+        from lucidshark.bootstrap.paths import LucidsharkPaths
+
+        cppcheck_dir = LucidsharkPaths.for_project(project_root).cache_dir / "cppcheck"
+        try:
+            cppcheck_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            LOGGER.debug(f"Cannot create cppcheck build dir {cppcheck_dir}: {e}")
+            return None
+        return cppcheck_dir
+
+    def _affected_tus(
+        self,
+        context: ScanContext,
+        targets: List[str],
+        build_dir: Path,
+    ) -> Optional[Set[Path]]:
+        """Find the translation units affected by the files being checked.
+
+        Only applies when the scan targets individual files (e.g. the
+        changed files of an incremental scan): a TU is affected if it is
+        one of them or includes one of them.
+
+        Args:
+            context: Scan context.
+            targets: Target paths from :meth:`_get_targets`.
+            build_dir: CMake build directory with ``compile_commands.json``.
+
+        Returns:
+            Affected TU paths, or None to analyze the whole project.
+        """
+        if not context.paths or any(Path(t).is_dir() for t in targets):
+            return None
+
+        changed = {Path(t).resolve() for t in targets}
+        parsed: Dict[Path, List[Tuple[str, str]]] = {}
+        affected: Set[Path] = set()
+        for tu, command in load_compile_commands(build_dir).items():
+            if tu in changed or local_includes(
+                tu, command.include_dirs(), context.project_root, parsed
+            ).intersection(changed):
+                affected.add(tu)
+        return affected
+
     def _get_targets(self, context: ScanContext) -> List[str]:
         """Get target paths for cppcheck.
 
@@ -15,9 +15,9 @@ import subprocess
 import tempfile
 from pathlib import Path
 from typing import List, Optional
+from xml.etree.ElementTree import Element
 
 import defusedxml.ElementTree as ET  # type: ignore[import-untyped]
-from xml.etree.ElementTree import Element
 
 from lucidshark.bootstrap.download import secure_urlopen
 from lucidshark.bootstrap.paths import LucidsharkPaths
@@ -31,6 +31,7 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
+from lucidshark.plugins.jvm_worker import run_in_jvm_worker
 from lucidshark.plugins.type_checkers.base import TypeCheckerPlugin
 
 LOGGER = get_logger(__name__)
@@ -203,13 +204,14 @@ class DetektChecker(TypeCheckerPlugin):
             LOGGER.debug(f"Running: {' '.join(cmd[:10])}...")
 
             try:
-                run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="detekt",
-                    stream_handler=context.stream_handler,
-                    timeout=300,
-                )
+                if run_in_jvm_worker(context, cmd, "detekt", timeout=300) is None:
+                    run_with_streaming(
+                        cmd=cmd,
+                        cwd=context.project_root,
+                        tool_name="detekt",
+                        stream_handler=context.stream_handler,
+                        timeout=300,
+                    )
             except subprocess.TimeoutExpired:
                 LOGGER.warning("detekt timed out after 300 seconds")
                 context.record_skip(
@@ -21,8 +21,11 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming
-from lucidshark.plugins.dotnet_utils import find_dotnet, find_project_file
+from lucidshark.plugins.dotnet_utils import (
+    find_dotnet,
+    find_project_file,
+    shared_build,
+)
 from lucidshark.plugins.type_checkers.base import TypeCheckerPlugin
 from lucidshark.plugins.utils import get_cli_version
 
@@ -87,6 +90,9 @@ class DotnetBuildChecker(TypeCheckerPlugin):
     def check(self, context: ScanContext) -> List[UnifiedIssue]:
         """Run dotnet build for type checking.
 
+        The build is shared with the dotnet test runner, so a scan that also
+        runs tests compiles the project only once.
+
         Args:
             context: Scan context with paths and configuration.
 
@@ -104,30 +110,9 @@ class DotnetBuildChecker(TypeCheckerPlugin):
             LOGGER.info("No .sln or .csproj found, skipping dotnet build")
             return []
 
-        cmd = [
-            str(dotnet),
-            "build",
-            str(project_file),
-            "--no-restore",
-            "-v",
-            "quiet",
-            "-nologo",
-        ]
-
-        LOGGER.debug(f"Running: {' '.join(cmd)}")
-
-        stdout = ""
-        stderr = ""
+        output = ""
         try:
-            result = run_with_streaming(
-                cmd=cmd,
-                cwd=context.project_root,
-                tool_name="dotnet-build",
-                stream_handler=context.stream_handler,
-                timeout=300,
-            )
-            stdout = result.stdout or ""
-            stderr = result.stderr or ""
+            output = shared_build(context, dotnet, project_file).output
         except subprocess.TimeoutExpired:
             LOGGER.warning("dotnet build timed out after 300 seconds")
             context.record_skip(
@@ -141,9 +126,9 @@ class DotnetBuildChecker(TypeCheckerPlugin):
             LOGGER.debug(f"dotnet build completed with: {e}")
             stdout = getattr(e, "stdout", "") or ""
             stderr = getattr(e, "stderr", "") or ""
+            output = stdout + "\n" + stderr
 
-        combined = stdout + "\n" + stderr
-        issues = self._parse_output(combined, context.project_root)
+        issues = self._parse_output(output, context.project_root)
         LOGGER.info(f"dotnet build found {len(issues)} issues")
         return issues
 
@@ -21,12 +21,13 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming, temporary_env
+from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.go_utils import (
     ensure_go_in_path,
     find_go,
     generate_issue_id,
     get_go_version,
+    go_package_targets,
     has_go_mod,
     parse_go_error_position,
 )
@@ -134,11 +135,16 @@ class GoVetChecker(TypeCheckerPlugin):
             LOGGER.info("No go.mod found, skipping go vet")
             return []
 
+        targets = go_package_targets(context)
+        if not targets:
+            LOGGER.info("No Go packages affected by the changes, skipping go vet")
+            return []
+
         cmd = [
             str(go_bin),
             "vet",
             "-json",
-            "./...",
+            *targets,
         ]
 
         LOGGER.debug(f"Running: {' '.join(cmd)}")
@@ -147,14 +153,14 @@ class GoVetChecker(TypeCheckerPlugin):
         env_vars = ensure_go_in_path()
 
         try:
-            with temporary_env(env_vars):
-                result = run_with_streaming(
-                    cmd=cmd,
-                    cwd=context.project_root,
-                    tool_name="go-vet",
-                    stream_handler=context.stream_handler,
-                    timeout=300,
-                )
+            result = run_with_streaming(
+                cmd=cmd,
+                cwd=context.project_root,
+                tool_name="go-vet",
+                stream_handler=context.stream_handler,
+                timeout=300,
+                env=env_vars,
+            )
         except subprocess.TimeoutExpired:
             LOGGER.warning("go vet timed out after 300 seconds")
             context.record_skip(
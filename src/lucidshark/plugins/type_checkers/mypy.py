@@ -9,8 +9,9 @@ from __future__ import annotations
 import hashlib
 import json
 import subprocess
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from lucidshark.core.logging import get_logger
 from lucidshark.core.models import (
@@ -22,10 +23,22 @@ from lucidshark.core.models import (
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
 from lucidshark.plugins.type_checkers.base import TypeCheckerPlugin
-from lucidshark.plugins.utils import ensure_python_binary, get_cli_version
+from lucidshark.plugins.utils import (
+    ensure_python_binary,
+    get_cli_version,
+    site_packages_dirs,
+)
+
+if TYPE_CHECKING:
+    from lucidshark.core.streaming import StreamHandler
 
 LOGGER = get_logger(__name__)
 
+MYPY_TIMEOUT = 180
+
+# Seconds without a request before an orphaned dmypy daemon exits
+DMYPY_IDLE_TIMEOUT = 3600
+
 
 def _glob_to_regex(pattern: str) -> str:
     """Convert a gitignore-style glob pattern to a regex for mypy.
@@ -95,6 +108,148 @@ SEVERITY_MAP = {
 }
 
 
+class DmypyDaemon:
+    """A ``dmypy`` daemon checking one project.
+
+    ``dmypy run`` starts the daemon on first use, restarts it when the mypy
+    flags change and otherwise rechecks only what changed since the last
+    run (fine-grained incremental mode). The daemon's status file is kept
+    in ``.lucidshark/cache/mypy/``.
+    """
+
+    def __init__(self, dmypy: Path, project_root: Path) -> None:
+        """Initialize the daemon handle.
+
+        Args:
+            dmypy: Path to the dmypy binary.
+            project_root: Project root; dmypy runs from it.
+        """
+        from lucidshark.bootstrap.paths import LucidsharkPaths
+
+        self.dmypy = dmypy
+        self.project_root = project_root
+        self.status_file = (
+            LucidsharkPaths.for_project(project_root).plugin_cache_dir("mypy")
+            / "dmypy.json"
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> str:
+        """Identifier in the daemon registry."""
+        return f"dmypy:{self.project_root}"
+
+    def _base_cmd(self) -> List[str]:
+        return [str(self.dmypy), "--status-file", str(self.status_file)]
+
+    def run(
+        self,
+        flags: List[str],
+        paths: List[str],
+        stream_handler: Optional["StreamHandler"] = None,
+        timeout: int = MYPY_TIMEOUT,
+    ) -> subprocess.CompletedProcess:
+        """Check paths with the daemon, starting it if needed.
+
+        Args:
+            flags: mypy flags (output format, config file, excludes ...).
+            paths: Files and directories to check.
+            stream_handler: Handler for streaming output.
+            timeout: Timeout in seconds.
+
+        Returns:
+            The completed ``dmypy run``; exit code 2 means the daemon
+            failed.
+
+        Raises:
+            subprocess.TimeoutExpired: If the check timed out; the daemon
+                is killed.
+        """
+        from lucidshark.core.daemons import register_daemon
+
+        cmd = [
+            *self._base_cmd(),
+            "run",
+            "--timeout",
+            str(DMYPY_IDLE_TIMEOUT),
+            "--",
+            *flags,
+            *paths,
+        ]
+        with self._lock:
+            self.status_file.parent.mkdir(parents=True, exist_ok=True)
+            register_daemon(self.key, self.stop)
+            LOGGER.debug(f"Running: {' '.join(cmd)}")
+            try:
+                return run_with_streaming(
+                    cmd=cmd,
+                    cwd=self.project_root,
+                    tool_name="mypy",
+                    stream_handler=stream_handler,
+                    timeout=timeout,
+                )
+            except subprocess.TimeoutExpired:
+                self._command("kill")
+                raise
+
+    def stop(self) -> None:
+        """Stop the daemon, killing it if it does not respond."""
+        from lucidshark.core.daemons import unregister_daemon
+
+        unregister_daemon(self.key)
+        if not self.status_file.exists():
+            return
+        if not self._command("stop"):
+            self._command("kill")
+
+    def kill(self) -> None:
+        """Kill the daemon (e.g. after it crashed)."""
+        from lucidshark.core.daemons import unregister_daemon
+
+        unregister_daemon(self.key)
+        self._command("kill")
+
+    def _command(self, command: str) -> bool:
+        """Run a dmypy control command; True if it succeeded."""
+        try:
+            result = subprocess.run(
+                [*self._base_cmd(), command],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            LOGGER.debug(f"dmypy {command} failed: {e}")
+            return False
+        return result.returncode == 0
+
+
+_daemons: Dict[Tuple[Path, Path], DmypyDaemon] = {}
+_daemons_lock = threading.Lock()
+
+
+def get_dmypy_daemon(mypy_binary: Path, project_root: Path) -> Optional[DmypyDaemon]:
+    """Return the daemon for a project, using the dmypy next to mypy.
+
+    Args:
+        mypy_binary: Path to the mypy binary.
+        project_root: Project root.
+
+    Returns:
+        The shared daemon handle, or None if dmypy is not installed.
+    """
+    dmypy = mypy_binary.with_name("dmypy" + mypy_binary.suffix)
+    if not dmypy.exists():
+        return None
+    with _daemons_lock:
+        daemon = _daemons.get((dmypy, project_root))
+        if daemon is None:
+            daemon = DmypyDaemon(dmypy, project_root)
+            _daemons[(dmypy, project_root)] = daemon
+        return daemon
+
+
 class MypyChecker(TypeCheckerPlugin):
     """mypy type checker plugin for Python code analysis."""
 
@@ -121,6 +276,31 @@ class MypyChecker(TypeCheckerPlugin):
         """mypy supports strict mode."""
         return True
 
+    @property
+    def cache_extensions(self) -> Tuple[str, ...]:
+        """Python sources checked by mypy."""
+        return (".py", ".pyi")
+
+    @property
+    def cache_config_files(self) -> Tuple[str, ...]:
+        """mypy configuration files."""
+        return (
+            "pyproject.toml",
+            "mypy.ini",
+            ".mypy.ini",
+            "setup.cfg",
+            "poetry.lock",
+            "uv.lock",
+            "requirements.txt",
+        )
+
+    def cache_environment(self, context: ScanContext) -> List[Path]:
+        """site-packages of the environment mypy resolves imports from."""
+        try:
+            return site_packages_dirs(self.ensure_binary())
+        except FileNotFoundError:
+            return []
+
     def get_version(self) -> str:
         """Get mypy version."""
         try:
@@ -173,9 +353,8 @@ class MypyChecker(TypeCheckerPlugin):
             )
             return []
 
-        # Build command
-        cmd = [
-            str(binary),
+        # Build flags (everything but the paths, which dmypy takes separately)
+        flags = [
             "--output",
             "json",
             "--no-error-summary",
@@ -186,7 +365,7 @@ class MypyChecker(TypeCheckerPlugin):
             type_config = context.config.pipeline.type_checking
             for tool in type_config.tools:
                 if tool.strict:
-                    cmd.append("--strict")
+                    flags.append("--strict")
                     break
 
         # Check for mypy config file
@@ -195,11 +374,11 @@ class MypyChecker(TypeCheckerPlugin):
         pyproject = context.project_root / "pyproject.toml"
 
         if mypy_ini.exists():
-            cmd.extend(["--config-file", str(mypy_ini)])
+            flags.extend(["--config-file", str(mypy_ini)])
         elif setup_cfg.exists():
-            cmd.extend(["--config-file", str(setup_cfg)])
+            flags.extend(["--config-file", str(setup_cfg)])
         elif pyproject.exists():
-            cmd.extend(["--config-file", str(pyproject)])
+            flags.extend(["--config-file", str(pyproject)])
 
         # Add paths to check (filter to Python files or directories)
         # When only path is project_root (a directory), pass "." so mypy runs from cwd reliably
@@ -232,31 +411,35 @@ class MypyChecker(TypeCheckerPlugin):
                 paths = [p.as_posix() for p in filtered]
         else:
             paths = ["."]
-        cmd.extend(paths)
 
         # Add exclude patterns (convert glob patterns to regex for mypy)
         exclude_patterns = context.get_exclude_patterns()
         for pattern in exclude_patterns:
             regex_pattern = _glob_to_regex(pattern)
-            cmd.extend(["--exclude", regex_pattern])
+            flags.extend(["--exclude", regex_pattern])
 
-        LOGGER.debug(f"Running: {' '.join(cmd)}")
+        cmd = [str(binary), *flags, *paths]
 
         try:
-            result = run_with_streaming(
-                cmd=cmd,
-                cwd=context.project_root,
-                tool_name="mypy",
-                stream_handler=context.stream_handler,
-                timeout=180,
-            )
+            result = None
+            if context.persistent_tools:
+                result = self._run_daemon(binary, flags, paths, context)
+            if result is None:
+                LOGGER.debug(f"Running: {' '.join(cmd)}")
+                result = run_with_streaming(
+                    cmd=cmd,
+                    cwd=context.project_root,
+                    tool_name="mypy",
+                    stream_handler=context.stream_handler,
+                    timeout=MYPY_TIMEOUT,
+                )
         except subprocess.TimeoutExpired:
-            LOGGER.warning("mypy timed out after 180 seconds")
+            LOGGER.warning(f"mypy timed out after {MYPY_TIMEOUT} seconds")
             context.record_skip(
                 tool_name=self.name,
                 domain=ToolDomain.TYPE_CHECKING,
                 reason=SkipReason.EXECUTION_FAILED,
-                message="mypy timed out after 180 seconds",
+                message=f"mypy timed out after {MYPY_TIMEOUT} seconds",
             )
             return []
         except Exception as e:
@@ -276,6 +459,42 @@ class MypyChecker(TypeCheckerPlugin):
         LOGGER.info(f"mypy found {len(issues)} issues")
         return issues
 
+    def _run_daemon(
+        self,
+        binary: Path,
+        flags: List[str],
+        paths: List[str],
+        context: ScanContext,
+    ) -> Optional[subprocess.CompletedProcess]:
+        """Check through the project's dmypy daemon.
+
+        Used by long-lived processes (MCP server, file watcher), where the
+        daemon turns repeated full mypy runs into incremental rechecks.
+
+        Returns:
+            The dmypy result, or None to fall back to a full mypy run
+            (dmypy not installed or the daemon failed).
+        """
+        daemon = get_dmypy_daemon(binary, context.project_root)
+        if daemon is None:
+            return None
+        try:
+            result = daemon.run(flags, paths, context.stream_handler)
+        except subprocess.SubprocessError as e:
+            if isinstance(e, subprocess.TimeoutExpired):
+                raise
+            LOGGER.debug(f"dmypy failed, running mypy: {e}")
+            return None
+        # 0: no errors, 1: errors found, anything else: the daemon failed
+        if result.returncode not in (0, 1):
+            LOGGER.debug(
+                f"dmypy exited with {result.returncode}, running mypy: "
+                f"{(result.stderr or result.stdout or '')[-500:]}"
+            )
+            daemon.kill()
+            return None
+        return result
+
     def _parse_output(self, output: str, project_root: Path) -> List[UnifiedIssue]:
         """Parse mypy JSON output.
 
@@ -1,7 +1,8 @@
 """Scala compiler type checker plugin.
 
 Uses sbt compile, mvn compile, or gradle compileScala to run the Scala
-compiler and extract type errors and warnings.
+compiler and extract type errors and warnings. The compile is shared with
+Scalafix (see ``scala_utils``).
 """
 
 from __future__ import annotations
@@ -20,7 +21,7 @@ from lucidshark.core.models import (
     ToolDomain,
     UnifiedIssue,
 )
-from lucidshark.core.subprocess_runner import run_with_streaming
+from lucidshark.plugins.scala_utils import SCALA_COMPILE_TIMEOUT, shared_compile
 from lucidshark.plugins.type_checkers.base import TypeCheckerPlugin
 from lucidshark.plugins.utils import find_scala_build_tool
 
@@ -95,73 +96,31 @@ class ScalaCompileChecker(TypeCheckerPlugin):
             )
             return []
 
-        if build_system == "sbt":
-            return self._run_sbt_compile(binary, context)
-        elif build_system == "maven":
-            return self._run_maven_compile(binary, context)
-        else:
-            return self._run_gradle_compile(binary, context)
-
-    def _run_sbt_compile(
-        self, binary: Path, context: ScanContext
-    ) -> List[UnifiedIssue]:
-        """Run sbt compile and parse output."""
-        cmd = [str(binary), "--no-colors", "compile"]
-
-        output = self._run_compile_command(cmd, context, "sbt-compile")
-        if output is None:
-            return []
-
-        return self._parse_scala_compiler_output(output, context.project_root)
-
-    def _run_maven_compile(
-        self, binary: Path, context: ScanContext
-    ) -> List[UnifiedIssue]:
-        """Run mvn compile and parse output."""
-        cmd = [str(binary), "compile", "-B"]
-
-        output = self._run_compile_command(cmd, context, "maven-compile")
-        if output is None:
-            return []
-
-        return self._parse_scala_compiler_output(output, context.project_root)
-
-    def _run_gradle_compile(
-        self, binary: Path, context: ScanContext
-    ) -> List[UnifiedIssue]:
-        """Run gradle compileScala and parse output."""
-        cmd = [str(binary), "compileScala", "--no-daemon"]
-
-        output = self._run_compile_command(cmd, context, "gradle-compile")
+        output = self._run_compile(binary, build_system, context)
         if output is None:
             return []
 
         return self._parse_scala_compiler_output(output, context.project_root)
 
-    def _run_compile_command(
+    def _run_compile(
         self,
-        cmd: List[str],
+        binary: Path,
+        build_system: str,
         context: ScanContext,
-        tool_label: str,
     ) -> Optional[str]:
-        """Run a compile command and return combined output."""
+        """Compile the project (shared with Scalafix) and return its output."""
+        tool_label = f"{build_system}-compile"
         try:
-            result = run_with_streaming(
-                cmd=cmd,
-                cwd=context.project_root,
-                tool_name=tool_label,
-                stream_handler=context.stream_handler,
-                timeout=300,
-            )
-            # Combine stdout and stderr (compiler output may go to either)
-            return (result.stdout or "") + "\n" + (result.stderr or "")
+            return shared_compile(context, binary, build_system).output
         except subprocess.TimeoutExpired:
-            LOGGER.warning(f"{tool_label} timed out after 300 seconds")
+            LOGGER.warning(
+                f"{tool_label} timed out after {SCALA_COMPILE_TIMEOUT} seconds"
+            )
             context.record_skip(
                 tool_name=self.name,
                 domain=ToolDomain.TYPE_CHECKING,
                 reason=SkipReason.EXECUTION_FAILED,
-                message=f"{tool_label} timed out after 300 seconds",
+                message=f"{tool_label} timed out after {SCALA_COMPILE_TIMEOUT} seconds",
             )
             return None
         except Exception as e:
@@ -4,6 +4,9 @@ SpotBugs is a static analysis tool for finding bugs in Java programs.
 https://spotbugs.github.io/
 
 SpotBugs is a managed tool - LucidShark auto-downloads it on first use.
+
+Scans of specific files analyze only the classes compiled from the changed
+``.java`` files (``-onlyAnalyze``).
 """
 
 from __future__ import annotations
@@ -17,9 +20,9 @@ import tempfile
 import zipfile
 from pathlib import Path
 from typing import List, Optional
+from xml.etree.ElementTree import Element
 
 import defusedxml.ElementTree as ET  # type: ignore[import-untyped]
-from xml.etree.ElementTree import Element
 
 from lucidshark.bootstrap.download import secure_urlopen
 from lucidshark.bootstrap.paths import LucidsharkPaths
@@ -33,6 +36,8 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.core.subprocess_runner import run_with_streaming
+from lucidshark.plugins.java_utils import changed_classes
+from lucidshark.plugins.jvm_worker import run_in_jvm_worker
 from lucidshark.plugins.type_checkers.base import TypeCheckerPlugin
 
 LOGGER = get_logger(__name__)
@@ -325,6 +330,20 @@ class SpotBugsChecker(TypeCheckerPlugin):
             )
             return []
 
+        # Scans of specific files analyze only the changed classes; the
+        # other class directories only provide types
+        aux_dirs: List[Path] = []
+        only_analyze: List[str] = []
+        classes = changed_classes(context)
+        if classes is not None:
+            if not classes:
+                LOGGER.info("No compiled classes for the changed files, skipping")
+                return []
+            targets = {d.resolve() for d in classes}
+            aux_dirs = [d for d in class_dirs if d.resolve() not in targets]
+            class_dirs = list(classes)
+            only_analyze = [name for names in classes.values() for name in names]
+
         # Find source directories for better reporting
         source_dirs = self._find_source_directories(context.project_root)
 
@@ -350,9 +369,16 @@ class SpotBugsChecker(TypeCheckerPlugin):
 
         # Add auxiliary classpath if available (for better analysis)
         aux_classpath = self._find_aux_classpath(context.project_root)
+        if aux_dirs:
+            aux_classpath = os.pathsep.join(
+                [str(d) for d in aux_dirs] + ([aux_classpath] if aux_classpath else [])
+            )
         if aux_classpath:
             cmd.extend(["-auxclasspath", aux_classpath])
 
+        if only_analyze:
+            cmd.extend(["-onlyAnalyze", ",".join(only_analyze)])
+
         # Add class directories to analyze
         for class_dir in class_dirs:
             cmd.append(str(class_dir))
@@ -360,13 +386,15 @@ class SpotBugsChecker(TypeCheckerPlugin):
         LOGGER.debug(f"Running: {' '.join(cmd[:10])}...")
 
         try:
-            result = run_with_streaming(
-                cmd=cmd,
-                cwd=context.project_root,
-                tool_name="spotbugs",
-                stream_handler=context.stream_handler,
-                timeout=300,
-            )
+            result = run_in_jvm_worker(context, cmd, "spotbugs", timeout=300)
+            if result is None:
+                result = run_with_streaming(
+                    cmd=cmd,
+                    cwd=context.project_root,
+                    tool_name="spotbugs",
+                    stream_handler=context.stream_handler,
+                    timeout=300,
+                )
         except subprocess.TimeoutExpired:
             LOGGER.warning("SpotBugs timed out after 300 seconds")
             context.record_skip(
@@ -2,15 +2,24 @@
 
 TypeScript uses the tsc compiler for type checking.
 https://www.typescriptlang.org/
+
+tsc runs incrementally and never emits JavaScript or declarations by
+default: single projects keep their ``.tsbuildinfo`` under
+``.lucidshark/cache/tsc``. Projects whose root ``tsconfig.json`` has
+``references`` are checked with ``tsc -b --noEmit`` (TypeScript 5.6+) or,
+with older compilers, one ``tsc -p <project> --noEmit`` per affected
+project. ``settings.typescript_build: true`` runs an emitting ``tsc -b``
+instead, like the project's own build.
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
 import re
 import subprocess
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from lucidshark.core.logging import get_logger
 from lucidshark.core.models import (
@@ -21,7 +30,11 @@ from lucidshark.core.models import (
     UnifiedIssue,
 )
 from lucidshark.plugins.type_checkers.base import TypeCheckerPlugin
-from lucidshark.plugins.utils import ensure_node_binary, get_cli_version
+from lucidshark.plugins.utils import (
+    domain_cache_enabled,
+    ensure_node_binary,
+    get_cli_version,
+)
 
 LOGGER = get_logger(__name__)
 
@@ -30,6 +43,160 @@ TSC_ERROR_PATTERN = re.compile(
     r"^(.+?)\((\d+),(\d+)\):\s+(error|warning)\s+(TS\d+):\s+(.+)$"
 )
 
+TSC_TIMEOUT = 180
+
+# First TypeScript version accepting --noEmit in build mode
+BUILD_NO_EMIT_VERSION = (5, 6)
+
+# Files the package managers rewrite in node_modules on every install
+NODE_MODULES_MARKERS = (
+    ".package-lock.json",
+    ".yarn-integrity",
+    ".yarn-state.yml",
+    ".modules.yaml",
+)
+
+# Strings are matched first so comment markers inside them are kept
+_JSONC_COMMENT = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/', re.DOTALL)
+_JSONC_TRAILING_COMMA = re.compile(r'("(?:\\.|[^"\\])*")|,(?=\s*[}\]])')
+
+
+def _load_tsconfig(path: Path) -> Optional[Dict]:
+    """Read a tsconfig file, which may contain comments and trailing commas.
+
+    Args:
+        path: Path to the tsconfig file.
+
+    Returns:
+        Parsed config, or None if it is missing or unreadable.
+    """
+    try:
+        text = path.read_text(encoding="utf-8-sig")
+        text = _JSONC_COMMENT.sub(lambda m: m.group(1) or "", text)
+        text = _JSONC_TRAILING_COMMA.sub(lambda m: m.group(1) or "", text)
+        data = json.loads(text)
+    except (OSError, ValueError) as e:
+        LOGGER.debug(f"Cannot read {path}: {e}")
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _project_references(config_path: Path) -> List[Path]:
+    """Resolve the ``references`` of a tsconfig file.
+
+    Args:
+        config_path: Path to the tsconfig file.
+
+    Returns:
+        Resolved config paths of the referenced projects.
+    """
+    config = _load_tsconfig(config_path)
+    references = config.get("references") if config else None
+    if not isinstance(references, list):
+        return []
+
+    resolved = []
+    for reference in references:
+        ref_path = reference.get("path") if isinstance(reference, dict) else None
+        if not isinstance(ref_path, str):
+            continue
+        target = (config_path.parent / ref_path).resolve()
+        if target.is_dir():
+            target = target / "tsconfig.json"
+        resolved.append(target)
+    return resolved
+
+
+def load_project_graph(root_config: Path) -> Dict[Path, List[Path]]:
+    """Collect the project reference graph below a tsconfig file.
+
+    Args:
+        root_config: Root tsconfig file.
+
+    Returns:
+        Referenced config paths keyed by config path, for the root and
+        every project it (transitively) references.
+    """
+    graph: Dict[Path, List[Path]] = {}
+    pending = [root_config.resolve()]
+    while pending:
+        config_path = pending.pop()
+        if config_path in graph:
+            continue
+        graph[config_path] = _project_references(config_path)
+        pending.extend(graph[config_path])
+    return graph
+
+
+def _has_sources(config_path: Path) -> bool:
+    """Whether a tsconfig has sources, unlike a ``"files": []`` solution."""
+    config = _load_tsconfig(config_path) or {}
+    return not (config.get("files") == [] and not config.get("include"))
+
+
+def typescript_build_enabled(context: Any) -> bool:
+    """Whether ``settings.typescript_build`` is enabled for a scan.
+
+    Args:
+        context: Scan context.
+    """
+    settings = getattr(getattr(context, "config", None), "settings", None)
+    return getattr(settings, "typescript_build", False) is True
+
+
+def _resolve_extends(config_path: Path, value: str) -> Optional[Path]:
+    """Resolve one ``extends`` entry of a tsconfig file.
+
+    Relative and absolute paths are resolved against the config's
+    directory; package names are looked up in the ``node_modules``
+    directories above it.
+
+    Returns:
+        The extended config file, or None if it cannot be found.
+    """
+    base = config_path.parent
+    if value.startswith(".") or Path(value).is_absolute():
+        candidates = [base / value]
+    else:
+        candidates = [d / "node_modules" / value for d in (base, *base.parents)]
+    for candidate in candidates:
+        for path in (
+            candidate,
+            candidate.with_name(candidate.name + ".json"),
+            candidate / "tsconfig.json",
+        ):
+            if path.is_file():
+                return path.resolve()
+    return None
+
+
+def extended_configs(config_path: Path) -> List[Path]:
+    """Collect the configs a tsconfig file (transitively) ``extends``.
+
+    Args:
+        config_path: Path to the tsconfig file.
+
+    Returns:
+        Resolved paths of the extended configs, nearest first.
+    """
+    found: List[Path] = []
+    pending = [config_path]
+    while pending:
+        current = pending.pop(0)
+        values = (_load_tsconfig(current) or {}).get("extends")
+        if isinstance(values, str):
+            values = [values]
+        if not isinstance(values, list):
+            continue
+        for value in values:
+            if not isinstance(value, str):
+                continue
+            resolved = _resolve_extends(current, value)
+            if resolved is not None and resolved not in found:
+                found.append(resolved)
+                pending.append(resolved)
+    return found
+
 
 class TypeScriptChecker(TypeCheckerPlugin):
     """TypeScript type checker plugin using tsc."""
@@ -57,14 +224,45 @@ class TypeScriptChecker(TypeCheckerPlugin):
         """TypeScript supports strict mode via tsconfig.json."""
         return True
 
+    @property
+    def cache_extensions(self) -> Tuple[str, ...]:
+        """TypeScript sources checked by tsc."""
+        return (".ts", ".tsx", ".mts", ".cts")
+
+    @property
+    def cache_config_files(self) -> Tuple[str, ...]:
+        """TypeScript project files."""
+        return (
+            "tsconfig.json",
+            "package.json",
+            "package-lock.json",
+            "yarn.lock",
+            "pnpm-lock.yaml",
+        )
+
+    def cache_config_paths(self, context: ScanContext) -> List[Path]:
+        """Every tsconfig of the reference graph and the configs they extend."""
+        tsconfig = context.project_root / "tsconfig.json"
+        if not tsconfig.exists():
+            return []
+        configs = set(load_project_graph(tsconfig))
+        for config_path in list(configs):
+            configs.update(extended_configs(config_path))
+        return sorted(configs)
+
+    def cache_environment(self, context: ScanContext) -> List[Path]:
+        """Install markers of ``node_modules``, rewritten by every install."""
+        node_modules = context.project_root / "node_modules"
+        return [node_modules / name for name in NODE_MODULES_MARKERS] + [
+            node_modules,
+            node_modules / "@types",
+        ]
+
     def get_version(self) -> str:
         """Get TypeScript version."""
         try:
-            binary = self.ensure_binary()
             # Output is like "Version 5.3.3"
-            return get_cli_version(
-                binary, parser=lambda s: s.split()[1] if len(s.split()) >= 2 else s
-            )
+            return self._version(self.ensure_binary())
         except FileNotFoundError:
             return "unknown"
 
@@ -102,51 +300,235 @@ class TypeScriptChecker(TypeCheckerPlugin):
             )
             return []
 
-        # Build command
-        cmd = [
-            str(binary),
-            "--noEmit",  # Don't emit compiled files
-            "--pretty",
-            "false",  # Plain output for parsing
+        commands = self._build_commands(binary, tsconfig, context)
+        if commands is None:
+            LOGGER.debug("No TypeScript project affected by the changes")
+            return []
+
+        issues: List[UnifiedIssue] = []
+        for cmd in commands:
+            LOGGER.debug(f"Running: {' '.join(cmd)}")
+
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    cwd=str(context.project_root),
+                    timeout=TSC_TIMEOUT,
+                )
+            except subprocess.TimeoutExpired:
+                LOGGER.warning(f"tsc timed out after {TSC_TIMEOUT} seconds")
+                context.record_skip(
+                    tool_name=self.name,
+                    domain=ToolDomain.TYPE_CHECKING,
+                    reason=SkipReason.EXECUTION_FAILED,
+                    message=f"tsc timed out after {TSC_TIMEOUT} seconds",
+                )
+                return []
+            except Exception as e:
+                LOGGER.error(f"Failed to run tsc: {e}")
+                context.record_skip(
+                    tool_name=self.name,
+                    domain=ToolDomain.TYPE_CHECKING,
+                    reason=SkipReason.EXECUTION_FAILED,
+                    message=f"Failed to run tsc: {e}",
+                )
+                return []
+
+            # Parse output (tsc outputs to stdout on success, stderr on error)
+            output = result.stdout or result.stderr
+            issues.extend(self._parse_output(output, context.project_root))
+
+        # Projects checked one by one share files, and with them errors
+        issues = list({issue.id: issue for issue in issues}.values())
+        LOGGER.info(f"TypeScript found {len(issues)} issues")
+        return issues
+
+    def _build_commands(
+        self,
+        binary: Path,
+        tsconfig: Path,
+        context: ScanContext,
+    ) -> Optional[List[List[str]]]:
+        """Build the tsc command lines.
+
+        Without project references the root project is checked with
+        ``--noEmit --incremental``. With references only the affected
+        projects are checked: by one ``tsc -b --noEmit`` on TypeScript 5.6+,
+        otherwise by one ``tsc -p <project> --noEmit`` per project. Build
+        info of ``-p`` checks is kept in the LucidShark cache. Only
+        ``settings.typescript_build`` runs an emitting ``tsc -b``.
+
+        Args:
+            binary: Path to tsc.
+            tsconfig: Root tsconfig.json.
+            context: Scan context.
+
+        Returns:
+            The commands, or None if no project is affected by the files
+            being checked.
+        """
+        use_cache = domain_cache_enabled(context, "type_checking")
+        graph = load_project_graph(tsconfig)
+        root_config = tsconfig.resolve()
+
+        if not graph[root_config]:
+            return [self._check_command(binary, None, context, use_cache)]
+
+        projects = self._affected_projects(context, root_config, graph)
+        if projects is not None and not projects:
+            return None
+
+        emit = typescript_build_enabled(context)
+        if emit or self._supports_build_no_emit(binary):
+            if projects is None:
+                targets = [str(tsconfig)]
+            else:
+                targets = [str(p) for p in sorted(projects)]
+            cmd = [str(binary), "--build", *targets, "--pretty", "false"]
+            if not emit:
+                cmd.append("--noEmit")
+            if not use_cache:
+                cmd.append("--force")
+            return [cmd]
+
+        if projects is None:
+            projects = {p for p in graph if p != root_config or _has_sources(p)}
+        return [
+            self._check_command(binary, project, context, use_cache)
+            for project in sorted(projects)
         ]
 
-        LOGGER.debug(f"Running: {' '.join(cmd)}")
+    def _check_command(
+        self,
+        binary: Path,
+        project: Optional[Path],
+        context: ScanContext,
+        use_cache: bool,
+    ) -> List[str]:
+        """Command checking one project without emitting.
 
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                cwd=str(context.project_root),
-                timeout=180,  # 3 minute timeout
-            )
-        except subprocess.TimeoutExpired:
-            LOGGER.warning("tsc timed out after 180 seconds")
-            context.record_skip(
-                tool_name=self.name,
-                domain=ToolDomain.TYPE_CHECKING,
-                reason=SkipReason.EXECUTION_FAILED,
-                message="tsc timed out after 180 seconds",
-            )
-            return []
-        except Exception as e:
-            LOGGER.error(f"Failed to run tsc: {e}")
-            context.record_skip(
-                tool_name=self.name,
-                domain=ToolDomain.TYPE_CHECKING,
-                reason=SkipReason.EXECUTION_FAILED,
-                message=f"Failed to run tsc: {e}",
-            )
-            return []
+        Args:
+            binary: Path to tsc.
+            project: tsconfig passed with ``-p``, or None for the root.
+            context: Scan context.
+            use_cache: Whether to keep build info in the LucidShark cache.
+        """
+        cmd = [str(binary)]
+        if project is not None:
+            cmd.extend(["-p", str(project)])
+        cmd.extend(
+            [
+                "--noEmit",  # Don't emit compiled files
+                "--pretty",
+                "false",  # Plain output for parsing
+            ]
+        )
+        if use_cache:
+            from lucidshark.bootstrap.paths import LucidsharkPaths
+
+            cache_dir = LucidsharkPaths.for_project(
+                context.project_root
+            ).plugin_cache_dir("tsc")
+            if project is None:
+                name = "tsconfig.tsbuildinfo"
+            else:
+                digest = hashlib.sha256(str(project).encode()).hexdigest()[:16]
+                name = f"{digest}.tsbuildinfo"
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                cmd.extend(
+                    [
+                        "--incremental",
+                        "--tsBuildInfoFile",
+                        str(cache_dir / name),
+                    ]
+                )
+            except OSError as e:
+                LOGGER.debug(f"Cannot create tsc cache directory: {e}")
+        return cmd
+
+    def _supports_build_no_emit(self, binary: Path) -> bool:
+        """Whether this tsc accepts ``--noEmit`` in build mode."""
+        match = re.match(r"(\d+)\.(\d+)", self._version(binary))
+        if match is None:
+            return False
+        version = (int(match.group(1)), int(match.group(2)))
+        return version >= BUILD_NO_EMIT_VERSION
+
+    def _version(self, binary: Path) -> str:
+        """Version of a tsc binary, e.g. ``5.6.2``."""
+        return get_cli_version(
+            binary, parser=lambda s: s.split()[1] if len(s.split()) >= 2 else s
+        )
 
-        # Parse output (tsc outputs to stdout on success, stderr on error)
-        output = result.stdout or result.stderr
-        issues = self._parse_output(output, context.project_root)
+    def _affected_projects(
+        self,
+        context: ScanContext,
+        root_config: Path,
+        graph: Dict[Path, List[Path]],
+    ) -> Optional[Set[Path]]:
+        """Find the referenced projects affected by the files being checked.
 
-        LOGGER.info(f"TypeScript found {len(issues)} issues")
-        return issues
+        Only applies when the scan targets individual files (e.g. the
+        changed files of an incremental scan): a project is affected if it
+        is the innermost project containing one of them, or if it
+        (transitively) references such a project.
+
+        Args:
+            context: Scan context.
+            root_config: Resolved root tsconfig.json.
+            graph: Project reference graph from :func:`load_project_graph`.
+
+        Returns:
+            Config paths of the affected projects, or None to build the
+            root project (and with it every referenced project).
+        """
+        if not context.paths or any(p.is_dir() for p in context.paths):
+            return None
+
+        # Innermost project first; several configs may share a directory
+        projects = sorted(
+            (p for p in graph if p != root_config),
+            key=lambda p: len(p.parent.parts),
+            reverse=True,
+        )
+        changed: Set[Path] = set()
+        for path in context.paths:
+            if path.suffix not in self.cache_extensions:
+                continue
+            resolved = path.resolve()
+            owner = next(
+                (p for p in projects if resolved.is_relative_to(p.parent)), None
+            )
+            if owner is None:
+                # Belongs to the root project itself
+                return None
+            changed.add(owner)
+
+        dependents: Dict[Path, Set[Path]] = {}
+        for config_path, references in graph.items():
+            for reference in references:
+                dependents.setdefault(reference, set()).add(config_path)
+
+        solution = not _has_sources(root_config)
+
+        affected: Set[Path] = set()
+        pending = list(changed)
+        while pending:
+            config_path = pending.pop()
+            if config_path in affected:
+                continue
+            if config_path == root_config:
+                if not solution:
+                    return None
+                continue
+            affected.add(config_path)
+            pending.extend(dependents.get(config_path, ()))
+        return affected
 
     def _parse_output(self, output: str, project_root: Path) -> List[UnifiedIssue]:
         """Parse tsc output.
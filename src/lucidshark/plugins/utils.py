@@ -6,15 +6,37 @@ Common helper functions to reduce code duplication across plugins.
 from __future__ import annotations
 
 import hashlib
+import json
+import os
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple
-
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from lucidshark.core.logging import get_logger
 from lucidshark.core.models import Severity, ToolDomain, UnifiedIssue
 from lucidshark.core.paths import resolve_node_bin
 
+LOGGER = get_logger(__name__)
+
+T = TypeVar("T")
+
 # Import tomllib (Python 3.11+) or tomli (Python 3.10)
 _tomllib: Any = None
 try:
@@ -39,6 +61,45 @@ def get_tomllib() -> Any:
     return _tomllib
 
 
+# Version files read by version-manager shims (pyenv, rbenv, nodenv, asdf)
+_SHIM_VERSION_FILES = (
+    ".tool-versions",
+    ".python-version",
+    ".ruby-version",
+    ".node-version",
+)
+
+
+def version_watched_paths(binary: Path) -> List[Path]:
+    """Files whose change can alter the output of ``binary --version``.
+
+    The binary itself and, when it is a symlink, the file it resolves to.
+    A version-manager shim stays the same when another version is
+    selected, so for binaries in a ``shims`` directory the manager's
+    global version file and the version files of the working directory
+    are watched as well.
+
+    Args:
+        binary: Path to the binary.
+
+    Returns:
+        Paths to watch (some may not exist).
+    """
+    paths = [binary]
+    try:
+        resolved = binary.resolve()
+    except OSError:
+        resolved = binary
+    if resolved != binary:
+        paths.append(resolved)
+    if binary.parent.name == "shims":
+        manager_root = binary.parent.parent
+        paths.append(manager_root / "version")
+        paths.append(Path.home() / ".tool-versions")
+        paths.extend(Path.cwd() / name for name in _SHIM_VERSION_FILES)
+    return paths
+
+
 def get_cli_version(
     binary: Path,
     version_flag: str = "--version",
@@ -47,6 +108,9 @@ def get_cli_version(
 ) -> str:
     """Get version from a CLI tool.
 
+    The output is cached by the capability cache until the binary (see
+    :func:`version_watched_paths`) changes.
+
     Args:
         binary: Path to the binary.
         version_flag: Flag to get version (default: --version).
@@ -57,7 +121,9 @@ def get_cli_version(
     Returns:
         Version string or 'unknown' if unable to determine.
     """
-    try:
+    from lucidshark.core.capability_cache import cached_probe
+
+    def probe() -> Optional[str]:
         result = subprocess.run(
             [str(binary), version_flag],
             capture_output=True,
@@ -66,16 +132,25 @@ def get_cli_version(
             errors="replace",
             timeout=timeout,
         )
-        if result.returncode == 0:
-            output = result.stdout.strip()
-            if parser:
-                parsed = parser(output)
-                # Return "unknown" if parser returns empty/falsy result
-                return parsed if parsed else "unknown"
-            return output if output else "unknown"
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    try:
+        # Version managers pick the version from the working directory
+        output = cached_probe(
+            "version",
+            [str(binary), version_flag, os.getcwd()],
+            version_watched_paths(binary),
+            probe,
+        )
     except Exception:
-        pass
-    return "unknown"
+        return "unknown"
+    if output is None:
+        return "unknown"
+    if parser:
+        parsed = parser(output)
+        # Return "unknown" if parser returns empty/falsy result
+        return parsed if parsed else "unknown"
+    return output if output else "unknown"
 
 
 def ensure_node_binary(
@@ -147,6 +222,24 @@ def _is_binary_executable(binary_path: Path) -> bool:
         return True  # Can't read — let subprocess handle the error
 
 
+def site_packages_dirs(binary: Path) -> List[Path]:
+    """Return the site-packages directories of the environment of a binary.
+
+    Installing or removing a package changes their modification time.
+
+    Args:
+        binary: Script in the ``bin``/``Scripts`` directory of an environment.
+
+    Returns:
+        Existing site-packages directories (empty if none are found).
+    """
+    env = binary.resolve().parent.parent
+    dirs = list(env.glob("lib/python*/site-packages"))
+    dirs.extend(env.glob("lib/python*/dist-packages"))
+    dirs.extend(env.glob("Lib/site-packages"))
+    return sorted(dirs)
+
+
 def ensure_python_binary(
     project_root: Optional[Path],
     binary_name: str,
@@ -208,6 +301,287 @@ def resolve_src_paths(
     return ["."]
 
 
+def domain_cache_enabled(context: Any, domain: str) -> bool:
+    """Whether a domain's ``cache`` option allows reusing earlier results.
+
+    Args:
+        context: Scan context.
+        domain: Pipeline domain (linting, type_checking).
+
+    Returns:
+        True unless the domain config sets ``cache: false``.
+    """
+    pipeline = getattr(context.config, "pipeline", None)
+    domain_config = getattr(pipeline, domain, None)
+    return domain_config is None or bool(getattr(domain_config, "cache", True))
+
+
+def read_json_cache(
+    path: Path,
+    field: str,
+    format_version: int,
+    fingerprint: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Read a mapping stored by :func:`write_json_cache`.
+
+    Args:
+        path: Cache file.
+        field: Key holding the mapping in the file.
+        format_version: Current format; files of other formats are ignored.
+        fingerprint: Digest of the inputs the mapping was computed from, or
+            None if the cache has none.
+
+    Returns:
+        The stored mapping, or None if the file is missing, unreadable, of
+        another format or written for another fingerprint.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("format") != format_version
+        or data.get("fingerprint") != fingerprint
+    ):
+        return None
+    value = data.get(field)
+    return value if isinstance(value, dict) else None
+
+
+def write_json_cache(
+    path: Path,
+    field: str,
+    value: Dict[str, Any],
+    format_version: int,
+    fingerprint: Optional[str] = None,
+) -> bool:
+    """Store a mapping atomically, together with its format and fingerprint.
+
+    Args:
+        path: Cache file (its directory is created).
+        field: Key holding the mapping in the file.
+        value: JSON-serializable mapping.
+        format_version: Current format.
+        fingerprint: Digest of the inputs the mapping was computed from.
+
+    Returns:
+        True if the file was written.
+    """
+    data: Dict[str, Any] = {"format": format_version}
+    if fingerprint is not None:
+        data["fingerprint"] = fingerprint
+    data[field] = value
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp", prefix=path.stem)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        LOGGER.debug(f"Failed to write cache {path}: {e}")
+        return False
+    return True
+
+
+def cached_json(
+    path: Path,
+    field: str,
+    format_version: int,
+    fingerprint: str,
+    compute: Callable[[], Optional[Dict[str, Any]]],
+) -> Optional[Dict[str, Any]]:
+    """Return a mapping from its cache file, computing and storing it on a miss.
+
+    Args:
+        path: Cache file.
+        field: Key holding the mapping in the file.
+        format_version: Current format.
+        fingerprint: Digest of the inputs the mapping is computed from.
+        compute: Builds the mapping, or returns None if it cannot (nothing
+            is stored then).
+
+    Returns:
+        The cached or computed mapping, or None.
+    """
+    value = read_json_cache(path, field, format_version, fingerprint)
+    if value is not None:
+        return value
+    value = compute()
+    if value is not None:
+        write_json_cache(path, field, value, format_version, fingerprint)
+    return value
+
+
+def directory_fingerprint(
+    root: Path,
+    skip_dirs: AbstractSet[str],
+    include: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """Fingerprint the files below a directory.
+
+    Covers the mtime and size of every file outside hidden directories and
+    ``skip_dirs``, so any edit, addition or removal changes the digest.
+
+    Args:
+        root: Directory to walk.
+        skip_dirs: Names of directories that never hold build inputs.
+        include: Filter on file names, or None to cover every file.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            d for d in dirnames if not d.startswith(".") and d not in skip_dirs
+        )
+        for name in sorted(filenames):
+            if include is not None and not include(name):
+                continue
+            try:
+                stat = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            digest.update(
+                f"{dirpath}/{name}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode()
+            )
+    return digest.hexdigest()
+
+
+_memoized_lock = threading.Lock()
+_memoized_locks: Dict[Tuple[str, Path], threading.Lock] = {}
+_memoized: Dict[Tuple[str, Path], Tuple[str, Any]] = {}
+
+
+def memoized_build(
+    kind: str,
+    key: Path,
+    source_dir: Path,
+    skip_dirs: AbstractSet[str],
+    run: Callable[[], T],
+    include: Optional[Callable[[str], bool]] = None,
+    reusable: Optional[Callable[[T], bool]] = None,
+) -> T:
+    """Run a build once and share its outcome until its sources change.
+
+    Concurrent callers with the same ``kind`` and ``key`` wait for a run in
+    progress. A finished run is reused while the fingerprint of
+    ``source_dir`` (see :func:`directory_fingerprint`) is unchanged.
+    Exceptions of ``run`` propagate and are not cached.
+
+    Args:
+        kind: Kind of build, e.g. ``"dotnet-build"``.
+        key: Project or build file the outcome belongs to.
+        source_dir: Directory holding the build inputs.
+        skip_dirs: Directories below ``source_dir`` that hold no inputs.
+        run: Runs the build and returns its outcome.
+        include: Filter on the names of input files, or None for all files.
+        reusable: Whether a cached outcome may still be used, e.g. because
+            its output directory exists.
+
+    Returns:
+        The cached or new outcome.
+    """
+    with _memoized_lock:
+        lock = _memoized_locks.setdefault((kind, key), threading.Lock())
+    with lock:
+        fingerprint = directory_fingerprint(source_dir, skip_dirs, include)
+        cached = _memoized.get((kind, key))
+        if (
+            cached is not None
+            and cached[0] == fingerprint
+            and (reusable is None or reusable(cached[1]))
+        ):
+            LOGGER.info(f"Reusing {kind} of {key.name}")
+            result: T = cached[1]
+            return result
+        result = run()
+        _memoized[(kind, key)] = (fingerprint, result)
+        return result
+
+
+def changed_files(context: Any) -> Optional[List[str]]:
+    """Files changed in a scan of specific files.
+
+    Args:
+        context: Scan context.
+
+    Returns:
+        Changed files relative to the project root (posix), or None for
+        full scans (all files, no paths, or a directory among the paths).
+        Paths outside the project root are dropped.
+    """
+    if context.all_files or not context.paths:
+        return None
+    root = context.project_root.resolve()
+    changed = []
+    for path in context.paths:
+        path = Path(path).resolve()
+        if path.is_dir():
+            return None
+        try:
+            changed.append(path.relative_to(root).as_posix())
+        except ValueError:
+            continue
+    return changed
+
+
+def affected_closure(
+    dirs: Mapping[str, str],
+    deps: Mapping[str, Iterable[str]],
+    changed: Iterable[str],
+    global_files: Collection[str],
+) -> Optional[Set[str]]:
+    """Find the units of a build graph affected by changed files.
+
+    A changed file belongs to the innermost unit whose directory contains
+    it; the result adds every unit that depends on an affected unit,
+    directly or transitively.
+
+    Args:
+        dirs: Directory of each unit relative to the root (posix, ``"."``
+            for the root).
+        deps: Units each unit depends on.
+        changed: Changed files relative to the root (posix).
+        global_files: Files that affect every unit; entries ending in
+            ``/`` match every file below that directory.
+
+    Returns:
+        The affected units, or None if a global file changed.
+    """
+    global_dirs = tuple(f for f in global_files if f.endswith("/"))
+    dependents: Dict[str, Set[str]] = {}
+    for unit, unit_deps in deps.items():
+        for dependency in unit_deps:
+            dependents.setdefault(dependency, set()).add(unit)
+
+    # Innermost unit first; the root unit contains every other unit
+    by_depth = sorted(
+        dirs.items(),
+        key=lambda item: 0 if item[1] == "." else item[1].count("/") + 1,
+        reverse=True,
+    )
+
+    pending: List[str] = []
+    for path in changed:
+        if path in global_files or path.startswith(global_dirs):
+            return None
+        for unit, unit_dir in by_depth:
+            if unit_dir == "." or path.startswith(f"{unit_dir}/"):
+                pending.append(unit)
+                break
+
+    affected: Set[str] = set()
+    while pending:
+        unit = pending.pop()
+        if unit in affected:
+            continue
+        affected.add(unit)
+        pending.extend(dependents.get(unit, ()))
+    return affected
+
+
 def find_java_build_tool(project_root: Path) -> Tuple[Path, str]:
     """Find Java build tool (Gradle or Maven).
 
@@ -3,6 +3,9 @@
 Disables telemetry for all tests to prevent real PostHog events from leaking
 during test runs. Individual telemetry tests re-enable it via their own
 fixtures (mock_posthog deletes the env var and injects a mock client).
+
+Also disables the capability cache so tool probes that tests mock are never
+answered from an earlier test (or an earlier run) on the same machine.
 """
 
 from __future__ import annotations
@@ -13,3 +16,4 @@ import os
 def pytest_configure(config):  # noqa: ARG001
     """Disable telemetry before any test collection or import."""
     os.environ["LUCIDSHARK_TELEMETRY"] = "0"
+    os.environ["LUCIDSHARK_CAPABILITY_CACHE"] = "0"
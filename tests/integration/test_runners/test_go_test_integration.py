@@ -95,6 +95,36 @@ class TestGoTestFunctional:
             assert result.success is True
             assert result.tool == "go_test"
 
+    def test_incremental_run_tests_affected_packages(
+        self, go_test_runner: GoTestRunner, tmp_path: Path
+    ) -> None:
+        """Test that changed files only run the packages depending on them."""
+        _create_temp_go_project(tmp_path, "example.com/m")
+        for package in ("core", "api", "cli"):
+            (tmp_path / package).mkdir()
+        (tmp_path / "core" / "core.go").write_text(
+            "package core\n\nfunc Add(a, b int) int { return a + b }\n"
+        )
+        (tmp_path / "api" / "api_test.go").write_text(
+            'package api\n\nimport (\n\t"testing"\n\n\t"example.com/m/core"\n)\n\n'
+            "func TestAdd(t *testing.T) {\n\tif core.Add(1, 2) != 3 {\n"
+            '\t\tt.Error("expected 3")\n\t}\n}\n'
+        )
+        (tmp_path / "cli" / "cli_test.go").write_text(
+            'package cli\n\nimport "testing"\n\nfunc TestCli(t *testing.T) {}\n'
+        )
+
+        context = ScanContext(
+            project_root=tmp_path,
+            paths=[tmp_path / "core" / "core.go"],
+            enabled_domains=[],
+        )
+
+        result = go_test_runner.run_tests(context)
+
+        assert result.passed == 1
+        assert result.failed == 0
+
     def test_run_failing_tests(self, go_test_runner: GoTestRunner) -> None:
         """Test running a Go project with failing tests."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -347,6 +347,53 @@ class TestScanCommandRunScan:
         assert len(result.issues) == 1
         mock_runner.run_linting.assert_called_once()
 
+    @patch("lucidshark.cli.commands.scan.PipelineExecutor")
+    @patch("lucidshark.cli.commands.scan.DomainRunner")
+    @patch("lucidshark.cli.commands.scan.ScanContext.create")
+    @patch("lucidshark.cli.commands.scan.ConfigBridge.get_enabled_domains")
+    def test_run_scan_fix_formats_after_linting(
+        self,
+        mock_get_domains,
+        mock_create_ctx,
+        mock_runner_cls,
+        mock_executor_cls,
+        tmp_path: Path,
+    ) -> None:
+        import time
+
+        mock_get_domains.return_value = []
+        mock_ctx = MagicMock()
+        mock_ctx.coverage_result = None
+        mock_ctx.duplication_result = None
+        mock_create_ctx.return_value = mock_ctx
+
+        order: list[str] = []
+
+        def slow_lint(*args, **kwargs):
+            time.sleep(0.05)
+            order.append("linting")
+            return [_make_issue(rule_id="LINT")]
+
+        def format_check(*args, **kwargs):
+            order.append("formatting")
+            return [_make_issue(domain=ToolDomain.FORMATTING, rule_id="FMT")]
+
+        mock_runner = MagicMock()
+        mock_runner.run_linting.side_effect = slow_lint
+        mock_runner.run_formatting.side_effect = format_check
+        mock_runner.run_type_checking.return_value = []
+        mock_runner_cls.return_value = mock_runner
+
+        cmd = ScanCommand(version="1.0.0")
+        args = _make_args(
+            tmp_path, linting=True, formatting=True, type_checking=True, fix=True
+        )
+
+        result = cmd._run_scan(args, _make_config())
+
+        assert order == ["linting", "formatting"]
+        assert [i.rule_id for i in result.issues] == ["LINT", "FMT"]
+
     @patch("lucidshark.cli.commands.scan.PipelineExecutor")
     @patch("lucidshark.cli.commands.scan.DomainRunner")
     @patch("lucidshark.cli.commands.scan.ScanContext.create")
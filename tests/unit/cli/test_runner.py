@@ -135,7 +135,7 @@ class TestCLIRunner:
         runner = CLIRunner()
 
         with patch(
-            "lucidshark.cli.runner.load_config",
+            "lucidshark.config.load_config",
         ) as mock_load:
             mock_config = MagicMock()
             mock_config.get_enabled_domains.return_value = []
@@ -157,7 +157,7 @@ class TestCLIRunner:
         runner = CLIRunner()
 
         with patch(
-            "lucidshark.cli.runner.load_config",
+            "lucidshark.config.load_config",
         ) as mock_load:
             mock_config = MagicMock()
             mock_config.get_enabled_domains.return_value = []
@@ -176,7 +176,7 @@ class TestCLIRunner:
         runner = CLIRunner()
 
         with patch(
-            "lucidshark.cli.runner.load_config",
+            "lucidshark.config.load_config",
             side_effect=ConfigError("Invalid config"),
         ):
             result = runner.run(["scan", str(tmp_path)])
@@ -186,7 +186,7 @@ class TestCLIRunner:
         """Test scan command with file not found error."""
         runner = CLIRunner()
 
-        with patch("lucidshark.cli.runner.load_config") as mock_load:
+        with patch("lucidshark.config.load_config") as mock_load:
             mock_config = MagicMock()
             mock_config.get_enabled_domains.return_value = []
             mock_load.return_value = mock_config
@@ -203,7 +203,7 @@ class TestCLIRunner:
         """Test scan command with generic error."""
         runner = CLIRunner()
 
-        with patch("lucidshark.cli.runner.load_config") as mock_load:
+        with patch("lucidshark.config.load_config") as mock_load:
             mock_config = MagicMock()
             mock_config.get_enabled_domains.return_value = []
             mock_load.return_value = mock_config
@@ -220,7 +220,7 @@ class TestCLIRunner:
         """Test scan command with generic error and debug flag."""
         runner = CLIRunner()
 
-        with patch("lucidshark.cli.runner.load_config") as mock_load:
+        with patch("lucidshark.config.load_config") as mock_load:
             mock_config = MagicMock()
             mock_config.get_enabled_domains.return_value = []
             mock_load.return_value = mock_config
@@ -239,7 +239,7 @@ class TestCLIRunner:
         """Test serve command."""
         runner = CLIRunner()
 
-        with patch("lucidshark.cli.runner.load_config") as mock_load:
+        with patch("lucidshark.config.load_config") as mock_load:
             mock_config = MagicMock()
             mock_load.return_value = mock_config
 
@@ -261,7 +261,7 @@ class TestCLIRunner:
         runner = CLIRunner()
 
         with patch(
-            "lucidshark.cli.runner.load_config",
+            "lucidshark.config.load_config",
             side_effect=ConfigError("Invalid config"),
         ):
             result = runner.run(["serve", str(tmp_path)])
@@ -271,7 +271,7 @@ class TestCLIRunner:
         """Test serve command with import error."""
         runner = CLIRunner()
 
-        with patch("lucidshark.cli.runner.load_config") as mock_load:
+        with patch("lucidshark.config.load_config") as mock_load:
             mock_config = MagicMock()
             mock_load.return_value = mock_config
 
@@ -0,0 +1,79 @@
+"""Import-time budget for the CLI startup path.
+
+Importing the CLI must stay cheap: configuration, pipeline, plugin and MCP
+modules (and their third-party dependencies) are only imported once a
+command that needs them actually runs.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# Modules that must not be imported just to start the CLI
+HEAVY_MODULES = (
+    "yaml",
+    "pathspec",
+    "defusedxml",
+    "watchdog",
+    "mcp",
+    "lucidshark.config.models",
+    "lucidshark.config.loader",
+    "lucidshark.pipeline",
+    "lucidshark.core.domain_runner",
+    "lucidshark.plugins",
+    "lucidshark.mcp",
+)
+
+# Generous budget (microseconds) so slow CI machines do not flake
+CLI_IMPORT_BUDGET_US = 500_000
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """Run ``code`` under ``-X importtime`` and return cumulative times."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        try:
+            times[name.strip()] = int(cumulative.strip())
+        except ValueError:
+            continue  # Header line
+    return times
+
+
+class TestStartupImports:
+    """Tests for the lazily imported CLI startup path."""
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "import lucidshark.cli",
+            "from lucidshark.cli.runner import CLIRunner; CLIRunner()",
+        ],
+    )
+    def test_heavy_modules_not_imported(self, code: str) -> None:
+        times = _import_times(code)
+
+        loaded = [
+            name
+            for name in times
+            if any(name == m or name.startswith(m + ".") for m in HEAVY_MODULES)
+        ]
+        assert loaded == []
+
+    def test_cli_import_within_budget(self) -> None:
+        times = _import_times("import lucidshark.cli")
+
+        assert times["lucidshark.cli"] < CLI_IMPORT_BUDGET_US
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-
+from unittest.mock import patch
 
 from lucidshark.config.ignore import (
     IgnorePatterns,
@@ -110,6 +110,63 @@ class TestIgnorePatterns:
         assert patterns.get_exclude_patterns() == []
 
 
+class TestIgnorePatternsMatchMany:
+    """Tests for batched matching with memoized resolution."""
+
+    def test_match_many_agrees_with_matches(self) -> None:
+        """Test that batch verdicts equal single-path verdicts."""
+        patterns = IgnorePatterns(["*.log", "build/", "!keep.log"])
+        root = Path("/project")
+        paths = [
+            Path("/project/a.log"),
+            Path("/project/keep.log"),
+            Path("/project/build/out.py"),
+            Path("/project/src/main.py"),
+            Path("src/rel.log"),
+            Path("/elsewhere/x.py"),
+        ]
+
+        assert patterns.match_many(paths, root) == [
+            patterns.matches(p, root) for p in paths
+        ]
+        assert patterns.filter_paths(paths, root) == [
+            Path("/project/keep.log"),
+            Path("/project/src/main.py"),
+            Path("/elsewhere/x.py"),
+        ]
+
+    def test_each_directory_resolved_once(self, tmp_path: Path) -> None:
+        """Test that files share the resolution of their directory."""
+        patterns = IgnorePatterns(["*.tmp"])
+        paths = [tmp_path / "src" / f"f{i}.py" for i in range(50)]
+
+        with patch.object(
+            Path, "resolve", autospec=True, side_effect=Path.resolve
+        ) as resolve:
+            patterns.match_many(paths, tmp_path)
+
+        # Root and the one directory
+        assert resolve.call_count == 2
+
+    def test_ignored_directory_covers_children(self) -> None:
+        """Test that files below an ignored directory are ignored."""
+        patterns = IgnorePatterns(["build/*"])
+        root = Path("/project")
+
+        assert patterns.matches(Path("/project/build/sub/file.txt"), root)
+        assert not patterns.matches(Path("/project/src/build.txt"), root)
+
+    def test_negation_reincludes_below_directory_pattern(self) -> None:
+        """Test that negated patterns still apply to individual files."""
+        patterns = IgnorePatterns(["generated/*", "!generated/keep.py"])
+        root = Path("/project")
+
+        assert patterns.match_many(
+            [Path("/project/generated/keep.py"), Path("/project/generated/x.py")],
+            root,
+        ) == [False, True]
+
+
 class TestIgnorePatternsFromFile:
     """Tests for IgnorePatterns.from_file class method."""
 
@@ -493,6 +493,22 @@ class TestParseDomainPipelineConfigCommand:
         assert config.pipeline.testing.command == "python -m pytest -x"
         assert config.pipeline.testing.post_command == "rm -rf .pytest_cache"
 
+    def test_parses_testing_shards(self) -> None:
+        """Test that dict_to_config parses pipeline.testing.shards."""
+        data = {"pipeline": {"testing": {"tools": [{"name": "pytest"}]}}}
+        assert dict_to_config(data).pipeline.testing.shards == 0
+
+        data["pipeline"]["testing"]["shards"] = "auto"
+        assert dict_to_config(data).pipeline.testing.shards == "auto"
+
+    def test_parses_testing_impact(self) -> None:
+        """Test that dict_to_config parses pipeline.testing.impact."""
+        data = {"pipeline": {"testing": {"tools": [{"name": "pytest"}]}}}
+        assert dict_to_config(data).pipeline.testing.impact is False
+
+        data["pipeline"]["testing"]["impact"] = True
+        assert dict_to_config(data).pipeline.testing.impact is True
+
 
 class TestDictToConfigIgnoreIssues:
     """Tests for dict_to_config handling of ignore_issues."""
@@ -673,6 +689,16 @@ class TestDictToConfigSettings:
         config = dict_to_config({"settings": {"strict_mode": False}})
         assert config.settings.strict_mode is False
 
+    def test_parses_jvm_worker(self) -> None:
+        assert dict_to_config({}).settings.jvm_worker is False
+        config = dict_to_config({"settings": {"jvm_worker": True}})
+        assert config.settings.jvm_worker is True
+
+    def test_parses_scala_build_server(self) -> None:
+        assert dict_to_config({}).settings.scala_build_server is False
+        config = dict_to_config({"settings": {"scala_build_server": True}})
+        assert config.settings.scala_build_server is True
+
     def test_parses_both_settings(self) -> None:
         data = {"settings": {"strict_mode": False, "auto_update": False}}
         config = dict_to_config(data)
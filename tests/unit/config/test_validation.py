@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from lucidshark.config.validation import (
     ConfigValidationWarning,
     ConfigValidationIssue,
@@ -561,6 +563,60 @@ class TestValidateConfigCommand:
             )
 
 
+class TestValidateConfigShards:
+    """Tests for pipeline.testing.shards validation."""
+
+    @pytest.mark.parametrize("shards", [0, 4, "auto"])
+    def test_valid_shards(self, shards) -> None:
+        data = {
+            "version": 1,
+            "pipeline": {"testing": {"tools": [{"name": "pytest"}], "shards": shards}},
+        }
+        warnings = validate_config(data, source="test.yml")
+        assert not any("shards" in (w.key or "") for w in warnings)
+
+    @pytest.mark.parametrize("shards", [-1, "many", True])
+    def test_invalid_shards_warns(self, shards) -> None:
+        data = {
+            "version": 1,
+            "pipeline": {"testing": {"tools": [{"name": "pytest"}], "shards": shards}},
+        }
+        warnings = validate_config(data, source="test.yml")
+        shard_warnings = [w for w in warnings if w.key == "pipeline.testing.shards"]
+        assert len(shard_warnings) == 1
+        assert "non-negative integer or 'auto'" in shard_warnings[0].message
+
+    def test_shards_unknown_outside_testing(self) -> None:
+        data = {
+            "version": 1,
+            "pipeline": {"linting": {"tools": [{"name": "ruff"}], "shards": 2}},
+        }
+        warnings = validate_config(data, source="test.yml")
+        assert any("Unknown" in w.message and "shards" in w.message for w in warnings)
+
+
+class TestValidateConfigImpact:
+    """Tests for pipeline.testing.impact validation."""
+
+    def test_boolean_accepted(self) -> None:
+        data = {
+            "version": 1,
+            "pipeline": {"testing": {"tools": [{"name": "pytest"}], "impact": True}},
+        }
+        warnings = validate_config(data, source="test.yml")
+        assert not any("impact" in (w.key or "") for w in warnings)
+
+    def test_non_bool_warns(self) -> None:
+        data = {
+            "version": 1,
+            "pipeline": {"testing": {"tools": [{"name": "pytest"}], "impact": "yes"}},
+        }
+        warnings = validate_config(data, source="test.yml")
+        impact_warnings = [w for w in warnings if w.key == "pipeline.testing.impact"]
+        assert len(impact_warnings) == 1
+        assert "must be a boolean" in impact_warnings[0].message
+
+
 class TestValidateConfigAI:
     """Tests for AI section validation."""
 
@@ -1267,6 +1323,30 @@ class TestValidateConfigAliasKeys:
         assert len(auto_warnings) == 1
         assert "must be a boolean" in auto_warnings[0].message
 
+    def test_settings_jvm_worker_non_bool_warns(self) -> None:
+        """settings.jvm_worker with non-boolean value should warn."""
+        data = {"version": 1, "settings": {"jvm_worker": "on"}}
+        warnings = validate_config(data, source="test.yml")
+        jvm_warnings = [w for w in warnings if "jvm_worker" in (w.key or "")]
+        assert len(jvm_warnings) == 1
+        assert "must be a boolean" in jvm_warnings[0].message
+
+    def test_settings_scala_build_server_non_bool_warns(self) -> None:
+        """settings.scala_build_server with non-boolean value should warn."""
+        data = {"version": 1, "settings": {"scala_build_server": 1}}
+        warnings = validate_config(data, source="test.yml")
+        server_warnings = [w for w in warnings if "scala_build_server" in (w.key or "")]
+        assert len(server_warnings) == 1
+        assert "must be a boolean" in server_warnings[0].message
+
+    def test_settings_typescript_build_non_bool_warns(self) -> None:
+        """settings.typescript_build with non-boolean value should warn."""
+        data = {"version": 1, "settings": {"typescript_build": "yes"}}
+        warnings = validate_config(data, source="test.yml")
+        build_warnings = [w for w in warnings if "typescript_build" in (w.key or "")]
+        assert len(build_warnings) == 1
+        assert "must be a boolean" in build_warnings[0].message
+
     def test_settings_strict_mode_non_bool_warns(self) -> None:
         """settings.strict_mode with non-boolean value should warn."""
         data = {"version": 1, "settings": {"strict_mode": "always"}}
@@ -0,0 +1,162 @@
+"""Tests for the tool capability cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from lucidshark.core import capability_cache
+from lucidshark.core.capability_cache import (
+    CapabilityCache,
+    cached_probe,
+    get_capability_cache,
+)
+
+
+class Probe:
+    def __init__(self, value) -> None:
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def _touch(path: Path, content: str = "x") -> None:
+    path.write_text(content)
+    # Make sure the change is visible even on coarse mtime filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestCapabilityCache:
+    def test_reuses_result_across_instances(self, tmp_path: Path) -> None:
+        binary = tmp_path / "tool"
+        binary.write_text("#!/bin/sh\n")
+        cache_file = tmp_path / "cache" / "capabilities.json"
+        probe = Probe("1.2.3")
+
+        first = CapabilityCache(cache_file).probe("version", ["tool"], [binary], probe)
+        second = CapabilityCache(cache_file).probe("version", ["tool"], [binary], probe)
+
+        assert first == second == "1.2.3"
+        assert probe.calls == 1
+
+    def test_watched_file_change_invalidates(self, tmp_path: Path) -> None:
+        binary = tmp_path / "tool"
+        binary.write_text("v1")
+        plugin = tmp_path / "plugin.py"
+        cache = CapabilityCache(tmp_path / "capabilities.json")
+        probe = Probe(False)
+
+        cache.probe("json-report", ["tool"], [binary, plugin], probe)
+        # A watched path that appears invalidates the entry
+        _touch(plugin)
+        cache.probe("json-report", ["tool"], [binary, plugin], probe)
+        cache.probe("json-report", ["tool"], [binary, plugin], probe)
+        _touch(binary, "v2")
+        cache.probe("json-report", ["tool"], [binary, plugin], probe)
+
+        assert probe.calls == 3
+
+    def test_entries_expire(self, tmp_path: Path) -> None:
+        binary = tmp_path / "tool"
+        binary.write_text("x")
+        cache = CapabilityCache(tmp_path / "capabilities.json", ttl=60)
+        probe = Probe("x")
+
+        with patch("time.time", return_value=1000.0):
+            cache.probe("version", ["tool"], [binary], probe)
+        with patch("time.time", return_value=1059.0):
+            cache.probe("version", ["tool"], [binary], probe)
+        with patch("time.time", return_value=1061.0):
+            cache.probe("version", ["tool"], [binary], probe)
+
+        assert probe.calls == 2
+
+    def test_keys_are_separate(self, tmp_path: Path) -> None:
+        binary = tmp_path / "tool"
+        binary.write_text("x")
+        cache = CapabilityCache(None)
+
+        a = cache.probe("version", ["tool", "/a"], [binary], Probe("a"))
+        b = cache.probe("version", ["tool", "/b"], [binary], Probe("b"))
+
+        assert (a, b) == ("a", "b")
+
+    def test_not_cached_without_existing_watched_path(self, tmp_path: Path) -> None:
+        cache = CapabilityCache(tmp_path / "capabilities.json")
+        probe = Probe("x")
+
+        cache.probe("version", ["tool"], [tmp_path / "missing"], probe)
+        cache.probe("version", ["tool"], [tmp_path / "missing"], probe)
+
+        assert probe.calls == 2
+
+    def test_failed_probe_is_not_cached(self, tmp_path: Path) -> None:
+        binary = tmp_path / "tool"
+        binary.write_text("x")
+        cache = CapabilityCache(tmp_path / "capabilities.json")
+        calls: List[int] = []
+
+        def failing():
+            calls.append(1)
+            raise TimeoutError("slow")
+
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                cache.probe("version", ["tool"], [binary], failing)
+
+        assert len(calls) == 2
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path: Path) -> None:
+        binary = tmp_path / "tool"
+        binary.write_text("x")
+        cache_file = tmp_path / "capabilities.json"
+        cache_file.write_text("{not json")
+
+        value = CapabilityCache(cache_file).probe("v", ["tool"], [binary], Probe(1))
+
+        assert value == 1
+
+
+def test_disabled_by_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    binary = tmp_path / "tool"
+    binary.write_text("x")
+    monkeypatch.setenv("LUCIDSHARK_CAPABILITY_CACHE", "0")
+    probe = Probe("x")
+
+    cached_probe("version", ["tool"], [binary], probe)
+    cached_probe("version", ["tool"], [binary], probe)
+
+    assert get_capability_cache() is None
+    assert probe.calls == 2
+
+
+def test_stored_outside_the_working_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("LUCIDSHARK_CAPABILITY_CACHE", "1")
+    monkeypatch.delenv("LUCIDSHARK_HOME", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(capability_cache, "_default_cache", None)
+
+    cache = get_capability_cache()
+    assert cache is not None
+    assert cache.cache_file == (
+        tmp_path / "home" / ".lucidshark" / "cache" / "capabilities.json"
+    )
+
+    monkeypatch.setenv("LUCIDSHARK_HOME", str(tmp_path / "shared"))
+    monkeypatch.setattr(capability_cache, "_default_cache", None)
+    cache = get_capability_cache()
+    assert cache is not None
+    assert cache.cache_file == tmp_path / "shared" / "cache" / "capabilities.json"
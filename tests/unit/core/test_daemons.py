@@ -0,0 +1,29 @@
+"""Tests for the tool daemon registry."""
+
+from __future__ import annotations
+
+from typing import List
+
+from lucidshark.core.daemons import (
+    register_daemon,
+    shutdown_daemons,
+    unregister_daemon,
+)
+
+
+def test_shutdown_stops_registered_daemons() -> None:
+    stopped: List[str] = []
+
+    def failing() -> None:
+        raise RuntimeError("already gone")
+
+    register_daemon("a", lambda: stopped.append("a"))
+    register_daemon("broken", failing)
+    register_daemon("b", lambda: stopped.append("b"))
+    register_daemon("gone", lambda: stopped.append("gone"))
+    unregister_daemon("gone")
+
+    shutdown_daemons()
+    shutdown_daemons()
+
+    assert stopped == ["a", "b"]
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 import subprocess
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Dict, Type
+from typing import Any, Dict, Iterator, Type
 from unittest.mock import patch, MagicMock
 
 
@@ -116,6 +117,30 @@ class TestFilterPluginsByLanguage:
         assert "eslint" in result
         assert "typescript" in result
 
+    def test_only_selected_plugins_are_loaded(self) -> None:
+        """Test that plugins for other languages are never looked up."""
+        loaded = []
+
+        classes = {"ruff": MockPythonPlugin, "eslint": MockJsPlugin, "pmd": MockPlugin}
+
+        class RecordingPlugins(Mapping):
+            def __getitem__(self, name: str) -> Type[Any]:
+                loaded.append(name)
+                return classes[name]
+
+            def __iter__(self) -> Iterator[str]:
+                return iter(classes)
+
+            def __len__(self) -> int:
+                return len(classes)
+
+        plugins = RecordingPlugins()
+
+        result = filter_plugins_by_language(plugins, ["python"])
+
+        assert result == {"ruff": MockPythonPlugin}
+        assert loaded == ["ruff"]
+
 
 class TestDetectLanguage:
     """Tests for detect_language function."""
@@ -2028,3 +2053,159 @@ class TestLogCommandFailure:
             mock_logger.info.assert_called_once()
             call_args = mock_logger.info.call_args[0][0]
             assert "error output" in call_args
+
+
+# ---------------------------------------------------------------------------
+# TestPluginPool  -  concurrent execution of plugins within a domain
+# ---------------------------------------------------------------------------
+
+
+class TestPluginPool:
+    """Tests for running multiple plugins of one domain concurrently."""
+
+    def _make_checker(self, name: str, delay: float, skip: bool = False) -> MagicMock:
+        import time
+
+        from lucidshark.core.models import SkipReason
+
+        def check(ctx: Any) -> list:
+            time.sleep(delay)
+            if skip:
+                ctx.record_skip(
+                    name, ToolDomain.TYPE_CHECKING, SkipReason.TOOL_NOT_INSTALLED, "x"
+                )
+            return [
+                UnifiedIssue(
+                    id=f"{name}-1",
+                    domain=ToolDomain.TYPE_CHECKING,
+                    source_tool=name,
+                    severity=Severity.HIGH,
+                    rule_id="E1",
+                    title=name,
+                    description=name,
+                )
+            ]
+
+        plugin_class = MagicMock()
+        plugin_class.return_value.check.side_effect = check
+        return plugin_class
+
+    def test_results_merged_in_plugin_order(self, tmp_path: Path) -> None:
+        """Slow first plugin still reports first; skips and tools merge in order."""
+        from lucidshark.core.models import ScanContext
+
+        runner = _make_runner(tmp_path)
+        context = ScanContext(
+            project_root=tmp_path, paths=[tmp_path], enabled_domains=[]
+        )
+        plugins = {
+            "mypy": self._make_checker("mypy", 0.05, skip=True),
+            "pyright": self._make_checker("pyright", 0.0, skip=True),
+            "typescript": self._make_checker("typescript", 0.0),
+        }
+
+        with (
+            patch(
+                "lucidshark.plugins.type_checkers.discover_type_checker_plugins",
+                return_value=plugins,
+            ),
+            patch(
+                "lucidshark.core.domain_runner.filter_plugins_by_config",
+                return_value=plugins,
+            ),
+        ):
+            issues = runner.run_type_checking(context)
+
+        assert [i.source_tool for i in issues] == ["mypy", "pyright", "typescript"]
+        assert [t["name"] for t in context.tools_executed] == [
+            "mypy",
+            "pyright",
+            "typescript",
+        ]
+        assert [s.tool_name for s in context.tool_skips] == ["mypy", "pyright"]
+
+    def test_plugins_run_concurrently(self, tmp_path: Path) -> None:
+        """Independent plugins overlap instead of running back to back."""
+        import threading
+
+        from lucidshark.core.models import ScanContext
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def make(name: str) -> MagicMock:
+            plugin_class = MagicMock()
+
+            def check(ctx: Any) -> list:
+                barrier.wait()
+                return []
+
+            plugin_class.return_value.check.side_effect = check
+            return plugin_class
+
+        runner = _make_runner(tmp_path)
+        context = ScanContext(
+            project_root=tmp_path, paths=[tmp_path], enabled_domains=[]
+        )
+        plugins = {"mypy": make("mypy"), "pyright": make("pyright")}
+
+        with (
+            patch(
+                "lucidshark.plugins.type_checkers.discover_type_checker_plugins",
+                return_value=plugins,
+            ),
+            patch(
+                "lucidshark.core.domain_runner.filter_plugins_by_config",
+                return_value=plugins,
+            ),
+        ):
+            runner.run_type_checking(context)
+
+        assert len(context.tools_executed) == 2
+
+    def test_fix_mode_runs_linters_sequentially(self, tmp_path: Path) -> None:
+        """Linters that rewrite files never overlap."""
+        import threading
+        import time
+
+        from lucidshark.core.models import ScanContext
+
+        active = 0
+        max_active = 0
+        lock = threading.Lock()
+
+        def make() -> MagicMock:
+            def fix(ctx: Any) -> MagicMock:
+                nonlocal active, max_active
+                with lock:
+                    active += 1
+                    max_active = max(max_active, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+                return MagicMock(issues_fixed=0, issues_remaining=0)
+
+            plugin_class = MagicMock()
+            plugin_class.return_value.supports_fix = True
+            plugin_class.return_value.fix.side_effect = fix
+            plugin_class.return_value.lint.return_value = []
+            return plugin_class
+
+        runner = _make_runner(tmp_path)
+        context = ScanContext(
+            project_root=tmp_path, paths=[tmp_path], enabled_domains=[]
+        )
+        plugins = {"ruff": make(), "eslint": make(), "biome": make()}
+
+        with (
+            patch(
+                "lucidshark.plugins.linters.discover_linter_plugins",
+                return_value=plugins,
+            ),
+            patch(
+                "lucidshark.core.domain_runner.filter_plugins_by_config",
+                return_value=plugins,
+            ),
+        ):
+            runner.run_linting(context, fix=True)
+
+        assert max_active == 1
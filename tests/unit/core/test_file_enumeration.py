@@ -0,0 +1,114 @@
+"""Tests for project file enumeration."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from lucidshark.core.file_enumeration import FileEnumerator, compile_patterns
+
+
+def _make_tree(root: Path) -> None:
+    for rel in [
+        "src/app.py",
+        "src/util.js",
+        "src/notes.txt",
+        "node_modules/lib/index.js",
+        "generated/out.py",
+        ".git/hooks/pre-commit.py",
+    ]:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+
+def _names(root: Path, files: List[Path]) -> List[str]:
+    return sorted(f.relative_to(root).as_posix() for f in files)
+
+
+class TestWalk:
+    def test_filters_extensions_and_patterns(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        enumerator = FileEnumerator(tmp_path, ["generated/"])
+
+        files = enumerator.walk({".py", ".js"})
+
+        assert _names(tmp_path, files) == ["src/app.py", "src/util.js"]
+
+    def test_excluded_directories_are_not_listed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _make_tree(tmp_path)
+        listed: List[str] = []
+        real_scandir = os.scandir
+
+        def spy(path):
+            listed.append(Path(path).relative_to(tmp_path).as_posix())
+            return real_scandir(path)
+
+        monkeypatch.setattr(
+            "lucidshark.core.file_enumeration.os.scandir", spy, raising=True
+        )
+        FileEnumerator(tmp_path, ["generated/"]).walk()
+
+        assert sorted(listed) == [".", "src"]
+
+    def test_negated_pattern_disables_pruning(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        enumerator = FileEnumerator(tmp_path, ["generated/*", "!generated/out.py"])
+
+        files = enumerator.walk({".py"})
+
+        assert _names(tmp_path, files) == ["generated/out.py", "src/app.py"]
+
+    def test_skip_dirs_and_hidden_dirs(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        (tmp_path / ".tox").mkdir()
+        (tmp_path / ".tox" / "env.py").write_text("x = 1\n")
+        enumerator = FileEnumerator(
+            tmp_path,
+            include_defaults=False,
+            skip_dirs={"node_modules"},
+            skip_hidden_dirs=True,
+        )
+
+        files = enumerator.walk({".py", ".js"})
+
+        assert _names(tmp_path, files) == [
+            "generated/out.py",
+            "src/app.py",
+            "src/util.js",
+        ]
+
+    def test_walk_from_subdirectory(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        enumerator = FileEnumerator(tmp_path, ["src/*.js"])
+
+        files = enumerator.walk(start=tmp_path / "src")
+
+        assert _names(tmp_path, files) == ["src/app.py", "src/notes.txt"]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitFiles:
+    def test_lists_tracked_and_untracked_files(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        shutil.rmtree(tmp_path / ".git")
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        (tmp_path / ".gitignore").write_text("*.txt\n")
+
+        files = FileEnumerator(tmp_path, ["generated/"]).files({".py", ".js"})
+
+        assert _names(tmp_path, files) == ["src/app.py", "src/util.js"]
+
+    def test_not_a_repository(self, tmp_path: Path) -> None:
+        assert FileEnumerator(tmp_path).git_files() is None
+
+
+def test_compiled_patterns_are_reused() -> None:
+    assert compile_patterns(("a/", "*.log")) is compile_patterns(("a/", "*.log"))
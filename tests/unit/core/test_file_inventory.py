@@ -0,0 +1,149 @@
+"""Tests for the project-wide file inventory."""
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from unittest.mock import patch
+
+from lucidshark.config.ignore import IgnorePatterns
+from lucidshark.core.file_enumeration import FileEnumerator
+from lucidshark.core.file_inventory import FileInventory
+from lucidshark.core.models import ScanContext
+
+
+def _make_tree(root: Path) -> None:
+    for rel in [
+        "src/app.py",
+        "src/lib/util.py",
+        "src/main.cpp",
+        "src/main.h",
+        "tests/test_app.py",
+        "node_modules/pkg/index.js",
+        ".tox/env/site.py",
+        "generated/out.py",
+    ]:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+
+def _names(root: Path, files) -> list:
+    return sorted(Path(f).relative_to(root).as_posix() for f in files)
+
+
+class TestFileInventory:
+    def test_indexed_by_extension_and_language(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        inventory = FileInventory(tmp_path, IgnorePatterns(["generated/"]))
+
+        assert _names(tmp_path, inventory.with_extensions({".PY"})) == [
+            ".tox/env/site.py",
+            "src/app.py",
+            "src/lib/util.py",
+            "tests/test_app.py",
+        ]
+        assert _names(tmp_path, inventory.for_language("c++")) == ["src/main.cpp"]
+        assert inventory.count_by_extension() == {
+            ".py": 4,
+            ".cpp": 1,
+            ".h": 1,
+            ".js": 1,
+        }
+
+    def test_only_ignore_patterns_prune_the_walk(self, tmp_path: Path) -> None:
+        # Source packages may share names with vendor or build directories
+        for rel in ["src/env/settings.py", "build/gen.py", "lib/build/rules.py"]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n")
+        inventory = FileInventory(tmp_path, IgnorePatterns(["/build/"]))
+
+        assert _names(tmp_path, inventory.with_extensions({".py"})) == [
+            "lib/build/rules.py",
+            "src/env/settings.py",
+        ]
+
+    def test_under_selects_directories_and_files(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        inventory = FileInventory(tmp_path)
+
+        files = inventory.under(
+            [tmp_path / "src" / "lib", tmp_path / "tests" / "test_app.py"],
+            {".py"},
+        )
+
+        assert _names(tmp_path, files) == ["src/lib/util.py", "tests/test_app.py"]
+
+    def test_under_drops_ignored_and_missing_files(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        inventory = FileInventory(tmp_path, IgnorePatterns(["generated/"]))
+
+        files = inventory.under(
+            [
+                tmp_path / "generated" / "out.py",
+                tmp_path / "src" / "missing.py",
+                tmp_path / "src" / "app.py",
+            ],
+            {".py"},
+        )
+
+        assert _names(tmp_path, files) == ["src/app.py"]
+
+    def test_walks_once(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        inventory = FileInventory(tmp_path)
+
+        with patch.object(
+            FileEnumerator, "walk", autospec=True, side_effect=FileEnumerator.walk
+        ) as walk:
+            inventory.with_extensions({".py"})
+            inventory.for_language("c")
+            inventory.files()
+
+        assert walk.call_count == 1
+
+
+class TestScanContextInventory:
+    def test_shared_with_shallow_copies(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        context = ScanContext(project_root=tmp_path, paths=[], enabled_domains=[])
+
+        clone = copy.copy(context)
+
+        assert clone.get_file_inventory() is context.get_file_inventory()
+
+    def test_rebuilt_when_ignore_patterns_change(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        context = ScanContext(project_root=tmp_path, paths=[], enabled_domains=[])
+        assert "generated/out.py" in _names(tmp_path, context.find_files({".py"}))
+
+        context.ignore_patterns = IgnorePatterns(["generated/"])
+
+        assert "generated/out.py" not in _names(tmp_path, context.find_files({".py"}))
+
+    def test_equal_ignore_patterns_share_an_inventory(self, tmp_path: Path) -> None:
+        context = ScanContext(
+            project_root=tmp_path,
+            paths=[],
+            enabled_domains=[],
+            ignore_patterns=IgnorePatterns(["generated/"]),
+        )
+        first = context.get_file_inventory()
+
+        context.ignore_patterns = IgnorePatterns(["generated/"])
+        assert context.get_file_inventory() is first
+        context.ignore_patterns = None
+        other = context.get_file_inventory()
+        assert other is not first
+
+        context.ignore_patterns = IgnorePatterns(["generated/"])
+        assert context.get_file_inventory() is first
+
+    def test_find_files_defaults_to_scan_paths(self, tmp_path: Path) -> None:
+        _make_tree(tmp_path)
+        context = ScanContext(
+            project_root=tmp_path, paths=[tmp_path / "tests"], enabled_domains=[]
+        )
+
+        assert _names(tmp_path, context.find_files({".py"})) == ["tests/test_app.py"]
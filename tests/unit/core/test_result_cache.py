@@ -0,0 +1,298 @@
+"""Tests for the linter/type checker result cache."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pytest
+
+from lucidshark.config.ignore import IgnorePatterns
+from lucidshark.config.models import LucidSharkConfig
+from lucidshark.core.models import (
+    ScanContext,
+    Severity,
+    SkipReason,
+    ToolDomain,
+    UnifiedIssue,
+)
+from lucidshark.core.result_cache import (
+    ResultCache,
+    compute_fingerprint,
+    expand_files,
+    issue_from_dict,
+    issue_to_dict,
+    run_cached,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_home(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("LUCIDSHARK_HOME", raising=False)
+
+
+def _context(root: Path, paths: Optional[List[Path]] = None) -> ScanContext:
+    return ScanContext(
+        project_root=root,
+        paths=paths if paths is not None else [root],
+        enabled_domains=[ToolDomain.LINTING],
+        config=LucidSharkConfig(),
+    )
+
+
+def _issue(path: Path, rule: str = "E1") -> UnifiedIssue:
+    return UnifiedIssue(
+        id=f"{path.name}-{rule}",
+        domain=ToolDomain.LINTING,
+        source_tool="fake",
+        severity=Severity.MEDIUM,
+        rule_id=rule,
+        title=f"{rule} in {path.name}",
+        description="Test issue",
+        file_path=path,
+        line_start=1,
+    )
+
+
+class FakeLinter:
+    """Minimal linter reporting one issue per file it is given."""
+
+    name = "fake"
+    cache_extensions: Tuple[str, ...] = (".py",)
+    cache_config_files: Tuple[str, ...] = ("fake.toml",)
+
+    def __init__(self, version: str = "1.0") -> None:
+        self.version = version
+        self.calls: List[List[Path]] = []
+
+    def get_version(self) -> str:
+        return self.version
+
+    def lint(self, context: ScanContext) -> List[UnifiedIssue]:
+        files = expand_files(context, self.cache_extensions)
+        self.calls.append(files)
+        return [_issue(f) for f in files]
+
+
+class TestIssueSerialization:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        issue = _issue(tmp_path / "src" / "a.py")
+        issue.metadata = {"noqa_row": 3}
+
+        data = issue_to_dict(issue, tmp_path)
+        restored = issue_from_dict(data, tmp_path)
+
+        assert data["file_path"] == "src/a.py"
+        assert restored == issue
+
+    def test_metadata_types_survive_json(self, tmp_path: Path) -> None:
+        issue = _issue(tmp_path / "a.py")
+        issue.metadata = {
+            "span": (3, 7),
+            "related": [tmp_path / "b.py"],
+            "nested": {"ok": True, "score": 0.5, "items": [1, None]},
+        }
+
+        data = json.loads(json.dumps(issue_to_dict(issue, tmp_path)))
+
+        assert issue_from_dict(data, tmp_path) == issue
+
+    def test_unsupported_metadata_is_not_cached(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.py"
+        a.write_text("a = 1\n")
+        issue = _issue(a)
+        issue.metadata = {"rules": {"E501"}}
+
+        cache = ResultCache(tmp_path, "fake", "fp")
+        cache.store([a], [issue])
+        cache.save()
+
+        _, misses = ResultCache(tmp_path, "fake", "fp").lookup([a])
+        assert misses == [a]
+
+
+class TestExpandFiles:
+    def test_walks_directories_and_skips_ignored(self, tmp_path: Path) -> None:
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "a.py").write_text("a = 1\n")
+        (tmp_path / "pkg" / "b.txt").write_text("text\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "c.py").write_text("c = 1\n")
+        (tmp_path / "gen").mkdir()
+        (tmp_path / "gen" / "d.py").write_text("d = 1\n")
+        context = _context(tmp_path)
+        context.ignore_patterns = IgnorePatterns(["gen/"])
+
+        files = expand_files(context, (".py",))
+
+        assert files == [(tmp_path / "pkg" / "a.py").resolve()]
+
+
+class TestResultCache:
+    def test_fingerprint_changes_with_config_file(self, tmp_path: Path) -> None:
+        context = _context(tmp_path)
+        before = compute_fingerprint("fake", "1.0", context, "linting", ("fake.toml",))
+        (tmp_path / "fake.toml").write_text("line-length = 100\n")
+        after = compute_fingerprint("fake", "1.0", context, "linting", ("fake.toml",))
+
+        assert before != after
+
+    def test_lookup_and_store(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("a = 1\n")
+        b.write_text("b = 1\n")
+
+        cache = ResultCache(tmp_path, "fake", "fp")
+        cache.store([a, b], [_issue(a)])
+        cache.save()
+
+        reloaded = ResultCache(tmp_path, "fake", "fp")
+        b.write_text("b = 2\n")
+        issues, misses = reloaded.lookup([a, b])
+
+        assert [i.file_path for i in issues] == [a]
+        assert misses == [b]
+
+    def test_fingerprint_mismatch_discards_entries(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.py"
+        a.write_text("a = 1\n")
+        cache = ResultCache(tmp_path, "fake", "fp-1")
+        cache.store([a], [])
+        cache.save()
+
+        _, misses = ResultCache(tmp_path, "fake", "fp-2").lookup([a])
+
+        assert misses == [a]
+
+
+class TestRunCached:
+    def test_only_changed_files_are_relinted(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("a = 1\n")
+        b.write_text("b = 1\n")
+        linter = FakeLinter()
+
+        first = run_cached(linter, _context(tmp_path), "linting", linter.lint)
+        b.write_text("b = 2\n")
+        second = run_cached(linter, _context(tmp_path), "linting", linter.lint)
+        third = run_cached(linter, _context(tmp_path), "linting", linter.lint)
+
+        assert len(first) == len(second) == len(third) == 2
+        assert linter.calls == [[a.resolve(), b.resolve()], [b.resolve()]]
+        assert (tmp_path / ".lucidshark" / "cache" / "results" / "fake.json").exists()
+
+    def test_version_change_invalidates(self, tmp_path: Path) -> None:
+        (tmp_path / "a.py").write_text("a = 1\n")
+        linter = FakeLinter()
+        run_cached(linter, _context(tmp_path), "linting", linter.lint)
+
+        linter.version = "2.0"
+        run_cached(linter, _context(tmp_path), "linting", linter.lint)
+
+        assert len(linter.calls) == 2
+
+    def test_unknown_version_bypasses_cache(self, tmp_path: Path) -> None:
+        (tmp_path / "a.py").write_text("a = 1\n")
+        linter = FakeLinter(version="unknown")
+
+        run_cached(linter, _context(tmp_path), "linting", linter.lint)
+        run_cached(linter, _context(tmp_path), "linting", linter.lint)
+
+        assert len(linter.calls) == 2
+        assert not (tmp_path / ".lucidshark").exists()
+
+    def test_failed_run_is_not_cached(self, tmp_path: Path) -> None:
+        (tmp_path / "a.py").write_text("a = 1\n")
+        linter = FakeLinter()
+        calls = []
+
+        def failing(context: ScanContext) -> List[UnifiedIssue]:
+            calls.append(context)
+            context.record_skip(
+                "fake", ToolDomain.LINTING, SkipReason.EXECUTION_FAILED, "timed out"
+            )
+            return []
+
+        run_cached(linter, _context(tmp_path), "linting", failing)
+        run_cached(linter, _context(tmp_path), "linting", failing)
+
+        assert len(calls) == 2
+
+    def test_project_scope_reruns_on_any_change(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.py"
+        (tmp_path / "b.py").write_text("b = 1\n")
+        a.write_text("a = 1\n")
+        linter = FakeLinter()
+        # Type checkers are asked about one file but read the whole project
+        context = _context(tmp_path, [tmp_path / "b.py"])
+
+        run_cached(linter, context, "type_checking", linter.lint, per_file=False)
+        cached = run_cached(
+            linter,
+            _context(tmp_path, [tmp_path / "b.py"]),
+            "type_checking",
+            linter.lint,
+            per_file=False,
+        )
+        a.write_text("a = 2\n")
+        run_cached(
+            linter,
+            _context(tmp_path, [tmp_path / "b.py"]),
+            "type_checking",
+            linter.lint,
+            per_file=False,
+        )
+
+        assert len(cached) == 1
+        assert len(linter.calls) == 2
+
+    def test_environment_change_invalidates(self, tmp_path: Path) -> None:
+        (tmp_path / "a.py").write_text("a = 1\n")
+        site_packages = tmp_path / "env" / "site-packages"
+        site_packages.mkdir(parents=True)
+        linter = FakeLinter()
+        linter.cache_environment = lambda context: [site_packages]  # type: ignore[attr-defined]
+
+        def check() -> None:
+            run_cached(
+                linter,
+                _context(tmp_path, [tmp_path / "a.py"]),
+                "type_checking",
+                linter.lint,
+                per_file=False,
+            )
+
+        check()
+        check()
+        # A package is installed without touching any lockfile
+        (site_packages / "typed_pkg").mkdir()
+        check()
+
+        assert len(linter.calls) == 2
+
+    def test_project_config_change_invalidates(self, tmp_path: Path) -> None:
+        (tmp_path / "a.py").write_text("a = 1\n")
+        nested = tmp_path / "pkg" / "fake.toml"
+        nested.parent.mkdir()
+        nested.write_text("strict = false\n")
+        linter = FakeLinter()
+        linter.cache_config_paths = lambda context: [nested]  # type: ignore[attr-defined]
+
+        def check() -> None:
+            run_cached(
+                linter,
+                _context(tmp_path, [tmp_path / "a.py"]),
+                "type_checking",
+                linter.lint,
+                per_file=False,
+            )
+
+        check()
+        check()
+        nested.write_text("strict = true\n")
+        check()
+
+        assert len(linter.calls) == 2
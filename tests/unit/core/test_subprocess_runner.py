@@ -0,0 +1,59 @@
+"""Tests for the subprocess runner."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from lucidshark.core.streaming import (
+    CallbackStreamHandler,
+    StreamEvent,
+    StreamType,
+)
+from lucidshark.core.subprocess_runner import merge_env, run_with_streaming
+
+PRINT_VAR = [sys.executable, "-c", "import os; print(os.environ.get('LS_TEST_VAR'))"]
+
+
+@pytest.fixture(autouse=True)
+def _unset_test_var(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("LS_TEST_VAR", raising=False)
+
+
+class TestEnvOverlay:
+    def test_overlay_reaches_child(self, tmp_path: Path) -> None:
+        result = run_with_streaming(
+            PRINT_VAR, tmp_path, "probe", env={"LS_TEST_VAR": "set"}
+        )
+
+        assert result.stdout.strip() == "set"
+        assert "LS_TEST_VAR" not in os.environ
+
+    def test_overlay_with_streaming(self, tmp_path: Path) -> None:
+        events: List[StreamEvent] = []
+        result = run_with_streaming(
+            PRINT_VAR,
+            tmp_path,
+            "probe",
+            stream_handler=CallbackStreamHandler(on_event=events.append),
+            env={"LS_TEST_VAR": "streamed"},
+        )
+
+        assert result.stdout.strip() == "streamed"
+        assert [e.content for e in events if e.stream_type == StreamType.STDOUT] == [
+            "streamed"
+        ]
+        assert "LS_TEST_VAR" not in os.environ
+
+
+def test_merge_env() -> None:
+    assert merge_env(None) is None
+    assert merge_env({}) is None
+    merged = merge_env({"LS_TEST_VAR": "x"})
+    assert merged is not None
+    assert merged["LS_TEST_VAR"] == "x"
+    assert merged["PATH"] == os.environ["PATH"]
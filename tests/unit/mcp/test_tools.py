@@ -170,6 +170,14 @@ class TestMCPToolExecutor:
         assert len(context.paths) == 1
         assert context.paths[0] == project_root
 
+    def test_build_context_allows_persistent_tools(
+        self, executor: MCPToolExecutor
+    ) -> None:
+        """Test that plugins may keep tool daemons running between scans."""
+        context = executor._build_context([ToolDomain.TYPE_CHECKING])
+
+        assert context.persistent_tools is True
+
     def test_issue_cache(self, executor: MCPToolExecutor) -> None:
         """Test that issues are cached for later retrieval."""
         issue = UnifiedIssue(
@@ -0,0 +1,202 @@
+"""Tests for dependency-aware domain scheduling."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import List
+
+import pytest
+
+from lucidshark.core.models import Severity, ToolDomain, UnifiedIssue
+from lucidshark.pipeline.scheduler import DomainScheduler, domain_dependencies
+
+
+def _issue(name: str) -> UnifiedIssue:
+    return UnifiedIssue(
+        id=f"{name}-1",
+        domain=ToolDomain.LINTING,
+        source_tool=name,
+        severity=Severity.LOW,
+        rule_id="R1",
+        title=f"Issue from {name}",
+        description="Test issue",
+    )
+
+
+class TestDomainDependencies:
+    """Tests for the domain dependency model."""
+
+    def test_coverage_depends_on_testing(self) -> None:
+        assert domain_dependencies("coverage") == ["testing"]
+
+    def test_formatting_depends_on_linting_only_with_fix(self) -> None:
+        assert domain_dependencies("formatting", fix=True) == ["linting"]
+        assert domain_dependencies("formatting", fix=False) == []
+
+    def test_testing_depends_on_type_checking(self) -> None:
+        assert domain_dependencies("testing") == ["type_checking"]
+        assert domain_dependencies("testing", fix=True) == [
+            "type_checking",
+            "linting",
+            "formatting",
+        ]
+
+    @pytest.mark.parametrize(
+        "domain", ["linting", "type_checking", "duplication", "security"]
+    )
+    def test_independent_domains(self, domain: str) -> None:
+        assert domain_dependencies(domain) == []
+
+    @pytest.mark.parametrize("domain", ["type_checking", "duplication", "security"])
+    def test_fix_mode_waits_for_rewriting_domains(self, domain: str) -> None:
+        assert domain_dependencies(domain, fix=True) == ["linting", "formatting"]
+
+    def test_fix_mode_coverage(self) -> None:
+        assert domain_dependencies("coverage", fix=True) == [
+            "testing",
+            "linting",
+            "formatting",
+        ]
+
+
+class TestDomainScheduler:
+    """Tests for DomainScheduler."""
+
+    def test_empty_scheduler(self) -> None:
+        assert DomainScheduler().execute() == {}
+
+    def test_duplicate_task_rejected(self) -> None:
+        scheduler = DomainScheduler()
+        scheduler.add("linting", lambda: [])
+        with pytest.raises(ValueError, match="already registered"):
+            scheduler.add("linting", lambda: [])
+
+    def test_results_in_registration_order(self) -> None:
+        scheduler = DomainScheduler(max_workers=4)
+        scheduler.add("slow", lambda: (time.sleep(0.05), [_issue("slow")])[1])
+        scheduler.add("fast", lambda: [_issue("fast")])
+
+        results = scheduler.execute()
+
+        assert list(results) == ["slow", "fast"]
+        assert results["slow"][0].source_tool == "slow"
+
+    def test_independent_tasks_run_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        def task() -> List[UnifiedIssue]:
+            # Deadlocks (and times out) unless both tasks run at once
+            barrier.wait()
+            return []
+
+        scheduler = DomainScheduler(max_workers=2)
+        scheduler.add("linting", task)
+        scheduler.add("type_checking", task)
+
+        assert scheduler.execute() == {"linting": [], "type_checking": []}
+
+    def test_dependency_runs_first(self) -> None:
+        order: List[str] = []
+
+        def testing() -> List[UnifiedIssue]:
+            time.sleep(0.05)
+            order.append("testing")
+            return []
+
+        def coverage() -> List[UnifiedIssue]:
+            order.append("coverage")
+            return []
+
+        scheduler = DomainScheduler(max_workers=4)
+        scheduler.add("coverage", coverage, depends_on=["testing"])
+        scheduler.add("testing", testing)
+        scheduler.execute()
+
+        assert order == ["testing", "coverage"]
+
+    def test_fix_mode_readers_start_after_rewriters(self) -> None:
+        events: List[str] = []
+        lock = threading.Lock()
+
+        def task(name: str, duration: float = 0.0):
+            def run() -> List[UnifiedIssue]:
+                with lock:
+                    events.append(f"{name}:start")
+                time.sleep(duration)
+                with lock:
+                    events.append(f"{name}:end")
+                return []
+
+            return run
+
+        scheduler = DomainScheduler(max_workers=4)
+        for name, duration in [
+            ("linting", 0.05),
+            ("formatting", 0.05),
+            ("type_checking", 0.0),
+            ("security", 0.0),
+        ]:
+            scheduler.add(
+                name, task(name, duration), domain_dependencies(name, fix=True)
+            )
+        scheduler.execute()
+
+        rewrites_done = max(events.index("linting:end"), events.index("formatting:end"))
+        assert events.index("formatting:start") > events.index("linting:end")
+        assert events.index("type_checking:start") > rewrites_done
+        assert events.index("security:start") > rewrites_done
+
+    def test_unregistered_dependency_ignored(self) -> None:
+        scheduler = DomainScheduler()
+        scheduler.add("formatting", lambda: [], depends_on=["linting"])
+
+        assert scheduler.execute() == {"formatting": []}
+
+    def test_cycle_detected(self) -> None:
+        scheduler = DomainScheduler()
+        scheduler.add("a", lambda: [], depends_on=["b"])
+        scheduler.add("b", lambda: [], depends_on=["a"])
+
+        with pytest.raises(ValueError, match="cycle"):
+            scheduler.execute()
+
+    def test_sequential_mode_respects_dependencies(self) -> None:
+        order: List[str] = []
+
+        def make(name: str):
+            return lambda: order.append(name) or []
+
+        scheduler = DomainScheduler(sequential=True)
+        scheduler.add("coverage", make("coverage"), depends_on=["testing"])
+        scheduler.add("linting", make("linting"))
+        scheduler.add("testing", make("testing"))
+        scheduler.execute()
+
+        assert order == ["linting", "testing", "coverage"]
+
+    def test_failure_propagates_and_skips_dependents(self) -> None:
+        ran: List[str] = []
+
+        def failing() -> List[UnifiedIssue]:
+            raise RuntimeError("tests exploded")
+
+        def coverage() -> List[UnifiedIssue]:
+            ran.append("coverage")
+            return []
+
+        scheduler = DomainScheduler(max_workers=4)
+        scheduler.add("testing", failing)
+        scheduler.add("coverage", coverage, depends_on=["testing"])
+        scheduler.add("linting", lambda: ran.append("linting") or [])
+
+        with pytest.raises(RuntimeError, match="tests exploded"):
+            scheduler.execute()
+        assert "coverage" not in ran
+
+    def test_none_result_normalized(self) -> None:
+        scheduler = DomainScheduler(max_workers=2)
+        scheduler.add("a", lambda: None)  # type: ignore[arg-type,return-value]
+        scheduler.add("b", lambda: [])
+
+        assert scheduler.execute() == {"a": [], "b": []}
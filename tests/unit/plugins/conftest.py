@@ -0,0 +1,19 @@
+"""Shared fixtures for plugin unit tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def scan_context() -> Callable[..., MagicMock]:
+    """Factory for scan contexts limited to the given paths."""
+
+    def make(root: Path, paths, all_files: bool = False) -> MagicMock:
+        return MagicMock(project_root=root, paths=paths, all_files=all_files)
+
+    return make
@@ -0,0 +1,333 @@
+"""Unit tests for the native coverage.py data reader."""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import Dict, Iterable
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lucidshark.plugins.coverage.coverage_py import CoveragePyPlugin
+from lucidshark.plugins.coverage.coverage_py_data import (
+    DEFAULT_EXCLUDE,
+    NativeReportUnavailable,
+    analyze_python_source,
+    environment_python_version,
+    load_exclude_regex,
+    python_version_matches,
+    read_executed_lines,
+    read_python_source,
+)
+
+DEFAULT_REGEX = "|".join(f"(?:{regex})" for regex in DEFAULT_EXCLUDE)
+
+
+def _numbits(lines: Iterable[int]) -> bytes:
+    value = sum(1 << line for line in set(lines))
+    return value.to_bytes((value.bit_length() + 7) // 8, "little")
+
+
+def write_coverage_data(
+    path: Path,
+    lines: Dict[str, Dict[str, Iterable[int]]],
+    has_arcs: bool = False,
+    tracer: str = "",
+    version: str = "7.16.2",
+) -> None:
+    """Write a coverage.py (schema 7) data file.
+
+    Args:
+        path: Data file to create.
+        lines: Executed lines per context per file path.
+        has_arcs: Mark the data as branch coverage.
+        tracer: File tracer plugin recorded for every file.
+        version: coverage.py version recorded in the metadata.
+    """
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        """
+        CREATE TABLE coverage_schema (version INTEGER);
+        CREATE TABLE meta (key TEXT, value TEXT, UNIQUE (key));
+        CREATE TABLE file (id INTEGER PRIMARY KEY, path TEXT, UNIQUE (path));
+        CREATE TABLE context (id INTEGER PRIMARY KEY, context TEXT);
+        CREATE TABLE line_bits (file_id INTEGER, context_id INTEGER, numbits BLOB);
+        CREATE TABLE arc (
+            file_id INTEGER, context_id INTEGER, fromno INTEGER, tono INTEGER
+        );
+        CREATE TABLE tracer (file_id INTEGER PRIMARY KEY, tracer TEXT);
+        INSERT INTO coverage_schema VALUES (7);
+        """
+    )
+    connection.execute(
+        "INSERT INTO meta VALUES ('has_arcs', ?)", ("1" if has_arcs else "0",)
+    )
+    connection.execute("INSERT INTO meta VALUES ('version', ?)", (version,))
+    contexts: Dict[str, int] = {}
+    for file_id, (file_path, per_context) in enumerate(lines.items(), start=1):
+        connection.execute("INSERT INTO file VALUES (?, ?)", (file_id, file_path))
+        if tracer:
+            connection.execute("INSERT INTO tracer VALUES (?, ?)", (file_id, tracer))
+        for context_name, context_lines in per_context.items():
+            context_id = contexts.setdefault(context_name, len(contexts) + 1)
+            connection.execute(
+                "INSERT OR IGNORE INTO context VALUES (?, ?)",
+                (context_id, context_name),
+            )
+            connection.execute(
+                "INSERT INTO line_bits VALUES (?, ?, ?)",
+                (file_id, context_id, _numbits(context_lines)),
+            )
+    connection.commit()
+    connection.close()
+
+
+class TestReadExecutedLines:
+    def test_merges_contexts(self, tmp_path: Path) -> None:
+        data_file = tmp_path / ".coverage"
+        write_coverage_data(
+            data_file,
+            {
+                "/p/a.py": {"": [1, 2, 9], "t::a": [2, 300]},
+                "/p/unexecuted.py": {},
+            },
+        )
+
+        assert read_executed_lines(data_file) == {
+            "/p/a.py": [1, 2, 9, 300],
+            "/p/unexecuted.py": [],
+        }
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"has_arcs": True},
+            {"tracer": "Cython.Coverage.Plugin"},
+            # Older analysis and default exclusions; unknown future releases
+            {"version": "7.6.1"},
+            {"version": "6.5.0"},
+            {"version": "8.0.0"},
+            {"version": ""},
+        ],
+    )
+    def test_unsupported_data(self, tmp_path: Path, kwargs) -> None:
+        data_file = tmp_path / ".coverage"
+        write_coverage_data(data_file, {"/p/a.py": {"": [1]}}, **kwargs)
+
+        with pytest.raises(NativeReportUnavailable):
+            read_executed_lines(data_file)
+
+    def test_not_a_database(self, tmp_path: Path) -> None:
+        data_file = tmp_path / ".coverage"
+        data_file.write_text("!coverage.py: This is a private format")
+
+        with pytest.raises(NativeReportUnavailable):
+            read_executed_lines(data_file)
+
+
+class TestAnalyzePythonSource:
+    def test_multiline_statements_and_docstrings(self) -> None:
+        source = dedent(
+            '''\
+            """Module docstring."""
+
+            VALUE = {
+                "a": 1,
+            }
+
+
+            def func(
+                arg,
+            ):
+                """Function docstring."""
+                return arg
+            '''
+        )
+
+        analysis = analyze_python_source(source, DEFAULT_REGEX)
+
+        assert analysis.statements == {3, 8, 12}
+        assert analysis.executed([3, 4, 5, 99]) == {3}
+
+    def test_excluded_blocks(self) -> None:
+        source = dedent(
+            """\
+            from typing import TYPE_CHECKING
+
+            if TYPE_CHECKING:
+                import os
+
+            def used():
+                return 1
+
+            @decorator
+            def unused():  # pragma: no cover
+                return 2
+
+            class Base:
+                def method(self) -> int: ...
+            """
+        )
+
+        analysis = analyze_python_source(source, DEFAULT_REGEX)
+
+        assert analysis.statements == {1, 6, 7, 13}
+        assert analysis.excluded == {3, 4, 9, 10, 11, 14, 15}
+
+    def test_no_exclusions(self) -> None:
+        analysis = analyze_python_source("x = 1  # pragma: no cover\n", "")
+
+        assert analysis.statements == {1}
+        assert analysis.excluded == set()
+
+    def test_syntax_error(self) -> None:
+        with pytest.raises(SyntaxError):
+            analyze_python_source("def broken(:\n", DEFAULT_REGEX)
+
+    def test_reads_source_like_coverage(self, tmp_path: Path) -> None:
+        source = tmp_path / "mod.py"
+        source.write_bytes(b"# -*- coding: latin-1 -*-\r\nname = '\xe9'\r\nx = 1")
+
+        assert read_python_source(source) == (
+            "# -*- coding: latin-1 -*-\nname = '\u00e9'\nx = 1\n"
+        )
+
+
+class TestLoadExcludeRegex:
+    def test_defaults(self, tmp_path: Path) -> None:
+        assert load_exclude_regex(tmp_path) == DEFAULT_REGEX
+
+    def test_coveragerc_replaces_defaults(self, tmp_path: Path) -> None:
+        (tmp_path / ".coveragerc").write_text(
+            "[report]\nexclude_lines =\n    no cover\n"
+        )
+
+        assert load_exclude_regex(tmp_path) == "no cover"
+
+    def test_pyproject_exclude_also(self, tmp_path: Path) -> None:
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.coverage.report]\nexclude_also = ["def __repr__"]\n'
+        )
+
+        assert load_exclude_regex(tmp_path).endswith("|(?:def __repr__)")
+
+    def test_setup_cfg_without_coverage_sections(self, tmp_path: Path) -> None:
+        (tmp_path / "setup.cfg").write_text("[report]\nexclude_lines = x\n")
+        (tmp_path / "tox.ini").write_text(
+            "[coverage:report]\nexclude_lines = from tox\n"
+        )
+
+        assert load_exclude_regex(tmp_path) == "from tox"
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            "[report]\nomit = tests/*\n",
+            "[run]\nplugins = Cython.Coverage\n",
+            "[report]\nexclude_lines = ${MARKER}\n",
+        ],
+    )
+    def test_unsupported_settings(self, tmp_path: Path, config: str) -> None:
+        (tmp_path / ".coveragerc").write_text(config)
+
+        with pytest.raises(NativeReportUnavailable):
+            load_exclude_regex(tmp_path)
+
+
+class TestPythonVersion:
+    def test_reads_pyvenv_cfg(self, tmp_path: Path) -> None:
+        (tmp_path / "bin").mkdir()
+        (tmp_path / "pyvenv.cfg").write_text("home = /usr/bin\nversion_info = 3.12.4\n")
+
+        assert environment_python_version(tmp_path / "bin" / "coverage") == (3, 12)
+
+    def test_reads_shebang(self, tmp_path: Path) -> None:
+        binary = tmp_path / "coverage"
+        binary.write_text("#!/usr/bin/python3.10\nimport coverage\n")
+
+        assert environment_python_version(binary) == (3, 10)
+
+    def test_unknown_version_is_unavailable(self, tmp_path: Path) -> None:
+        binary = tmp_path / "coverage"
+        binary.write_text("#!/usr/bin/env python3\n")
+
+        assert environment_python_version(binary) is None
+        with pytest.raises(NativeReportUnavailable):
+            python_version_matches(binary)
+
+
+class TestNativeReport:
+    def _project(self, tmp_path: Path) -> Path:
+        version = f"{sys.version_info[0]}.{sys.version_info[1]}.0"
+        (tmp_path / ".venv" / "bin").mkdir(parents=True)
+        (tmp_path / ".venv" / "pyvenv.cfg").write_text(f"version = {version}\n")
+        (tmp_path / ".venv" / "bin" / "coverage").touch()
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text(
+            "def f(x):\n    if x:\n        return 1\n    return 2\n"
+        )
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_app.py").write_text("def test_f():\n    pass\n")
+        write_coverage_data(
+            tmp_path / ".coverage",
+            {
+                str(tmp_path / "src" / "app.py"): {"": [1, 2, 3]},
+                str(tmp_path / "tests" / "test_app.py"): {"": [1, 2]},
+                str(tmp_path / "src" / "deleted.py"): {"": [1]},
+            },
+        )
+        return tmp_path
+
+    def _context(self, project_root: Path, ignore_patterns=None) -> MagicMock:
+        context = MagicMock()
+        context.project_root = project_root
+        context.ignore_patterns = ignore_patterns
+        return context
+
+    def test_measures_without_coverage_process(self, tmp_path: Path) -> None:
+        project_root = self._project(tmp_path)
+        plugin = CoveragePyPlugin(project_root=project_root)
+
+        with patch(
+            "lucidshark.plugins.coverage.coverage_py.run_with_streaming"
+        ) as mock_run:
+            result = plugin.measure_coverage(self._context(project_root), 80.0)
+
+        mock_run.assert_not_called()
+        assert (result.total_lines, result.covered_lines, result.missing_lines) == (
+            6,
+            5,
+            1,
+        )
+        assert result.files["src/app.py"].missing_lines == [4]
+        assert "src/deleted.py" not in result.files
+        assert result.issues == []
+
+    def test_ignore_patterns_limit_scope(self, tmp_path: Path) -> None:
+        project_root = self._project(tmp_path)
+        ignore_patterns = MagicMock()
+        ignore_patterns.matches.side_effect = lambda path, root: "tests" in path.parts
+        plugin = CoveragePyPlugin(project_root=project_root)
+
+        result = plugin.measure_coverage(
+            self._context(project_root, ignore_patterns), 80.0
+        )
+
+        assert list(result.files) == ["src/app.py"]
+        assert (result.total_lines, result.covered_lines) == (4, 3)
+        assert len(result.issues) == 1
+
+    def test_falls_back_to_coverage_json(self, tmp_path: Path) -> None:
+        project_root = self._project(tmp_path)
+        (project_root / ".coveragerc").write_text("[report]\nomit = tests/*\n")
+        plugin = CoveragePyPlugin(project_root=project_root)
+
+        with patch.object(plugin, "_generate_and_parse_report") as mock_report:
+            mock_report.return_value = MagicMock(total_lines=10, issues=[])
+            result = plugin.measure_coverage(self._context(project_root), 80.0)
+
+        mock_report.assert_called_once()
+        assert result is mock_report.return_value
@@ -0,0 +1,276 @@
+"""Tests for the incremental duplication index."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from lucidshark.core.models import ScanContext
+from lucidshark.plugins.duplication.base import DuplicationResult
+from lucidshark.plugins.duplication.duplo import DuploPlugin
+from lucidshark.plugins.duplication.index import (
+    DuplicationIndex,
+    assign_lines,
+    line_estimates,
+    strip_comments,
+    window_hashes,
+)
+
+BODY_A = "def a():\n    x = 1\n    y = 2\n    z = 3\n    return x + y + z\n"
+BODY_B = "def b():\n    p = 4\n    q = 5\n    r = 6\n    return p * q * r\n"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_home(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("LUCIDSHARK_HOME", raising=False)
+
+
+class FakeDuplo:
+    """Stand-in for the duplo binary.
+
+    Like Duplo, it removes comments and whitespace before comparing. It
+    reports one block for every pair of files with identical code and
+    counts lines with code, so its summary is additive per file.
+    """
+
+    def __init__(self) -> None:
+        self.file_lists: List[List[str]] = []
+
+    def __call__(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        files = Path(cmd[1]).read_text().splitlines()
+        self.file_lists.append(sorted(Path(f).name for f in files))
+        contents: Dict[str, List[str]] = {}
+        for f in files:
+            lines = ("".join(ln.split("#")[0].split()) for ln in open(f))
+            contents[f] = [ln for ln in lines if ln]
+        duplicates = []
+        for i, f1 in enumerate(files):
+            for f2 in files[i + 1 :]:
+                if contents[f1] == contents[f2]:
+                    n = len(contents[f1])
+                    duplicates.append(
+                        {
+                            "file1": {"path": f2, "start_line": 1, "end_line": n},
+                            "file2": {"path": f1, "start_line": 1, "end_line": n},
+                            "line_count": n,
+                            "lines": contents[f1],
+                        }
+                    )
+        output = {
+            "summary": {
+                "files_analyzed": len(files),
+                "total_lines": sum(len(c) for c in contents.values()),
+                "duplicate_blocks": len(duplicates),
+                "duplicate_lines": sum(d["line_count"] for d in duplicates),
+            },
+            "duplicates": duplicates,
+        }
+        return subprocess.CompletedProcess(cmd, 0, json.dumps(output), "")
+
+
+def _detect(root: Path, duplo: FakeDuplo) -> DuplicationResult:
+    plugin = DuploPlugin(project_root=root)
+    context = ScanContext(project_root=root, paths=[root], enabled_domains=[])
+    with patch.object(plugin, "ensure_binary", return_value=Path("/usr/bin/duplo")):
+        with patch(
+            "lucidshark.plugins.duplication.duplo.run_with_streaming", new=duplo
+        ):
+            return plugin.detect_duplication(context, use_git=False, use_cache=True)
+
+
+def _full_run(root: Path) -> DuplicationResult:
+    """Result of a run without any previous index."""
+    shutil.rmtree(root / ".lucidshark", ignore_errors=True)
+    return _detect(root, FakeDuplo())
+
+
+def _assert_same(result: DuplicationResult, expected: DuplicationResult) -> None:
+    assert result.to_dict() == expected.to_dict()
+    assert result.duplicates == expected.duplicates
+    assert [i.id for i in result.issues] == [i.id for i in expected.issues]
+
+
+class TestWindowHashes:
+    def test_whitespace_is_normalized(self) -> None:
+        indented = "\n".join("    " + ln for ln in BODY_A.splitlines())
+        assert window_hashes(BODY_A, 4, 3) == window_hashes(indented, 4, 3)
+
+    def test_short_lines_are_ignored(self) -> None:
+        padded = BODY_A.replace("\n", "\n}\n\n")
+        assert window_hashes(BODY_A, 4, 3) == window_hashes(padded, 4, 3)
+
+    def test_file_shorter_than_window(self) -> None:
+        assert window_hashes("x = 1\n", 4, 3) == set()
+
+    def test_comments_are_ignored(self) -> None:
+        commented = BODY_A.replace("\n", "  # note\n")
+        assert window_hashes(BODY_A, 4, 3, ".py") & window_hashes(
+            commented, 4, 3, ".py"
+        )
+
+    def test_strip_comments(self) -> None:
+        source = "int a; // one\nint b; /* two\nthree */ int c;\n/**/int d;\n"
+        assert strip_comments(source, ".c") == [
+            "int a; ",
+            "int b; ",
+            " int c;",
+            "int d;",
+        ]
+        assert strip_comments("x = 1  # y\n", ".txt") == ["x = 1  # y"]
+
+    def test_line_estimates(self) -> None:
+        assert line_estimates("a = 1\n\n# b\nc = 2  # d\n", ".py") == [4, 3, 2]
+
+
+class TestDuplicationIndex:
+    def test_refresh_reports_changed_and_deleted(self, tmp_path: Path) -> None:
+        a, b = tmp_path / "a.py", tmp_path / "b.py"
+        a.write_text(BODY_A)
+        b.write_text(BODY_B)
+        cache_dir = tmp_path / "cache"
+
+        index = DuplicationIndex(tmp_path, cache_dir, "fp")
+        first = index.refresh([a, b], 4, 3)
+        index.save()
+
+        a.write_text(BODY_B)
+        second = DuplicationIndex(tmp_path, cache_dir, "fp").refresh([a], 4, 3)
+
+        assert first.changed == ["a.py", "b.py"]
+        assert second.changed == ["a.py"]
+        assert second.deleted == ["b.py"]
+
+    def test_fingerprint_change_discards_index(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.py"
+        a.write_text(BODY_A)
+        index = DuplicationIndex(tmp_path, tmp_path / "cache", "fp-1")
+        index.refresh([a], 4, 3)
+        index.save()
+
+        update = DuplicationIndex(tmp_path, tmp_path / "cache", "fp-2").refresh(
+            [a], 4, 3
+        )
+
+        assert update.changed == ["a.py"]
+
+    def test_candidates_share_a_window(self, tmp_path: Path) -> None:
+        for name, body in [("a.py", BODY_A), ("b.py", BODY_A), ("c.py", BODY_B)]:
+            (tmp_path / name).write_text(body)
+        files = sorted(tmp_path.glob("*.py"))
+        index = DuplicationIndex(tmp_path, tmp_path / "cache", "fp")
+        index.refresh(files, 4, 3)
+        index.save()
+
+        (tmp_path / "a.py").write_text(BODY_A + "\n# trailing\n")
+        index = DuplicationIndex(tmp_path, tmp_path / "cache", "fp")
+        update = index.refresh(files, 4, 3)
+
+        assert index.candidates(update) == ["b.py"]
+
+    def test_assign_lines_rejects_ambiguous_estimates(self, tmp_path: Path) -> None:
+        (tmp_path / "a.py").write_text(BODY_A)
+        (tmp_path / "b.py").write_text(BODY_B)
+        index = DuplicationIndex(tmp_path, tmp_path / "cache", "fp")
+        index.refresh(sorted(tmp_path.glob("*.py")), 4, 3)
+        index.files["a.py"].estimates = [6, 5, 4]
+        index.files["b.py"].estimates = [4, 5, 4]
+
+        # Physical and non-blank lines both add up to 10, per file they differ
+        assert not assign_lines(index, ["a.py", "b.py"], 10)
+        assert index.files["a.py"].lines is None
+        assert assign_lines(index, ["a.py", "b.py"], 8)
+        assert index.files["a.py"].lines == 4
+
+
+class TestIncrementalDetection:
+    def _project(self, root: Path) -> None:
+        (root / "a.py").write_text(BODY_A)
+        (root / "b.py").write_text(BODY_A)
+        (root / "c.py").write_text(BODY_B)
+        (root / "d.py").write_text("print('unrelated code here')\n")
+
+    def test_unchanged_project_skips_duplo(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+        first = _detect(tmp_path, FakeDuplo())
+        duplo = FakeDuplo()
+
+        second = _detect(tmp_path, duplo)
+
+        assert duplo.file_lists == []
+        _assert_same(second, first)
+        assert second.duplicate_blocks == 1
+
+    def test_changed_file_matches_full_run(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+        _detect(tmp_path, FakeDuplo())
+
+        (tmp_path / "c.py").write_text(BODY_A)
+        duplo = FakeDuplo()
+        incremental = _detect(tmp_path, duplo)
+
+        # Only the changed file and the files sharing windows with it
+        assert duplo.file_lists[0] == ["a.py", "b.py", "c.py"]
+        assert incremental.duplicate_blocks == 3
+        _assert_same(incremental, _full_run(tmp_path))
+
+    def test_comment_only_difference_matches_full_run(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+        _detect(tmp_path, FakeDuplo())
+
+        (tmp_path / "c.py").write_text(BODY_A.replace("\n", "  # note\n"))
+        duplo = FakeDuplo()
+        incremental = _detect(tmp_path, duplo)
+
+        assert duplo.file_lists[0] == ["a.py", "b.py", "c.py"]
+        assert incremental.duplicate_blocks == 3
+        _assert_same(incremental, _full_run(tmp_path))
+
+    def test_several_changed_files_need_one_run(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+        _detect(tmp_path, FakeDuplo())
+
+        (tmp_path / "c.py").write_text(BODY_A)
+        (tmp_path / "d.py").write_text(BODY_B + "# more\nprint('more')\n")
+        duplo = FakeDuplo()
+        incremental = _detect(tmp_path, duplo)
+
+        # Line counts come from the estimates, no per-file measuring runs
+        assert duplo.file_lists == [["a.py", "b.py", "c.py", "d.py"]]
+        assert incremental.duplicate_blocks == 3
+        _assert_same(incremental, _full_run(tmp_path))
+
+    def test_deleted_file_matches_full_run(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+        _detect(tmp_path, FakeDuplo())
+
+        (tmp_path / "b.py").unlink()
+        duplo = FakeDuplo()
+        incremental = _detect(tmp_path, duplo)
+
+        assert duplo.file_lists == []
+        assert incremental.duplicate_blocks == 0
+        _assert_same(incremental, _full_run(tmp_path))
+
+    def test_non_additive_summary_disables_incremental(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+
+        class SkewedDuplo(FakeDuplo):
+            def __call__(self, cmd, **kwargs):
+                result = super().__call__(cmd, **kwargs)
+                data = json.loads(result.stdout)
+                data["summary"]["duplicate_lines"] += 1
+                result.stdout = json.dumps(data)
+                return result
+
+        _detect(tmp_path, SkewedDuplo())
+        (tmp_path / "c.py").write_text(BODY_A)
+        duplo = SkewedDuplo()
+        _detect(tmp_path, duplo)
+
+        assert duplo.file_lists[0] == ["a.py", "b.py", "c.py", "d.py"]
@@ -6,13 +6,17 @@ import json
 import subprocess
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import pytest
 
+from lucidshark.core.daemons import shutdown_daemons
 from lucidshark.core.models import ScanContext, Severity, ToolDomain
 from lucidshark.plugins.linters.biome import (
+    BiomeDaemon,
     BiomeLinter,
     SEVERITY_MAP,
+    get_biome_daemon,
 )
 
 _BIOME_BINARY = "biome"
@@ -661,3 +665,148 @@ class TestBiomeIssueIdGeneration:
         issue_id = linter._generate_issue_id("", "f.js", 1, 1, "msg")
         assert issue_id.startswith("biome-")
         assert "biome--" not in issue_id
+
+
+class TestBiomeDaemon:
+    """Tests for running Biome through its daemon in long-lived sessions."""
+
+    def _context(self, root: Path) -> ScanContext:
+        context = ScanContext(project_root=root, paths=[root], enabled_domains=[])
+        context.persistent_tools = True
+        return context
+
+    def test_persistent_session_uses_server(self, tmp_path: Path) -> None:
+        linter = BiomeLinter()
+        daemon = MagicMock()
+        daemon.ensure_running.return_value = True
+
+        with (
+            patch.object(linter, "ensure_binary", return_value=Path("/bin/biome")),
+            patch(
+                "lucidshark.plugins.linters.biome.get_biome_daemon",
+                return_value=daemon,
+            ),
+            patch(
+                "lucidshark.plugins.linters.biome.run_with_streaming",
+                return_value=make_completed_process(0, '{"diagnostics": []}'),
+            ) as server_run,
+            patch("lucidshark.plugins.linters.base.run_with_streaming") as plain_run,
+        ):
+            linter.lint(self._context(tmp_path))
+
+        plain_run.assert_not_called()
+        assert server_run.call_args.kwargs["cmd"][:3] == [
+            "/bin/biome",
+            "lint",
+            "--use-server",
+        ]
+
+    def test_unreachable_daemon_falls_back(self, tmp_path: Path) -> None:
+        linter = BiomeLinter()
+        daemon = MagicMock()
+        daemon.ensure_running.return_value = True
+
+        with (
+            patch.object(linter, "ensure_binary", return_value=Path("/bin/biome")),
+            patch(
+                "lucidshark.plugins.linters.biome.get_biome_daemon",
+                return_value=daemon,
+            ),
+            patch(
+                "lucidshark.plugins.linters.biome.run_with_streaming",
+                return_value=make_completed_process(1, "", "cannot connect"),
+            ),
+            patch(
+                "lucidshark.plugins.linters.base.run_with_streaming",
+                return_value=make_completed_process(0, '{"diagnostics": []}'),
+            ) as plain_run,
+        ):
+            linter.lint(self._context(tmp_path))
+
+        daemon.mark_failed.assert_called_once()
+        assert "--use-server" not in plain_run.call_args.kwargs["cmd"]
+
+    def test_config_change_does_not_restart(self, tmp_path: Path) -> None:
+        binary = tmp_path / "biome"
+        binary.touch()
+        daemon = BiomeDaemon(binary, tmp_path)
+
+        with (
+            patch.object(
+                daemon, "_command", return_value="The server was successfully started"
+            ) as command,
+            patch(
+                "lucidshark.plugins.linters.biome.get_cli_version",
+                return_value="1.9.4",
+            ),
+        ):
+            assert daemon.ensure_running()
+            # Biome reloads its configuration itself
+            (tmp_path / "biome.json").write_text("{}")
+            assert daemon.ensure_running()
+            shutdown_daemons()
+
+        assert [c.args[0] for c in command.call_args_list] == ["start", "stop"]
+
+    @pytest.mark.parametrize("change", ["version", "lockfile"])
+    def test_upgrade_restarts_owned_daemon(self, tmp_path: Path, change: str) -> None:
+        daemon = BiomeDaemon(tmp_path / "biome", tmp_path)
+        version = MagicMock(return_value="1.9.4")
+
+        with (
+            patch.object(
+                daemon, "_command", return_value="The server was successfully started"
+            ) as command,
+            patch("lucidshark.plugins.linters.biome.get_cli_version", version),
+        ):
+            assert daemon.ensure_running()
+            if change == "version":
+                version.return_value = "2.0.0"
+            else:
+                (tmp_path / "package-lock.json").write_text("{}")
+            assert daemon.ensure_running()
+            assert daemon.ensure_running()
+            shutdown_daemons()
+
+        assert [c.args[0] for c in command.call_args_list] == [
+            "start",
+            "stop",
+            "start",
+            "stop",
+        ]
+
+    def test_running_daemon_is_not_stopped(self, tmp_path: Path) -> None:
+        daemon = BiomeDaemon(tmp_path / "biome", tmp_path)
+        version = MagicMock(return_value="1.9.4")
+
+        with (
+            patch.object(
+                daemon, "_command", return_value="The server was already running"
+            ) as command,
+            patch("lucidshark.plugins.linters.biome.get_cli_version", version),
+        ):
+            assert daemon.ensure_running()
+            # Not restarted after an upgrade either: someone else owns it
+            version.return_value = "2.0.0"
+            assert daemon.ensure_running()
+            shutdown_daemons()
+            daemon.stop()
+
+        command.assert_called_once_with("start")
+
+    def test_handles_keyed_by_binary_and_project(self, tmp_path: Path) -> None:
+        binary = tmp_path / "biome"
+        first = get_biome_daemon(binary, tmp_path / "a")
+
+        assert get_biome_daemon(binary, tmp_path / "a") is first
+        assert get_biome_daemon(binary, tmp_path / "b") is not first
+        assert first.key == f"biome:{binary}:{tmp_path / 'a'}"
+
+    def test_failed_start_disables_daemon(self, tmp_path: Path) -> None:
+        daemon = BiomeDaemon(tmp_path / "biome", tmp_path)
+
+        with patch.object(daemon, "_command", return_value=None) as command:
+            assert not daemon.ensure_running()
+            assert not daemon.ensure_running()
+
+        command.assert_called_once_with("start")
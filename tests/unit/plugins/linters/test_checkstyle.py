@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from lucidshark.config.ignore import IgnorePatterns
 from lucidshark.core.models import ScanContext, Severity, ToolDomain
 from lucidshark.plugins.linters.checkstyle import (
     DEFAULT_VERSION,
@@ -385,16 +386,11 @@ class TestCheckstyleFindJavaFiles:
             build_dir.mkdir()
             (build_dir / "Generated.java").touch()
 
-            mock_patterns = MagicMock()
-            mock_patterns.matches = MagicMock(
-                side_effect=lambda f, root: "build" in str(f)
-            )
-
             context = ScanContext(
                 project_root=Path(tmpdir),
                 paths=[src_dir, build_dir],
                 enabled_domains=[],
-                ignore_patterns=mock_patterns,
+                ignore_patterns=IgnorePatterns(["build/"]),
             )
 
             linter = CheckstyleLinter()
@@ -534,6 +530,39 @@ class TestCheckstyleLint:
             assert "-jar" in captured_cmd
             assert "/opt/checkstyle.jar" in captured_cmd
 
+    def test_lint_uses_jvm_worker_output(self) -> None:
+        """Output of the persistent JVM worker replaces a java -jar run."""
+        linter = CheckstyleLinter()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            src_dir = tmpdir_path / "src"
+            src_dir.mkdir()
+            (src_dir / "Main.java").touch()
+
+            context = ScanContext(
+                project_root=tmpdir_path,
+                paths=[src_dir],
+                enabled_domains=[],
+            )
+
+            with patch.object(
+                linter, "ensure_binary", return_value=Path("/opt/checkstyle.jar")
+            ):
+                with patch(
+                    "lucidshark.plugins.linters.checkstyle.run_in_jvm_worker",
+                    return_value=make_completed_process(0, SAMPLE_CHECKSTYLE_OUTPUT),
+                ) as worker:
+                    with patch(
+                        "lucidshark.plugins.linters.checkstyle.run_with_streaming"
+                    ) as runner:
+                        issues = linter.lint(context)
+
+            assert len(issues) == 1
+            runner.assert_not_called()
+            cmd = worker.call_args[0][1]
+            assert cmd[:3] == ["java", "-jar", "/opt/checkstyle.jar"]
+
     def test_lint_passes_correct_kwargs_to_runner(self) -> None:
         """Verify correct cwd, tool_name, timeout passed to run_with_streaming."""
         linter = CheckstyleLinter()
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
 import tempfile
 from pathlib import Path
+from typing import List
 from unittest.mock import patch
 
+import pytest
 
 from lucidshark.core.models import ScanContext, Severity, ToolDomain
+from lucidshark.plugins.cpp_utils import load_compile_commands, local_includes
 from lucidshark.plugins.linters.clang_tidy import (
     CATEGORY_SEVERITY,
     ClangTidyLinter,
@@ -229,6 +233,113 @@ class TestLint:
             assert files[0] == str(cpp_file)
 
 
+def _cmake_project(root: Path) -> None:
+    """Two translation units sharing a header, with a compilation database."""
+    (root / "include").mkdir()
+    (root / "include" / "common.h").write_text("int shared();\n")
+    (root / "a.cpp").write_text('#include "common.h"\nint a() { return 0; }\n')
+    (root / "b.cpp").write_text("#include <common.h>\nint b() { return 0; }\n")
+    build = root / "build"
+    build.mkdir()
+    (build / "CMakeCache.txt").write_text("")
+    (build / "compile_commands.json").write_text(
+        json.dumps(
+            [
+                {
+                    "directory": str(build),
+                    "command": f"c++ -I{root / 'include'} -c {root / name}",
+                    "file": str(root / name),
+                }
+                for name in ("a.cpp", "b.cpp")
+            ]
+        )
+    )
+
+
+class FakeClangTidy:
+    """Reports a header warning for every TU and one warning per TU."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.targets: List[List[str]] = []
+
+    def __call__(self, cmd, **kwargs) -> subprocess.CompletedProcess:
+        targets = [Path(c).name for c in cmd[3:]]
+        self.targets.append(sorted(targets))
+        header = self.root / "include" / "common.h"
+        lines = []
+        for target in targets:
+            if target.endswith(".cpp"):
+                lines.append(f"{header}:1:1: warning: shared [readability-x]")
+                lines.append(f"{self.root / target}:2:5: warning: tu [misc-y]")
+        return subprocess.CompletedProcess(cmd, 1, "\n".join(lines), "")
+
+
+class TestShardedLint:
+    @pytest.fixture(autouse=True)
+    def _isolated_home(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("LUCIDSHARK_HOME", raising=False)
+
+    def _lint(self, root: Path, fake: FakeClangTidy):
+        context = ScanContext(project_root=root, paths=[root], enabled_domains=[])
+        linter = ClangTidyLinter()
+        with (
+            patch.object(ClangTidyLinter, "ensure_binary", return_value=Path("/ct")),
+            patch.object(ClangTidyLinter, "get_version", return_value="18.1.0"),
+            patch("lucidshark.plugins.linters.clang_tidy.run_with_streaming", new=fake),
+        ):
+            return linter.lint(context)
+
+    def test_one_process_per_tu_and_header_findings_once(self, tmp_path: Path) -> None:
+        _cmake_project(tmp_path)
+        fake = FakeClangTidy(tmp_path)
+
+        issues = self._lint(tmp_path, fake)
+
+        assert sorted(fake.targets) == [["a.cpp"], ["b.cpp"], ["common.h"]]
+        assert sorted(i.rule_id for i in issues) == [
+            "misc-y",
+            "misc-y",
+            "readability-x",
+        ]
+
+    def test_unchanged_tus_reuse_cached_output(self, tmp_path: Path) -> None:
+        _cmake_project(tmp_path)
+        first = self._lint(tmp_path, FakeClangTidy(tmp_path))
+
+        fake = FakeClangTidy(tmp_path)
+        second = self._lint(tmp_path, fake)
+
+        assert fake.targets == [["common.h"]]
+        assert [i.id for i in second] == [i.id for i in first]
+
+    def test_header_change_invalidates_including_tus(self, tmp_path: Path) -> None:
+        _cmake_project(tmp_path)
+        self._lint(tmp_path, FakeClangTidy(tmp_path))
+
+        (tmp_path / "include" / "common.h").write_text("int shared(int);\n")
+        fake = FakeClangTidy(tmp_path)
+        self._lint(tmp_path, fake)
+
+        assert sorted(fake.targets) == [["a.cpp"], ["b.cpp"], ["common.h"]]
+
+
+class TestCompileDatabase:
+    def test_load_and_resolve_includes(self, tmp_path: Path) -> None:
+        _cmake_project(tmp_path)
+
+        commands = load_compile_commands(tmp_path / "build")
+        command = commands[(tmp_path / "b.cpp").resolve()]
+
+        assert command.include_dirs() == [tmp_path / "include"]
+        assert local_includes(command.file, command.include_dirs(), tmp_path) == {
+            (tmp_path / "include" / "common.h").resolve()
+        }
+
+    def test_missing_database(self, tmp_path: Path) -> None:
+        assert load_compile_commands(tmp_path) == {}
+
+
 class TestCategorySeverityMapping:
     """Tests for category severity constants."""
 
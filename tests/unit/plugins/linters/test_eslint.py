@@ -897,3 +897,89 @@ class TestESLintPathFiltering:
                 result = linter.fix(context)
                 assert result.issues_fixed == 0
                 assert result.files_modified == 0
+
+
+class TestESLintCacheAndServer:
+    """Tests for ESLint's result cache and the persistent server."""
+
+    def _context(self, root: Path, cache: bool = True) -> ScanContext:
+        context = ScanContext(
+            project_root=root,
+            paths=[root],
+            enabled_domains=[],
+            config=MagicMock(),
+        )
+        context.config.pipeline.linting.cache = cache
+        return context
+
+    def test_lint_uses_content_cache(self, tmp_path: Path) -> None:
+        linter = ESLintLinter()
+
+        with (
+            patch.object(linter, "ensure_binary", return_value=Path("/bin/eslint")),
+            patch(
+                "lucidshark.plugins.linters.base.run_with_streaming",
+                return_value=make_completed_process(0, "[]"),
+            ) as mock_run,
+        ):
+            linter.lint(self._context(tmp_path))
+
+        cmd = mock_run.call_args.kwargs["cmd"]
+        location = Path(cmd[cmd.index("--cache-location") + 1])
+        assert "--cache" in cmd
+        assert cmd[cmd.index("--cache-strategy") + 1] == "content"
+        assert location.parent == tmp_path / ".lucidshark" / "cache" / "eslint"
+
+    def test_cache_disabled(self, tmp_path: Path) -> None:
+        linter = ESLintLinter()
+
+        with (
+            patch.object(linter, "ensure_binary", return_value=Path("/bin/eslint")),
+            patch(
+                "lucidshark.plugins.linters.base.run_with_streaming",
+                return_value=make_completed_process(0, "[]"),
+            ) as mock_run,
+        ):
+            linter.lint(self._context(tmp_path, cache=False))
+
+        assert "--cache" not in mock_run.call_args.kwargs["cmd"]
+
+    def test_lint_uses_server_result(self, tmp_path: Path) -> None:
+        linter = ESLintLinter()
+        output = json.dumps(
+            [
+                {
+                    "filePath": str(tmp_path / "a.js"),
+                    "messages": [{"ruleId": "semi", "severity": 1, "message": "m"}],
+                }
+            ]
+        )
+
+        with (
+            patch.object(linter, "ensure_binary", return_value=Path("/bin/eslint")),
+            patch(
+                "lucidshark.plugins.linters.eslint.run_in_eslint_server",
+                return_value=make_completed_process(1, output),
+            ) as server,
+            patch("lucidshark.plugins.linters.base.run_with_streaming") as mock_run,
+        ):
+            issues = linter.lint(self._context(tmp_path))
+
+        mock_run.assert_not_called()
+        assert server.call_args[0][1][0] == "/bin/eslint"
+        assert [i.rule_id for i in issues] == ["semi"]
+
+    def test_server_timeout_records_skip(self, tmp_path: Path) -> None:
+        linter = ESLintLinter()
+        context = self._context(tmp_path)
+
+        with (
+            patch.object(linter, "ensure_binary", return_value=Path("/bin/eslint")),
+            patch(
+                "lucidshark.plugins.linters.eslint.run_in_eslint_server",
+                side_effect=subprocess.TimeoutExpired("eslint", 120),
+            ),
+        ):
+            assert linter.lint(context) == []
+
+        assert context.tool_skips[0].tool_name == "eslint"
@@ -0,0 +1,148 @@
+"""Tests for the persistent ESLint server."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lucidshark.core.daemons import shutdown_daemons
+from lucidshark.core.models import ScanContext
+from lucidshark.plugins.linters import eslint_server
+from lucidshark.plugins.linters.eslint_server import (
+    ESLintServer,
+    ServerUnavailable,
+    eslint_package_dir,
+    run_in_eslint_server,
+)
+
+# Stand-in for eslint/lib/cli.js counting its invocations
+FAKE_CLI = """
+let calls = 0;
+module.exports = {
+  async execute(argv) {
+    calls += 1;
+    console.error("stderr " + calls);
+    console.log(JSON.stringify({calls, args: argv.slice(2), cwd: process.cwd()}));
+    return 1;
+  },
+};
+"""
+
+
+def _fake_eslint(root: Path) -> Path:
+    """Install a fake ESLint package and return its bin link."""
+    package = root / "node_modules" / "eslint"
+    (package / "lib").mkdir(parents=True)
+    (package / "bin").mkdir()
+    (package / "package.json").write_text('{"name": "eslint"}')
+    (package / "lib" / "cli.js").write_text(FAKE_CLI)
+    (package / "bin" / "eslint.js").write_text("")
+    bin_dir = root / "node_modules" / ".bin"
+    bin_dir.mkdir()
+    (bin_dir / "eslint").symlink_to("../eslint/bin/eslint.js")
+    return bin_dir / "eslint"
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[ESLintServer]:
+    binary = _fake_eslint(tmp_path)
+    (tmp_path / "eslint.config.js").write_text("export default [];")
+    package_dir = eslint_package_dir(binary)
+    assert package_dir is not None
+    server = ESLintServer(tmp_path, package_dir)
+    yield server
+    server.stop()
+
+
+def test_package_dir_requires_eslint_layout(tmp_path: Path) -> None:
+    binary = tmp_path / "eslint"
+    binary.touch()
+
+    assert eslint_package_dir(binary) is None
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+class TestESLintServerProcess:
+    def test_reuses_process_between_runs(
+        self, tmp_path: Path, server: ESLintServer
+    ) -> None:
+        first = server.run(["--format", "json", "a.js"], timeout=30)
+        exit_code, stdout, stderr = server.run(["b.js"], timeout=30)
+
+        assert json.loads(first[1])["args"] == ["--format", "json", "a.js"]
+        assert exit_code == 1
+        assert json.loads(stdout) == {
+            "calls": 2,
+            "args": ["b.js"],
+            "cwd": str(tmp_path.resolve()),
+        }
+        assert stderr == "stderr 2"
+
+    def test_restarts_when_config_changes(
+        self, tmp_path: Path, server: ESLintServer
+    ) -> None:
+        server.run([], timeout=30)
+        (tmp_path / "eslint.config.js").write_text("export default [{}];")
+
+        _, stdout, _ = server.run([], timeout=30)
+
+        assert json.loads(stdout)["calls"] == 1
+
+    def test_shutdown_stops_server(self, server: ESLintServer) -> None:
+        server.run([], timeout=30)
+        proc = server._proc
+        assert proc is not None
+
+        shutdown_daemons()
+
+        assert proc.poll() is not None
+        assert server._proc is None
+
+
+class TestRunInESLintServer:
+    def _context(self, tmp_path: Path, persistent: bool) -> ScanContext:
+        context = ScanContext(project_root=tmp_path, paths=[], enabled_domains=[])
+        context.persistent_tools = persistent
+        return context
+
+    def test_one_shot_scans_do_not_use_server(self, tmp_path: Path) -> None:
+        with patch.object(eslint_server, "get_eslint_server") as get_server:
+            result = run_in_eslint_server(
+                self._context(tmp_path, persistent=False), ["eslint"], "eslint"
+            )
+
+        assert result is None
+        get_server.assert_not_called()
+
+    def test_replays_server_output(self, tmp_path: Path) -> None:
+        server = MagicMock()
+        server.run.return_value = (0, "[]", "")
+
+        with patch.object(eslint_server, "get_eslint_server", return_value=server):
+            result = run_in_eslint_server(
+                self._context(tmp_path, persistent=True),
+                ["/bin/eslint", "--format", "json", "."],
+                "eslint",
+            )
+
+        assert isinstance(result, subprocess.CompletedProcess)
+        assert result.stdout == "[]"
+        server.run.assert_called_once_with(["--format", "json", "."], 120)
+
+    def test_unavailable_server_falls_back(self, tmp_path: Path) -> None:
+        server = MagicMock()
+        server.run.side_effect = ServerUnavailable("node not found in PATH")
+
+        with patch.object(eslint_server, "get_eslint_server", return_value=server):
+            assert (
+                run_in_eslint_server(
+                    self._context(tmp_path, persistent=True), ["eslint"], "eslint"
+                )
+                is None
+            )
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from lucidshark.config.ignore import IgnorePatterns
 from lucidshark.core.models import ScanContext, Severity, ToolDomain
 from lucidshark.plugins.linters.ktlint import (
     DEFAULT_VERSION,
@@ -467,16 +468,11 @@ class TestKtlintFindKotlinFiles:
             build_dir.mkdir()
             (build_dir / "Generated.kt").touch()
 
-            mock_patterns = MagicMock()
-            mock_patterns.matches = MagicMock(
-                side_effect=lambda f, root: "build" in str(f)
-            )
-
             context = ScanContext(
                 project_root=Path(tmpdir),
                 paths=[src_dir, build_dir],
                 enabled_domains=[],
-                ignore_patterns=mock_patterns,
+                ignore_patterns=IgnorePatterns(["build/"]),
             )
 
             linter = KtlintLinter()
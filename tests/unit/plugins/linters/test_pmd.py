@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from lucidshark.config.ignore import IgnorePatterns
 from lucidshark.core.models import ScanContext, Severity, ToolDomain
 from lucidshark.plugins.linters.pmd import (
     PRIORITY_SEVERITY_MAP,
@@ -518,16 +519,11 @@ class TestPmdFindJavaFiles:
             build_dir.mkdir()
             (build_dir / "Generated.java").touch()
 
-            mock_patterns = MagicMock()
-            mock_patterns.matches = MagicMock(
-                side_effect=lambda f, root: "build" in str(f)
-            )
-
             context = ScanContext(
                 project_root=Path(tmpdir),
                 paths=[src_dir, build_dir],
                 enabled_domains=[],
-                ignore_patterns=mock_patterns,
+                ignore_patterns=IgnorePatterns(["build/"]),
             )
 
             linter = PmdLinter()
@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from lucidshark.core.models import Severity, ToolDomain
+from lucidshark.core.models import ScanContext, Severity, ToolDomain
 from lucidshark.plugins.linters.scalafix import ScalafixLinter
 
 
@@ -60,10 +60,9 @@ class TestScalafixFindScalaFiles:
             (src_dir / "Utils.scala").write_text("object Utils")
 
             plugin = ScalafixLinter(project_root=project_root)
-            context = MagicMock()
-            context.project_root = project_root
-            context.paths = None
-            context.ignore_patterns = None
+            context = ScanContext(
+                project_root=project_root, paths=[], enabled_domains=[]
+            )
 
             files = plugin._find_scala_files(context)
             assert len(files) == 2
@@ -91,10 +90,9 @@ class TestScalafixFindScalaFiles:
             (src_dir / "script.sc").write_text("println('hello')")
 
             plugin = ScalafixLinter(project_root=project_root)
-            context = MagicMock()
-            context.project_root = project_root
-            context.paths = None
-            context.ignore_patterns = None
+            context = ScanContext(
+                project_root=project_root, paths=[], enabled_domains=[]
+            )
 
             files = plugin._find_scala_files(context)
             assert len(files) == 1
@@ -199,10 +197,9 @@ class TestScalafixLint:
 
             with patch("shutil.which", return_value="/usr/local/bin/scalafix"):
                 plugin = ScalafixLinter(project_root=project_root)
-                context = MagicMock()
-                context.project_root = project_root
-                context.paths = None
-                context.ignore_patterns = None
+                context = ScanContext(
+                    project_root=project_root, paths=[], enabled_domains=[]
+                )
 
                 mock_result = MagicMock()
                 mock_result.returncode = 1
@@ -222,6 +219,37 @@ class TestScalafixLint:
                     assert "DisableSyntax" in issues[0].rule_id
 
 
+class TestScalafixSemanticdb:
+    """Tests for reusing the shared compile's SemanticDB output."""
+
+    def test_passes_targetroots_of_shared_compile(self, tmp_path: Path) -> None:
+        (tmp_path / "build.sbt").write_text("semanticdbEnabled := true\n")
+        meta = tmp_path / "target" / "scala-2.13" / "meta"
+        (meta / "META-INF" / "semanticdb").mkdir(parents=True)
+        context = MagicMock(project_root=tmp_path)
+
+        with (
+            patch(
+                "lucidshark.plugins.linters.scalafix.find_scala_build_tool",
+                return_value=(Path("/usr/bin/sbt"), "sbt"),
+            ),
+            patch("lucidshark.plugins.linters.scalafix.shared_compile") as compile_,
+        ):
+            args = ScalafixLinter()._semanticdb_args(context)
+
+        compile_.assert_called_once_with(context, Path("/usr/bin/sbt"), "sbt")
+        assert args == ["--sourceroot", str(tmp_path), "--classpath", str(meta)]
+
+    def test_no_semanticdb_in_build(self, tmp_path: Path) -> None:
+        (tmp_path / "build.sbt").write_text('scalaVersion := "3.3.3"\n')
+
+        with patch("lucidshark.plugins.linters.scalafix.shared_compile") as compile_:
+            args = ScalafixLinter()._semanticdb_args(MagicMock(project_root=tmp_path))
+
+        compile_.assert_not_called()
+        assert args == []
+
+
 class TestScalafixIssueId:
     """Tests for deterministic issue ID generation."""
 
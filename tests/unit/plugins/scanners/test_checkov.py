@@ -184,12 +184,9 @@ class TestCheckovRunIacScan:
             "lucidshark.plugins.scanners.checkov.run_with_streaming",
             return_value=mock_result,
         ):
-            with patch("lucidshark.plugins.scanners.checkov.temporary_env") as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                issues = scanner._run_iac_scan(Path("/bin/checkov"), scan_context)
-                assert len(issues) == 1
-                assert issues[0].rule_id == "CKV_AWS_18"
+            issues = scanner._run_iac_scan(Path("/bin/checkov"), scan_context)
+            assert len(issues) == 1
+            assert issues[0].rule_id == "CKV_AWS_18"
 
     def test_empty_output(
         self, scanner: CheckovScanner, scan_context: ScanContext
@@ -199,11 +196,8 @@ class TestCheckovRunIacScan:
             "lucidshark.plugins.scanners.checkov.run_with_streaming",
             return_value=mock_result,
         ):
-            with patch("lucidshark.plugins.scanners.checkov.temporary_env") as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                issues = scanner._run_iac_scan(Path("/bin/checkov"), scan_context)
-                assert issues == []
+            issues = scanner._run_iac_scan(Path("/bin/checkov"), scan_context)
+            assert issues == []
 
     def test_exit_code_2_with_stderr(
         self, scanner: CheckovScanner, scan_context: ScanContext
@@ -213,22 +207,16 @@ class TestCheckovRunIacScan:
             "lucidshark.plugins.scanners.checkov.run_with_streaming",
             return_value=mock_result,
         ):
-            with patch("lucidshark.plugins.scanners.checkov.temporary_env") as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                issues = scanner._run_iac_scan(Path("/bin/checkov"), scan_context)
-                assert issues == []
+            issues = scanner._run_iac_scan(Path("/bin/checkov"), scan_context)
+            assert issues == []
 
     def test_timeout(self, scanner: CheckovScanner, scan_context: ScanContext) -> None:
         with patch(
             "lucidshark.plugins.scanners.checkov.run_with_streaming",
             side_effect=subprocess.TimeoutExpired("checkov", 180),
         ):
-            with patch("lucidshark.plugins.scanners.checkov.temporary_env") as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                issues = scanner._run_iac_scan(Path("/bin/checkov"), scan_context)
-                assert issues == []
+            issues = scanner._run_iac_scan(Path("/bin/checkov"), scan_context)
+            assert issues == []
 
     def test_generic_exception(
         self, scanner: CheckovScanner, scan_context: ScanContext
@@ -237,11 +225,8 @@ class TestCheckovRunIacScan:
             "lucidshark.plugins.scanners.checkov.run_with_streaming",
             side_effect=OSError("command failed"),
         ):
-            with patch("lucidshark.plugins.scanners.checkov.temporary_env") as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                issues = scanner._run_iac_scan(Path("/bin/checkov"), scan_context)
-                assert issues == []
+            issues = scanner._run_iac_scan(Path("/bin/checkov"), scan_context)
+            assert issues == []
 
     def test_framework_filter_in_command(
         self, scanner: CheckovScanner, tmp_path: Path
@@ -262,18 +247,15 @@ class TestCheckovRunIacScan:
             "lucidshark.plugins.scanners.checkov.run_with_streaming",
             return_value=mock_result,
         ) as mock_run:
-            with patch("lucidshark.plugins.scanners.checkov.temporary_env") as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                scanner._run_iac_scan(Path("/bin/checkov"), context)
-                cmd = mock_run.call_args.kwargs.get(
-                    "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
-                )
-                assert "--framework" in cmd
-                assert "terraform" in cmd
-                assert "kubernetes" in cmd
-                assert "--skip-check" in cmd
-                assert "CKV_AWS_1" in cmd
+            scanner._run_iac_scan(Path("/bin/checkov"), context)
+            cmd = mock_run.call_args.kwargs.get(
+                "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
+            )
+            assert "--framework" in cmd
+            assert "terraform" in cmd
+            assert "kubernetes" in cmd
+            assert "--skip-check" in cmd
+            assert "CKV_AWS_1" in cmd
 
     def test_exclude_patterns_converted_to_regex(
         self, scanner: CheckovScanner, tmp_path: Path
@@ -291,17 +273,14 @@ class TestCheckovRunIacScan:
             "lucidshark.plugins.scanners.checkov.run_with_streaming",
             return_value=mock_result,
         ) as mock_run:
-            with patch("lucidshark.plugins.scanners.checkov.temporary_env") as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                scanner._run_iac_scan(Path("/bin/checkov"), context)
-                cmd = mock_run.call_args.kwargs.get(
-                    "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
-                )
-                assert "--skip-path" in cmd
-                # Regex conversions
-                assert "\\.venv/.*" in cmd
-                assert "[^/]*\\.bak" in cmd
+            scanner._run_iac_scan(Path("/bin/checkov"), context)
+            cmd = mock_run.call_args.kwargs.get(
+                "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
+            )
+            assert "--skip-path" in cmd
+            # Regex conversions
+            assert "\\.venv/.*" in cmd
+            assert "[^/]*\\.bak" in cmd
 
 
 # --- _parse_checkov_json ---
@@ -199,14 +199,9 @@ class TestOpenGrepRunSastScan:
             "lucidshark.plugins.scanners.opengrep.run_with_streaming",
             return_value=mock_result,
         ):
-            with patch(
-                "lucidshark.plugins.scanners.opengrep.temporary_env"
-            ) as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                issues = scanner._run_sast_scan(Path("/bin/opengrep"), scan_context)
-                assert len(issues) == 1
-                assert issues[0].rule_id == "python.lang.security.audit.exec-used"
+            issues = scanner._run_sast_scan(Path("/bin/opengrep"), scan_context)
+            assert len(issues) == 1
+            assert issues[0].rule_id == "python.lang.security.audit.exec-used"
 
     def test_empty_output(
         self, scanner: OpenGrepScanner, scan_context: ScanContext
@@ -216,13 +211,8 @@ class TestOpenGrepRunSastScan:
             "lucidshark.plugins.scanners.opengrep.run_with_streaming",
             return_value=mock_result,
         ):
-            with patch(
-                "lucidshark.plugins.scanners.opengrep.temporary_env"
-            ) as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                issues = scanner._run_sast_scan(Path("/bin/opengrep"), scan_context)
-                assert issues == []
+            issues = scanner._run_sast_scan(Path("/bin/opengrep"), scan_context)
+            assert issues == []
 
     def test_nonzero_exit_with_stderr(
         self, scanner: OpenGrepScanner, scan_context: ScanContext
@@ -232,26 +222,16 @@ class TestOpenGrepRunSastScan:
             "lucidshark.plugins.scanners.opengrep.run_with_streaming",
             return_value=mock_result,
         ):
-            with patch(
-                "lucidshark.plugins.scanners.opengrep.temporary_env"
-            ) as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                issues = scanner._run_sast_scan(Path("/bin/opengrep"), scan_context)
-                assert issues == []
+            issues = scanner._run_sast_scan(Path("/bin/opengrep"), scan_context)
+            assert issues == []
 
     def test_timeout(self, scanner: OpenGrepScanner, scan_context: ScanContext) -> None:
         with patch(
             "lucidshark.plugins.scanners.opengrep.run_with_streaming",
             side_effect=subprocess.TimeoutExpired("opengrep", 180),
         ):
-            with patch(
-                "lucidshark.plugins.scanners.opengrep.temporary_env"
-            ) as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                issues = scanner._run_sast_scan(Path("/bin/opengrep"), scan_context)
-                assert issues == []
+            issues = scanner._run_sast_scan(Path("/bin/opengrep"), scan_context)
+            assert issues == []
 
     def test_generic_exception(
         self, scanner: OpenGrepScanner, scan_context: ScanContext
@@ -260,13 +240,8 @@ class TestOpenGrepRunSastScan:
             "lucidshark.plugins.scanners.opengrep.run_with_streaming",
             side_effect=OSError("command failed"),
         ):
-            with patch(
-                "lucidshark.plugins.scanners.opengrep.temporary_env"
-            ) as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                issues = scanner._run_sast_scan(Path("/bin/opengrep"), scan_context)
-                assert issues == []
+            issues = scanner._run_sast_scan(Path("/bin/opengrep"), scan_context)
+            assert issues == []
 
     def test_custom_ruleset(self, scanner: OpenGrepScanner, tmp_path: Path) -> None:
         config = MagicMock()
@@ -287,19 +262,14 @@ class TestOpenGrepRunSastScan:
             "lucidshark.plugins.scanners.opengrep.run_with_streaming",
             return_value=mock_result,
         ) as mock_run:
-            with patch(
-                "lucidshark.plugins.scanners.opengrep.temporary_env"
-            ) as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                scanner._run_sast_scan(Path("/bin/opengrep"), context)
-                cmd = mock_run.call_args.kwargs.get(
-                    "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
-                )
-                assert "--config" in cmd
-                assert "p/security-audit" in cmd
-                assert "--timeout" in cmd
-                assert "60" in cmd
+            scanner._run_sast_scan(Path("/bin/opengrep"), context)
+            cmd = mock_run.call_args.kwargs.get(
+                "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
+            )
+            assert "--config" in cmd
+            assert "p/security-audit" in cmd
+            assert "--timeout" in cmd
+            assert "60" in cmd
 
     def test_auto_ruleset(self, scanner: OpenGrepScanner, tmp_path: Path) -> None:
         context = ScanContext(
@@ -314,17 +284,12 @@ class TestOpenGrepRunSastScan:
             "lucidshark.plugins.scanners.opengrep.run_with_streaming",
             return_value=mock_result,
         ) as mock_run:
-            with patch(
-                "lucidshark.plugins.scanners.opengrep.temporary_env"
-            ) as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                scanner._run_sast_scan(Path("/bin/opengrep"), context)
-                cmd = mock_run.call_args.kwargs.get(
-                    "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
-                )
-                assert "--config" in cmd
-                assert "auto" in cmd
+            scanner._run_sast_scan(Path("/bin/opengrep"), context)
+            cmd = mock_run.call_args.kwargs.get(
+                "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
+            )
+            assert "--config" in cmd
+            assert "auto" in cmd
 
     def test_exclude_patterns(self, scanner: OpenGrepScanner, tmp_path: Path) -> None:
         ignore = MagicMock()
@@ -342,18 +307,13 @@ class TestOpenGrepRunSastScan:
             "lucidshark.plugins.scanners.opengrep.run_with_streaming",
             return_value=mock_result,
         ) as mock_run:
-            with patch(
-                "lucidshark.plugins.scanners.opengrep.temporary_env"
-            ) as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                scanner._run_sast_scan(Path("/bin/opengrep"), context)
-                cmd = mock_run.call_args.kwargs.get(
-                    "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
-                )
-                assert cmd.count("--exclude") == 2
-                assert "node_modules" in cmd
-                assert "*.min.js" in cmd
+            scanner._run_sast_scan(Path("/bin/opengrep"), context)
+            cmd = mock_run.call_args.kwargs.get(
+                "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
+            )
+            assert cmd.count("--exclude") == 2
+            assert "node_modules" in cmd
+            assert "*.min.js" in cmd
 
     def test_string_ruleset(self, scanner: OpenGrepScanner, tmp_path: Path) -> None:
         """Test non-list ruleset config falls back to auto."""
@@ -374,17 +334,12 @@ class TestOpenGrepRunSastScan:
             "lucidshark.plugins.scanners.opengrep.run_with_streaming",
             return_value=mock_result,
         ) as mock_run:
-            with patch(
-                "lucidshark.plugins.scanners.opengrep.temporary_env"
-            ) as mock_env:
-                mock_env.return_value.__enter__ = MagicMock()
-                mock_env.return_value.__exit__ = MagicMock(return_value=False)
-                scanner._run_sast_scan(Path("/bin/opengrep"), context)
-                cmd = mock_run.call_args.kwargs.get(
-                    "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
-                )
-                assert "--config" in cmd
-                assert "auto" in cmd
+            scanner._run_sast_scan(Path("/bin/opengrep"), context)
+            cmd = mock_run.call_args.kwargs.get(
+                "cmd", mock_run.call_args[0][0] if mock_run.call_args[0] else []
+            )
+            assert "--config" in cmd
+            assert "auto" in cmd
 
 
 # --- _parse_opengrep_json ---
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import sys
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from lucidshark.plugins import discovery
 from lucidshark.plugins import (
     discover_plugins,
     get_plugin,
     list_available_plugins,
     SCANNER_ENTRY_POINT_GROUP,
 )
+from lucidshark.plugins.discovery import LazyPluginMap, PluginRegistry, PluginSpec
 from lucidshark.plugins.scanners.base import ScannerPlugin
 from lucidshark.plugins.scanners.trivy import TrivyScanner
 
@@ -59,3 +68,80 @@ class TestListAvailablePlugins:
         """Test that unknown group returns empty list."""
         plugins = list_available_plugins("lucidshark.nonexistent")
         assert plugins == []
+
+
+class TestPluginRegistry:
+    """Tests for the cached, lazily-loading plugin registry."""
+
+    @staticmethod
+    def _registry_with(
+        monkeypatch: pytest.MonkeyPatch, tmp_path: Path, *names: str
+    ) -> Tuple[PluginRegistry, List[str]]:
+        """Create a registry over fake entry points backed by temp modules."""
+        monkeypatch.syspath_prepend(str(tmp_path))
+        eps = []
+        for name in names:
+            module = f"fake_plugin_{name}_{tmp_path.name}"
+            (tmp_path / f"{module}.py").write_text("class Plugin:\n    pass\n")
+            eps.append(
+                EntryPoint(name=name, value=f"{module}:Plugin", group="test.group")
+            )
+        calls: List[str] = []
+
+        def fake_entry_points(group: str) -> List[EntryPoint]:
+            calls.append(group)
+            return eps if group == "test.group" else []
+
+        monkeypatch.setattr(discovery, "entry_points", fake_entry_points)
+        return PluginRegistry(), calls
+
+    def test_entry_points_read_once(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        registry, calls = self._registry_with(monkeypatch, tmp_path, "one", "two")
+
+        assert registry.names("test.group") == ["one", "two"]
+        registry.load("test.group", "one")
+        registry.load("test.group", "two")
+        registry.names("test.group")
+
+        assert calls == ["test.group"]
+
+    def test_modules_imported_only_on_access(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        registry, _ = self._registry_with(monkeypatch, tmp_path, "one", "two")
+        plugins = LazyPluginMap(registry, "test.group")
+
+        assert list(plugins) == ["one", "two"]
+        assert len(plugins) == 2
+        assert "one" in plugins
+        first = plugins["one"]
+
+        assert first.__module__ in sys.modules
+        assert f"fake_plugin_two_{tmp_path.name}" not in sys.modules
+        assert registry.load("test.group", "one") is first
+
+    def test_load_failure_is_cached_and_skipped(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        registry, _ = self._registry_with(monkeypatch, tmp_path, "good")
+        registry.specs("test.group")["broken"] = PluginSpec(
+            "broken", "test.group", "lucidshark_missing_module:Plugin"
+        )
+        plugins = LazyPluginMap(registry, "test.group")
+
+        assert registry.load("test.group", "broken") is None
+        assert "broken" not in plugins
+        with pytest.raises(KeyError):
+            plugins["broken"]
+        assert [name for name, _ in plugins.items()] == ["good"]
+        assert list(plugins) == ["good"]
+
+    def test_base_class_mismatch_rejected(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        registry, _ = self._registry_with(monkeypatch, tmp_path, "one")
+
+        assert registry.load("test.group", "one", ScannerPlugin) is None
+        assert registry.load("test.group", "one") is not None
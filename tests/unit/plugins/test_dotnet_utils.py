@@ -0,0 +1,222 @@
+"""Unit tests for the shared .NET build."""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lucidshark.plugins.dotnet_utils import (
+    DotnetBuild,
+    shared_build,
+    whitespace_format_target,
+)
+
+FAKE_BINARY = Path("/usr/bin/dotnet")
+
+
+def _project(tmp_path: Path) -> Path:
+    (tmp_path / "App.sln").write_text("solution\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "Program.cs").write_text("class Program {}\n")
+    return tmp_path / "App.sln"
+
+
+def _completed(returncode: int = 0, stdout: str = "") -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(
+        args=[], returncode=returncode, stdout=stdout, stderr=""
+    )
+
+
+@pytest.fixture
+def sdk_version():
+    with patch(
+        "lucidshark.plugins.utils.get_cli_version", return_value="8.0.414"
+    ) as mock_version:
+        yield mock_version
+
+
+class TestSharedBuild:
+    def test_builds_into_artifacts_directory(self, tmp_path: Path, sdk_version) -> None:
+        project_file = _project(tmp_path)
+        context = MagicMock(project_root=tmp_path)
+
+        with patch(
+            "lucidshark.plugins.dotnet_utils.run_with_streaming",
+            return_value=_completed(stdout="Build succeeded."),
+        ) as mock_run:
+            build = shared_build(context, FAKE_BINARY, project_file)
+
+        artifacts = tmp_path / ".lucidshark" / "cache" / "dotnet" / "artifacts"
+        restore, build_call = (c.kwargs["cmd"] for c in mock_run.call_args_list)
+        assert restore[:3] == [
+            str(FAKE_BINARY),
+            "restore",
+            str(project_file.resolve()),
+        ]
+        assert restore[3:5] == ["--artifacts-path", str(artifacts)]
+        assert build_call[:3] == [
+            str(FAKE_BINARY),
+            "build",
+            str(project_file.resolve()),
+        ]
+        assert build_call[-2:] == ["--artifacts-path", str(artifacts)]
+        assert "--no-restore" in build_call
+        assert build.succeeded
+        assert "Build succeeded." in build.output
+        assert build.artifacts_args() == ["--artifacts-path", str(artifacts)]
+
+    def test_failed_restore_builds_in_place(self, tmp_path: Path, sdk_version) -> None:
+        project_file = _project(tmp_path)
+        context = MagicMock(project_root=tmp_path)
+
+        with patch(
+            "lucidshark.plugins.dotnet_utils.run_with_streaming",
+            side_effect=[_completed(returncode=1), _completed(), _completed()],
+        ) as mock_run:
+            build = shared_build(context, FAKE_BINARY, project_file)
+            (tmp_path / "src" / "Added.cs").write_text("class Added {}\n")
+            shared_build(context, FAKE_BINARY, project_file)
+
+        # Offline: the restore is not retried and the build uses obj/
+        commands = [c.kwargs["cmd"][1] for c in mock_run.call_args_list]
+        assert commands == ["restore", "build", "build"]
+        assert "--no-restore" in mock_run.call_args.kwargs["cmd"]
+        assert "--artifacts-path" not in mock_run.call_args.kwargs["cmd"]
+        assert build.artifacts_args() == []
+
+    def test_project_file_change_restores_again(
+        self, tmp_path: Path, sdk_version
+    ) -> None:
+        project_file = _project(tmp_path)
+        context = MagicMock(project_root=tmp_path)
+
+        with patch(
+            "lucidshark.plugins.dotnet_utils.run_with_streaming",
+            return_value=_completed(),
+        ) as mock_run:
+            shared_build(context, FAKE_BINARY, project_file)
+            (tmp_path / "src" / "App.csproj").write_text("<Project />\n")
+            shared_build(context, FAKE_BINARY, project_file)
+
+        commands = [c.kwargs["cmd"][1] for c in mock_run.call_args_list]
+        assert commands == ["restore", "build", "restore", "build"]
+
+    def test_older_sdk_builds_in_place(self, tmp_path: Path, sdk_version) -> None:
+        sdk_version.return_value = "7.0.410"
+        project_file = _project(tmp_path)
+
+        with patch(
+            "lucidshark.plugins.dotnet_utils.run_with_streaming",
+            return_value=_completed(returncode=1),
+        ) as mock_run:
+            build = shared_build(
+                MagicMock(project_root=tmp_path), FAKE_BINARY, project_file
+            )
+
+        assert "--no-restore" in mock_run.call_args.kwargs["cmd"]
+        assert not build.succeeded
+        assert build.artifacts_args() == []
+
+    def test_reuses_build_until_sources_change(
+        self, tmp_path: Path, sdk_version
+    ) -> None:
+        project_file = _project(tmp_path)
+        context = MagicMock(project_root=tmp_path)
+
+        def build(**kwargs):
+            (tmp_path / ".lucidshark" / "cache" / "dotnet" / "artifacts").mkdir(
+                parents=True, exist_ok=True
+            )
+            (tmp_path / "src" / "obj").mkdir(exist_ok=True)
+            return _completed()
+
+        with patch(
+            "lucidshark.plugins.dotnet_utils.run_with_streaming", side_effect=build
+        ) as mock_run:
+            first = shared_build(context, FAKE_BINARY, project_file)
+            assert shared_build(context, FAKE_BINARY, project_file) is first
+            # One restore and one build
+            assert mock_run.call_count == 2
+
+            (tmp_path / "src" / "Added.cs").write_text("class Added {}\n")
+            assert shared_build(context, FAKE_BINARY, project_file) is not first
+            assert mock_run.call_count == 3
+
+    def test_concurrent_callers_share_one_build(
+        self, tmp_path: Path, sdk_version
+    ) -> None:
+        project_file = _project(tmp_path)
+        context = MagicMock(project_root=tmp_path)
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def build(**kwargs):
+            if kwargs["cmd"][1] == "restore":
+                return _completed()
+            started.set()
+            release.wait(5)
+            (tmp_path / ".lucidshark" / "cache" / "dotnet" / "artifacts").mkdir(
+                parents=True
+            )
+            return _completed()
+
+        with patch(
+            "lucidshark.plugins.dotnet_utils.run_with_streaming", side_effect=build
+        ) as mock_run:
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        shared_build(context, FAKE_BINARY, project_file)
+                    )
+                )
+                for _ in range(2)
+            ]
+            threads[0].start()
+            started.wait(5)
+            threads[1].start()
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert mock_run.call_count == 2
+        assert results[0] is results[1]
+
+    def test_timeout_is_not_cached(self, tmp_path: Path, sdk_version) -> None:
+        project_file = _project(tmp_path)
+        context = MagicMock(project_root=tmp_path)
+
+        with patch(
+            "lucidshark.plugins.dotnet_utils.run_with_streaming",
+            side_effect=[
+                _completed(),
+                subprocess.TimeoutExpired(cmd="dotnet", timeout=300),
+                _completed(),
+            ],
+        ):
+            with pytest.raises(subprocess.TimeoutExpired):
+                shared_build(context, FAKE_BINARY, project_file)
+            assert isinstance(
+                shared_build(context, FAKE_BINARY, project_file), DotnetBuild
+            )
+
+
+class TestWhitespaceFormatTarget:
+    def test_root_solution_excludes_lucidshark(self, tmp_path: Path) -> None:
+        assert whitespace_format_target(tmp_path, tmp_path / "App.sln") == [
+            str(tmp_path),
+            "--folder",
+            "--exclude",
+            ".lucidshark",
+        ]
+
+    def test_nested_project(self, tmp_path: Path) -> None:
+        project_file = tmp_path / "App" / "App.csproj"
+        assert whitespace_format_target(tmp_path, project_file) == [
+            str(tmp_path / "App"),
+            "--folder",
+        ]
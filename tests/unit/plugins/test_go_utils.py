@@ -9,7 +9,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from lucidshark.plugins import go_utils
 from lucidshark.plugins.go_utils import (
+    GO_ALL_PACKAGES,
+    affected_packages,
     find_go,
     find_gofmt,
     find_golangci_lint,
@@ -18,7 +21,9 @@ from lucidshark.plugins.go_utils import (
     get_go_version,
     get_golangci_lint_version,
     get_gosec_version,
+    go_package_targets,
     has_go_mod,
+    load_package_graph,
     parse_go_error_position,
 )
 
@@ -646,3 +651,109 @@ class TestHasGoMod:
         # Path.exists() returns True for dirs too, so the implementation
         # will return True.  Document the actual behavior.
         assert has_go_mod(tmp_path) is True
+
+
+# ---------------------------------------------------------------------------
+# package graph scoping
+# ---------------------------------------------------------------------------
+
+GRAPH = {
+    ".": ["api", "cli"],
+    "api": ["core"],
+    "cli": [],
+    "core": [],
+    "core/internal": [],
+}
+
+
+class TestAffectedPackages:
+    """Tests for affected_packages function."""
+
+    def test_includes_reverse_dependencies(self) -> None:
+        assert affected_packages(GRAPH, ["core/core.go"]) == {"core", "api", "."}
+
+    def test_leaf_dependent(self) -> None:
+        assert affected_packages(GRAPH, ["cli/cli_test.go"]) == {"cli", "."}
+
+    def test_nested_package_is_not_its_parent(self) -> None:
+        assert affected_packages(GRAPH, ["core/internal/x.go"]) == {"core/internal"}
+
+    def test_non_go_file_maps_to_enclosing_package(self) -> None:
+        assert affected_packages(GRAPH, ["cli/templates/help.txt"]) == {"cli", "."}
+
+    def test_files_outside_packages(self) -> None:
+        graph = {"api": [], "core": []}
+        assert affected_packages(graph, ["docs/README.md"]) == set()
+
+    def test_module_files_affect_everything(self) -> None:
+        assert affected_packages(GRAPH, ["cli/cli.go", "go.sum"]) is None
+
+
+class TestGoPackageTargets:
+    """Tests for go_package_targets function."""
+
+    def test_full_scans(self, tmp_path: Path, scan_context) -> None:
+        with patch.object(go_utils, "load_package_graph") as mock_graph:
+            assert go_package_targets(scan_context(tmp_path, [tmp_path])) == [
+                GO_ALL_PACKAGES
+            ]
+            assert go_package_targets(
+                scan_context(tmp_path, [tmp_path / "a.go"], all_files=True)
+            ) == [GO_ALL_PACKAGES]
+        mock_graph.assert_not_called()
+
+    def test_changed_files(self, tmp_path: Path, scan_context) -> None:
+        context = scan_context(tmp_path, [tmp_path / "api" / "api.go"])
+        with patch.object(go_utils, "load_package_graph", return_value=GRAPH):
+            assert go_package_targets(context) == [".", "./api"]
+
+    def test_nothing_affected(self, tmp_path: Path, scan_context) -> None:
+        context = scan_context(tmp_path, [tmp_path / "README.md"])
+        with patch.object(go_utils, "load_package_graph", return_value={"api": []}):
+            assert go_package_targets(context) == []
+
+    def test_graph_unavailable(self, tmp_path: Path, scan_context) -> None:
+        context = scan_context(tmp_path, [tmp_path / "api" / "api.go"])
+        with patch.object(go_utils, "load_package_graph", return_value=None):
+            assert go_package_targets(context) == [GO_ALL_PACKAGES]
+
+
+class TestLoadPackageGraph:
+    """Tests for load_package_graph function."""
+
+    def test_caches_until_sources_change(self, tmp_path: Path) -> None:
+        (tmp_path / "go.mod").write_text("module example.com/m\n")
+        (tmp_path / "api").mkdir()
+        source = tmp_path / "api" / "api.go"
+        source.write_text("package api\n")
+
+        with patch.object(
+            go_utils, "_list_packages", return_value={"api": []}
+        ) as mock_list:
+            assert load_package_graph(tmp_path) == {"api": []}
+            assert load_package_graph(tmp_path) == {"api": []}
+            assert mock_list.call_count == 1
+
+            source.write_text('package api\n\nimport "fmt"\n')
+            load_package_graph(tmp_path)
+            assert mock_list.call_count == 2
+
+        cache_file = tmp_path / ".lucidshark" / "cache" / "go" / "packages.json"
+        assert cache_file.exists()
+
+    def test_go_list_failure(self, tmp_path: Path) -> None:
+        with patch.object(go_utils, "_list_packages", return_value=None):
+            assert load_package_graph(tmp_path) is None
+
+    def test_parses_go_list_output(self, tmp_path: Path) -> None:
+        output = (
+            f'{{"ImportPath": "m/api", "Dir": "{tmp_path / "api"}", '
+            '"Imports": ["fmt", "m/core"], "XTestImports": ["m/api"]}\n'
+            f'{{"ImportPath": "m/core", "Dir": "{tmp_path / "core"}"}}\n'
+        )
+        completed = subprocess.CompletedProcess([], 0, stdout=output, stderr="")
+        with (
+            patch.object(go_utils, "find_go", return_value=Path("/usr/bin/go")),
+            patch.object(go_utils.subprocess, "run", return_value=completed),
+        ):
+            assert go_utils._list_packages(tmp_path) == {"api": ["core"], "core": []}
@@ -0,0 +1,218 @@
+"""Unit tests for Maven/Gradle module selection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from lucidshark.plugins.java_utils import (
+    affected_modules,
+    changed_classes,
+    gradle_modules,
+    gradle_task,
+    java_module_selection,
+    maven_modules,
+    upstream_modules,
+)
+
+
+def _pom(artifact: str, modules=(), deps=(), parent: bool = True) -> str:
+    parent_xml = (
+        "<parent><groupId>com.example</groupId><artifactId>root</artifactId></parent>"
+        if parent
+        else "<groupId>com.example</groupId>"
+    )
+    modules_xml = "".join(f"<module>{m}</module>" for m in modules)
+    deps_xml = "".join(
+        f"<dependency><groupId>{g}</groupId><artifactId>{a}</artifactId></dependency>"
+        for g, a in deps
+    )
+    return (
+        '<project xmlns="http://maven.apache.org/POM/4.0.0">'
+        f"{parent_xml}<artifactId>{artifact}</artifactId>"
+        f"<modules>{modules_xml}</modules>"
+        f"<dependencies>{deps_xml}</dependencies></project>"
+    )
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def maven_project(tmp_path: Path) -> Path:
+    _write(tmp_path / "pom.xml", _pom("root", ["core", "apps"], parent=False))
+    _write(
+        tmp_path / "core" / "pom.xml",
+        _pom("core", deps=[("junit", "junit")]),
+    )
+    _write(tmp_path / "apps" / "pom.xml", _pom("apps", ["web/pom.xml"]))
+    _write(
+        tmp_path / "apps" / "web" / "pom.xml",
+        _pom("web", deps=[("${project.groupId}", "core")]),
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def gradle_project(tmp_path: Path) -> Path:
+    _write(
+        tmp_path / "settings.gradle.kts",
+        'rootProject.name = "demo"\ninclude(":core", ":apps:web")\ninclude "cli"\n',
+    )
+    _write(tmp_path / "core" / "build.gradle.kts", "plugins { java }\n")
+    _write(
+        tmp_path / "apps" / "web" / "build.gradle.kts",
+        'dependencies { implementation(project(":core")) }\n',
+    )
+    _write(
+        tmp_path / "cli" / "build.gradle",
+        "dependencies { implementation project(path: ':apps:web') }\n",
+    )
+    return tmp_path
+
+
+class TestMavenModules:
+    def test_reads_reactor(self, maven_project: Path) -> None:
+        assert maven_modules(maven_project) == {
+            ".": {"deps": []},
+            "core": {"deps": ["."]},
+            "apps": {"deps": ["."]},
+            "apps/web": {"deps": [".", "core"]},
+        }
+
+    def test_unreadable_pom(self, maven_project: Path) -> None:
+        (maven_project / "core" / "pom.xml").write_text("<project>")
+        assert maven_modules(maven_project) is None
+
+
+class TestGradleModules:
+    def test_reads_settings_and_project_dependencies(
+        self, gradle_project: Path
+    ) -> None:
+        assert gradle_modules(gradle_project) == {
+            ".": {"deps": []},
+            "core": {"deps": []},
+            "apps/web": {"deps": ["core"]},
+            "cli": {"deps": ["apps/web"]},
+        }
+
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            'include("a")\nproject(":a").projectDir = file("modules/a")\n',
+            'includeBuild("build-logic")\n',
+        ],
+    )
+    def test_unsupported_layouts(self, tmp_path: Path, settings: str) -> None:
+        _write(tmp_path / "settings.gradle.kts", settings)
+        assert gradle_modules(tmp_path) is None
+
+    def test_type_safe_accessors(self, gradle_project: Path) -> None:
+        _write(
+            gradle_project / "cli" / "build.gradle",
+            "dependencies { implementation(projects.core) }\n",
+        )
+        assert gradle_modules(gradle_project) is None
+
+    def test_task_paths(self) -> None:
+        assert gradle_task("apps/web", "test") == ":apps:web:test"
+        assert gradle_task(".", "test") == ":test"
+
+
+class TestAffectedModules:
+    MODULES = {
+        ".": {"deps": []},
+        "core": {"deps": ["."]},
+        "apps": {"deps": ["."]},
+        "apps/web": {"deps": [".", "core"]},
+        "cli": {"deps": ["apps/web"]},
+    }
+
+    def test_innermost_module_and_dependents(self) -> None:
+        assert affected_modules(self.MODULES, ["core/src/main/java/A.java"]) == {
+            "core",
+            "apps/web",
+            "cli",
+        }
+        assert affected_modules(self.MODULES, ["apps/web/pom.xml"]) == {
+            "apps/web",
+            "cli",
+        }
+
+    @pytest.mark.parametrize(
+        "changed", ["settings.gradle", "gradle/libs.versions.toml", ".mvn/jvm.config"]
+    )
+    def test_build_wide_files(self, changed: str) -> None:
+        assert affected_modules(self.MODULES, [changed]) is None
+
+    def test_upstream_modules(self) -> None:
+        assert upstream_modules(self.MODULES, {"apps/web", "cli"}) == {".", "core"}
+        assert upstream_modules(self.MODULES, {"."}) == set()
+
+
+class TestJavaModuleSelection:
+    def test_maven_selection(self, maven_project: Path, scan_context) -> None:
+        changed = maven_project / "apps" / "web" / "src" / "Web.java"
+        selection = java_module_selection(
+            scan_context(maven_project, [changed]), "maven"
+        )
+
+        assert selection["affected"] == {"apps/web"}
+        assert selection["upstream"] == {".", "core"}
+
+    def test_full_scans(self, gradle_project: Path, scan_context) -> None:
+        changed = gradle_project / "core" / "A.java"
+        assert (
+            java_module_selection(scan_context(gradle_project, [gradle_project]), "")
+            is None
+        )
+        assert (
+            java_module_selection(
+                scan_context(gradle_project, [changed], all_files=True), "gradle"
+            )
+            is None
+        )
+
+    def test_single_module_build(self, tmp_path: Path, scan_context) -> None:
+        _write(tmp_path / "pom.xml", _pom("app", parent=False))
+        context = scan_context(tmp_path, [tmp_path / "src" / "A.java"])
+        assert java_module_selection(context, "maven") is None
+
+
+class TestChangedClasses:
+    def test_finds_nested_classes(self, tmp_path: Path) -> None:
+        classes = tmp_path / "core" / "target" / "classes" / "com" / "example"
+        classes.mkdir(parents=True)
+        for name in ("Foo", "Foo$Inner", "Foo$1", "FooBar"):
+            (classes / f"{name}.class").touch()
+        test_classes = tmp_path / "build" / "classes" / "java" / "test"
+        test_classes.mkdir(parents=True)
+        (test_classes / "AppTest.class").touch()
+
+        context = MagicMock(
+            project_root=tmp_path,
+            all_files=False,
+            paths=[
+                tmp_path / "core/src/main/java/com/example/Foo.java",
+                tmp_path / "src/test/java/AppTest.java",
+                tmp_path / "src/main/java/NotCompiled.java",
+                tmp_path / "README.md",
+            ],
+        )
+
+        assert changed_classes(context) == {
+            tmp_path / "core" / "target" / "classes": [
+                "com.example.Foo",
+                "com.example.Foo$1",
+                "com.example.Foo$Inner",
+            ],
+            test_classes: ["AppTest"],
+        }
+
+    def test_full_scan(self, tmp_path: Path) -> None:
+        context = MagicMock(project_root=tmp_path, all_files=True, paths=[])
+        assert changed_classes(context) is None
@@ -0,0 +1,297 @@
+"""Tests for the persistent JVM worker client."""
+
+from __future__ import annotations
+
+import socket
+import struct
+import subprocess
+import threading
+from contextlib import ExitStack
+from pathlib import Path
+from typing import List, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lucidshark.core.models import ScanContext
+from lucidshark.core.streaming import CallbackStreamHandler, StreamType
+from lucidshark.plugins import jvm_worker
+from lucidshark.plugins.jvm_worker import (
+    JvmWorker,
+    WorkerUnavailable,
+    java_major_version,
+    run_in_jvm_worker,
+)
+
+
+def _read_field(stream) -> bytes:
+    (length,) = struct.unpack(">i", stream.read(4))
+    return stream.read(length)
+
+
+def _read_list(stream) -> List[str]:
+    (count,) = struct.unpack(">i", stream.read(4))
+    return [_read_field(stream).decode() for _ in range(count)]
+
+
+def _field(data: bytes) -> bytes:
+    return struct.pack(">i", len(data)) + data
+
+
+class FakeWorker:
+    """Loopback server speaking the worker protocol."""
+
+    def __init__(self, exit_code: int = 0, error: Optional[str] = None) -> None:
+        self.exit_code = exit_code
+        self.error = error
+        self.requests: List[Tuple[str, ...]] = []
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.port = self.server.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            with conn, conn.makefile("rwb") as stream:
+                token = _read_field(stream).decode()
+                op = _read_field(stream).decode()
+                if op == "run":
+                    main_class = _read_field(stream).decode()
+                    classpath = _read_list(stream)
+                    args = _read_list(stream)
+                    self.requests.append(
+                        (token, op, main_class, *classpath, "--", *args)
+                    )
+                else:
+                    self.requests.append((token, op))
+                if self.error is not None:
+                    stream.write(struct.pack(">i", 1) + _field(self.error.encode()))
+                else:
+                    stream.write(
+                        struct.pack(">ii", 0, self.exit_code)
+                        + _field(b"<checkstyle/>\nline 2")
+                        + _field(b"warning")
+                    )
+                stream.flush()
+
+    def state(self) -> dict:
+        return {"pid": 0, "port": self.port, "token": "secret", "fingerprint": []}
+
+    def close(self) -> None:
+        self.server.close()
+
+
+@pytest.fixture
+def fake_worker():
+    worker = FakeWorker()
+    yield worker
+    worker.close()
+
+
+def _context(tmp_path: Path, enabled: bool = True, handler=None) -> ScanContext:
+    config = MagicMock()
+    config.settings.jvm_worker = enabled
+    return ScanContext(
+        project_root=tmp_path,
+        paths=[tmp_path],
+        enabled_domains=[],
+        config=config,
+        stream_handler=handler,
+    )
+
+
+class TestJvmWorkerRun:
+    def test_runs_request(self, tmp_path: Path, fake_worker: FakeWorker) -> None:
+        worker = JvmWorker(tmp_path)
+        worker._state = fake_worker.state()
+
+        exit_code, stdout, stderr = worker.run(
+            [Path("/opt/tool.jar")], ["-f", "xml"], timeout=10
+        )
+
+        assert (exit_code, stdout, stderr) == (0, "<checkstyle/>\nline 2", "warning")
+        assert fake_worker.requests == [
+            ("secret", "run", "", "/opt/tool.jar", "--", "-f", "xml")
+        ]
+
+    def test_error_status_is_unavailable(self, tmp_path: Path) -> None:
+        fake = FakeWorker(error="cannot load tool")
+        try:
+            worker = JvmWorker(tmp_path)
+            worker._state = fake.state()
+
+            with pytest.raises(WorkerUnavailable, match="cannot load tool"):
+                worker.run([Path("tool.jar")], [], timeout=10)
+            assert worker._state is None
+        finally:
+            fake.close()
+
+    def test_busy_worker_is_unavailable(self, tmp_path: Path) -> None:
+        worker = JvmWorker(tmp_path)
+        worker._lock.acquire()
+        try:
+            with pytest.raises(WorkerUnavailable, match="busy"):
+                worker.run([Path("tool.jar")], [])
+        finally:
+            worker._lock.release()
+
+    def test_timeout_kills_worker(self, tmp_path: Path) -> None:
+        server = socket.create_server(("127.0.0.1", 0))
+        try:
+            worker = JvmWorker(tmp_path)
+            worker._state = {"pid": 4242, "port": server.getsockname()[1], "token": "t"}
+
+            with patch.object(jvm_worker.os, "kill") as kill:
+                with pytest.raises(subprocess.TimeoutExpired):
+                    worker.run([Path("tool.jar")], [], timeout=0.2)
+
+            assert kill.call_args[0][0] == 4242
+            assert worker._state is None
+        finally:
+            server.close()
+
+
+class TestJvmWorkerLifecycle:
+    @staticmethod
+    def _environment(stack: ExitStack, worker: JvmWorker, state: Optional[dict]):
+        stack.enter_context(
+            patch.object(jvm_worker.shutil, "which", return_value="/usr/bin/java")
+        )
+        stack.enter_context(
+            patch.object(jvm_worker, "java_major_version", return_value=17)
+        )
+        stack.enter_context(
+            patch.object(worker, "_install_source", return_value=Path("W.java"))
+        )
+        stack.enter_context(
+            patch.object(worker, "_fingerprint", return_value=["current"])
+        )
+        stack.enter_context(patch.object(worker, "_read_state", return_value=state))
+
+    def test_reuses_running_worker(self, tmp_path: Path) -> None:
+        worker = JvmWorker(tmp_path)
+        state = {"port": 1, "token": "t", "fingerprint": ["current"]}
+        with ExitStack() as stack:
+            self._environment(stack, worker, state)
+            stack.enter_context(patch.object(worker, "_ping", return_value=True))
+            start = stack.enter_context(patch.object(worker, "_start"))
+
+            assert worker._ensure_running() is state
+
+        start.assert_not_called()
+
+    def test_restarts_on_fingerprint_change(self, tmp_path: Path) -> None:
+        worker = JvmWorker(tmp_path)
+        old = {"port": 1, "token": "t", "fingerprint": ["java 17.0.1"]}
+        new = {"port": 2, "token": "u", "fingerprint": ["current"]}
+        with ExitStack() as stack:
+            self._environment(stack, worker, old)
+            stop = stack.enter_context(patch.object(worker, "_stop"))
+            start = stack.enter_context(
+                patch.object(worker, "_start", return_value=new)
+            )
+
+            assert worker._ensure_running() is new
+
+        stop.assert_called_once_with(old)
+        start.assert_called_once()
+
+    def test_failed_start_disables_worker(self, tmp_path: Path) -> None:
+        worker = JvmWorker(tmp_path)
+        with ExitStack() as stack:
+            self._environment(stack, worker, None)
+            start = stack.enter_context(
+                patch.object(worker, "_start", side_effect=WorkerUnavailable("exit"))
+            )
+
+            for _ in range(2):
+                with pytest.raises(WorkerUnavailable):
+                    worker._ensure_running()
+
+        assert start.call_count == 1
+
+    def test_unsupported_java_version(self, tmp_path: Path) -> None:
+        worker = JvmWorker(tmp_path)
+        with (
+            patch.object(jvm_worker.shutil, "which", return_value="/usr/bin/java"),
+            patch.object(jvm_worker, "java_major_version", return_value=25),
+        ):
+            with pytest.raises(WorkerUnavailable, match="Java 25"):
+                worker._ensure_running()
+
+
+class TestRunInJvmWorker:
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        context = _context(tmp_path, enabled=False)
+
+        with patch.object(jvm_worker, "get_jvm_worker") as get_worker:
+            assert run_in_jvm_worker(context, ["java", "-jar", "a.jar"], "x") is None
+        get_worker.assert_not_called()
+
+    def test_translates_jar_command_and_streams(self, tmp_path: Path) -> None:
+        events = []
+        handler = CallbackStreamHandler(on_event=events.append)
+        context = _context(tmp_path, handler=handler)
+        worker = MagicMock()
+        worker.run.return_value = (1, "a\nb", "")
+
+        with patch.object(jvm_worker, "get_jvm_worker", return_value=worker):
+            result = run_in_jvm_worker(
+                context, ["java", "-jar", "/t/ktlint.jar", "--reporter=json"], "ktlint"
+            )
+
+        assert result is not None
+        assert result.returncode == 1
+        assert result.stdout == "a\nb"
+        worker.run.assert_called_once_with(
+            [Path("/t/ktlint.jar")], ["--reporter=json"], None, 120
+        )
+        stdout = [e.content for e in events if e.stream_type == StreamType.STDOUT]
+        assert stdout == ["a", "b"]
+
+    def test_explicit_classpath(self, tmp_path: Path) -> None:
+        context = _context(tmp_path)
+        worker = MagicMock()
+        worker.run.return_value = (0, "", "")
+        jars = [tmp_path / "lib" / "pmd-core.jar"]
+
+        with patch.object(jvm_worker, "get_jvm_worker", return_value=worker):
+            run_in_jvm_worker(
+                context,
+                ["/opt/pmd/bin/pmd", "check", "-f", "json"],
+                "pmd",
+                classpath=jars,
+                main_class="net.sourceforge.pmd.cli.PmdCli",
+            )
+
+        worker.run.assert_called_once_with(
+            jars, ["check", "-f", "json"], "net.sourceforge.pmd.cli.PmdCli", 120
+        )
+
+    def test_unavailable_worker_falls_back(self, tmp_path: Path) -> None:
+        context = _context(tmp_path)
+        worker = MagicMock()
+        worker.run.side_effect = WorkerUnavailable("Java 25")
+
+        with patch.object(jvm_worker, "get_jvm_worker", return_value=worker):
+            assert run_in_jvm_worker(context, ["java", "-jar", "a.jar"], "x") is None
+
+
+class TestJavaMajorVersion:
+    @pytest.mark.parametrize(
+        "output, expected",
+        [
+            ('openjdk version "17.0.2" 2022-01-18', 17),
+            ('java version "1.8.0_292"', 8),
+            ('openjdk version "21" 2023-09-19', 21),
+            ("garbage", None),
+        ],
+    )
+    def test_parses_version(self, output: str, expected: Optional[int]) -> None:
+        completed = subprocess.CompletedProcess([], 0, stdout="", stderr=output)
+        with patch.object(jvm_worker.subprocess, "run", return_value=completed):
+            assert java_major_version("/usr/bin/java") == expected
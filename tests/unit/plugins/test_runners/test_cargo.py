@@ -260,6 +260,67 @@ class TestRunTestsTarpaulinIntegration:
             assert mock_run.call_count == 2
 
 
+class TestRunTestsPackageSelection:
+    """Tests for workspace member selection and the shared target directory."""
+
+    @patch("lucidshark.plugins.test_runners.cargo.run_with_streaming")
+    @patch.object(CargoTestRunner, "ensure_binary")
+    def test_tests_affected_members(
+        self,
+        mock_binary: MagicMock,
+        mock_run: MagicMock,
+        tmp_path: Path,
+        monkeypatch,
+    ) -> None:
+        monkeypatch.delenv("CARGO_TARGET_DIR", raising=False)
+        (tmp_path / "Cargo.toml").write_text("[workspace]\n")
+        mock_binary.return_value = Path("/usr/bin/cargo")
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        context = ScanContext(
+            project_root=tmp_path,
+            paths=[tmp_path / "api" / "src" / "lib.rs"],
+            enabled_domains=[ToolDomain.TESTING],
+        )
+
+        with patch(
+            "lucidshark.plugins.test_runners.cargo.cargo_package_args",
+            return_value=["-p", "api"],
+        ):
+            CargoTestRunner().run_tests(context)
+
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["cmd"] == ["/usr/bin/cargo", "test", "-p", "api"]
+        assert kwargs["env"] == {
+            "CARGO_TARGET_DIR": str(
+                tmp_path / ".lucidshark" / "cache" / "cargo" / "target"
+            )
+        }
+
+    @patch("lucidshark.plugins.test_runners.cargo.run_with_streaming")
+    @patch.object(CargoTestRunner, "ensure_binary")
+    def test_skips_when_no_member_affected(
+        self, mock_binary: MagicMock, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        (tmp_path / "Cargo.toml").write_text("[workspace]\n")
+        mock_binary.return_value = Path("/usr/bin/cargo")
+        context = ScanContext(
+            project_root=tmp_path,
+            paths=[tmp_path / "README.md"],
+            enabled_domains=[ToolDomain.TESTING],
+        )
+
+        with patch(
+            "lucidshark.plugins.test_runners.cargo.cargo_package_args",
+            return_value=[],
+        ):
+            result = CargoTestRunner().run_tests(context)
+
+        mock_run.assert_not_called()
+        assert result.total == 0
+
+
 class TestParseTestOutput:
     """Tests for _parse_test_output."""
 
@@ -5,9 +5,13 @@ from __future__ import annotations
 import subprocess
 import tempfile
 from pathlib import Path
+from typing import List
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from lucidshark.core.models import ScanContext, ToolDomain
+from lucidshark.plugins.dotnet_utils import DotnetBuild
 from lucidshark.plugins.test_runners.dotnet_test import DotnetTestRunner
 
 
@@ -298,3 +302,45 @@ class TestRunTests:
                 result = runner.run_tests(context)
                 assert result.tool == "dotnet_test"
                 assert result.passed == 0
+
+    @pytest.mark.parametrize(
+        "build, expected, unexpected",
+        [
+            (
+                DotnetBuild(output="", succeeded=True, artifacts_path=Path("/a")),
+                ["--no-build", "--artifacts-path", "/a"],
+                "--no-restore",
+            ),
+            (
+                DotnetBuild(output="", succeeded=False, artifacts_path=Path("/a")),
+                ["--no-restore"],
+                "--no-build",
+            ),
+        ],
+    )
+    def test_runs_against_shared_build(
+        self, build: DotnetBuild, expected: List[str], unexpected: str
+    ) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            (project_root / "MyApp.csproj").touch()
+
+            runner = DotnetTestRunner()
+            with (
+                patch(
+                    "lucidshark.plugins.test_runners.dotnet_test.shared_build",
+                    return_value=build,
+                ),
+                patch(
+                    "lucidshark.plugins.test_runners.dotnet_test.run_with_streaming",
+                    return_value=subprocess.CompletedProcess(
+                        args=[], returncode=0, stdout="", stderr=""
+                    ),
+                ) as mock_run,
+                patch.object(runner, "ensure_binary", return_value=FAKE_BINARY),
+            ):
+                runner.run_tests(_make_context(project_root))
+
+            cmd = mock_run.call_args.kwargs["cmd"]
+            assert cmd[-len(expected) :] == expected
+            assert unexpected not in cmd
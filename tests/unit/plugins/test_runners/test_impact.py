@@ -0,0 +1,192 @@
+"""Unit tests for change-based test selection."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from lucidshark.plugins.test_runners.impact import (
+    ImpactMap,
+    config_fingerprint,
+    impact_enabled,
+    is_global_file,
+    read_coverage_contexts,
+    select_tests,
+)
+
+
+def _write_coverage_data(path: Path, rows) -> None:
+    """Write a minimal coverage.py SQLite data file."""
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        """
+        CREATE TABLE file (id INTEGER PRIMARY KEY, path TEXT);
+        CREATE TABLE context (id INTEGER PRIMARY KEY, context TEXT);
+        CREATE TABLE line_bits (file_id INTEGER, context_id INTEGER, numbits BLOB);
+        CREATE TABLE arc (
+            file_id INTEGER, context_id INTEGER, fromno INTEGER, tono INTEGER
+        );
+        """
+    )
+    files = {}
+    contexts = {}
+    for context_name, file_path, table in rows:
+        file_id = files.setdefault(file_path, len(files) + 1)
+        context_id = contexts.setdefault(context_name, len(contexts) + 1)
+        connection.execute(
+            "INSERT OR IGNORE INTO file VALUES (?, ?)", (file_id, file_path)
+        )
+        connection.execute(
+            "INSERT OR IGNORE INTO context VALUES (?, ?)", (context_id, context_name)
+        )
+        if table == "arc":
+            connection.execute(
+                "INSERT INTO arc VALUES (?, ?, 1, 2)", (file_id, context_id)
+            )
+        else:
+            connection.execute(
+                "INSERT INTO line_bits VALUES (?, ?, x'01')", (file_id, context_id)
+            )
+    connection.commit()
+    connection.close()
+
+
+class TestImpactEnabled:
+    @pytest.mark.parametrize("value, expected", [(True, True), (False, False)])
+    def test_reads_config(self, value: bool, expected: bool) -> None:
+        context = MagicMock()
+        context.config.pipeline.testing.impact = value
+        assert impact_enabled(context) is expected
+
+    def test_missing_testing_config(self) -> None:
+        context = MagicMock()
+        context.config.pipeline.testing = None
+        assert impact_enabled(context) is False
+
+
+class TestSelectTests:
+    TESTS = [
+        "tests/test_a.py::test_a",
+        "tests/test_b.py::TestB::test_b",
+        "tests/test_c.py::test_new",
+    ]
+    FOOTPRINTS = {
+        "tests/test_a.py::test_a": ["src/a.py", "src/common.py"],
+        "tests/test_b.py::TestB::test_b": ["src/b.py", "src/common.py"],
+    }
+
+    def test_selects_by_footprint(self) -> None:
+        selected = select_tests(self.TESTS, ["src/b.py"], self.FOOTPRINTS)
+        assert selected == [
+            "tests/test_b.py::TestB::test_b",
+            "tests/test_c.py::test_new",
+        ]
+
+    def test_selects_tests_in_changed_test_files(self) -> None:
+        selected = select_tests(self.TESTS, ["tests/test_a.py"], self.FOOTPRINTS)
+        assert selected == ["tests/test_a.py::test_a", "tests/test_c.py::test_new"]
+
+    def test_unknown_tests_always_run(self) -> None:
+        assert select_tests(self.TESTS, ["README.md"], self.FOOTPRINTS) == [
+            "tests/test_c.py::test_new"
+        ]
+
+    def test_documentation_is_ignored(self) -> None:
+        changed = ["docs/index.html", "CHANGELOG.md", "src/a.py"]
+        assert select_tests(self.TESTS, changed, self.FOOTPRINTS) == [
+            "tests/test_a.py::test_a",
+            "tests/test_c.py::test_new",
+        ]
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            "tests/helpers.py",
+            "src/new_module.py",
+            "tests/data/fixture.json",
+            "src/templates/page.html",
+            "src/fast.pyx",
+        ],
+    )
+    def test_untracked_files_select_everything(self, changed: str) -> None:
+        # Neither a test file nor executed by any recorded test
+        assert select_tests(self.TESTS, [changed], self.FOOTPRINTS) is None
+        assert select_tests(self.TESTS, [changed, "src/a.py"], self.FOOTPRINTS) is None
+
+    @pytest.mark.parametrize(
+        "changed", ["tests/conftest.py", "pyproject.toml", "requirements-dev.txt"]
+    )
+    def test_global_files_select_everything(self, changed: str) -> None:
+        assert select_tests(self.TESTS, [changed], self.FOOTPRINTS) is None
+
+    def test_is_global_file(self) -> None:
+        assert is_global_file("a/b/conftest.py")
+        assert is_global_file("requirements.txt")
+        assert not is_global_file("src/requirements.py")
+
+
+class TestReadCoverageContexts:
+    def test_reads_files_per_context(self, tmp_path: Path) -> None:
+        data_file = tmp_path / ".coverage"
+        _write_coverage_data(
+            data_file,
+            [
+                ("", str(tmp_path / "src" / "a.py"), "line_bits"),
+                ("t.py::a", str(tmp_path / "src" / "a.py"), "line_bits"),
+                ("t.py::a", "src/rel.py", "line_bits"),
+                ("t.py::b", str(tmp_path / "src" / "b.py"), "arc"),
+                ("t.py::b", "/usr/lib/python3/site.py", "line_bits"),
+            ],
+        )
+
+        assert read_coverage_contexts(data_file, tmp_path) == {
+            "t.py::a": {"src/a.py", "src/rel.py"},
+            "t.py::b": {"src/b.py"},
+        }
+
+    def test_unreadable_data(self, tmp_path: Path) -> None:
+        data_file = tmp_path / ".coverage"
+        assert read_coverage_contexts(data_file, tmp_path) == {}
+        data_file.write_text("!coverage.py: old JSON format")
+        assert read_coverage_contexts(data_file, tmp_path) == {}
+
+
+class TestImpactMap:
+    def test_complete_run_replaces_map(self, tmp_path: Path) -> None:
+        impact_map = ImpactMap.for_project(tmp_path, "pytest")
+        impact_map.record({"t::a": {"a.py"}}, "f1", complete=True)
+        impact_map.record({"t::b": {"b.py", "a.py"}}, "f1", complete=True)
+
+        assert impact_map.path.parent == tmp_path / ".lucidshark" / "cache" / "pytest"
+        assert impact_map.load("f1") == {"t::b": ["a.py", "b.py"]}
+
+    def test_partial_run_updates_map(self, tmp_path: Path) -> None:
+        impact_map = ImpactMap.for_project(tmp_path, "pytest")
+        impact_map.record({"t::a": {"a.py"}, "t::b": {"b.py"}}, "f1", complete=True)
+        impact_map.record({"t::b": {"c.py"}}, "f1", complete=False)
+
+        assert impact_map.load("f1") == {"t::a": ["a.py"], "t::b": ["c.py"]}
+
+    def test_stale_map(self, tmp_path: Path) -> None:
+        impact_map = ImpactMap.for_project(tmp_path, "pytest")
+        impact_map.record({"t::a": {"a.py"}}, "f1", complete=True)
+
+        assert impact_map.load("f2") is None
+        impact_map.record({"t::a": {"b.py"}}, "f2", complete=False)
+        assert impact_map.load("f1") == {"t::a": ["a.py"]}
+
+    def test_fingerprint_tracks_global_files(self, tmp_path: Path) -> None:
+        (tmp_path / "src.py").write_text("x = 1\n")
+        before = config_fingerprint(tmp_path, "pytest")
+
+        (tmp_path / "src.py").write_text("x = 2\n")
+        assert config_fingerprint(tmp_path, "pytest") == before
+
+        (tmp_path / "pyproject.toml").write_text("[tool.pytest.ini_options]\n")
+        assert config_fingerprint(tmp_path, "pytest") != before
+        assert config_fingerprint(tmp_path, "other") != config_fingerprint(
+            tmp_path, "pytest"
+        )
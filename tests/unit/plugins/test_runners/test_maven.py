@@ -383,6 +383,114 @@ class TestMavenRunTests:
                 assert result.failed == 1
 
 
+class TestMavenModuleSelection:
+    """Tests for running only the modules affected by changed files."""
+
+    REPORT = (
+        '<testsuite name="T" tests="1" failures="0" errors="0" skipped="0">'
+        '<testcase classname="T" name="t"/></testsuite>'
+    )
+
+    def _context(self, project_root: Path, *changed: str, coverage: bool = False):
+        context = MagicMock()
+        context.project_root = project_root
+        context.stream_handler = None
+        context.all_files = False
+        context.paths = [project_root / path for path in changed]
+        context.enabled_domains = (
+            [ToolDomain.TESTING, ToolDomain.COVERAGE] if coverage else []
+        )
+        return context
+
+    def _maven_project(self, project_root: Path) -> None:
+        (project_root / "pom.xml").write_text(
+            "<project><groupId>g</groupId><artifactId>root</artifactId>"
+            "<modules><module>core</module><module>app</module></modules></project>"
+        )
+        (project_root / "core").mkdir()
+        (project_root / "core" / "pom.xml").write_text(
+            "<project><groupId>g</groupId><artifactId>core</artifactId></project>"
+        )
+        (project_root / "app").mkdir()
+        (project_root / "app" / "pom.xml").write_text(
+            "<project><groupId>g</groupId><artifactId>app</artifactId>"
+            "<dependencies><dependency><groupId>g</groupId>"
+            "<artifactId>core</artifactId></dependency></dependencies></project>"
+        )
+        for module in ("core", "app"):
+            reports = project_root / module / "target" / "surefire-reports"
+            reports.mkdir(parents=True)
+            (reports / "TEST-T.xml").write_text(self.REPORT)
+
+    def _cmd(self, mock_run: MagicMock) -> list:
+        return mock_run.call_args.kwargs["cmd"]
+
+    def test_maven_runs_affected_modules(self, tmp_path: Path) -> None:
+        self._maven_project(tmp_path)
+        runner = MavenTestRunner(project_root=tmp_path)
+
+        with patch("lucidshark.plugins.test_runners.maven.run_with_streaming") as run:
+            result = runner._run_maven_tests(
+                tmp_path / "mvnw", self._context(tmp_path, "core/src/A.java")
+            )
+
+        assert self._cmd(run)[-3:] == ["-pl", "app,core", "-amd"]
+        assert result.passed == 2
+
+    def test_maven_builds_upstream_reactor_modules(self, tmp_path: Path) -> None:
+        self._maven_project(tmp_path)
+        runner = MavenTestRunner(project_root=tmp_path)
+
+        with patch("lucidshark.plugins.test_runners.maven.run_with_streaming") as run:
+            result = runner._run_maven_tests(
+                tmp_path / "mvnw", self._context(tmp_path, "app/src/A.java")
+            )
+
+        assert self._cmd(run)[-4:] == ["-pl", "app", "-amd", "-am"]
+        assert result.passed == 2
+
+    def test_maven_with_coverage_runs_everything(self, tmp_path: Path) -> None:
+        self._maven_project(tmp_path)
+        runner = MavenTestRunner(project_root=tmp_path)
+
+        with patch("lucidshark.plugins.test_runners.maven.run_with_streaming") as run:
+            runner._run_maven_tests(
+                tmp_path / "mvnw",
+                self._context(tmp_path, "app/src/A.java", coverage=True),
+            )
+
+        assert "-pl" not in self._cmd(run)
+
+    def test_maven_nothing_affected(self, tmp_path: Path) -> None:
+        self._maven_project(tmp_path)
+        runner = MavenTestRunner(project_root=tmp_path)
+
+        with patch("lucidshark.plugins.test_runners.maven.run_with_streaming") as run:
+            result = runner._run_maven_tests(
+                tmp_path / "mvnw", self._context(tmp_path, "../elsewhere/A.java")
+            )
+
+        run.assert_not_called()
+        assert result.total == 0
+
+    def test_gradle_runs_affected_project_tasks(self, tmp_path: Path) -> None:
+        (tmp_path / "settings.gradle").write_text("include 'core', 'app'\n")
+        for module in ("core", "app"):
+            (tmp_path / module / "src").mkdir(parents=True)
+        (tmp_path / "app" / "build.gradle").write_text(
+            "dependencies { implementation project(':core') }\n"
+        )
+        runner = MavenTestRunner(project_root=tmp_path)
+
+        with patch("lucidshark.plugins.test_runners.maven.run_with_streaming") as run:
+            runner._run_gradle_tests(
+                tmp_path / "gradlew",
+                self._context(tmp_path, "core/src/A.java", "README.md"),
+            )
+
+        assert self._cmd(run)[1:] == [":app:test", ":core:test", "--no-daemon"]
+
+
 class TestMavenSurefireReportParsing:
     """Tests for Surefire report directory parsing."""
 
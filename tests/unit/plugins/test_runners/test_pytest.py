@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
+import subprocess
 import tempfile
 from pathlib import Path
+from typing import List
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from lucidshark.core.models import Severity, ToolDomain
-from lucidshark.plugins.test_runners.pytest import PytestRunner
+from lucidshark.core.models import ScanContext, Severity, ToolDomain
+from lucidshark.plugins.test_runners.impact import ImpactMap, config_fingerprint
+from lucidshark.plugins.test_runners.pytest import (
+    CONTEXTS_ENV,
+    HELPER_PLUGIN,
+    SELECT_FILE_ENV,
+    PytestRunner,
+    _junit_test_id,
+)
+from lucidshark.plugins.test_runners.sharding import DurationStore
 
 
 class TestPytestRunner:
@@ -374,3 +386,237 @@ class TestBuildBaseCmd:
 
             assert "--source" not in cmd
             assert cmd == [str(cov), "run", "-m", "pytest"]
+
+
+class TestPytestSharding:
+    """Tests for running pytest in parallel shards."""
+
+    @pytest.mark.parametrize(
+        "nodeid, expected",
+        [
+            ("tests/test_a.py::test_x", "tests.test_a::test_x"),
+            ("tests/test_a.py::TestA::test_x", "tests.test_a.TestA::test_x"),
+            ("test_a.py::test_x[1-2]", "test_a::test_x[1-2]"),
+        ],
+    )
+    def test_junit_test_id(self, nodeid: str, expected: str) -> None:
+        assert _junit_test_id(nodeid) == expected
+
+    def test_collect_tests_parses_node_ids(self, tmp_path: Path) -> None:
+        output = (
+            "tests/test_a.py::test_one\n"
+            "tests/test_a.py::TestA::test_two\n"
+            "\n"
+            "2 tests collected in 0.01s\n"
+        )
+        completed = subprocess.CompletedProcess([], 0, stdout=output, stderr="")
+        with patch("subprocess.run", return_value=completed):
+            tests = PytestRunner()._collect_tests(Path("pytest"), tmp_path)
+
+        assert tests == [
+            "tests/test_a.py::test_one",
+            "tests/test_a.py::TestA::test_two",
+        ]
+
+    def test_collect_errors_return_nothing(self, tmp_path: Path) -> None:
+        completed = subprocess.CompletedProcess(
+            [], 2, stdout="tests/test_a.py::test_one\n", stderr=""
+        )
+        with patch("subprocess.run", return_value=completed):
+            assert PytestRunner()._collect_tests(Path("pytest"), tmp_path) == []
+
+    def test_few_tests_run_unsharded(self, tmp_path: Path) -> None:
+        runner = PytestRunner(project_root=tmp_path)
+        context = MagicMock(project_root=tmp_path)
+        context.config.pipeline.testing.shards = 4
+        context.config.pipeline.testing.impact = False
+        with (
+            patch.object(runner, "ensure_binary", return_value=Path("pytest")),
+            patch.object(runner, "_find_coverage_binary", return_value=None),
+            patch.object(runner, "_has_json_report_plugin", return_value=False),
+            patch.object(runner, "_collect_tests", return_value=["t.py::a"]),
+            patch.object(runner, "_run_sharded") as sharded,
+            patch.object(runner, "_run_with_junit_xml") as unsharded,
+        ):
+            runner.run_tests(context)
+
+        sharded.assert_not_called()
+        unsharded.assert_called_once()
+
+    def test_records_durations(self, tmp_path: Path) -> None:
+        json_report = tmp_path / "report.json"
+        json_report.write_text(
+            json.dumps(
+                {
+                    "tests": [
+                        {
+                            "nodeid": "t.py::a",
+                            "setup": {"duration": 0.5},
+                            "call": {"duration": 1.0},
+                            "teardown": {"duration": 0.25},
+                        }
+                    ]
+                }
+            )
+        )
+        junit_report = tmp_path / "junit.xml"
+        junit_report.write_text(
+            '<testsuite><testcase classname="t" name="b" time="2.5"/></testsuite>'
+        )
+
+        PytestRunner()._record_durations([json_report, junit_report], tmp_path)
+
+        store = DurationStore.for_project(tmp_path, "pytest")
+        assert store.load() == {"t.py::a": 1.75, "t::b": 2.5}
+
+    @pytest.mark.skipif(shutil.which("pytest") is None, reason="pytest not in PATH")
+    def test_sharded_run_merges_results(self, tmp_path: Path) -> None:
+        (tmp_path / "test_sample.py").write_text(
+            "def test_one():\n    pass\n\n"
+            "def test_two():\n    assert 1 == 2\n\n"
+            "def test_three():\n    pass\n"
+        )
+        context = ScanContext(
+            project_root=tmp_path,
+            paths=[tmp_path],
+            enabled_domains=[],
+            config=MagicMock(),
+        )
+        runner = PytestRunner()
+        binary = Path(shutil.which("pytest"))  # type: ignore[arg-type]
+
+        tests = runner._collect_tests(binary, tmp_path)
+
+        result = runner._run_sharded(binary, context, None, 2, False, tests)
+
+        assert result is not None
+        assert (result.passed, result.failed) == (2, 1)
+        assert len(result.issues) == 1
+        recorded = DurationStore.for_project(tmp_path, "pytest").load()
+        assert set(recorded) == {
+            "test_sample::test_one",
+            "test_sample::test_two",
+            "test_sample::test_three",
+        }
+
+
+class TestPytestImpactAnalysis:
+    """Tests for running only the tests affected by changed files."""
+
+    @staticmethod
+    def _context(tmp_path: Path, changed: List[str], **kwargs) -> ScanContext:
+        config = MagicMock()
+        config.pipeline.testing.impact = True
+        config.pipeline.testing.shards = 0
+        return ScanContext(
+            project_root=tmp_path,
+            paths=[tmp_path / path for path in changed],
+            enabled_domains=kwargs.pop("enabled_domains", [ToolDomain.TESTING]),
+            config=config,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _record_map(tmp_path: Path, footprints: dict) -> str:
+        fingerprint = config_fingerprint(tmp_path, "pytest")
+        ImpactMap.for_project(tmp_path, "pytest").record(
+            footprints, fingerprint, complete=True
+        )
+        return fingerprint
+
+    def _run(self, tmp_path: Path, context: ScanContext, tests: List[str]):
+        runner = PytestRunner(project_root=tmp_path)
+        with (
+            patch.object(runner, "ensure_binary", return_value=Path("pytest")),
+            patch.object(
+                runner, "_find_coverage_binary", return_value=Path("coverage")
+            ),
+            patch.object(runner, "_has_json_report_plugin", return_value=False),
+            patch.object(runner, "_collect_tests", return_value=tests),
+            patch.object(runner, "_run_with_junit_xml") as run,
+            patch.object(runner, "_record_impact") as record,
+        ):
+            result = runner.run_tests(context)
+        return result, run, record
+
+    def test_runs_affected_tests(self, tmp_path: Path) -> None:
+        tests = ["tests/test_a.py::test_a", "tests/test_b.py::test_b"]
+        self._record_map(tmp_path, {tests[0]: ["src/a.py"], tests[1]: ["src/b.py"]})
+
+        _, run, record = self._run(
+            tmp_path, self._context(tmp_path, ["src/b.py"]), tests
+        )
+
+        run.assert_called_once()
+        assert run.call_args[0][3:] == ([tests[1]], True)
+        assert record.call_args[0][1] == [tests[1]]
+        assert record.call_args[0][3] is False
+
+    def test_no_affected_tests_skips_run(self, tmp_path: Path) -> None:
+        tests = ["tests/test_a.py::test_a"]
+        self._record_map(tmp_path, {tests[0]: ["src/a.py"]})
+
+        result, run, _ = self._run(
+            tmp_path, self._context(tmp_path, ["docs/index.md"]), tests
+        )
+
+        run.assert_not_called()
+        assert (result.passed, result.failed, result.errors) == (0, 0, 0)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"all_files": True},
+            {"enabled_domains": [ToolDomain.TESTING, ToolDomain.COVERAGE]},
+        ],
+    )
+    def test_full_suite_when_not_incremental(self, tmp_path: Path, kwargs) -> None:
+        tests = ["tests/test_a.py::test_a", "tests/test_b.py::test_b"]
+        self._record_map(tmp_path, {tests[0]: ["src/a.py"], tests[1]: ["src/b.py"]})
+
+        _, run, record = self._run(
+            tmp_path, self._context(tmp_path, ["src/b.py"], **kwargs), tests
+        )
+
+        assert run.call_args[0][3:] == (None, True)
+        assert record.call_args[0][3] is True
+
+    def test_full_suite_without_current_map(self, tmp_path: Path) -> None:
+        tests = ["tests/test_a.py::test_a"]
+        (tmp_path / "pytest.ini").write_text("[pytest]\n")
+        self._record_map(tmp_path, {tests[0]: ["src/a.py"]})
+        (tmp_path / "pytest.ini").write_text("[pytest]\naddopts = -x\n")
+
+        _, run, _ = self._run(tmp_path, self._context(tmp_path, ["src/b.py"]), tests)
+
+        assert run.call_args[0][3] is None
+
+    def test_helper_plugin_environment(self, tmp_path: Path) -> None:
+        args, env = PytestRunner()._helper_plugin(
+            tmp_path, "selected", ["t.py::a", "t.py::b"], record_contexts=True
+        )
+
+        assert args == ["-p", HELPER_PLUGIN]
+        assert env is not None
+        assert env["PYTHONPATH"].split(os.pathsep)[0] == str(tmp_path)
+        assert Path(env[SELECT_FILE_ENV]).read_text() == "t.py::a\nt.py::b"
+        assert env[CONTEXTS_ENV] == "1"
+        assert (tmp_path / f"{HELPER_PLUGIN}.py").exists()
+
+    def test_helper_plugin_not_needed(self, tmp_path: Path) -> None:
+        assert PytestRunner()._helper_plugin(tmp_path, "x", None, False) == ([], None)
+
+    @pytest.mark.skipif(shutil.which("pytest") is None, reason="pytest not in PATH")
+    def test_helper_plugin_selects_tests(self, tmp_path: Path) -> None:
+        (tmp_path / "test_sample.py").write_text(
+            "def test_one():\n    pass\n\ndef test_two():\n    assert False\n"
+        )
+        context = self._context(tmp_path, ["test_sample.py"])
+        runner = PytestRunner()
+        binary = Path(shutil.which("pytest"))  # type: ignore[arg-type]
+
+        result = runner._run_with_junit_xml(
+            binary, context, None, ["test_sample.py::test_one"]
+        )
+
+        assert (result.passed, result.failed) == (1, 0)
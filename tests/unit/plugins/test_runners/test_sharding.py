@@ -0,0 +1,108 @@
+"""Unit tests for duration-balanced test sharding."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lucidshark.plugins.test_runners import sharding
+from lucidshark.plugins.test_runners.sharding import (
+    DURATIONS_FORMAT,
+    DurationStore,
+    partition,
+    shard_count,
+)
+
+
+def _context(shards) -> MagicMock:
+    context = MagicMock()
+    context.config.pipeline.testing.shards = shards
+    return context
+
+
+class TestShardCount:
+    @pytest.mark.parametrize(
+        "value, expected", [(0, 0), (4, 4), (-2, 0), ("many", 0), (True, 0)]
+    )
+    def test_configured_value(self, value, expected: int) -> None:
+        assert shard_count(_context(value)) == expected
+
+    def test_auto_uses_cpu_count(self) -> None:
+        with patch.object(sharding.os, "cpu_count", return_value=8):
+            assert shard_count(_context("auto")) == 8
+
+    def test_missing_testing_config(self) -> None:
+        context = MagicMock()
+        context.config.pipeline.testing = None
+        assert shard_count(context) == 0
+
+
+class TestPartition:
+    def test_balances_by_duration(self) -> None:
+        tests = ["a", "b", "c", "d", "e"]
+        durations = {"a": 5.0, "b": 1.0, "c": 3.0, "d": 2.0, "e": 3.0}
+
+        groups = partition(tests, durations, 2)
+
+        totals = sorted(sum(durations[t] for t in group) for group in groups)
+        assert totals == [7.0, 7.0]
+
+    def test_keeps_collection_order(self) -> None:
+        tests = ["a", "b", "c", "d"]
+        durations = {"a": 1.0, "b": 4.0, "c": 2.0, "d": 3.0}
+
+        for group in partition(tests, durations, 2):
+            assert group == sorted(group, key=tests.index)
+
+    def test_unknown_durations_use_average(self) -> None:
+        durations = {"slow": 10.0, "fast": 2.0}
+
+        groups = partition(["slow", "fast", "new1", "new2"], durations, 2)
+
+        # Unknown tests count as 6s each: 10 + 2 | 6 + 6
+        assert sorted(groups) == [["new1", "new2"], ["slow", "fast"]]
+
+    def test_zero_duration_is_known(self) -> None:
+        durations = {"a": 0.0, "b": 0.0, "c": 9.0}
+
+        groups = partition(["a", "b", "c"], durations, 2)
+
+        assert sorted(groups, key=len) == [["c"], ["a", "b"]]
+
+    def test_no_more_shards_than_tests(self) -> None:
+        assert partition(["a", "b"], {}, 8) == [["a"], ["b"]]
+
+    def test_empty(self) -> None:
+        assert partition([], {}, 4) == []
+
+
+class TestDurationStore:
+    def test_round_trip_merges(self, tmp_path: Path) -> None:
+        store = DurationStore.for_project(tmp_path, "pytest")
+        store.record({"a": 1.0, "b": 2.0})
+        store.record({"b": 3.0})
+
+        assert store.path == tmp_path / ".lucidshark" / "cache" / "pytest" / (
+            "durations.json"
+        )
+        assert store.load() == {"a": 1.0, "b": 3.0}
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        assert DurationStore(tmp_path / "durations.json").load() == {}
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "not json",
+            json.dumps({"format": DURATIONS_FORMAT + 1, "durations": {"a": 1}}),
+            json.dumps({"format": DURATIONS_FORMAT, "durations": []}),
+        ],
+    )
+    def test_ignores_invalid_file(self, tmp_path: Path, content: str) -> None:
+        path = tmp_path / "durations.json"
+        path.write_text(content, encoding="utf-8")
+
+        assert DurationStore(path).load() == {}
@@ -0,0 +1,162 @@
+"""Unit tests for Rust plugin utilities."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+from lucidshark.plugins import rust_utils
+from lucidshark.plugins.rust_utils import (
+    affected_members,
+    cargo_env,
+    cargo_package_args,
+    load_workspace_graph,
+)
+
+MEMBERS = {
+    "app": {"dir": ".", "deps": ["api", "cli"]},
+    "api": {"dir": "crates/api", "deps": ["core"]},
+    "cli": {"dir": "crates/cli", "deps": []},
+    "core": {"dir": "crates/core", "deps": []},
+    "core-macros": {"dir": "crates/core/macros", "deps": []},
+}
+
+
+class TestCargoEnv:
+    """Tests for cargo_env function."""
+
+    def test_managed_target_dir(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.delenv("CARGO_TARGET_DIR", raising=False)
+        assert cargo_env(tmp_path) == {
+            "CARGO_TARGET_DIR": str(
+                tmp_path / ".lucidshark" / "cache" / "cargo" / "target"
+            )
+        }
+
+    def test_respects_user_target_dir(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CARGO_TARGET_DIR", "/custom/target")
+        assert cargo_env(tmp_path) == {}
+
+
+class TestAffectedMembers:
+    """Tests for affected_members function."""
+
+    def test_includes_reverse_dependencies(self) -> None:
+        assert affected_members(MEMBERS, ["crates/core/src/lib.rs"]) == {
+            "core",
+            "api",
+            "app",
+        }
+
+    def test_innermost_member(self) -> None:
+        assert affected_members(MEMBERS, ["crates/core/macros/src/lib.rs"]) == {
+            "core-macros"
+        }
+
+    def test_root_package_owns_other_files(self) -> None:
+        assert affected_members(MEMBERS, ["src/main.rs"]) == {"app"}
+
+    def test_member_manifest(self) -> None:
+        assert affected_members(MEMBERS, ["crates/cli/Cargo.toml"]) == {"cli", "app"}
+
+    def test_virtual_workspace_files_outside_members(self) -> None:
+        members = {"api": {"dir": "api", "deps": []}}
+        assert affected_members(members, ["README.md", "docs/x.md"]) == set()
+
+    def test_workspace_files_affect_everything(self) -> None:
+        assert affected_members(MEMBERS, ["Cargo.lock"]) is None
+        assert affected_members(MEMBERS, [".cargo/config.toml"]) is None
+
+
+class TestCargoPackageArgs:
+    """Tests for cargo_package_args function."""
+
+    def test_full_scans(self, tmp_path: Path, scan_context) -> None:
+        with patch.object(rust_utils, "load_workspace_graph") as mock_graph:
+            assert cargo_package_args(scan_context(tmp_path, [tmp_path])) is None
+            assert (
+                cargo_package_args(
+                    scan_context(tmp_path, [tmp_path / "a.rs"], all_files=True)
+                )
+                is None
+            )
+        mock_graph.assert_not_called()
+
+    def test_changed_files(self, tmp_path: Path, scan_context) -> None:
+        context = scan_context(tmp_path, [tmp_path / "crates" / "api" / "lib.rs"])
+        with patch.object(rust_utils, "load_workspace_graph", return_value=MEMBERS):
+            assert cargo_package_args(context) == ["-p", "api", "-p", "app"]
+
+    def test_nothing_affected(self, tmp_path: Path, scan_context) -> None:
+        context = scan_context(tmp_path, [tmp_path / "README.md"])
+        members = {"api": {"dir": "api", "deps": []}}
+        with patch.object(rust_utils, "load_workspace_graph", return_value=members):
+            assert cargo_package_args(context) == []
+
+    def test_workspace_unavailable(self, tmp_path: Path, scan_context) -> None:
+        context = scan_context(tmp_path, [tmp_path / "src" / "lib.rs"])
+        with patch.object(rust_utils, "load_workspace_graph", return_value=None):
+            assert cargo_package_args(context) is None
+
+
+class TestLoadWorkspaceGraph:
+    """Tests for load_workspace_graph function."""
+
+    def _metadata(self, root: Path) -> str:
+        return json.dumps(
+            {
+                "packages": [
+                    {
+                        "name": "api",
+                        "manifest_path": str(root / "api" / "Cargo.toml"),
+                        "dependencies": [
+                            {"name": "core", "path": str(root / "core")},
+                            {"name": "serde"},
+                        ],
+                    },
+                    {
+                        "name": "core",
+                        "manifest_path": str(root / "core" / "Cargo.toml"),
+                        "dependencies": [],
+                    },
+                ]
+            }
+        )
+
+    def test_reads_path_dependencies(self, tmp_path: Path) -> None:
+        completed = subprocess.CompletedProcess(
+            [], 0, stdout=self._metadata(tmp_path), stderr=""
+        )
+        with (
+            patch.object(rust_utils, "find_cargo", return_value=Path("/usr/bin/cargo")),
+            patch.object(rust_utils.subprocess, "run", return_value=completed),
+        ):
+            assert rust_utils._read_workspace(tmp_path) == {
+                "api": {"dir": "api", "deps": ["core"]},
+                "core": {"dir": "core", "deps": []},
+            }
+
+    def test_caches_until_manifests_change(self, tmp_path: Path) -> None:
+        (tmp_path / "Cargo.toml").write_text("[workspace]\n")
+        (tmp_path / "api").mkdir()
+        manifest = tmp_path / "api" / "Cargo.toml"
+        manifest.write_text('[package]\nname = "api"\n')
+        members = {"api": {"dir": "api", "deps": []}}
+
+        with patch.object(
+            rust_utils, "_read_workspace", return_value=members
+        ) as mock_read:
+            assert load_workspace_graph(tmp_path) == members
+            (tmp_path / "api" / "lib.rs").write_text("")
+            assert load_workspace_graph(tmp_path) == members
+            assert mock_read.call_count == 1
+
+            manifest.write_text('[package]\nname = "api"\nversion = "0.2.0"\n')
+            load_workspace_graph(tmp_path)
+            assert mock_read.call_count == 2
+
+    def test_cargo_metadata_failure(self, tmp_path: Path) -> None:
+        with patch.object(rust_utils, "_read_workspace", return_value=None):
+            assert load_workspace_graph(tmp_path) is None
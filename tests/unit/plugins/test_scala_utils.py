@@ -0,0 +1,197 @@
+"""Unit tests for the shared Scala compile and the sbt server."""
+
+from __future__ import annotations
+
+import json
+import socket
+import subprocess
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lucidshark.plugins.scala_utils import (
+    SbtServer,
+    compile_command,
+    gradle_daemon_args,
+    sbt_command,
+    semanticdb_enabled,
+    semanticdb_targetroots,
+    shared_compile,
+)
+
+FAKE_SBT = Path("/usr/bin/sbt")
+
+
+def _context(project_root: Path, build_server: bool = False) -> MagicMock:
+    context = MagicMock(project_root=project_root)
+    context.config.settings.scala_build_server = build_server
+    return context
+
+
+def _completed(returncode: int = 0, stdout: str = "") -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(
+        args=[], returncode=returncode, stdout=stdout, stderr=""
+    )
+
+
+@pytest.fixture
+def sbt_project(tmp_path: Path) -> Path:
+    (tmp_path / "build.sbt").write_text('scalaVersion := "2.13.14"\n')
+    (tmp_path / "project").mkdir()
+    (tmp_path / "project" / "build.properties").write_text("sbt.version=1.9.9\n")
+    (tmp_path / "src" / "main" / "scala").mkdir(parents=True)
+    (tmp_path / "src" / "main" / "scala" / "App.scala").write_text("object App\n")
+    return tmp_path
+
+
+@pytest.fixture
+def listening_socket():
+    """A Unix socket standing in for a running sbt server."""
+    with tempfile.TemporaryDirectory(dir="/tmp") as tmpdir:
+        path = f"{tmpdir}/sbt.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(path)
+            sock.listen(5)
+            yield path
+
+
+def _write_active(project_root: Path, uri: str) -> None:
+    active = project_root / "project" / "target" / "active.json"
+    active.parent.mkdir(parents=True, exist_ok=True)
+    active.write_text(json.dumps({"uri": uri}))
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+class TestSbtServer:
+    def test_starts_server_and_registers_shutdown(
+        self, sbt_project: Path, listening_socket: str
+    ) -> None:
+        server = SbtServer(FAKE_SBT, sbt_project)
+        _write_active(sbt_project, "local:///nonexistent/sbt.sock")
+
+        def start(cmd, **kwargs):
+            _write_active(sbt_project, f"local://{listening_socket}")
+            return _completed()
+
+        with (
+            patch("subprocess.run", side_effect=start) as mock_run,
+            patch("lucidshark.core.daemons.register_daemon") as mock_register,
+        ):
+            assert server.command("compile") == [str(FAKE_SBT), "--client", "compile"]
+            assert server.command("test") == [str(FAKE_SBT), "--client", "test"]
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args.args[0] == [str(FAKE_SBT), "--client", "sbtVersion"]
+        mock_register.assert_called_once_with(server.key, server.stop)
+
+        with patch("subprocess.run", return_value=_completed()) as mock_run:
+            server.stop()
+        assert mock_run.call_args.args[0] == [str(FAKE_SBT), "--client", "shutdown"]
+
+    def test_reloads_running_server_when_build_changes(
+        self, sbt_project: Path, listening_socket: str
+    ) -> None:
+        _write_active(sbt_project, f"local://{listening_socket}")
+        server = SbtServer(FAKE_SBT, sbt_project)
+
+        with patch("subprocess.run", return_value=_completed()) as mock_run:
+            server.command("compile")
+            server.command("compile")
+            assert mock_run.call_count == 1
+            assert mock_run.call_args.args[0][-1] == "reload"
+
+            (sbt_project / "build.sbt").write_text('scalaVersion := "3.3.3"\n')
+            server.command("compile")
+            assert mock_run.call_count == 2
+
+        # An existing server is left running
+        with patch("subprocess.run") as mock_run:
+            server.stop()
+        mock_run.assert_not_called()
+
+    def test_falls_back_when_server_does_not_start(self, sbt_project: Path) -> None:
+        server = SbtServer(FAKE_SBT, sbt_project)
+
+        with patch("subprocess.run", return_value=_completed(returncode=1)) as run:
+            assert server.command("compile") is None
+            assert server.command("compile") is None
+        assert run.call_count == 1
+
+    def test_old_sbt_has_no_client(self, sbt_project: Path) -> None:
+        (sbt_project / "project" / "build.properties").write_text(
+            "sbt.version=1.3.13\n"
+        )
+
+        with patch("subprocess.run") as mock_run:
+            assert SbtServer(FAKE_SBT, sbt_project).command("compile") is None
+        mock_run.assert_not_called()
+
+
+class TestBuildCommands:
+    def test_disabled_by_default(self, sbt_project: Path) -> None:
+        context = _context(sbt_project)
+        assert sbt_command(context, FAKE_SBT, "test") == [
+            str(FAKE_SBT),
+            "--no-colors",
+            "test",
+        ]
+        assert gradle_daemon_args(context) == ["--no-daemon"]
+
+    def test_build_server_enabled(self, sbt_project: Path) -> None:
+        context = _context(sbt_project, build_server=True)
+        with patch.object(
+            SbtServer, "command", return_value=[str(FAKE_SBT), "--client", "compile"]
+        ):
+            assert compile_command(context, FAKE_SBT, "sbt")[1] == "--client"
+        assert compile_command(context, Path("gradlew"), "gradle") == [
+            "gradlew",
+            "compileScala",
+        ]
+
+
+class TestSharedCompile:
+    def test_reuses_compile_until_sources_change(self, sbt_project: Path) -> None:
+        context = _context(sbt_project)
+
+        def compile_project(**kwargs):
+            (sbt_project / "target").mkdir(exist_ok=True)
+            return _completed(
+                returncode=1, stdout="\x1b[31m[error]\x1b[0m App.scala:1:1: boom"
+            )
+
+        with patch(
+            "lucidshark.plugins.scala_utils.run_with_streaming",
+            side_effect=compile_project,
+        ) as mock_run:
+            first = shared_compile(context, FAKE_SBT, "sbt")
+            assert shared_compile(context, FAKE_SBT, "sbt") is first
+            assert mock_run.call_count == 1
+
+            (sbt_project / "src" / "main" / "scala" / "B.scala").write_text("object B")
+            assert shared_compile(context, FAKE_SBT, "sbt") is not first
+            assert mock_run.call_count == 2
+
+        assert not first.succeeded
+        assert "[error] App.scala:1:1: boom" in first.output
+
+
+class TestSemanticdb:
+    def test_detects_semanticdb_setting(self, sbt_project: Path) -> None:
+        assert not semanticdb_enabled(sbt_project)
+        (sbt_project / "build.sbt").write_text(
+            "ThisBuild / semanticdbEnabled := true\n"
+        )
+        assert semanticdb_enabled(sbt_project)
+
+    def test_finds_targetroots(self, sbt_project: Path) -> None:
+        meta = sbt_project / "target" / "scala-2.13" / "meta"
+        (meta / "META-INF" / "semanticdb" / "src").mkdir(parents=True)
+        classes = sbt_project / "core" / "target" / "classes"
+        (classes / "META-INF" / "semanticdb").mkdir(parents=True)
+        (sbt_project / "target" / "scala-2.13" / "classes" / "META-INF").mkdir(
+            parents=True
+        )
+
+        assert semanticdb_targetroots(sbt_project) == [classes, meta]
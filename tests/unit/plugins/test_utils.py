@@ -7,12 +7,22 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 
 from lucidshark.plugins.utils import (
+    affected_closure,
+    cached_json,
+    changed_files,
     coverage_has_source_config,
     detect_source_directory,
+    directory_fingerprint,
     get_cli_version,
+    memoized_build,
+    read_json_cache,
     resolve_src_paths,
+    version_watched_paths,
+    write_json_cache,
 )
 
 
@@ -106,6 +116,190 @@ class TestGetCliVersion:
         assert version == "unknown"
 
 
+class TestVersionWatchedPaths:
+    """Tests for version_watched_paths function."""
+
+    def test_symlink_target_is_watched(self, tmp_path: Path) -> None:
+        real = tmp_path / "lib" / "tool-1.2" / "tool"
+        real.parent.mkdir(parents=True)
+        real.write_text("#!/bin/sh\n")
+        link = tmp_path / "bin" / "tool"
+        link.parent.mkdir()
+        link.symlink_to(real)
+
+        assert version_watched_paths(link) == [link, real.resolve()]
+
+    def test_shim_watches_version_files(self, tmp_path: Path, monkeypatch) -> None:
+        shim = tmp_path / ".pyenv" / "shims" / "python"
+        shim.parent.mkdir(parents=True)
+        shim.write_text("#!/bin/sh\n")
+        monkeypatch.chdir(tmp_path)
+
+        paths = version_watched_paths(shim)
+
+        assert paths[0] == shim
+        assert tmp_path / ".pyenv" / "version" in paths
+        assert tmp_path / ".python-version" in paths
+
+
+class TestJsonCache:
+    """Tests for the JSON cache helpers."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache" / "graph.json"
+
+        assert write_json_cache(path, "graph", {"a": ["b"]}, 1, "fp")
+
+        assert read_json_cache(path, "graph", 1, "fp") == {"a": ["b"]}
+        assert read_json_cache(path, "graph", 2, "fp") is None
+        assert read_json_cache(path, "graph", 1, "other") is None
+        assert read_json_cache(path, "other", 1, "fp") is None
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_unreadable_file_is_a_miss(self, tmp_path: Path) -> None:
+        path = tmp_path / "graph.json"
+        path.write_text("{not json")
+
+        assert read_json_cache(path, "graph", 1) is None
+
+    def test_cached_json_computes_on_miss(self, tmp_path: Path) -> None:
+        path = tmp_path / "graph.json"
+        compute = MagicMock(return_value={"a": 1})
+
+        assert cached_json(path, "graph", 1, "fp", compute) == {"a": 1}
+        assert cached_json(path, "graph", 1, "fp", compute) == {"a": 1}
+        assert compute.call_count == 1
+
+        assert cached_json(path, "graph", 1, "fp2", compute) == {"a": 1}
+        assert compute.call_count == 2
+
+    def test_failed_compute_is_not_stored(self, tmp_path: Path) -> None:
+        path = tmp_path / "graph.json"
+
+        assert cached_json(path, "graph", 1, "fp", lambda: None) is None
+        assert not path.exists()
+
+
+class TestChangedFiles:
+    """Tests for changed_files function."""
+
+    def test_relative_paths(self, tmp_path: Path, scan_context) -> None:
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").touch()
+        outside = tmp_path.parent / "elsewhere.py"
+
+        context = scan_context(
+            tmp_path, [tmp_path / "src" / "a.py", tmp_path / "gone.py", outside]
+        )
+
+        assert changed_files(context) == ["src/a.py", "gone.py"]
+
+    def test_full_scans(self, tmp_path: Path, scan_context) -> None:
+        assert changed_files(scan_context(tmp_path, [tmp_path])) is None
+        assert changed_files(scan_context(tmp_path, [])) is None
+        assert changed_files(scan_context(tmp_path, ["a.py"], all_files=True)) is None
+
+
+class TestAffectedClosure:
+    """Tests for affected_closure function."""
+
+    DIRS = {"root": ".", "core": "libs/core", "web": "apps/web", "cli": "apps/cli"}
+    DEPS = {"root": [], "core": [], "web": ["core"], "cli": ["web"]}
+
+    def test_innermost_unit_and_dependents(self) -> None:
+        affected = affected_closure(
+            self.DIRS, self.DEPS, ["libs/core/src/a.rs"], {"Cargo.lock"}
+        )
+        assert affected == {"core", "web", "cli"}
+
+    def test_file_outside_units_belongs_to_root(self) -> None:
+        affected = affected_closure(self.DIRS, self.DEPS, ["README.md"], set())
+        assert affected == {"root"}
+
+    def test_no_root_unit(self) -> None:
+        dirs = {"api": "api", "cmd": "cmd"}
+        affected = affected_closure(dirs, {"cmd": ["api"]}, ["docs/a.md"], set())
+        assert affected == set()
+
+    def test_sibling_prefix_is_not_a_parent(self) -> None:
+        dirs = {"api": "api", "apiv2": "apiv2"}
+        affected = affected_closure(dirs, {}, ["apiv2/a.go"], set())
+        assert affected == {"apiv2"}
+
+    @pytest.mark.parametrize("path", ["go.mod", "gradle/wrapper.properties"])
+    def test_global_file(self, path: str) -> None:
+        assert (
+            affected_closure(self.DIRS, self.DEPS, [path], {"go.mod", "gradle/"})
+            is None
+        )
+
+
+class TestMemoizedBuild:
+    """Tests for the shared build memo."""
+
+    def _tree(self, root: Path) -> None:
+        (root / "src").mkdir()
+        (root / "src" / "a.txt").write_text("a")
+        (root / "out").mkdir()
+        (root / "out" / "a.bin").write_text("0")
+
+    def test_fingerprint_skips_output_and_hidden_dirs(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        before = directory_fingerprint(tmp_path, {"out"})
+
+        (tmp_path / "out" / "b.bin").write_text("1")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref")
+        assert directory_fingerprint(tmp_path, {"out"}) == before
+
+        (tmp_path / "src" / "b.txt").write_text("b")
+        assert directory_fingerprint(tmp_path, {"out"}) != before
+
+    def test_fingerprint_include_filter(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        only_cfg = lambda name: name.endswith(".cfg")  # noqa: E731
+        before = directory_fingerprint(tmp_path, {"out"}, only_cfg)
+
+        (tmp_path / "src" / "b.txt").write_text("b")
+        assert directory_fingerprint(tmp_path, {"out"}, only_cfg) == before
+
+        (tmp_path / "build.cfg").write_text("x")
+        assert directory_fingerprint(tmp_path, {"out"}, only_cfg) != before
+
+    def test_reuses_outcome_until_sources_change(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        run = MagicMock(side_effect=["first", "second"])
+
+        assert memoized_build("test", tmp_path, tmp_path, {"out"}, run) == "first"
+        assert memoized_build("test", tmp_path, tmp_path, {"out"}, run) == "first"
+        (tmp_path / "out" / "b.bin").write_text("1")
+        assert memoized_build("test", tmp_path, tmp_path, {"out"}, run) == "first"
+        assert run.call_count == 1
+
+        (tmp_path / "src" / "b.txt").write_text("b")
+        assert memoized_build("test", tmp_path, tmp_path, {"out"}, run) == "second"
+
+    def test_unusable_outcome_runs_again(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        run = MagicMock(side_effect=["first", "second"])
+
+        memoized_build("test", tmp_path, tmp_path, set(), run)
+        result = memoized_build(
+            "test", tmp_path, tmp_path, set(), run, reusable=lambda r: False
+        )
+        assert result == "second"
+
+    def test_failure_is_not_cached(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        run = MagicMock(
+            side_effect=[subprocess.TimeoutExpired(cmd="build", timeout=1), "done"]
+        )
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            memoized_build("test", tmp_path, tmp_path, set(), run)
+        assert memoized_build("test", tmp_path, tmp_path, set(), run) == "done"
+
+
 class TestResolveSrcPaths:
     """Tests for resolve_src_paths function."""
 
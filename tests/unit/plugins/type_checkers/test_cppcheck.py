@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
 import tempfile
 from pathlib import Path
+from typing import List
 from unittest.mock import patch
 
+import pytest
 
 from lucidshark.core.models import ScanContext, Severity, ToolDomain
 from lucidshark.plugins.type_checkers.cppcheck import CppcheckChecker
@@ -225,14 +228,16 @@ class TestCheck:
     def test_check_timeout(self, mock_binary, mock_run) -> None:
         mock_binary.return_value = Path("/usr/bin/cppcheck")
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="cppcheck", timeout=300)
-        checker = CppcheckChecker()
-        context = ScanContext(
-            project_root=Path("/tmp"),
-            paths=[Path("/tmp")],
-            enabled_domains=[],
-        )
-        issues = checker.check(context)
-        assert issues == []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            checker = CppcheckChecker()
+            context = ScanContext(
+                project_root=tmpdir_path,
+                paths=[tmpdir_path],
+                enabled_domains=[],
+            )
+            issues = checker.check(context)
+            assert issues == []
 
     @patch("lucidshark.plugins.type_checkers.cppcheck.run_with_streaming")
     @patch.object(CppcheckChecker, "ensure_binary")
@@ -295,3 +300,77 @@ class TestCheck:
             )
             targets = checker._get_targets(context)
             assert targets == []
+
+
+class TestIncrementalCheck:
+    """Tests for the persistent build dir and changed-file restriction."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_home(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("LUCIDSHARK_HOME", raising=False)
+
+    def _project(self, root: Path) -> None:
+        (root / "util.h").write_text("int util();\n")
+        (root / "a.cpp").write_text('#include "util.h"\n')
+        (root / "b.cpp").write_text("int b() { return 0; }\n")
+        build = root / "build"
+        build.mkdir()
+        (build / "CMakeCache.txt").write_text("")
+        (build / "compile_commands.json").write_text(
+            json.dumps(
+                [
+                    {
+                        "directory": str(build),
+                        "command": f"c++ -c {root / name}",
+                        "file": str(root / name),
+                    }
+                    for name in ("a.cpp", "b.cpp")
+                ]
+            )
+        )
+
+    def _cmd(self, root: Path, paths: List[Path]) -> List[str]:
+        context = ScanContext(project_root=root, paths=paths, enabled_domains=[])
+        with (
+            patch.object(CppcheckChecker, "ensure_binary", return_value=Path("/cc")),
+            patch(
+                "lucidshark.plugins.type_checkers.cppcheck.run_with_streaming",
+                return_value=subprocess.CompletedProcess([], 0, "", ""),
+            ) as mock_run,
+            patch(
+                "lucidshark.plugins.type_checkers.cppcheck.os.cpu_count",
+                return_value=4,
+            ),
+        ):
+            CppcheckChecker().check(context)
+        if not mock_run.called:
+            return []
+        return mock_run.call_args.kwargs["cmd"]
+
+    def test_build_dir_and_jobs(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+
+        cmd = self._cmd(tmp_path, [tmp_path])
+
+        build_dir = tmp_path / ".lucidshark" / "cache" / "cppcheck"
+        assert f"--cppcheck-build-dir={build_dir}" in cmd
+        assert build_dir.is_dir()
+        assert "-j4" in cmd
+        assert not any(c.startswith("--file-filter") for c in cmd)
+        assert "--suppress=unusedFunction" not in cmd
+
+    def test_changed_header_selects_including_tus(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+
+        cmd = self._cmd(tmp_path, [tmp_path / "util.h"])
+
+        filters = [c for c in cmd if c.startswith("--file-filter=")]
+        assert filters == [f"--file-filter={(tmp_path / 'a.cpp').resolve()}"]
+        # Functions called only from the other TUs must not look unused
+        assert "--suppress=unusedFunction" in cmd
+
+    def test_unaffected_change_skips_cppcheck(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+        (tmp_path / "other.h").write_text("int other();\n")
+
+        assert self._cmd(tmp_path, [tmp_path / "other.h"]) == []
@@ -96,7 +96,7 @@ class TestDotnetBuildCheckerCheck:
 
             with (
                 patch(
-                    "lucidshark.plugins.type_checkers.dotnet_build.run_with_streaming",
+                    "lucidshark.plugins.dotnet_utils.run_with_streaming",
                     return_value=result,
                 ),
                 patch.object(checker, "ensure_binary", return_value=FAKE_BINARY),
@@ -128,7 +128,7 @@ class TestDotnetBuildCheckerCheck:
 
             with (
                 patch(
-                    "lucidshark.plugins.type_checkers.dotnet_build.run_with_streaming",
+                    "lucidshark.plugins.dotnet_utils.run_with_streaming",
                     return_value=result,
                 ),
                 patch.object(checker, "ensure_binary", return_value=FAKE_BINARY),
@@ -156,7 +156,7 @@ class TestDotnetBuildCheckerCheck:
 
             with (
                 patch(
-                    "lucidshark.plugins.type_checkers.dotnet_build.run_with_streaming",
+                    "lucidshark.plugins.dotnet_utils.run_with_streaming",
                     return_value=result,
                 ),
                 patch.object(checker, "ensure_binary", return_value=FAKE_BINARY),
@@ -174,7 +174,7 @@ class TestDotnetBuildCheckerCheck:
 
             with (
                 patch(
-                    "lucidshark.plugins.type_checkers.dotnet_build.run_with_streaming",
+                    "lucidshark.plugins.dotnet_utils.run_with_streaming",
                     side_effect=subprocess.TimeoutExpired(cmd="dotnet", timeout=300),
                 ),
                 patch.object(checker, "ensure_binary", return_value=FAKE_BINARY),
@@ -196,7 +196,7 @@ class TestDotnetBuildCheckerCheck:
 
             with (
                 patch(
-                    "lucidshark.plugins.type_checkers.dotnet_build.run_with_streaming",
+                    "lucidshark.plugins.dotnet_utils.run_with_streaming",
                     return_value=result,
                 ),
                 patch.object(checker, "ensure_binary", return_value=FAKE_BINARY),
@@ -222,7 +222,7 @@ class TestDotnetBuildCheckerCheck:
 
             with (
                 patch(
-                    "lucidshark.plugins.type_checkers.dotnet_build.run_with_streaming",
+                    "lucidshark.plugins.dotnet_utils.run_with_streaming",
                     return_value=result,
                 ),
                 patch.object(checker, "ensure_binary", return_value=FAKE_BINARY),
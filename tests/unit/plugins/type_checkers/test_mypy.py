@@ -6,15 +6,17 @@ import json
 import subprocess
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from lucidshark.core.models import ScanContext, Severity, ToolDomain
 from lucidshark.plugins.type_checkers.mypy import (
+    DmypyDaemon,
     MypyChecker,
     SEVERITY_MAP,
     _glob_to_regex,
+    get_dmypy_daemon,
 )
 
 
@@ -59,6 +61,21 @@ class TestMypyCheckerProperties:
             checker = MypyChecker(project_root=Path(tmpdir))
             assert checker._project_root == Path(tmpdir)
 
+    def test_cache_environment_is_site_packages(self, tmp_path: Path) -> None:
+        """Test the result cache key covers mypy's site-packages."""
+        site_packages = tmp_path / "lib" / "python3.12" / "site-packages"
+        site_packages.mkdir(parents=True)
+        (tmp_path / "bin").mkdir()
+        checker = MypyChecker()
+        context = MagicMock(project_root=tmp_path)
+
+        with patch.object(
+            checker, "ensure_binary", return_value=tmp_path / "bin" / "mypy"
+        ):
+            assert checker.cache_environment(context) == [site_packages]
+        with patch.object(checker, "ensure_binary", side_effect=FileNotFoundError):
+            assert checker.cache_environment(context) == []
+
 
 class TestMypySeverityMapping:
     """Tests for mypy severity mapping."""
@@ -630,3 +647,125 @@ class TestMypyIssueIdGeneration:
         checker = MypyChecker()
         issue_id = checker._generate_issue_id("misc", "f.py", None, None, "msg")
         assert issue_id.startswith("mypy-misc-")
+
+
+DMYPY_OUTPUT = "Daemon started\n" + json.dumps(
+    {
+        "file": "app.py",
+        "line": 2,
+        "column": 11,
+        "message": "Incompatible return value type",
+        "code": "return-value",
+        "severity": "error",
+    }
+)
+
+
+class TestDmypyDaemonMode:
+    """Tests for checks routed through dmypy in long-lived processes."""
+
+    def _context(self, tmp_path: Path, persistent: bool = True) -> ScanContext:
+        (tmp_path / "app.py").write_text("x = 1\n")
+        context = ScanContext(
+            project_root=tmp_path,
+            paths=[tmp_path / "app.py"],
+            enabled_domains=[],
+        )
+        context.persistent_tools = persistent
+        return context
+
+    def test_persistent_context_uses_daemon(self, tmp_path: Path) -> None:
+        checker = MypyChecker()
+        daemon = MagicMock()
+        daemon.run.return_value = make_completed_process(1, DMYPY_OUTPUT)
+
+        with (
+            patch.object(checker, "ensure_binary", return_value=Path("/v/bin/mypy")),
+            patch(
+                "lucidshark.plugins.type_checkers.mypy.get_dmypy_daemon",
+                return_value=daemon,
+            ),
+            patch(
+                "lucidshark.plugins.type_checkers.mypy.run_with_streaming"
+            ) as mock_run,
+        ):
+            issues = checker.check(self._context(tmp_path))
+
+        mock_run.assert_not_called()
+        assert [i.rule_id for i in issues] == ["return-value"]
+        flags, paths = daemon.run.call_args[0][:2]
+        assert flags[:3] == ["--output", "json", "--no-error-summary"]
+        assert paths == [(tmp_path / "app.py").as_posix()]
+
+    def test_daemon_failure_falls_back_to_mypy(self, tmp_path: Path) -> None:
+        checker = MypyChecker()
+        daemon = MagicMock()
+        daemon.run.return_value = make_completed_process(2, "", "Daemon crashed!")
+
+        with (
+            patch.object(checker, "ensure_binary", return_value=Path("/v/bin/mypy")),
+            patch(
+                "lucidshark.plugins.type_checkers.mypy.get_dmypy_daemon",
+                return_value=daemon,
+            ),
+            patch(
+                "lucidshark.plugins.type_checkers.mypy.run_with_streaming",
+                return_value=make_completed_process(0, ""),
+            ) as mock_run,
+        ):
+            checker.check(self._context(tmp_path))
+
+        daemon.kill.assert_called_once()
+        assert mock_run.call_args.kwargs["cmd"][0] == "/v/bin/mypy"
+
+    def test_one_shot_scan_does_not_use_daemon(self, tmp_path: Path) -> None:
+        checker = MypyChecker()
+
+        with (
+            patch.object(checker, "ensure_binary", return_value=Path("/v/bin/mypy")),
+            patch(
+                "lucidshark.plugins.type_checkers.mypy.get_dmypy_daemon"
+            ) as get_daemon,
+            patch(
+                "lucidshark.plugins.type_checkers.mypy.run_with_streaming",
+                return_value=make_completed_process(0, ""),
+            ),
+        ):
+            checker.check(self._context(tmp_path, persistent=False))
+
+        get_daemon.assert_not_called()
+
+    def test_get_daemon_requires_dmypy_next_to_mypy(self, tmp_path: Path) -> None:
+        mypy = tmp_path / "mypy"
+        mypy.touch()
+        assert get_dmypy_daemon(mypy, tmp_path) is None
+
+        (tmp_path / "dmypy").touch()
+        daemon = get_dmypy_daemon(mypy, tmp_path)
+        assert daemon is not None
+        assert daemon.dmypy == tmp_path / "dmypy"
+        assert get_dmypy_daemon(mypy, tmp_path) is daemon
+
+    def test_run_registers_daemon_for_shutdown(self, tmp_path: Path) -> None:
+        from lucidshark.core.daemons import shutdown_daemons
+
+        daemon = DmypyDaemon(tmp_path / "dmypy", tmp_path)
+        with patch(
+            "lucidshark.plugins.type_checkers.mypy.run_with_streaming",
+            return_value=make_completed_process(0, ""),
+        ) as mock_run:
+            daemon.run(["--strict"], ["app.py"])
+
+        cmd = mock_run.call_args.kwargs["cmd"]
+        assert cmd[:3] == [
+            str(tmp_path / "dmypy"),
+            "--status-file",
+            str(daemon.status_file),
+        ]
+        assert cmd[3] == "run"
+        assert cmd[-3:] == ["--", "--strict", "app.py"]
+
+        daemon.status_file.write_text("{}")
+        with patch.object(daemon, "_command", return_value=True) as command:
+            shutdown_daemons()
+        command.assert_called_once_with("stop")
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import subprocess
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -468,3 +469,57 @@ class TestSpotBugsExcludeFilter:
             if result:
                 assert "spotbugs-exclude.xml" in result
                 assert ".lucidshark" in result or "lucidshark/data" in result
+
+
+class TestSpotBugsChangedClasses:
+    """Tests for analyzing only the classes of changed files."""
+
+    def _run(self, project_root: Path, changed: list) -> tuple:
+        checker = SpotBugsChecker(project_root=project_root)
+        context = MagicMock()
+        context.project_root = project_root
+        context.all_files = False
+        context.paths = [project_root / path for path in changed]
+        with (
+            patch.object(checker, "ensure_binary", return_value=project_root),
+            patch.object(
+                checker, "_check_java_available", return_value=Path("/usr/bin/java")
+            ),
+            patch.object(checker, "_find_exclude_filter", return_value=None),
+            patch(
+                "lucidshark.plugins.type_checkers.spotbugs.run_in_jvm_worker",
+                return_value=None,
+            ),
+            patch(
+                "lucidshark.plugins.type_checkers.spotbugs.run_with_streaming",
+                return_value=subprocess.CompletedProcess([], 0, "", ""),
+            ) as mock_run,
+        ):
+            issues = checker.check(context)
+        return issues, mock_run
+
+    def _project(self, project_root: Path) -> None:
+        for module in ("core", "app"):
+            classes = project_root / module / "target" / "classes" / "com" / "example"
+            classes.mkdir(parents=True)
+            (classes / f"{module.title()}.class").touch()
+
+    def test_only_analyzes_changed_classes(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+
+        _, mock_run = self._run(tmp_path, ["core/src/main/java/com/example/Core.java"])
+
+        cmd = mock_run.call_args.kwargs["cmd"]
+        core_classes = str(tmp_path / "core" / "target" / "classes")
+        app_classes = str(tmp_path / "app" / "target" / "classes")
+        assert cmd[cmd.index("-onlyAnalyze") + 1] == "com.example.Core"
+        assert cmd[cmd.index("-auxclasspath") + 1] == app_classes
+        assert cmd[cmd.index("-onlyAnalyze") + 2 :] == [core_classes]
+
+    def test_skips_without_compiled_changes(self, tmp_path: Path) -> None:
+        self._project(tmp_path)
+
+        issues, mock_run = self._run(tmp_path, ["README.md"])
+
+        assert issues == []
+        mock_run.assert_not_called()
@@ -17,6 +17,9 @@ from lucidshark.core.models import ScanContext, Severity, ToolDomain
 from lucidshark.plugins.type_checkers.typescript import (
     TypeScriptChecker,
     TSC_ERROR_PATTERN,
+    _load_tsconfig,
+    extended_configs,
+    load_project_graph,
 )
 
 
@@ -358,3 +361,232 @@ class TestIssueIdGeneration:
 
         assert issue_id.startswith("ts-TS2322-")
         assert len(issue_id) == len("ts-TS2322-") + 12  # 12 char hash
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+@pytest.fixture
+def monorepo(tmp_path: Path) -> Path:
+    """Solution tsconfig referencing app -> core and a standalone util."""
+    _write(
+        tmp_path / "tsconfig.json",
+        """{
+  // Solution file
+  "files": [],
+  "references": [
+    {"path": "./packages/core"},
+    {"path": "./packages/app"},
+    {"path": "./packages/util/tsconfig.json"},
+  ],
+}""",
+    )
+    _write(tmp_path / "packages/core/tsconfig.json", '{"compilerOptions": {}}')
+    _write(
+        tmp_path / "packages/app/tsconfig.json",
+        '{"references": [{"path": "../core"}]}',
+    )
+    _write(tmp_path / "packages/util/tsconfig.json", "{}")
+    for package in ("core", "app", "util"):
+        _write(tmp_path / f"packages/{package}/src/index.ts", "export {};")
+    return tmp_path
+
+
+class TestIncrementalCommand:
+    """Tests for the incremental tsc command line."""
+
+    def _commands(
+        self, root: Path, paths=None, cache=True, version="5.6.2", emit=False
+    ):
+        context = ScanContext(
+            project_root=root,
+            paths=paths if paths is not None else [root],
+            enabled_domains=[],
+            config=MagicMock(),
+        )
+        context.config.pipeline.type_checking.cache = cache
+        context.config.settings.typescript_build = emit
+        checker = TypeScriptChecker()
+        with patch.object(checker, "_version", return_value=version):
+            return checker._build_commands(
+                Path("/bin/tsc"), root / "tsconfig.json", context
+            )
+
+    def _command(self, root: Path, paths=None, **kwargs):
+        commands = self._commands(root, paths, **kwargs)
+        if commands is None:
+            return None
+        assert len(commands) == 1
+        return commands[0]
+
+    def test_single_project_uses_cached_build_info(self, tmp_path: Path) -> None:
+        _write(tmp_path / "tsconfig.json", "{}")
+
+        cmd = self._command(tmp_path)
+
+        assert cmd is not None
+        assert cmd[:4] == ["/bin/tsc", "--noEmit", "--pretty", "false"]
+        build_info = Path(cmd[cmd.index("--tsBuildInfoFile") + 1])
+        assert "--incremental" in cmd
+        assert build_info.parent == tmp_path / ".lucidshark" / "cache" / "tsc"
+        assert build_info.parent.is_dir()
+
+    def test_cache_disabled_runs_full_check(self, tmp_path: Path) -> None:
+        _write(tmp_path / "tsconfig.json", "{}")
+
+        assert self._command(tmp_path, cache=False) == [
+            "/bin/tsc",
+            "--noEmit",
+            "--pretty",
+            "false",
+        ]
+
+    def test_references_use_build_mode_without_emit(self, monorepo: Path) -> None:
+        cmd = self._command(monorepo)
+
+        assert cmd == [
+            "/bin/tsc",
+            "--build",
+            str(monorepo / "tsconfig.json"),
+            "--pretty",
+            "false",
+            "--noEmit",
+        ]
+        assert self._command(monorepo, cache=False)[-1] == "--force"
+
+    def test_emitting_build_is_opt_in(self, monorepo: Path) -> None:
+        cmd = self._command(monorepo, emit=True, version="5.0.4")
+
+        assert cmd == [
+            "/bin/tsc",
+            "--build",
+            str(monorepo / "tsconfig.json"),
+            "--pretty",
+            "false",
+        ]
+
+    def test_older_tsc_checks_each_project(self, monorepo: Path) -> None:
+        commands = self._commands(monorepo, version="5.4.5")
+
+        packages = (monorepo / "packages").resolve()
+        assert commands is not None
+        # The solution tsconfig has no sources of its own
+        assert [cmd[1:3] for cmd in commands] == [
+            ["-p", str(packages / "app/tsconfig.json")],
+            ["-p", str(packages / "core/tsconfig.json")],
+            ["-p", str(packages / "util/tsconfig.json")],
+        ]
+        build_infos = {cmd[cmd.index("--tsBuildInfoFile") + 1] for cmd in commands}
+        assert len(build_infos) == 3
+        assert all("--noEmit" in cmd and "--build" not in cmd for cmd in commands)
+
+    def test_older_tsc_checks_affected_projects(self, monorepo: Path) -> None:
+        commands = self._commands(
+            monorepo, [monorepo / "packages/core/src/index.ts"], version="4.9.5"
+        )
+
+        packages = (monorepo / "packages").resolve()
+        assert commands is not None
+        assert [cmd[2] for cmd in commands] == [
+            str(packages / "app/tsconfig.json"),
+            str(packages / "core/tsconfig.json"),
+        ]
+
+    def test_changed_file_builds_project_and_dependents(self, monorepo: Path) -> None:
+        cmd = self._command(monorepo, [monorepo / "packages/core/src/index.ts"])
+
+        packages = (monorepo / "packages").resolve()
+        assert cmd is not None
+        assert cmd[2:-3] == [
+            str(packages / "app/tsconfig.json"),
+            str(packages / "core/tsconfig.json"),
+        ]
+
+    def test_changed_leaf_project_builds_only_itself(self, monorepo: Path) -> None:
+        cmd = self._command(monorepo, [monorepo / "packages/util/src/index.ts"])
+
+        assert cmd is not None
+        assert cmd[2:-3] == [str((monorepo / "packages/util/tsconfig.json").resolve())]
+
+    def test_non_typescript_changes_build_nothing(self, monorepo: Path) -> None:
+        readme = _write(monorepo / "packages/app/README.md", "# app")
+
+        assert self._commands(monorepo, [readme]) is None
+
+    def test_file_outside_references_builds_root(self, monorepo: Path) -> None:
+        script = _write(monorepo / "scripts/release.ts", "export {};")
+
+        cmd = self._command(monorepo, [script])
+
+        assert cmd is not None
+        assert cmd[2] == str(monorepo / "tsconfig.json")
+
+    def test_root_with_sources_is_rebuilt_for_dependencies(
+        self, monorepo: Path
+    ) -> None:
+        _write(
+            monorepo / "tsconfig.json",
+            '{"include": ["src"], "references": [{"path": "packages/core"}]}',
+        )
+
+        cmd = self._command(monorepo, [monorepo / "packages/core/src/index.ts"])
+
+        assert cmd is not None
+        assert cmd[2] == str(monorepo / "tsconfig.json")
+
+
+class TestProjectGraph:
+    """Tests for tsconfig reference parsing."""
+
+    def test_loads_jsonc(self, tmp_path: Path) -> None:
+        config = _write(
+            tmp_path / "tsconfig.json",
+            '{\n  /* block */ "extends": "https://x//y", // line\n  "a": [1,],\n}',
+        )
+
+        assert _load_tsconfig(config) == {"extends": "https://x//y", "a": [1]}
+
+    def test_invalid_config(self, tmp_path: Path) -> None:
+        config = _write(tmp_path / "tsconfig.json", "{ not json")
+
+        assert _load_tsconfig(config) is None
+        assert _load_tsconfig(tmp_path / "missing.json") is None
+
+    def test_graph_follows_references(self, monorepo: Path) -> None:
+        graph = load_project_graph(monorepo / "tsconfig.json")
+
+        packages = (monorepo / "packages").resolve()
+        assert graph[packages / "app/tsconfig.json"] == [
+            packages / "core/tsconfig.json"
+        ]
+        assert len(graph) == 4
+
+    def test_extended_configs(self, tmp_path: Path) -> None:
+        base = _write(
+            tmp_path / "tsconfig.base.json", '{"extends": "@tsconfig/node20"}'
+        )
+        shared = _write(tmp_path / "node_modules/@tsconfig/node20/tsconfig.json", "{}")
+        config = _write(
+            tmp_path / "packages/a/tsconfig.json",
+            '{"extends": ["../../tsconfig.base", "./missing.json"]}',
+        )
+
+        assert extended_configs(config) == [base.resolve(), shared.resolve()]
+
+    def test_cache_key_covers_every_tsconfig(self, monorepo: Path) -> None:
+        base = _write(monorepo / "tsconfig.base.json", "{}")
+        _write(
+            monorepo / "packages/util/tsconfig.json",
+            '{"extends": "../../tsconfig.base.json"}',
+        )
+        context = MagicMock(project_root=monorepo)
+
+        paths = TypeScriptChecker().cache_config_paths(context)
+
+        packages = (monorepo / "packages").resolve()
+        assert packages / "core/tsconfig.json" in paths
+        assert packages / "util/tsconfig.json" in paths
+        assert base.resolve() in paths